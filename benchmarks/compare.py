@@ -0,0 +1,149 @@
+"""
+benchmarks.compare
+
+Regression gate: diffs a benchmark run against a baseline and exits non-zero when p95
+latency or peak memory regressed beyond a threshold, so it can run before a deploy.
+
+A stage regresses when its p95 grew by more than --p95-threshold (relative) and by more
+than --min-delta-ms (absolute, so a 2ms stage jittering to 3ms does not fail the gate),
+when its error rate grew by more than --error-threshold (absolute), or when it has a
+baseline p95 but no successful samples in the new run (every request failed). Memory
+regresses when peak RSS grew by more than --memory-threshold. Stages that only exist in
+the new run are listed but not gated. Differences in the environment fingerprint or the
+run parameters are printed as warnings, since they usually explain a difference.
+
+The baseline defaults to the most recent stored run of the same benchmark in
+docs/test-results/test-data/benchmarks (see results.py).
+
+Usage (from the repo root):
+    python benchmarks/pipeline_benchmark.py --profile cloud --seed 1 --output new.json
+    python benchmarks/compare.py new.json
+    python benchmarks/compare.py new.json --baseline docs/test-results/test-data/benchmarks/2026-04-20-pipeline.json --p95-threshold 0.05
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+from results import load, latest
+
+
+def compare(
+    baseline: dict,
+    new: dict,
+    p95_threshold: float,
+    memory_threshold: float,
+    min_delta_ms: float,
+    error_threshold: float = 0.01,
+) -> tuple[list[dict], list[str]]:
+    """
+    Compare two result documents.
+
+    Returns:
+        (one row per stage p95, stage error rate and for memory with baseline, new, change
+        and status, the names of the rows that regressed).
+    """
+    rows, regressions = [], []
+    for stage in sorted(set(baseline["stages"]) | set(new["stages"])):
+        old, current = baseline["stages"].get(stage, {}), new["stages"].get(stage, {})
+        old_p95, new_p95 = old.get("p95"), current.get("p95")
+        if old_p95 is not None and new_p95 is None:
+            # No successful samples at all is the worst possible latency
+            rows.append({"name": f"{stage} p95 (ms)", "baseline": old_p95, "new": None, "change": None, "status": "REGRESSED"})
+            regressions.append(stage)
+        elif old_p95 is None or new_p95 is None:
+            rows.append({"name": f"{stage} p95 (ms)", "baseline": old_p95, "new": new_p95, "change": None, "status": "not compared"})
+        else:
+            change = (new_p95 - old_p95) / old_p95 if old_p95 else None
+            regressed = new_p95 - old_p95 > min_delta_ms and (change is None or change > p95_threshold)
+            rows.append({"name": f"{stage} p95 (ms)", "baseline": old_p95, "new": new_p95, "change": change, "status": "REGRESSED" if regressed else "ok"})
+            if regressed:
+                regressions.append(stage)
+
+        old_rate, new_rate = old.get("error_rate"), current.get("error_rate")
+        if old_rate is None or new_rate is None:
+            continue
+        # Absolute change, a 0% baseline has no meaningful relative one
+        change = new_rate - old_rate
+        regressed = change > error_threshold
+        rows.append({"name": f"{stage} error rate", "baseline": old_rate, "new": new_rate, "change": change, "status": "REGRESSED" if regressed else "ok"})
+        if regressed and stage not in regressions:
+            regressions.append(stage)
+
+    old_mb = baseline.get("memory", {}).get("peak_rss_mb")
+    new_mb = new.get("memory", {}).get("peak_rss_mb")
+    if old_mb and new_mb:
+        change = (new_mb - old_mb) / old_mb
+        regressed = change > memory_threshold
+        rows.append({"name": "peak RSS (MB)", "baseline": old_mb, "new": new_mb, "change": change, "status": "REGRESSED" if regressed else "ok"})
+        if regressed:
+            regressions.append("memory")
+    return rows, regressions
+
+
+def differences(baseline: dict, new: dict, key: str) -> list[str]:
+    """
+    Describe the top-level values of a section (environment or parameters) that differ
+    between runs. The git commit is expected to differ and is left out.
+    """
+    old, current = baseline.get(key, {}), new.get(key, {})
+    names = sorted((set(old) | set(current)) - {"git_commit", "git_dirty"})
+    return [f"{name}: {old.get(name)} -> {current.get(name)}" for name in names if old.get(name) != current.get(name)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fail when a benchmark run regresses against a baseline")
+    parser.add_argument("run", type=Path, help="Result JSON of the new run")
+    parser.add_argument("--baseline", type=Path, help="Baseline result JSON; defaults to the latest stored run")
+    parser.add_argument("--p95-threshold", type=float, default=0.10, help="Allowed relative p95 increase per stage")
+    parser.add_argument("--memory-threshold", type=float, default=0.10, help="Allowed relative peak RSS increase")
+    parser.add_argument("--min-delta-ms", type=float, default=5.0, help="p95 increases smaller than this never fail")
+    parser.add_argument("--error-threshold", type=float, default=0.01, help="Allowed absolute error rate increase per stage")
+    args = parser.parse_args()
+
+    try:
+        new = load(args.run)
+        baseline_path = args.baseline or latest(new["benchmark"], exclude=args.run)
+        if baseline_path is None:
+            print(f"No stored {new['benchmark']} baseline to compare against; store one with --save")
+            return
+        baseline = load(baseline_path)
+    except (OSError, ValueError, RuntimeError) as e:
+        sys.exit(f"Cannot compare: {e}")
+    if baseline["benchmark"] != new["benchmark"]:
+        sys.exit(f"Cannot compare a {new['benchmark']} run against a {baseline['benchmark']} baseline")
+
+    print(f"Comparing {args.run} against {baseline_path} ({baseline['created']}, commit {baseline['environment'].get('git_commit')})")
+    for key in ("environment", "parameters"):
+        changed = differences(baseline, new, key)
+        if changed:
+            print(f"\nWarning: {key} differs")
+            for line in changed:
+                print(f"  {line}")
+
+    rows, regressions = compare(baseline, new, args.p95_threshold, args.memory_threshold, args.min_delta_ms, args.error_threshold)
+    print("\n| Metric | Baseline | New | Change | Status |")
+    print("|---|---|---|---|---|")
+    for row in rows:
+        if row["change"] is None:
+            change = "-"
+        elif row["name"].endswith("error rate"):
+            change = f"{row['change'] * 100:+.1f} pts"
+        else:
+            change = f"{row['change']:+.1%}"
+        print(f"| {row['name']} | {row['baseline']} | {row['new']} | {change} | {row['status']} |")
+
+    throughput = sorted(set(baseline.get("throughput", {})) | set(new.get("throughput", {})))
+    if throughput:
+        print("\nThroughput (not gated):")
+        for name in throughput:
+            print(f"  {name}: {baseline.get('throughput', {}).get(name)} -> {new.get('throughput', {}).get(name)}")
+
+    if regressions:
+        print(f"\nRegressed beyond threshold: {', '.join(regressions)}")
+        sys.exit(1)
+    print("\nNo regressions beyond threshold")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+benchmarks.import_benchmark
+
+Measures the cold import cost of the API and the core modules, which every new API
+worker pays before it can serve a request (autoscaling, restarts).
+
+Each module is imported in a fresh interpreter with `python -X importtime`, so nothing is
+cached in sys.modules. For each module: median total import time, the slowest imports it
+pulls in (by self time, summed across sub-imports), and whether it loads device audio
+libraries (sounddevice, pygame) or an ML runtime (torch, whisper, onnxruntime), none of
+which the API needs at import time.
+
+With --budget-ms, exits non-zero if any module's median exceeds the budget, so the
+check can run in CI.
+
+Usage (from the repo root):
+    python benchmarks/import_benchmark.py
+    python benchmarks/import_benchmark.py --module api.main --repeat 10 --budget-ms 1500 --output imports.json
+"""
+
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+SRC = ROOT / "src"
+
+DEFAULT_MODULES = [
+    "api.main",
+    "core.pipeline",
+    "core.engines.stt.whisper_local",
+    "core.engines.stt.whisper_api",
+    "core.engines.stt.faster_whisper_stt",
+    "core.engines.llm.openrouter_llm",
+    "core.engines.llm.ollama_llm",
+    "core.engines.tts.gtts_tts",
+    "core.engines.tts.piper_tts",
+]
+
+# Top-level packages that must only load when a device or local model is actually used
+HEAVY = ["sounddevice", "pygame", "torch", "whisper", "faster_whisper", "ctranslate2", "onnxruntime", "piper"]
+
+
+def import_once(module: str) -> dict:
+    """
+    Import a module in a fresh interpreter and parse its -X importtime report.
+
+    Returns:
+        Total microseconds, self microseconds per top-level package, and the set of
+        top-level packages loaded.
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(SRC), str(SRC / "app"), os.environ.get("PYTHONPATH", "")]))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SRC / "app", env=env, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    total = 0
+    packages: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        package = name.split(".")[0]
+        packages[package] = packages.get(package, 0) + int(self_us)
+        if name == module:
+            total = int(cumulative_us)
+    return {"total_us": total, "packages": packages}
+
+
+def benchmark_module(module: str, repeat: int, top: int) -> dict:
+    """
+    Import a module repeat times and summarise.
+
+    Returns:
+        Median total milliseconds, the slowest packages by median self time, and the
+        heavy packages it loaded.
+    """
+    runs = [import_once(module) for _ in range(repeat)]
+    packages = {
+        package: statistics.median(run["packages"].get(package, 0) for run in runs)
+        for package in runs[0]["packages"]
+    }
+    slowest = sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+    return {
+        "module": module,
+        "median_ms": round(statistics.median(run["total_us"] for run in runs) / 1000, 1),
+        "slowest": {package: round(us / 1000, 1) for package, us in slowest},
+        "heavy": [package for package in HEAVY if package in packages],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cold import time of the API and core modules")
+    parser.add_argument("--module", action="append", help="Dotted module to import (repeatable)")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh-interpreter imports per module, median is used")
+    parser.add_argument("--top", type=int, default=5, help="Slowest packages to list per module")
+    parser.add_argument("--budget-ms", type=float, help="Fail if any module's median import exceeds this")
+    parser.add_argument("--output", type=Path, help="Write full results as JSON")
+    args = parser.parse_args()
+
+    results = []
+    for module in args.module or DEFAULT_MODULES:
+        print(f"Importing {module}...")
+        try:
+            results.append(benchmark_module(module, args.repeat, args.top))
+        except RuntimeError as e:
+            # A missing optional package should not stop the other modules
+            print(f"  skipped: {e}")
+
+    print("\n| Module | Import (ms) | Slowest packages (ms) | Heavy |")
+    print("|---|---|---|---|")
+    for result in results:
+        slowest = ", ".join(f"{package} {ms}" for package, ms in result["slowest"].items())
+        print(f"| {result['module']} | {result['median_ms']} | {slowest} | {', '.join(result['heavy']) or '-'} |")
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"\nResults written to {args.output}")
+
+    if args.budget_ms is not None:
+        over = [r["module"] for r in results if r["median_ms"] > args.budget_ms]
+        if over:
+            print(f"\nOver the {args.budget_ms}ms budget: {', '.join(over)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+"""
+benchmarks.load_test
+
+Concurrent load generator for the REST API: how many onboarding sessions can one
+instance sustain?
+
+Each virtual candidate runs a full session (POST /session/start, one /turn per field with
+the recorded clips in tests/audio, then /confirm), pausing for a think time between
+requests like a person listening and answering. Candidates arrive as a Poisson process at
+--arrival-rate sessions per second (or all at once without it). A 429/503 with
+Retry-After is retried after that delay, like the frontend does, and counted as a
+rejection.
+
+Reports per-endpoint latency percentiles and error rates, completed sessions per second,
+and a timeline of completions, requests, errors and p95 latency per --interval.
+
+With --local, an API instance is started in-process with the simulated engines
+(SIMULATED_PROFILES in config.py), so the serving path itself is load tested without
+provider cost or rate limits. Otherwise --url points at a running instance.
+
+Usage (from the repo root):
+    python benchmarks/load_test.py --local --profile cloud --candidates 50 --arrival-rate 2 --think-time 1
+    python benchmarks/load_test.py --url http://localhost:8000 --candidates 20 --output load.json
+    python benchmarks/load_test.py --local --candidates 50 --arrival-rate 2 --seed 1 --save cloud-50
+"""
+
+import sys
+import time
+import random
+import asyncio
+import argparse
+import threading
+from pathlib import Path
+
+import httpx
+
+ROOT = Path(__file__).parent.parent
+AUDIO_DIR = ROOT / "tests" / "audio"
+# Same fixtures as tests/integration/test_api_sess.py, one per onboarding field
+TURN_CLIPS = ["name.wav", "employment.wav", "skills.wav", "education.wav", "experience.wav", "job_prefs.wav"]
+CONFIRM_CLIP = "confirm.wav"
+MAX_RETRIES = 3
+
+from stats import percentiles  # noqa: E402
+import results  # noqa: E402
+
+
+def load_fixtures() -> tuple[list[bytes], bytes]:
+    """
+    Read the turn clips and the confirmation clip from tests/audio.
+    Missing clips are replaced by a generated noise clip that passes the energy gate.
+
+    Returns:
+        (one WAV per turn, confirmation WAV).
+    """
+    missing = [name for name in TURN_CLIPS + [CONFIRM_CLIP] if not (AUDIO_DIR / name).exists()]
+    fallback = None
+    if missing:
+        import io
+        import numpy as np
+        import soundfile as sf
+        print(f"Using a generated clip for missing fixtures in {AUDIO_DIR}: {', '.join(missing)}")
+        buf = io.BytesIO()
+        clip = (np.random.default_rng(0).standard_normal(5 * 16000) * 0.05).astype(np.float32)
+        sf.write(buf, clip, 16000, format="WAV")
+        fallback = buf.getvalue()
+
+    def read(name: str) -> bytes:
+        path = AUDIO_DIR / name
+        return path.read_bytes() if path.exists() else fallback
+
+    return [read(name) for name in TURN_CLIPS], read(CONFIRM_CLIP)
+
+
+class Stats:
+    """Request and session outcomes, with completion times relative to the run start."""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.requests: list[dict] = []
+        self.sessions: list[dict] = []
+
+    def request(self, endpoint: str, seconds: float, status: int):
+        self.requests.append({"endpoint": endpoint, "seconds": seconds, "status": status, "at": time.perf_counter() - self.start})
+
+    def session(self, completed: bool):
+        self.sessions.append({"completed": completed, "at": time.perf_counter() - self.start})
+
+
+async def post(client: httpx.AsyncClient, stats: Stats, endpoint: str, path: str, audio: bytes | None = None) -> httpx.Response | None:
+    """
+    POST once, retrying 429/503 after Retry-After up to MAX_RETRIES times.
+
+    Returns:
+        The 200 response, or None if the request failed.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        files = {"audio": ("audio.wav", audio, "audio/wav")} if audio is not None else None
+        t = time.perf_counter()
+        try:
+            response = await client.post(path, files=files)
+            status = response.status_code
+        except httpx.HTTPError:
+            response, status = None, 0
+        stats.request(endpoint, time.perf_counter() - t, status)
+        if status == 200:
+            return response
+        if status in (429, 503) and attempt < MAX_RETRIES:
+            await asyncio.sleep(float(response.headers.get("Retry-After", 1)))
+            continue
+        return None
+
+
+async def candidate(client: httpx.AsyncClient, stats: Stats, delay: float, think_time: float, turns: list[bytes], confirm: bytes):
+    """One virtual candidate: arrive after delay, then run a full session with think time between requests."""
+    await asyncio.sleep(delay)
+
+    async def think():
+        if think_time:
+            await asyncio.sleep(random.uniform(0.5, 1.5) * think_time)
+
+    response = await post(client, stats, "start", "/session/start")
+    if response is None:
+        stats.session(completed=False)
+        return
+    session_id = response.headers["X-Session-ID"]
+    for clip in turns:
+        await think()
+        if await post(client, stats, "turn", f"/session/{session_id}/turn", clip) is None:
+            await client.delete(f"/session/{session_id}")
+            stats.session(completed=False)
+            return
+    await think()
+    stats.session(completed=await post(client, stats, "confirm", f"/session/{session_id}/confirm", confirm) is not None)
+
+
+async def run(url: str, candidates: int, arrival_rate: float | None, think_time: float, timeout: float) -> Stats:
+    """Run every candidate against url and return the collected stats."""
+    turns, confirm = load_fixtures()
+    delays, t = [], 0.0
+    for _ in range(candidates):
+        delays.append(t)
+        if arrival_rate:
+            t += random.expovariate(arrival_rate)
+
+    stats = Stats()
+    limits = httpx.Limits(max_connections=candidates, max_keepalive_connections=candidates)
+    async with httpx.AsyncClient(base_url=url, timeout=timeout, limits=limits) as client:
+        await asyncio.gather(*(candidate(client, stats, delay, think_time, turns, confirm) for delay in delays))
+    return stats
+
+
+def start_local_server(profile: str, time_scale: float, port: int) -> str:
+    """
+    Serve the API in a background thread with simulated engines, kept offline like the
+    pipeline benchmark. The lifespan (engine warm-up) is off since no real engines are used.
+
+    Returns:
+        Base URL of the server.
+    """
+    import uvicorn
+    from pipeline_benchmark import offline_pipeline
+    from core.engines import simulation
+    from core.engines.stt.simulated_stt import SimulatedSTTEngine
+    from core.engines.llm.simulated_llm import SimulatedLLMEngine
+    from core.engines.tts.simulated_tts import SimulatedTTSEngine
+    import api.main
+
+    simulation.set_time_scale(time_scale)
+    engines = {"stt": SimulatedSTTEngine(profile), "llm": SimulatedLLMEngine(profile), "tts": SimulatedTTSEngine(profile)}
+    api.main.create_pipeline = lambda: offline_pipeline(**engines)
+
+    server = uvicorn.Server(uvicorn.Config(api.main.app, port=port, lifespan="off", log_level="warning"))
+    threading.Thread(target=server.run, name="load-test-api", daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return f"http://127.0.0.1:{port}"
+
+
+def summarise(stats: Stats, interval: float) -> dict:
+    """Per-endpoint latency and error rates, session throughput and the timeline."""
+    elapsed = max([r["at"] for r in stats.requests] + [0.0])
+    endpoints = {}
+    for endpoint in ("start", "turn", "confirm"):
+        rows = [r for r in stats.requests if r["endpoint"] == endpoint]
+        if not rows:
+            continue
+        errors: dict[str, int] = {}
+        for r in rows:
+            if r["status"] != 200:
+                key = str(r["status"] or "connection")
+                errors[key] = errors.get(key, 0) + 1
+        endpoints[endpoint] = {
+            "requests": len(rows),
+            "latency_ms": percentiles([r["seconds"] for r in rows if r["status"] == 200]),
+            "error_rate": round(sum(errors.values()) / len(rows), 4),
+            "errors": errors,
+        }
+
+    timeline = []
+    for i in range(int(elapsed // interval) + 1):
+        lo, hi = i * interval, (i + 1) * interval
+        rows = [r for r in stats.requests if lo <= r["at"] < hi]
+        completed = sum(1 for s in stats.sessions if s["completed"] and lo <= s["at"] < hi)
+        timeline.append({
+            "start_seconds": lo,
+            "sessions_per_second": round(completed / interval, 3),
+            "requests": len(rows),
+            "errors": sum(1 for r in rows if r["status"] != 200),
+            "p95_ms": percentiles([r["seconds"] for r in rows if r["status"] == 200]).get("p95"),
+        })
+
+    completed = sum(1 for s in stats.sessions if s["completed"])
+    return {
+        "elapsed_seconds": round(elapsed, 2),
+        "sessions": {"started": len(stats.sessions), "completed": completed},
+        "sessions_per_second": round(completed / elapsed, 3) if elapsed else None,
+        "endpoints": endpoints,
+        "timeline": timeline,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the onboarding API with concurrent virtual candidates")
+    parser.add_argument("--url", default="http://localhost:8000", help="Base URL of a running API instance")
+    parser.add_argument("--local", action="store_true", help="Start an in-process API backed by simulated engines")
+    parser.add_argument("--profile", default="cloud", help="Simulated latency profile for --local")
+    parser.add_argument("--time-scale", type=float, default=1.0, help="Multiplier on simulated waits for --local")
+    parser.add_argument("--port", type=int, default=8765, help="Port for --local")
+    parser.add_argument("--candidates", type=int, default=20, help="Virtual candidates (sessions) to run")
+    parser.add_argument("--arrival-rate", type=float, help="Poisson arrivals per second; all start at once if omitted")
+    parser.add_argument("--think-time", type=float, default=2.0, help="Mean seconds between a response and the next request")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Per-request timeout in seconds")
+    parser.add_argument("--interval", type=float, default=10.0, help="Timeline bucket in seconds")
+    parser.add_argument("--seed", type=int, help="Seed arrivals and think times")
+    parser.add_argument("--output", type=Path, help="Write results as JSON (format in results.py)")
+    parser.add_argument("--save", nargs="?", const="", metavar="LABEL", help="Store results as a baseline for compare.py")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    url = args.url
+    if args.local:
+        sys.path.insert(0, str(ROOT / "src"))
+        sys.path.insert(0, str(ROOT / "src" / "app"))
+        url = start_local_server(args.profile, args.time_scale, args.port)
+
+    print(f"Running {args.candidates} candidates against {url}...")
+    stats = asyncio.run(run(url, args.candidates, args.arrival_rate, args.think_time, args.timeout))
+    result = summarise(stats, args.interval)
+    result.update(url=url, candidates=args.candidates, arrival_rate=args.arrival_rate, think_time=args.think_time)
+
+    print("\n| Endpoint | Requests | p50 / p95 / p99 (ms) | Error rate | Errors |")
+    print("|---|---|---|---|---|")
+    for endpoint, row in result["endpoints"].items():
+        latency = row["latency_ms"]
+        print(
+            f"| {endpoint} | {row['requests']} | {latency.get('p50')} / {latency.get('p95')} / {latency.get('p99')} "
+            f"| {row['error_rate']:.1%} | {row['errors'] or '-'} |"
+        )
+    print(f"\nSessions: {result['sessions']['completed']}/{result['sessions']['started']} completed, "
+          f"{result['sessions_per_second']} sessions/s")
+
+    print("\n| From (s) | Sessions/s | Requests | Errors | p95 (ms) |")
+    print("|---|---|---|---|---|")
+    for row in result["timeline"]:
+        print(f"| {row['start_seconds']:g} | {row['sessions_per_second']} | {row['requests']} | {row['errors']} | {row['p95_ms']} |")
+
+    if args.output or args.save is not None:
+        stages = {
+            endpoint: {"count": row["requests"], "error_rate": row["error_rate"], **row["latency_ms"]}
+            for endpoint, row in result["endpoints"].items()
+        }
+        throughput = {"sessions_per_second": result["sessions_per_second"]}
+        # Peak memory is only the server's when it runs in this process
+        document = results.build("load", vars(args), stages, throughput, result, label=args.save or None, memory=args.local)
+        results.write(document, args.output, args.save)
+
+
+if __name__ == "__main__":
+    main()
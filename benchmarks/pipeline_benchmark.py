@@ -0,0 +1,293 @@
+"""
+benchmarks.pipeline_benchmark
+
+Measures the voice agent's own overhead, independent of provider variance.
+
+Runs full onboarding sessions (opening, one turn per field, confirmation through the API)
+with the simulated STT/LLM/TTS engines, whose latency, jitter and failure rate come from
+SIMULATED_PROFILES in config.py (fitted to the stage timings in docs/test-results). Every
+simulated provider wait is recorded, so per turn:
+
+    overhead = wall time - simulated provider time
+
+covering the call policy, rate limiters, degradation controller, history handling, file
+I/O and, with --target api, request parsing, audio decoding and the response.
+
+Targets:
+    pipeline  OnboardingPipeline._run_turn() directly, --concurrency sessions at once
+    api       The FastAPI app in-process via TestClient, one request at a time so each
+              request's provider time can be attributed to it
+
+With --cassette, sessions replay a cassette recorded from live providers (see
+core.engines.cassette) instead of the simulated profiles: the same responses with their
+recorded timings, scaled by --time-scale, so a pipeline change can be compared end to end
+against exactly the provider behaviour of the recording.
+
+Reports turn latency and overhead percentiles, simulated provider time per stage,
+throughput (turns and sessions per second), errors and degradations. Degradation budgets
+and call-policy timeout bounds are in real seconds, so with --time-scale below 1 they
+fire correspondingly less often.
+
+Usage (from the repo root):
+    python benchmarks/pipeline_benchmark.py
+    python benchmarks/pipeline_benchmark.py --profile cloud --time-scale 0.1 --sessions 50 --concurrency 8 --seed 1
+    python benchmarks/pipeline_benchmark.py --target api --profile zero --sessions 20 --output api.json
+    python benchmarks/pipeline_benchmark.py --cassette cassettes/session.jsonl.gz --time-scale 1 --sessions 10
+    python benchmarks/pipeline_benchmark.py --profile cloud --seed 1 --save cloud
+"""
+
+import io
+import sys
+import time
+import argparse
+import threading
+import numpy as np
+import soundfile as sf
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT / "src" / "app"))
+
+from stats import percentiles  # noqa: E402
+import results  # noqa: E402
+from core.pipeline import OnboardingPipeline  # noqa: E402
+from core.degradation import DegradationController, degradation_metrics, stage_worker_metrics  # noqa: E402
+from core.engines.call_policy import turn_deadline  # noqa: E402
+from core.engines import simulation  # noqa: E402
+from core.engines.stt.simulated_stt import SimulatedSTTEngine  # noqa: E402
+from core.engines.llm.simulated_llm import SimulatedLLMEngine  # noqa: E402
+from core.engines.tts.simulated_tts import SimulatedTTSEngine  # noqa: E402
+from core.engines.stt.cassette_stt import CassetteSTTEngine  # noqa: E402
+from core.engines.llm.cassette_llm import CassetteLLMEngine  # noqa: E402
+from core.engines.tts.cassette_tts import CassetteTTSEngine  # noqa: E402
+from core.engines.cassette import REPLAY  # noqa: E402
+from config import (  # noqa: E402
+    SYSTEM_PROMPT,
+    ONBOARDING_FIELDS,
+    RECORDING_DURATION,
+    AUDIO_SAMPLE_RATE,
+    ENERGY_THRESHOLD,
+    SIMULATED_PROFILE,
+)
+
+STAGES = ("stt", "llm", "tts")
+
+
+def speech_clip() -> np.ndarray:
+    """RECORDING_DURATION seconds of low-level noise, loud enough to pass the energy gate."""
+    rng = np.random.default_rng(0)
+    return (rng.standard_normal(int(RECORDING_DURATION * AUDIO_SAMPLE_RATE)) * 0.05).astype(np.float32)
+
+
+def offline_pipeline(stt, llm, tts) -> OnboardingPipeline:
+    """
+    Build a pipeline that never leaves the process: playback is skipped and the degraded
+    TTS path reuses the simulated engine instead of loading gTTS.
+    """
+    pipeline = OnboardingPipeline(
+        stt=stt,
+        llm=llm,
+        tts=tts,
+        system_prompt=SYSTEM_PROMPT,
+        onboarding_fields=ONBOARDING_FIELDS,
+        recording_duration=RECORDING_DURATION,
+        sample_rate=AUDIO_SAMPLE_RATE,
+        energy_threshold=ENERGY_THRESHOLD,
+    )
+    pipeline.degradation = DegradationController(tts, fallback_tts=tts)
+    pipeline.play_audio = lambda filepath: None
+    return pipeline
+
+
+class Recorder:
+    """Thread-safe collection of per-turn samples."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.turns: list[dict] = []
+        self.errors: dict[str, int] = {}
+        self.failures: dict[str, int] = {}
+
+    def turn(self, kind: str, wall: float, provider: dict[str, float]):
+        with self._lock:
+            self.turns.append({"kind": kind, "wall": wall, "provider": provider})
+
+    def error(self, kind: str, cause: str):
+        with self._lock:
+            key = f"{kind}: {cause}"
+            self.errors[key] = self.errors.get(key, 0) + 1
+            self.failures[kind] = self.failures.get(kind, 0) + 1
+
+
+def by_stage(entries: list[tuple[str, float]]) -> dict[str, float]:
+    totals = dict.fromkeys(STAGES, 0.0)
+    for stage, seconds in entries:
+        totals[stage] += seconds
+    return totals
+
+
+def run_pipeline_session(engines: dict, audio: np.ndarray, recorder: Recorder):
+    """Run the opening and every field turn of one session through OnboardingPipeline."""
+    pipeline = offline_pipeline(**engines)
+    with simulation.ledger() as entries:
+        t = time.perf_counter()
+        _, opening_path = pipeline.get_opening()
+        pipeline.cleanup_file(opening_path)
+        recorder.turn("opening", time.perf_counter() - t, by_stage(entries))
+
+    for turn, field in enumerate(ONBOARDING_FIELDS):
+        with simulation.ledger() as entries:
+            t = time.perf_counter()
+            try:
+                with turn_deadline():
+                    pipeline._run_turn(turn, field, audio, None)
+            except Exception as e:
+                recorder.error("turn", type(e).__name__)
+                continue
+            recorder.turn("turn", time.perf_counter() - t, by_stage(entries))
+
+
+def run_api_session(client, upload: bytes, recorder: Recorder):
+    """Run start, every field turn and the confirmation of one session against the API."""
+
+    def request(kind: str, path: str, files: dict | None = None):
+        before = simulation.simulation_totals()
+        t = time.perf_counter()
+        response = client.post(path, files=files)
+        wall = time.perf_counter() - t
+        after = simulation.simulation_totals()
+        if response.status_code != 200:
+            recorder.error(kind, f"HTTP {response.status_code}")
+            return None
+        provider = {
+            stage: after.get(stage, {}).get("seconds", 0.0) - before.get(stage, {}).get("seconds", 0.0)
+            for stage in STAGES
+        }
+        recorder.turn(kind, wall, provider)
+        return response
+
+    def audio():
+        return {"audio": ("audio.wav", io.BytesIO(upload), "audio/wav")}
+
+    response = request("opening", "/session/start")
+    if response is None:
+        return
+    session_id = response.headers["X-Session-ID"]
+    for _ in ONBOARDING_FIELDS:
+        request("turn", f"/session/{session_id}/turn", audio())
+    request("confirm", f"/session/{session_id}/confirm", audio())
+    client.delete(f"/session/{session_id}")
+
+
+def summarise(recorder: Recorder, elapsed: float, sessions: int) -> dict:
+    """Turn recorded samples into latency, overhead, provider time and throughput figures."""
+    result = {"elapsed_seconds": round(elapsed, 2), "sessions": sessions, "kinds": {}}
+    # Kinds whose every request failed still get a row, with an error rate and no latencies
+    for kind in sorted({turn["kind"] for turn in recorder.turns} | set(recorder.failures)):
+        turns = [turn for turn in recorder.turns if turn["kind"] == kind]
+        failed = recorder.failures.get(kind, 0)
+        result["kinds"][kind] = {
+            "count": len(turns),
+            "errors": failed,
+            "error_rate": round(failed / (len(turns) + failed), 4),
+            "latency_ms": percentiles([turn["wall"] for turn in turns]),
+            "overhead_ms": percentiles([turn["wall"] - sum(turn["provider"].values()) for turn in turns]),
+            "provider_ms": {
+                stage: percentiles([turn["provider"][stage] for turn in turns])
+                for stage in STAGES
+                if any(turn["provider"][stage] for turn in turns)
+            },
+        }
+    turns = sum(1 for turn in recorder.turns if turn["kind"] != "opening")
+    result["throughput"] = {
+        "turns_per_second": round(turns / elapsed, 2) if elapsed else None,
+        "sessions_per_second": round(sessions / elapsed, 3) if elapsed else None,
+    }
+    result["errors"] = dict(recorder.errors)
+    result["degradations"] = degradation_metrics()
+    result["stage_workers"] = stage_worker_metrics()
+    result["simulated"] = simulation.simulation_totals()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pipeline overhead with simulated providers")
+    parser.add_argument("--target", choices=["pipeline", "api"], default="pipeline")
+    parser.add_argument("--profile", default=SIMULATED_PROFILE, help="Latency profile from SIMULATED_PROFILES")
+    parser.add_argument("--sessions", type=int, default=10, help="Full onboarding sessions to run")
+    parser.add_argument("--concurrency", type=int, default=1, help="Sessions run at once (pipeline target)")
+    parser.add_argument("--time-scale", type=float, default=0.1, help="Multiplier on every simulated wait")
+    parser.add_argument("--seed", type=int, help="Seed the latency draws for a repeatable run")
+    parser.add_argument("--cassette", type=Path, help="Replay this recorded cassette instead of the simulated profile")
+    parser.add_argument("--output", type=Path, help="Write results as JSON (format in results.py)")
+    parser.add_argument("--save", nargs="?", const="", metavar="LABEL", help="Store results as a baseline for compare.py")
+    args = parser.parse_args()
+
+    simulation.seed(args.seed)
+    simulation.set_time_scale(args.time_scale)
+    if args.cassette:
+        replay = {"mode": REPLAY, "path": str(args.cassette), "time_scale": args.time_scale}
+        engines = {"stt": CassetteSTTEngine(**replay), "llm": CassetteLLMEngine(**replay), "tts": CassetteTTSEngine(**replay)}
+    else:
+        engines = {
+            "stt": SimulatedSTTEngine(args.profile),
+            "llm": SimulatedLLMEngine(args.profile),
+            "tts": SimulatedTTSEngine(args.profile),
+        }
+    source = f"cassette {args.cassette}" if args.cassette else f"{args.profile} profile"
+    recorder = Recorder()
+    audio = speech_clip()
+
+    print(f"Running {args.sessions} sessions against the {args.target} ({source}, time scale {args.time_scale})...")
+    t = time.perf_counter()
+    if args.target == "pipeline":
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            for future in [pool.submit(run_pipeline_session, engines, audio, recorder) for _ in range(args.sessions)]:
+                future.result()
+    else:
+        from fastapi.testclient import TestClient
+        import api.main
+
+        # Sessions get the simulated engines, kept offline the same way as the pipeline target
+        api.main.create_pipeline = lambda: offline_pipeline(**engines)
+        buf = io.BytesIO()
+        sf.write(buf, audio, AUDIO_SAMPLE_RATE, format="WAV")
+        client = TestClient(api.main.app)
+        for _ in range(args.sessions):
+            run_api_session(client, buf.getvalue(), recorder)
+    result = summarise(recorder, time.perf_counter() - t, args.sessions)
+    result.update(target=args.target, source=source, time_scale=args.time_scale, concurrency=args.concurrency)
+
+    print("\n| Request | Count | Errors | Latency p50 / p95 / p99 (ms) | Overhead p50 / p95 / p99 (ms) |")
+    print("|---|---|---|---|---|")
+    for kind, row in result["kinds"].items():
+        latency, overhead = row["latency_ms"], row["overhead_ms"]
+        print(
+            f"| {kind} | {row['count']} | {row['error_rate']:.1%} "
+            f"| {latency.get('p50')} / {latency.get('p95')} / {latency.get('p99')} "
+            f"| {overhead.get('p50')} / {overhead.get('p95')} / {overhead.get('p99')} |"
+        )
+    throughput = result["throughput"]
+    print(f"\nThroughput: {throughput['turns_per_second']} turns/s, {throughput['sessions_per_second']} sessions/s")
+    if result["errors"]:
+        print(f"Errors: {result['errors']}")
+    if result["degradations"]:
+        print(f"Degradations: {result['degradations']}")
+    if result["stage_workers"]["queued"]:
+        print(f"Stage worker waits: {result['stage_workers']}")
+
+    if args.output or args.save is not None:
+        stages = {}
+        for kind, row in result["kinds"].items():
+            stages[kind] = {"count": row["count"] + row["errors"], "error_rate": row["error_rate"], **row["latency_ms"]}
+            stages[f"{kind}.overhead"] = {"count": row["count"], **row["overhead_ms"]}
+            for stage, provider in row["provider_ms"].items():
+                stages[f"{kind}.{stage}"] = {"count": row["count"], **provider}
+        document = results.build("pipeline", vars(args), stages, result["throughput"], result, label=args.save or None)
+        results.write(document, args.output, args.save)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""
+benchmarks.results
+
+Machine-readable benchmark results and the baseline store.
+
+Benchmarks that support --output/--save write one JSON document per run:
+
+    {
+      "schema": 1,
+      "benchmark": "pipeline",
+      "label": "cloud-8x",
+      "created": "2026-04-20T14:03:11+00:00",
+      "parameters": {...},                         # the benchmark's CLI arguments
+      "environment": {...},                        # see environment()
+      "stages": {"turn": {"count": 60, "error_rate": 0.0, "p50": ..., "p95": ..., "p99": ..., "max": ...}, ...},
+      "throughput": {"turns_per_second": ..., ...},
+      "memory": {"peak_rss_mb": ...},
+      "details": {...}                             # the benchmark's own full results
+    }
+
+Stage latencies are in milliseconds; count is every request made for the stage and
+error_rate the fraction that failed, so a stage whose requests all failed has a count and
+error rate but no percentiles. Runs are stored in STORE as
+<date>-<benchmark>[-<label>].json; compare.py diffs a run against one of them.
+"""
+
+import os
+import sys
+import json
+import platform
+import subprocess
+from pathlib import Path
+from datetime import datetime, timezone
+
+ROOT = Path(__file__).parent.parent
+STORE = ROOT / "docs" / "test-results" / "test-data" / "benchmarks"
+SCHEMA = 1
+
+# Packages whose versions change performance enough to note in the fingerprint
+PACKAGES = ["openai", "httpx", "fastapi", "uvicorn", "numpy", "torch", "openai-whisper", "faster-whisper", "piper-tts"]
+
+
+def _git(*args: str) -> str | None:
+    try:
+        result = subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def environment() -> dict:
+    """
+    Fingerprint the machine and code a run was measured on, so a comparison can warn
+    when a baseline came from somewhere else.
+
+    Returns:
+        Python version, OS, CPU architecture and count, total memory, git commit and
+        whether the tree was dirty, and the installed versions of PACKAGES.
+    """
+    from importlib import metadata
+
+    try:
+        memory_gb = round(os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") / 1024 ** 3, 1)
+    except (AttributeError, ValueError, OSError):
+        memory_gb = None
+    versions = {}
+    for package in PACKAGES:
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            continue
+    status = _git("status", "--porcelain", "--untracked-files=no")
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "memory_gb": memory_gb,
+        "git_commit": _git("rev-parse", "--short", "HEAD"),
+        "git_dirty": bool(status) if status is not None else None,
+        "packages": versions,
+    }
+
+
+def peak_memory_mb() -> float | None:
+    """Return this process's peak resident memory in MB, or None where it cannot be read (Windows)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return round(peak / (1024 ** 2 if sys.platform == "darwin" else 1024), 1)
+
+
+def build(
+    benchmark: str,
+    parameters: dict,
+    stages: dict[str, dict],
+    throughput: dict,
+    details: dict,
+    label: str | None = None,
+    memory: bool = True,
+) -> dict:
+    """
+    Assemble a result document.
+
+    Args:
+        benchmark: Benchmark name; runs are only compared against the same benchmark.
+        parameters: The run's settings, e.g. vars() of the parsed CLI arguments; output
+                    and save are dropped since they do not affect the measurement.
+        stages: Percentiles in milliseconds per stage, from stats.percentiles(), plus a count
+                and, where the benchmark makes requests that can fail, an error_rate.
+        throughput: Rates such as turns or sessions per second.
+        details: The benchmark's full results.
+        label: Optional short name for the run, used in the stored filename.
+        memory: False when this process's memory says nothing about the system under test,
+                e.g. a load test against a remote server.
+    """
+    return {
+        "schema": SCHEMA,
+        "benchmark": benchmark,
+        "label": label,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "parameters": {k: str(v) if isinstance(v, Path) else v for k, v in parameters.items() if k not in ("output", "save")},
+        "environment": environment(),
+        "stages": stages,
+        "throughput": throughput,
+        "memory": {"peak_rss_mb": peak_memory_mb() if memory else None},
+        "details": details,
+    }
+
+
+def write(result: dict, output: Path | None = None, save: str | None = None):
+    """
+    Write a result to --output and/or the store (--save, whose value is an optional label).
+    """
+    if output:
+        output.write_text(json.dumps(result, indent=2))
+        print(f"\nResults written to {output}")
+    if save is not None:
+        label = save or result.get("label")
+        if label:
+            result["label"] = label
+        date = result["created"][:10]
+        path = STORE / f"{date}-{result['benchmark']}{'-' + label if label else ''}.json"
+        STORE.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(result, indent=2))
+        print(f"Results stored as {path.relative_to(ROOT)}")
+
+
+def load(path: Path) -> dict:
+    """
+    Read a result document.
+
+    Raises:
+        RuntimeError: If the file is not a result in this format.
+    """
+    result = json.loads(Path(path).read_text())
+    if not isinstance(result, dict) or result.get("schema") != SCHEMA:
+        raise RuntimeError(f"{path} is not a schema {SCHEMA} benchmark result")
+    return result
+
+
+def latest(benchmark: str, exclude: Path | None = None) -> Path | None:
+    """Return the most recently created stored run of a benchmark, or None if there is none."""
+    runs = []
+    for path in STORE.glob(f"*-{benchmark}*.json"):
+        if exclude is not None and path.resolve() == Path(exclude).resolve():
+            continue
+        try:
+            result = load(path)
+        except (RuntimeError, ValueError):
+            continue
+        if result["benchmark"] == benchmark:
+            runs.append((result["created"], path))
+    return max(runs)[1] if runs else None
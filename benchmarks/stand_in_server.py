@@ -0,0 +1,224 @@
+"""
+benchmarks.stand_in_server
+
+Local OpenAI-compatible stand-in for performance testing the real engine code paths.
+
+The simulated engines (core.engines.simulation) skip the SDK, HTTP client and response
+parsing entirely. This server instead answers the three OpenAI endpoints the cloud engines
+call, so OpenAILLMEngine, GroqLLMEngine, OpenRouterLLMEngine, WhisperAPIEngine and
+OpenAITTSEngine run unchanged, connection pooling and all, against a provider with known
+behaviour:
+
+    POST /v1/chat/completions      scripted onboarding responses (simulated_llm), streamed
+                                   as SSE chunks when "stream": true
+    POST /v1/audio/transcriptions  SIMULATED_ANSWERS in turn, then a confirmation, as
+                                   json, text or verbose_json with segment statistics
+    POST /v1/audio/speech          speech-length silence in the requested response_format
+                                   (mp3 by default, as at OpenAI)
+
+Speech is encoded with libsndfile: mp3, opus and flac as requested, and WAV for wav and pcm.
+aac, and any format the installed libsndfile cannot write (MP3 needs 1.1 or later), falls
+back to WAV with an audio/wav content type, so the body always matches its header.
+
+Latency comes from the same SIMULATED_PROFILES as the simulated engines. For streamed
+chat, the profile's fixed latency is the time to first token and the per-character cost
+is spread over the chunks. --error-rate injects --error-status responses (429 carries a
+Retry-After header), which the engines' call policies retry like real provider errors.
+Waits are async, so concurrent requests overlap as they would at a provider.
+
+Point the engines at it with STAND_IN_BASE_URL in config.py.
+
+Usage (from the repo root):
+    python benchmarks/stand_in_server.py --port 8900
+    python benchmarks/stand_in_server.py --profile groq --time-scale 0.5 --error-rate 0.05 --error-status 429
+"""
+
+import io
+import sys
+import json
+import time
+import uuid
+import random
+import asyncio
+import argparse
+import itertools
+import threading
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+from fastapi import FastAPI, Form, Request, UploadFile
+from fastapi.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT / "src" / "app"))
+
+from core.engines.simulation import latency_model  # noqa: E402
+from core.engines.llm.simulated_llm import scripted_response  # noqa: E402
+from core.engines.tts.simulated_tts import SAMPLE_RATE, SPEECH_SECONDS_PER_CHAR  # noqa: E402
+from config import SIMULATED_PROFILE, SIMULATED_ANSWERS  # noqa: E402
+
+CONFIRMATION = "Yes, everything looks correct."
+# Segment statistics of a clean transcription, inside the hallucination filter's limits
+SEGMENT_STATS = {"avg_logprob": -0.25, "compression_ratio": 1.3, "no_speech_prob": 0.02, "temperature": 0.0}
+# Speech response_format -> (libsndfile format, subtype, media type); pcm is served as WAV
+SPEECH_FORMATS = {
+    "mp3": ("MP3", None, "audio/mpeg"),
+    "opus": ("OGG", "OPUS", "audio/opus"),
+    "flac": ("FLAC", None, "audio/flac"),
+    "wav": ("WAV", None, "audio/wav"),
+    "pcm": ("WAV", None, "audio/wav"),
+}
+
+
+def encode_silence(seconds: float, response_format: str) -> tuple[bytes, str]:
+    """Return silence of the given length in response_format, and its media type."""
+    audio_format, subtype, media_type = SPEECH_FORMATS.get(response_format, SPEECH_FORMATS["wav"])
+    if audio_format not in sf.available_formats():
+        audio_format, subtype, media_type = SPEECH_FORMATS["wav"]
+    buf = io.BytesIO()
+    sf.write(buf, np.zeros(int(seconds * SAMPLE_RATE), dtype=np.int16), SAMPLE_RATE, format=audio_format, subtype=subtype)
+    return buf.getvalue(), media_type
+
+
+def create_app(
+    profile: str = SIMULATED_PROFILE,
+    time_scale: float = 1.0,
+    error_rate: float = 0.0,
+    error_status: int = 503,
+    seed: int | None = None,
+) -> FastAPI:
+    """
+    Build the stand-in app.
+
+    Args:
+        profile: Latency profile from SIMULATED_PROFILES.
+        time_scale: Multiplier on every simulated wait.
+        error_rate: Probability that a request fails with error_status instead of answering.
+        error_status: HTTP status of injected failures, e.g. 429, 500 or 503.
+        seed: Seed for the error draws.
+
+    Raises:
+        RuntimeError: If the profile is not configured.
+    """
+    models = {stage: latency_model(profile, stage) for stage in ("stt", "llm", "tts")}
+    rng = random.Random(seed)
+    lock = threading.Lock()
+    transcripts = itertools.cycle(list(SIMULATED_ANSWERS.values()) + [CONFIRMATION])
+    app = FastAPI(title="OpenAI-compatible stand-in")
+
+    def injected_error() -> JSONResponse | None:
+        with lock:
+            if rng.random() >= error_rate:
+                return None
+        headers = {"Retry-After": "1"} if error_status == 429 else None
+        body = {"error": {"message": "Injected stand-in failure", "type": "stand_in_error", "code": error_status}}
+        return JSONResponse(body, status_code=error_status, headers=headers)
+
+    async def wait(stage: str, chars: int = 0):
+        await asyncio.sleep(models[stage].sample(chars) * time_scale)
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        if (error := injected_error()) is not None:
+            return error
+        text = scripted_response(body["messages"])
+        completion_id, created, model = f"chatcmpl-{uuid.uuid4().hex}", int(time.time()), body.get("model", "stand-in")
+
+        if not body.get("stream"):
+            await wait("llm", len(text))
+            return {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": text}, "finish_reason": "stop"}],
+                "usage": {"prompt_tokens": 0, "completion_tokens": len(text.split()), "total_tokens": len(text.split())},
+            }
+
+        def chunk(delta: dict, finish_reason: str | None = None) -> str:
+            payload = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+            }
+            return f"data: {json.dumps(payload)}\n\n"
+
+        async def events():
+            await wait("llm")
+            yield chunk({"role": "assistant", "content": ""})
+            per_char = models["llm"].per_char * time_scale
+            words = text.split(" ")
+            for i, word in enumerate(words):
+                piece = word if i == len(words) - 1 else word + " "
+                await asyncio.sleep(per_char * len(piece))
+                yield chunk({"content": piece})
+            yield chunk({}, "stop")
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    @app.post("/v1/audio/transcriptions")
+    async def transcriptions(file: UploadFile, model: str = Form("whisper-1"), response_format: str = Form("json")):
+        audio = await file.read()
+        if (error := injected_error()) is not None:
+            return error
+        with lock:
+            text = next(transcripts)
+        await wait("stt")
+
+        if response_format == "text":
+            return PlainTextResponse(text)
+        if response_format != "verbose_json":
+            return {"text": text}
+        try:
+            duration = sf.info(io.BytesIO(audio)).duration
+        except Exception:
+            duration = len(text) * SPEECH_SECONDS_PER_CHAR
+        return {
+            "task": "transcribe",
+            "language": "english",
+            "duration": duration,
+            "text": text,
+            "segments": [{"id": 0, "seek": 0, "start": 0.0, "end": duration, "text": text, "tokens": [], **SEGMENT_STATS}],
+        }
+
+    @app.post("/v1/audio/speech")
+    async def speech(request: Request):
+        body = await request.json()
+        if (error := injected_error()) is not None:
+            return error
+        text = body.get("input", "")
+        await wait("tts", len(text))
+        audio, media_type = encode_silence(len(text) * SPEECH_SECONDS_PER_CHAR, body.get("response_format", "mp3"))
+        return Response(audio, media_type=media_type)
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve an OpenAI-compatible stand-in with simulated latency and errors")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--profile", default=SIMULATED_PROFILE, help="Latency profile from SIMULATED_PROFILES")
+    parser.add_argument("--time-scale", type=float, default=1.0, help="Multiplier on every simulated wait")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probability that a request fails")
+    parser.add_argument("--error-status", type=int, default=503, help="HTTP status of injected failures")
+    parser.add_argument("--seed", type=int, help="Seed the latency and error draws")
+    args = parser.parse_args()
+
+    import uvicorn
+    from core.engines import simulation
+
+    simulation.seed(args.seed)
+    app = create_app(args.profile, args.time_scale, args.error_rate, args.error_status, args.seed)
+    print(f"Stand-in serving the {args.profile} profile; set STAND_IN_BASE_URL = \"http://{args.host}:{args.port}/v1\"")
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+"""
+benchmarks.stats
+
+Summary statistics shared by the benchmark scripts.
+
+Percentiles use the app's nearest-rank rule (utils.latency.nearest_rank), so benchmark
+results, the regression gate, /health and the dashboard agree on the same samples.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "app"))
+
+from utils.latency import nearest_rank  # noqa: E402
+
+
+def percentiles(values: list[float]) -> dict:
+    """Return p50, p95, p99 and max in milliseconds for latencies in seconds, or an empty dict for no values."""
+    if not values:
+        return {}
+
+    def pct(p: float) -> float:
+        return round(nearest_rank(values, p) * 1000, 1)
+
+    return {"p50": pct(50), "p95": pct(95), "p99": pct(99), "max": round(max(values) * 1000, 1)}
@@ -0,0 +1,143 @@
+"""
+benchmarks.stt_benchmark
+
+Compares local STT engines on the recorded test audio in tests/audio/.
+
+For each engine: model load time, real-time factor (processing seconds per second of audio,
+lower is faster) and word error rate. WER is measured against tests/audio/transcripts.json
+({"name.wav": "reference text", ...}) when present, and always against the first (baseline)
+engine's transcripts so a faster engine's accuracy cost is visible without references.
+With --profile, each local Whisper engine is run once per decode profile (WHISPER_DECODE_PROFILES).
+
+Usage (from the repo root):
+    python benchmarks/stt_benchmark.py
+    python benchmarks/stt_benchmark.py --engine core.engines.stt.whisper_local.WhisperLocalEngine \
+        --engine core.engines.stt.faster_whisper_stt.FasterWhisperEngine --repeat 3 --output stt.json
+    python benchmarks/stt_benchmark.py --profile default --profile fast --profile accurate
+"""
+
+import sys
+import json
+import importlib
+import time
+import argparse
+import statistics
+import numpy as np
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "src" / "app"))
+
+from utils.audio import load_audio, WHISPER_SAMPLE_RATE  # noqa: E402
+from utils.text import word_error_rate  # noqa: E402
+
+DEFAULT_ENGINES = [
+    "core.engines.stt.whisper_local.WhisperLocalEngine",
+    "core.engines.stt.faster_whisper_stt.FasterWhisperEngine",
+]
+AUDIO_DIR = ROOT / "tests" / "audio"
+
+
+def load_clips(audio_dir: Path) -> list[tuple[str, np.ndarray, float]]:
+    """Load every WAV in the directory as (filename, 16kHz samples, duration seconds)."""
+    clips = []
+    for path in sorted(audio_dir.glob("*.wav")):
+        audio = load_audio(str(path))
+        clips.append((path.name, audio, audio.size / WHISPER_SAMPLE_RATE))
+    return clips
+
+
+def load_references(audio_dir: Path) -> dict[str, str]:
+    path = audio_dir / "transcripts.json"
+    return json.loads(path.read_text()) if path.exists() else {}
+
+
+def mean_wer(references: dict[str, str], transcripts: dict[str, str]) -> float | None:
+    """Mean WER over the clips that have a reference, or None if none do."""
+    scores = [word_error_rate(references[name], text) for name, text in transcripts.items() if name in references]
+    return round(statistics.mean(scores), 4) if scores else None
+
+
+def benchmark_engine(dotted_path: str, clips: list, repeat: int, profile: str | None = None) -> dict:
+    """
+    Load an engine, warm it up on the first clip, then time every clip repeat times.
+
+    Args:
+        dotted_path: Dotted path to the STT engine class.
+        clips: Clips from load_clips().
+        repeat: Timed runs per clip.
+        profile: Decode profile passed to the engine, or None for its default.
+
+    Returns:
+        Load time, total audio seconds, median processing seconds per clip, RTF and transcripts.
+    """
+    module_path, class_name = dotted_path.rsplit(".", 1)
+    cls = getattr(importlib.import_module(module_path), class_name)
+    t = time.perf_counter()
+    engine = cls(profile=profile) if profile else cls()
+    load_seconds = time.perf_counter() - t
+
+    engine.transcribe_array(clips[0][1], WHISPER_SAMPLE_RATE)
+
+    transcripts = {}
+    processing = 0.0
+    for name, audio, _ in clips:
+        timings = []
+        for _ in range(repeat):
+            t = time.perf_counter()
+            transcripts[name] = engine.transcribe_array(audio, WHISPER_SAMPLE_RATE)
+            timings.append(time.perf_counter() - t)
+        processing += statistics.median(timings)
+
+    audio_seconds = sum(duration for _, _, duration in clips)
+    return {
+        "engine": class_name + (f"[{profile}]" if profile else ""),
+        "load_seconds": round(load_seconds, 2),
+        "audio_seconds": round(audio_seconds, 2),
+        "processing_seconds": round(processing, 2),
+        "rtf": round(processing / audio_seconds, 4),
+        "transcripts": transcripts,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark local STT engines: RTF and WER")
+    parser.add_argument("--engine", action="append", help="Dotted engine path; first is the baseline")
+    parser.add_argument("--audio-dir", type=Path, default=AUDIO_DIR)
+    parser.add_argument("--profile", action="append", help="Decode profile to run each engine with")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per clip, median is used")
+    parser.add_argument("--output", type=Path, help="Write full results as JSON")
+    args = parser.parse_args()
+
+    clips = load_clips(args.audio_dir)
+    if not clips:
+        raise SystemExit(f"No WAV files in {args.audio_dir}. Record them with tests/audio/record_fixtures.py")
+    references = load_references(args.audio_dir)
+
+    results = []
+    for dotted_path in args.engine or DEFAULT_ENGINES:
+        for profile in args.profile or [None]:
+            print(f"Benchmarking {dotted_path} ({profile or 'default profile'}) on {len(clips)} clips...")
+            results.append(benchmark_engine(dotted_path, clips, args.repeat, profile))
+
+    baseline = results[0]["transcripts"]
+    for result in results:
+        result["wer"] = mean_wer(references, result["transcripts"])
+        result["wer_vs_baseline"] = mean_wer(baseline, result["transcripts"])
+
+    print(f"\n| Engine | Load (s) | RTF | Speed-up | WER | WER vs {results[0]['engine']} |")
+    print("|---|---|---|---|---|---|")
+    for result in results:
+        speedup = results[0]["rtf"] / result["rtf"] if result["rtf"] else float("inf")
+        print(
+            f"| {result['engine']} | {result['load_seconds']} | {result['rtf']} | {speedup:.2f}x "
+            f"| {result['wer'] if result['wer'] is not None else 'n/a'} | {result['wer_vs_baseline']} |"
+        )
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
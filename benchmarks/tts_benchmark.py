@@ -0,0 +1,127 @@
+"""
+benchmarks.tts_benchmark
+
+Compares TTS engines on the texts the agent actually speaks: the opening message, a
+typical per-field question, and the end-of-session summary (the longest utterance, whose
+TTS has been measured up to 8s with cloud engines).
+
+For each engine: load time (including any voice preload), time to first audio (first
+piece from synthesize_stream; the whole utterance for non-streaming engines), total
+synthesis time, and real-time factor (synthesis seconds per second of speech).
+
+Usage (from the repo root):
+    python benchmarks/tts_benchmark.py
+    python benchmarks/tts_benchmark.py --engine core.engines.tts.piper_tts.PiperTTSEngine --repeat 5 --output tts.json
+"""
+
+import sys
+import json
+import time
+import argparse
+import statistics
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "src" / "app"))
+
+from core.pipeline import load_engine  # noqa: E402
+from config import OPENING_TEXT, FIELD_QUESTIONS  # noqa: E402
+
+DEFAULT_ENGINES = [
+    "core.engines.tts.gtts_tts.GTTSEngine",
+    "core.engines.tts.openai_tts.OpenAITTSEngine",
+    "core.engines.tts.piper_tts.PiperTTSEngine",
+]
+
+SUMMARY_TEXT = (
+    "Thank you, Jane. Here is a summary of what you shared. Your full name is Jane Doe. "
+    "You are currently a full-time student. Your skills include Python, SQL, data analysis "
+    "and customer service. You are completing an Ontario College Diploma in Computer Programming. "
+    "You completed a four-month co-op placement as a junior data analyst at a logistics company. "
+    "You are interested in data analytics or software development roles, ideally hybrid in Toronto. "
+    "Does everything look correct?"
+)
+
+TEXTS = {
+    "opening": OPENING_TEXT,
+    "question": FIELD_QUESTIONS["experience"],
+    "summary": SUMMARY_TEXT,
+}
+
+
+def time_utterance(engine, text: str) -> dict:
+    """Synthesise one text through synthesize_stream and time the first piece and the whole."""
+    t = time.perf_counter()
+    first = None
+    samples = 0
+    sample_rate = 1
+    for audio, sample_rate in engine.synthesize_stream(text):
+        if first is None:
+            first = time.perf_counter() - t
+        samples += len(audio)
+    total = time.perf_counter() - t
+    return {"first_audio": first, "total": total, "audio_seconds": samples / sample_rate}
+
+
+def benchmark_engine(dotted_path: str, repeat: int) -> dict:
+    """
+    Load an engine, warm it up once, then time every text repeat times.
+
+    Returns:
+        Load time and, per text, median first-audio and total seconds, audio length and RTF.
+    """
+    t = time.perf_counter()
+    engine = load_engine(dotted_path)
+    load_seconds = time.perf_counter() - t
+    time_utterance(engine, "Hello.")
+
+    texts = {}
+    for name, text in TEXTS.items():
+        runs = [time_utterance(engine, text) for _ in range(repeat)]
+        total = statistics.median(r["total"] for r in runs)
+        audio_seconds = runs[0]["audio_seconds"]
+        texts[name] = {
+            "first_audio_seconds": round(statistics.median(r["first_audio"] for r in runs), 3),
+            "total_seconds": round(total, 3),
+            "audio_seconds": round(audio_seconds, 2),
+            "rtf": round(total / audio_seconds, 3) if audio_seconds else None,
+        }
+    return {
+        "engine": dotted_path.rsplit(".", 1)[1],
+        "load_seconds": round(load_seconds, 2),
+        "texts": texts,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark TTS engines: time to first audio and RTF")
+    parser.add_argument("--engine", action="append", help="Dotted engine path (repeatable)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per text, median is used")
+    parser.add_argument("--output", type=Path, help="Write full results as JSON")
+    args = parser.parse_args()
+
+    results = []
+    for dotted_path in args.engine or DEFAULT_ENGINES:
+        print(f"Benchmarking {dotted_path}...")
+        try:
+            results.append(benchmark_engine(dotted_path, args.repeat))
+        except RuntimeError as e:
+            # Missing API keys, network or optional packages should not stop the other engines
+            print(f"  skipped: {e}")
+
+    print("\n| Engine | Load (s) | Text | First audio (s) | Total (s) | Audio (s) | RTF |")
+    print("|---|---|---|---|---|---|---|")
+    for result in results:
+        for name, row in result["texts"].items():
+            print(
+                f"| {result['engine']} | {result['load_seconds']} | {name} | {row['first_audio_seconds']} "
+                f"| {row['total_seconds']} | {row['audio_seconds']} | {row['rtf']} |"
+            )
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,13 +7,17 @@ Exposes endpoints for starting a session and processing each turn.
 
 import os
 import sys
+import time
 import uuid
 import tempfile
+from contextlib import asynccontextmanager
 import numpy as np
 import soundfile as sf
 from fastapi import FastAPI, UploadFile, File, HTTPException
-from fastapi.responses import Response
+from fastapi.responses import Response, JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.concurrency import run_in_threadpool
+from starlette.background import BackgroundTask
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "app"))
@@ -25,12 +29,26 @@ from app.config import (
     RECORDING_DURATION,
     AUDIO_SAMPLE_RATE,
     ENERGY_THRESHOLD,
-    OPENING_TEXT
+    OPENING_TEXT,
+    WARMUP_ENABLED,
 )
 
-from app.core.pipeline import OnboardingPipeline, load_engine
+from app.core.pipeline import OnboardingPipeline, load_engine, transcribe_audio
 from app.utils.logger import setup_logger
 
+# Imported by the same path the engine modules use, so the API shares the same
+# process-wide registries and turn deadline rather than a second copy under "app."
+from core.engines.failover import provider_health
+from core.engines.call_policy import turn_deadline, policy_metrics, DeadlineExceeded
+from core.engines.rate_limit import find_rejection
+from core.admission import TurnAdmission
+from core.degradation import degradation_metrics, stage_worker_metrics
+from core.hallucination import HallucinationFilter, hallucination_metrics
+from core.inference.executor import executor_metrics
+from core.inference.decode import decode_metrics
+from core.warmup import WarmUp
+from core import tracing
+
 logger = setup_logger(__name__, log_type="api")
 
 
@@ -40,6 +58,11 @@ def safe_header(text: str) -> str:
     return text.encode("latin-1", errors="ignore").decode("latin-1")
 
 
+def media_type_for(audio_path: str) -> str:
+    """Return the response media type for a synthesised file (WAV from local TTS, MP3 otherwise)."""
+    return "audio/wav" if str(audio_path).lower().endswith(".wav") else "audio/mpeg"
+
+
 def read_and_cleanup(pipeline: OnboardingPipeline, audio_path: str) -> bytes:
     """Read audio file bytes then delete the temp file."""
     try:
@@ -48,10 +71,51 @@ def read_and_cleanup(pipeline: OnboardingPipeline, audio_path: str) -> bytes:
         pipeline.cleanup_file(audio_path)
 
 
+def traced(response: Response, trace: tracing.Trace | None) -> Response:
+    """
+    Add the Server-Timing header for the stages traced so far, then finish and export the
+    trace once the body has been sent, so the export includes the response write.
+    """
+    if trace is None:
+        return response
+    response.headers["Server-Timing"] = trace.server_timing()
+    send = trace.start_span("send")
+
+    def finish():
+        send.end()
+        tracing.finish_trace(trace)
+
+    response.background = BackgroundTask(finish)
+    return response
+
+
+async def read_upload(audio: UploadFile) -> str:
+    """Save an uploaded audio file to a temp WAV, traced as the upload stage."""
+    with tracing.span("upload"):
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp:
+            tmp.write(await audio.read())
+            return tmp.name
+
+
+# Shared engines, loaded and exercised once at startup; /ready reports 503 until done
+warmup = WarmUp(ENGINES)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start the engine warm-up in the background, so /health and /ready answer meanwhile."""
+    if WARMUP_ENABLED:
+        warmup.start()
+    else:
+        warmup.skip()
+    yield
+
+
 app = FastAPI(
     title="Voice Onboarding API",
     description="REST API for the Enabled Talent voice onboarding pipeline.",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Allow all origins for prototype - in prod this would be restricted
@@ -62,16 +126,45 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.exception_handler(RuntimeError)
+def overload_handler(request, exc: RuntimeError):
+    """
+    Map overload and deadline failures to retryable HTTP statuses.
+    Engines wrap provider errors in RuntimeError, so the original cause is found by
+    walking the exception chain. Anything else is re-raised and becomes a 500.
+    """
+    rejection = find_rejection(exc)
+    if rejection is not None:
+        logger.warning(f"{request.url.path}: {rejection} — returning {rejection.status_code}")
+        return JSONResponse(
+            status_code=rejection.status_code,
+            content={"detail": "Server is busy. Please try again shortly."},
+            headers={"Retry-After": str(rejection.retry_after)},
+        )
+
+    e = exc
+    while e is not None:
+        if isinstance(e, DeadlineExceeded):
+            logger.warning(f"{request.url.path}: {e}")
+            return JSONResponse(status_code=504, content={"detail": "Turn took too long. Please try again."})
+        e = e.__cause__ or e.__context__
+    raise exc
+
 # In-memory session store, restarting the server clears all active sessions
 sessions: dict[str, dict] = {}
 
+# Bounds concurrent turns process-wide; excess requests queue briefly, then get a 503
+turn_admission = TurnAdmission()
+hallucination_filter = HallucinationFilter()
+
 
 def create_pipeline() -> OnboardingPipeline:
-    """Instantiate a new OnboardingPipeline from config."""
+    """Instantiate a new OnboardingPipeline from config, reusing the warmed-up engines where loaded."""
+    engines = {stage: warmup.engines.get(stage) or load_engine(path) for stage, path in ENGINES.items()}
     return OnboardingPipeline(
-        stt=load_engine(ENGINES["stt"]),
-        llm=load_engine(ENGINES["llm"]),
-        tts=load_engine(ENGINES["tts"]),
+        stt=engines["stt"],
+        llm=engines["llm"],
+        tts=engines["tts"],
         system_prompt=SYSTEM_PROMPT,
         onboarding_fields=ONBOARDING_FIELDS,
         recording_duration=RECORDING_DURATION,
@@ -99,7 +192,7 @@ def start_session():
         "turn": 0,
     }
 
-    audio_path = pipeline.tts.synthesize(OPENING_TEXT)
+    audio_path = pipeline.degradation.cached_audio(OPENING_TEXT) or pipeline.tts.synthesize(OPENING_TEXT)
     audio_bytes = read_and_cleanup(pipeline, audio_path)
 
     pipeline.conversation_history.append({
@@ -111,7 +204,7 @@ def start_session():
 
     return Response(
         content=audio_bytes,
-        media_type="audio/mpeg",
+        media_type=media_type_for(audio_path),
         headers={
             "X-Session-ID": session_id,
             "X-Turn": "0",
@@ -138,6 +231,9 @@ async def process_turn(session_id: str, audio: UploadFile = File(...)):
         X-Field:             field that was collected
         X-Next-Field:        next field to collect (empty if session complete)
         X-Session-Complete:  "true" if all fields collected
+        X-Degradations:      comma-separated degradations that fired this turn, if any
+        Server-Timing:       duration per stage (upload, queue, energy, stt, llm, tts, audio-read;
+                             llm-ttft too when the LLM engine streams)
     """
     if session_id not in sessions:
         raise HTTPException(status_code=404, detail="Session not found.")
@@ -150,60 +246,83 @@ async def process_turn(session_id: str, audio: UploadFile = File(...)):
         raise HTTPException(status_code=400, detail="Session already complete.")
 
     current_field = ONBOARDING_FIELDS[turn]
-
-    # Save uploaded audio to a temp file
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp:
-        tmp.write(await audio.read())
-        tmp_path = tmp.name
-
-    try:
-        audio_arr, _ = sf.read(tmp_path)
-        energy = float(np.abs(audio_arr).mean())
-        logger.info(f"Session {session_id} turn {turn + 1} — audio energy: {energy:.4f}")
-        if energy < ENERGY_THRESHOLD:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Silent audio detected (energy {energy:.4f}). Please speak clearly and try again.",
+    trace = tracing.start_trace("turn", session_id, turn=turn + 1, field=current_field)
+    tmp_path = None
+
+    # Provider calls block, so the turn runs in the threadpool rather than on the event loop
+    def run_turn() -> Response:
+        with turn_deadline():
+            pipeline.degradation.start_turn()
+            with tracing.span("energy"):
+                audio_arr, sample_rate = sf.read(tmp_path, dtype="float32")
+                energy = float(np.abs(audio_arr).mean())
+            logger.info(f"Session {session_id} turn {turn + 1} — audio energy: {energy:.4f}")
+            if energy < ENERGY_THRESHOLD:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Silent audio detected (energy {energy:.4f}). Please speak clearly and try again.",
+                )
+
+            # STT, reusing the samples already decoded for the energy check
+            with tracing.span("stt"):
+                user_text = transcribe_audio(pipeline.stt, audio_arr, sample_rate, tmp_path, field=current_field)
+            if not user_text.strip():
+                raise HTTPException(status_code=400, detail="No speech detected in audio.")
+            reason = hallucination_filter.check(user_text)
+            if reason:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"No clear speech detected ({reason}). Please speak clearly and try again.",
+                )
+
+            # LLM
+            with tracing.span("llm"):
+                response_text = pipeline._generate(
+                    f"[Collecting: {current_field}]\n{user_text}",
+                    fallback=pipeline._fallback_response(turn),
+                )
+            if not response_text:
+                raise HTTPException(status_code=500, detail="LLM returned empty response.")
+
+            with tracing.span("tts"):
+                audio_path = pipeline._synthesize(response_text)
+            with tracing.span("audio-read"):
+                audio_bytes = read_and_cleanup(pipeline, audio_path)
+
+            session["turn"] += 1
+            next_turn = session["turn"]
+            session_complete = next_turn >= len(ONBOARDING_FIELDS)
+            next_field = ONBOARDING_FIELDS[next_turn] if not session_complete else ""
+
+            logger.info(
+                f"Session {session_id} — turn {turn + 1} complete — field: {current_field}"
             )
 
-        # STT
-        user_text = pipeline.stt.transcribe(tmp_path)
-        if not user_text.strip():
-            raise HTTPException(status_code=400, detail="No speech detected in audio.")
-
-        # LLM
-        response_text = pipeline._generate(
-            f"[Collecting: {current_field}]\n{user_text}"
-        )
-        if not response_text:
-            raise HTTPException(status_code=500, detail="LLM returned empty response.")
-
-        audio_path = pipeline.tts.synthesize(response_text)
-        audio_bytes = read_and_cleanup(pipeline, audio_path)
-
-        session["turn"] += 1
-        next_turn = session["turn"]
-        session_complete = next_turn >= len(ONBOARDING_FIELDS)
-        next_field = ONBOARDING_FIELDS[next_turn] if not session_complete else ""
-
-        logger.info(
-            f"Session {session_id} — turn {turn + 1} complete — field: {current_field}"
-        )
+            return Response(
+                content=audio_bytes,
+                media_type=media_type_for(audio_path),
+                headers={
+                    "X-Transcript": safe_header(user_text),
+                    "X-Response-Text": safe_header(response_text),
+                    "X-Turn": str(turn + 1),
+                    "X-Field": current_field,
+                    "X-Next-Field": next_field,
+                    "X-Session-Complete": str(session_complete).lower(),
+                    "X-Degradations": ",".join(pipeline.degradation.fired),
+                },
+            )
 
-        return Response(
-            content=audio_bytes,
-            media_type="audio/mpeg",
-            headers={
-                "X-Transcript": safe_header(user_text),
-                "X-Response-Text": safe_header(response_text),
-                "X-Turn": str(turn + 1),
-                "X-Field": current_field,
-                "X-Next-Field": next_field,
-                "X-Session-Complete": str(session_complete).lower(),
-            },
-        )
+    try:
+        tmp_path = await read_upload(audio)
+        queued = time.perf_counter()
+        async with turn_admission.slot():
+            tracing.record("queue", time.perf_counter() - queued)
+            return traced(await run_in_threadpool(run_turn), trace)
+    except BaseException:
+        tracing.finish_trace(trace)
+        raise
     finally:
-        if os.path.exists(tmp_path):
+        if tmp_path is not None and os.path.exists(tmp_path):
             os.remove(tmp_path)
 
 @app.post("/session/{session_id}/confirm")
@@ -215,6 +334,10 @@ async def confirm_session(session_id: str, audio: UploadFile = File(...)):
     Args:
         session_id: Session ID returned from /session/start
         audio:      User's confirmation response (WAV format)
+
+    Response headers:
+        Server-Timing:  duration per stage (upload, queue, stt, llm, tts, audio-read;
+                        llm-ttft too when the LLM engine streams)
     """
     if session_id not in sessions:
         raise HTTPException(status_code=404, detail="Session not found.")
@@ -228,33 +351,50 @@ async def confirm_session(session_id: str, audio: UploadFile = File(...)):
             detail=f"Session not yet complete — {len(ONBOARDING_FIELDS) - session['turn']} field(s) remaining.",
         )
 
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp:
-        tmp.write(await audio.read())
-        tmp_path = tmp.name
+    trace = tracing.start_trace("confirm", session_id)
+    tmp_path = None
+
+    # Runs in the threadpool for the same reason as run_turn in process_turn
+    def run_confirm() -> Response:
+        with turn_deadline():
+            pipeline.degradation.start_turn()
+            with tracing.span("stt"):
+                user_text = pipeline.stt.transcribe(tmp_path)
+            with tracing.span("llm"):
+                response_text = pipeline._generate(user_text)
+            if not response_text:
+                raise HTTPException(status_code=500, detail="LLM returned empty response.")
+
+            with tracing.span("tts"):
+                audio_path = pipeline._synthesize(response_text)
+            with tracing.span("audio-read"):
+                audio_bytes = read_and_cleanup(pipeline, audio_path)
+
+            del sessions[session_id]
+            logger.info(f"Session {session_id} confirmed and closed.")
+
+            return Response(
+                content=audio_bytes,
+                media_type=media_type_for(audio_path),
+                headers={
+                    "X-Transcript": safe_header(user_text),
+                    "X-Response-Text": safe_header(response_text),
+                    "X-Session-Complete": "true",
+                    "X-Degradations": ",".join(pipeline.degradation.fired),
+                },
+            )
 
     try:
-        user_text = pipeline.stt.transcribe(tmp_path)
-        response_text = pipeline._generate(user_text)
-        if not response_text:
-            raise HTTPException(status_code=500, detail="LLM returned empty response.")
-
-        audio_path = pipeline.tts.synthesize(response_text)
-        audio_bytes = read_and_cleanup(pipeline, audio_path)
-
-        del sessions[session_id]
-        logger.info(f"Session {session_id} confirmed and closed.")
-
-        return Response(
-            content=audio_bytes,
-            media_type="audio/mpeg",
-            headers={
-                "X-Transcript": safe_header(user_text),
-                "X-Response-Text": safe_header(response_text),
-                "X-Session-Complete": "true",
-            },
-        )
+        tmp_path = await read_upload(audio)
+        queued = time.perf_counter()
+        async with turn_admission.slot():
+            tracing.record("queue", time.perf_counter() - queued)
+            return traced(await run_in_threadpool(run_confirm), trace)
+    except BaseException:
+        tracing.finish_trace(trace)
+        raise
     finally:
-        if os.path.exists(tmp_path):
+        if tmp_path is not None and os.path.exists(tmp_path):
             os.remove(tmp_path)
 
 @app.delete("/session/{session_id}")
@@ -268,15 +408,34 @@ def end_session(session_id: str):
 
 @app.get("/health")
 def health_check():
-    """Health check — returns engine config and active session count."""
+    """Health check — returns engine config, session and admission counts, provider circuit states, call metrics, degradation counts and stage worker waits."""
     return {
         "status": "ok",
         "engines": ENGINES,
         "fields": ONBOARDING_FIELDS,
         "active_sessions": len(sessions),
+        "admission": turn_admission.snapshot(),
+        "providers": provider_health(),
+        "call_policy": policy_metrics(),
+        "degradations": degradation_metrics(),
+        "stage_workers": stage_worker_metrics(),
+        "inference": executor_metrics(),
+        "decode_profiles": decode_metrics(),
+        "hallucinations": hallucination_metrics(),
+        "warmup": warmup.state,
     }
 
 
+@app.get("/ready")
+def readiness_check():
+    """
+    Readiness probe — 200 once the startup warm-up has loaded and exercised every engine,
+    503 while it is still running or if an engine failed. Includes warm-up latency per engine.
+    """
+    ready = warmup.ready()
+    return JSONResponse(status_code=200 if ready else 503, content={"ready": ready, **warmup.snapshot()})
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("api.main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
@@ -17,6 +17,39 @@ AUDIO_SAMPLE_RATE = 16000
 ENERGY_THRESHOLD = 0.01
 
 
+# ===================================================================================
+# WHISPER HALLUCINATION FILTER
+# ===================================================================================
+# Transcripts that pass the energy gate are rejected before the LLM call when Whisper's own
+# statistics say there was no speech (no-speech probability above the threshold with average
+# log-probability below HALLUCINATION_LOGPROB_THRESHOLD), the decode was very unsure, the text
+# is a repetition loop, or the whole transcript is a known hallucinated phrase. Phrases are
+# from docs/test-results/2026-02-24-whisper-hallucination-testing.md. "You", "thank you" and
+# "bye" are also genuine answers, so a blocklisted phrase is only rejected alongside a weaker
+# doubt signal: no-speech probability above HALLUCINATION_BLOCKLIST_NO_SPEECH or average
+# log-probability below HALLUCINATION_BLOCKLIST_LOGPROB. Without decoder statistics it passes.
+HALLUCINATION_FILTER_ENABLED = True
+HALLUCINATION_NO_SPEECH_THRESHOLD = 0.6
+HALLUCINATION_LOGPROB_THRESHOLD = -1.0
+HALLUCINATION_MIN_AVG_LOGPROB = -1.5
+HALLUCINATION_COMPRESSION_RATIO = 2.4
+HALLUCINATION_BLOCKLIST_NO_SPEECH = 0.3
+HALLUCINATION_BLOCKLIST_LOGPROB = -0.8
+HALLUCINATION_BLOCKLIST = [
+    "you",
+    "thank you",
+    "thank you so much for watching",
+    "thank you for watching",
+    "thanks for watching",
+    "please subscribe",
+    "like and subscribe",
+    "bye",
+    "bye bye",
+    "oh poof poof poof",
+    "c'mon can't u just",
+]
+
+
 # ===================================================================================
 # CONVERSATION HISTORY
 # ===================================================================================
@@ -40,6 +73,25 @@ LLM_PRESENCE_PENALTY = 0.5
 LLM_FREQUENCY_PENALTY = 0.2
 
 
+# ===================================================================================
+# OLLAMA LOCAL LLM
+# ===================================================================================
+# Cold-loading the model dominates early local turns, so OllamaLLMEngine loads it in the
+# background at construction (OLLAMA_PRELOAD) and asks Ollama to keep it resident for
+# OLLAMA_KEEP_ALIVE after each request ("30m", or -1 to never unload). OLLAMA_OPTIONS are
+# sent with every request; None values are left to Ollama's defaults.
+OLLAMA_MODEL = "gemma3:1b"
+OLLAMA_BASE_URL = "http://localhost:11434"
+OLLAMA_KEEP_ALIVE = "30m"
+OLLAMA_PRELOAD = True
+OLLAMA_OPTIONS = {
+    "num_ctx": 2048,                    # onboarding prompts and 12-message history fit easily
+    "num_predict": LLM_MAX_TOKENS,
+    "temperature": LLM_TEMPERATURE,
+    "num_thread": None,                 # set to the physical core count if Whisper shares the machine
+}
+
+
 # ===================================================================================
 # OPENAI TTS PARAMETERS
 # ===================================================================================
@@ -48,6 +100,15 @@ TTS_VOICE = "alloy"
 TTS_MODEL = "tts-1"
 
 
+# ===================================================================================
+# OFFLINE LOCAL TTS (PIPER)
+# ===================================================================================
+# PiperTTSEngine runs a Piper ONNX voice on CPU with no network hop, synthesising and playing
+# one sentence at a time. Relative paths resolve against src/app; download voices as described
+# in docs/SETUP.md. Compare engines with: python benchmarks/tts_benchmark.py
+PIPER_VOICE = "models/piper/en_US-lessac-medium.onnx"
+
+
 # ===================================================================================
 # GROQ MODEL CONSTANTS
 # ===================================================================================
@@ -69,6 +130,248 @@ OPENROUTER_FREE_MODELS = {
 OPENROUTER_MODEL = OPENROUTER_FREE_MODELS["trinity-large"]
 
 
+# ===================================================================================
+# SHARED LOCAL WHISPER SERVER AND MICRO-BATCHING
+# ===================================================================================
+# SharedWhisperEngine sends audio to one Whisper server process over this Unix socket, so
+# API workers and sessions share a single loaded model. Start the server from src/app with:
+#   python -m core.inference.whisper_server --model base
+WHISPER_SERVER_SOCKET = "/tmp/voice-agent-whisper.sock"
+WHISPER_SERVER_MODEL = "base"
+
+# Concurrent local transcriptions (WhisperLocalEngine sessions in one process, or requests to
+# the shared server) are collected for up to WHISPER_BATCH_WINDOW seconds and decoded as one
+# batch of at most WHISPER_BATCH_MAX_SIZE clips. Set WHISPER_BATCHING = False to give each
+# WhisperLocalEngine its own model and decode clips one at a time.
+WHISPER_BATCHING = True
+WHISPER_BATCH_MAX_SIZE = 8
+WHISPER_BATCH_WINDOW = 0.03
+
+
+# ===================================================================================
+# LOCAL INFERENCE EXECUTOR
+# ===================================================================================
+# All local model calls (local Whisper, faster-whisper, the shared Whisper server) run on
+# INFERENCE_SLOTS worker slots, each capped to INFERENCE_THREADS_PER_SLOT intra-op threads
+# (None = CPU count / slots). Extra concurrent requests queue instead of oversubscribing the
+# cores. INFERENCE_PIN_CPUS pins each slot to its own cores on Linux.
+INFERENCE_SLOTS = 2
+INFERENCE_THREADS_PER_SLOT = None
+INFERENCE_PIN_CPUS = False
+
+
+# ===================================================================================
+# LOCAL WHISPER DECODE PROFILES
+# ===================================================================================
+# Decoding options used by the local Whisper engines (WhisperLocalEngine, SharedWhisperEngine
+# via the server, FasterWhisperEngine). "default" is openai-whisper's general-purpose path:
+# language detection on every clip and temperature fallback that can re-decode a clip up to
+# six times. Short onboarding answers do well with "fast": pinned language, one greedy pass,
+# and no conditioning on previous text. Keys follow openai-whisper's transcribe() arguments;
+# beam_size None is greedy. Latency per profile is reported under "decode_profiles" in /health.
+WHISPER_DECODE_PROFILE = "fast"
+WHISPER_DECODE_PROFILES = {
+    "default": {},
+    "fast": {
+        "language": "en",
+        "temperature": 0.0,
+        "beam_size": None,
+        "condition_on_previous_text": False,
+        "no_speech_threshold": 0.6,
+        "logprob_threshold": -1.0,
+        "compression_ratio_threshold": 2.4,
+    },
+    "accurate": {
+        "language": "en",
+        "temperature": (0.0, 0.2, 0.4),
+        "beam_size": 5,
+        "condition_on_previous_text": False,
+        "no_speech_threshold": 0.6,
+        "logprob_threshold": -1.0,
+        "compression_ratio_threshold": 2.4,
+    },
+}
+# Prepend each field's prompt as Whisper's initial_prompt, biasing the decoder towards the
+# vocabulary expected for that answer. Set WHISPER_FIELD_PROMPTS = False to disable.
+WHISPER_FIELD_PROMPTS = True
+
+
+# ===================================================================================
+# QUANTIZED CPU WHISPER (faster-whisper / CTranslate2)
+# ===================================================================================
+# FasterWhisperEngine runs int8-quantized Whisper weights with CTranslate2's CPU kernels.
+# Compare against WhisperLocalEngine with: python benchmarks/stt_benchmark.py
+FASTER_WHISPER_MODEL = "base"
+FASTER_WHISPER_COMPUTE_TYPE = "int8"    # "int8", "int8_float32" or "float32"
+FASTER_WHISPER_THREADS = None          # None = INFERENCE_THREADS_PER_SLOT of the executor
+
+
+# ===================================================================================
+# HEDGED LLM REQUESTS
+# ===================================================================================
+# HedgedLLMEngine sends each request to the primary engine and only fires the same
+# request at the secondary engine if no first token arrives within the hedge delay.
+# The delay is the HEDGE_PERCENTILE of the primary's recent time-to-first-token,
+# clamped to [HEDGE_MIN_DELAY, HEDGE_MAX_DELAY] seconds.
+HEDGE_PRIMARY_LLM = "core.engines.llm.groq_llm.GroqLLMEngine"
+HEDGE_SECONDARY_LLM = "core.engines.llm.openai_llm.OpenAILLMEngine"
+HEDGE_PERCENTILE = 95
+HEDGE_INITIAL_DELAY = 1.5       # used until HEDGE_MIN_SAMPLES latencies are recorded
+HEDGE_MIN_SAMPLES = 10
+HEDGE_MIN_DELAY = 0.3
+HEDGE_MAX_DELAY = 4.0
+
+
+# ===================================================================================
+# PROVIDER FAILOVER AND CIRCUIT BREAKERS
+# ===================================================================================
+# The Failover*Engine classes route each call to the first healthy provider in these
+# ordered lists. A provider's circuit opens after CIRCUIT_FAILURE_THRESHOLD consecutive
+# failures or CIRCUIT_SLOW_THRESHOLD consecutive calls over its stage latency SLO, and is
+# probed in the background every CIRCUIT_PROBE_INTERVAL seconds once CIRCUIT_COOLDOWN has passed.
+FAILOVER_ENGINES = {
+    "stt": [
+        "core.engines.stt.whisper_api.WhisperAPIEngine",
+        "core.engines.stt.whisper_local.WhisperLocalEngine",
+    ],
+    "llm": [
+        "core.engines.llm.groq_llm.GroqLLMEngine",
+        "core.engines.llm.openai_llm.OpenAILLMEngine",
+        "core.engines.llm.openrouter_llm.OpenRouterLLMEngine",
+        "core.engines.llm.ollama_llm.OllamaLLMEngine",
+    ],
+    "tts": [
+        "core.engines.tts.openai_tts.OpenAITTSEngine",
+        "core.engines.tts.gtts_tts.GTTSEngine",
+    ],
+}
+STAGE_LATENCY_SLO = {"stt": 3.0, "llm": 3.0, "tts": 3.0}  # seconds, per-stage success criterion
+PROVIDER_EWMA_ALPHA = 0.3
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_SLOW_THRESHOLD = 3
+CIRCUIT_COOLDOWN = 30
+CIRCUIT_PROBE_INTERVAL = 10
+
+
+# ===================================================================================
+# CALL POLICY - TIMEOUTS, RETRIES AND TURN DEADLINES
+# ===================================================================================
+# Every provider call gets a timeout of CALL_TIMEOUT_MULTIPLIER x its recent
+# CALL_TIMEOUT_PERCENTILE latency, clamped to the (min, max) bounds for its stage and
+# capped by what is left of the TURN_BUDGET. Transient failures are retried up to
+# CALL_MAX_RETRIES times while the shared retry budget (RETRY_BUDGET_RATIO retries
+# per request on average) has tokens left.
+TURN_BUDGET = 15.0                  # seconds for STT + LLM + TTS in one turn
+CALL_TIMEOUT_BOUNDS = {
+    "stt": (2.0, 10.0),
+    "llm": (2.0, 12.0),
+    "tts": (2.0, 12.0),             # summary turn TTS has been measured up to 8s
+}
+CALL_TIMEOUT_PERCENTILE = 99
+CALL_TIMEOUT_MULTIPLIER = 1.5
+CALL_TIMEOUT_MIN_SAMPLES = 20
+CALL_MAX_RETRIES = 2
+RETRY_BUDGET_RATIO = 0.1
+RETRY_BUDGET_MAX_TOKENS = 10
+RETRY_BACKOFF_BASE = 0.2
+
+
+# ===================================================================================
+# API STARTUP WARM-UP
+# ===================================================================================
+# At API startup one shared instance of each ENGINES entry is loaded, and with WARMUP_CALLS a
+# tiny STT/LLM/TTS call is made through each (model loads, TLS handshakes, first-call JIT).
+# Then the fixed phrases are synthesised into the TTS cache. GET /ready returns 503 until this
+# finishes, so the load balancer only routes to warm instances. Sessions share the engines.
+# Engines that fail (e.g. Ollama not up yet) are retried in the background with exponential
+# backoff from WARMUP_RETRY_BACKOFF up to WARMUP_RETRY_MAX_BACKOFF seconds until they warm up.
+WARMUP_ENABLED = True
+WARMUP_CALLS = True
+WARMUP_RETRY_BACKOFF = 2.0
+WARMUP_RETRY_MAX_BACKOFF = 60.0
+
+
+# ===================================================================================
+# LOGGING
+# ===================================================================================
+# With LOG_MODE "queue", module loggers only put records on a queue (a few microseconds) and
+# one background listener formats them and does the disk and stdout writes. "sync" writes on
+# the calling thread, as before. Either way all modules share one file and one console handler.
+# LOG_FORMAT "json" writes the file as JSON lines (one object per record, with any extra=
+# fields), "text" as plain lines; the console is always plain text. The file rotates once it
+# reaches LOG_MAX_BYTES or every LOG_ROTATE_SECONDS, keeping LOG_BACKUP_COUNT old files.
+# LOG_SAMPLING keeps a fraction of records per level for high-volume lines; a call can pass
+# extra={"sample": 0.1} to sample one line. WARNING and above are never sampled.
+LOG_MODE = "queue"                  # "queue" or "sync"
+LOG_FORMAT = "json"                 # "json" or "text"
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_ROTATE_SECONDS = 24 * 60 * 60   # None for size-based rotation only
+LOG_BACKUP_COUNT = 5
+LOG_SAMPLING = {"DEBUG": 0.1, "INFO": 1.0}
+
+
+# ===================================================================================
+# REQUEST TRACING
+# ===================================================================================
+# Each API /turn and /confirm request is traced: upload read, admission queue, energy gate,
+# STT, LLM (with time to first token for natively streaming engines: Ollama, hedged and
+# cassette), TTS, reading the synthesised audio back, and sending the response. The
+# spans are summarised in a Server-Timing response header, and finished traces are
+# exported in the background. TRACE_EXPORTER "jsonl" appends them to logs/traces/, "otlp"
+# posts them to an OpenTelemetry collector's OTLP/HTTP endpoint, None only sets the header.
+# The trace ID is derived from the session ID, so all turns of a session correlate.
+TRACING_ENABLED = True
+TRACE_EXPORTER = "jsonl"            # "jsonl", "otlp" or None
+TRACE_OTLP_ENDPOINT = "http://localhost:4318/v1/traces"
+
+
+# ===================================================================================
+# ADMISSION CONTROL AND PROVIDER RATE LIMITS
+# ===================================================================================
+# The API runs at most MAX_CONCURRENT_TURNS turns at once; up to MAX_QUEUED_TURNS more
+# wait up to ADMISSION_MAX_WAIT seconds, and anything beyond that gets an immediate 503
+# with Retry-After. Each provider call additionally waits for a slot and quota from
+# PROVIDER_LIMITS (concurrency, requests-per-minute, tokens-per-minute); providers not
+# listed are unlimited. Quota that will not refill within PROVIDER_MAX_WAIT returns 429.
+MAX_CONCURRENT_TURNS = 8
+MAX_QUEUED_TURNS = 16
+ADMISSION_MAX_WAIT = 10.0
+PROVIDER_MAX_QUEUE = 16
+PROVIDER_MAX_WAIT = 5.0
+PROVIDER_LIMITS = {
+    "groq":          {"concurrency": 4, "rpm": 30, "tpm": 6000},     # free tier
+    "openrouter":    {"concurrency": 2, "rpm": 20},                  # free models
+    "openai":        {"concurrency": 8, "rpm": 500, "tpm": 10000},
+    "whisper-api":   {"concurrency": 8, "rpm": 50},
+    "openai-tts":    {"concurrency": 8, "rpm": 50},
+    "ollama":        {"concurrency": 1},                             # one local model
+    "whisper-local": {"concurrency": WHISPER_BATCH_MAX_SIZE},          # the batcher queues and serialises decodes
+    "whisper-shared": {"concurrency": 4},                            # server runs one pass at a time
+}
+
+
+# ===================================================================================
+# SLO-AWARE GRACEFUL DEGRADATION
+# ===================================================================================
+# Each turn stage gets a latency budget in seconds. When the LLM overruns its budget the
+# turn uses the canonical question for the next field (FIELD_QUESTIONS) instead of waiting;
+# when TTS overruns, DEGRADE_FALLBACK_TTS is tried, then cached filler audio. In the CLI a
+# filler acknowledgement plays if the LLM has not answered after DEGRADE_FILLER_AFTER seconds.
+# Bounded turn latency is preferred over perfect phrasing. The fallback TTS engine runs within
+# the same TTS budget, on the share DEGRADE_TTS_FALLBACK_SHARE the primary engine leaves it.
+# At most DEGRADE_STAGE_WORKERS stage calls run at once (one per admitted turn); a call the
+# turn has abandoned stops counting, so a slow provider cannot starve later turns.
+DEGRADATION_ENABLED = True
+DEGRADE_STAGE_BUDGETS = {"llm": 4.0, "tts": 4.0}
+DEGRADE_FILLER_AFTER = 1.5
+DEGRADE_FALLBACK_TTS = "core.engines.tts.gtts_tts.GTTSEngine"
+DEGRADE_TTS_FALLBACK_SHARE = 0.5
+DEGRADE_STAGE_WORKERS = MAX_CONCURRENT_TURNS
+DEGRADE_FILLER_TEXT = "Thanks, one moment."
+DEGRADE_ACK_TEXT = "Thanks."
+DEGRADE_FINAL_TEXT = "Thank you, I have everything I need. Does everything look correct?"
+
+
 # ===================================================================================
 # ONBOARDING FIELDS
 # ===================================================================================
@@ -81,6 +384,27 @@ ONBOARDING_FIELDS = [
     "job_preferences"
 ]
 
+# Canonical question per field, also used as the degraded response when the LLM is slow
+FIELD_QUESTIONS = {
+    "name":               "What is your full name?",
+    "employment_status":  "Are you currently employed, unemployed, or a student?",
+    "skills":             "What technical or professional skills do you have?",
+    "education":          "What is your highest level of education, including any degrees or diplomas completed or in progress?",
+    "experience":         "Can you describe your professional work experience or any internships and co-op placements you have completed?",
+    "job_preferences":    "What type of role or industry are you interested in?",
+}
+
+# Initial prompt per field for local Whisper (WHISPER_FIELD_PROMPTS): example vocabulary the
+# answer is likely to contain, so names, credentials and tech terms are spelled correctly
+FIELD_INITIAL_PROMPTS = {
+    "name":               "My name is Priya Sharma. My full name is Jean-Luc O'Connor.",
+    "employment_status":  "I am currently employed. I'm unemployed. I'm a full-time student.",
+    "skills":             "Python, SQL, JavaScript, React, AWS, Excel, customer service, project management.",
+    "education":          "I have a Bachelor's degree. An Ontario College Diploma. A Master's in Computer Science.",
+    "experience":         "I completed a co-op placement as a software developer. I worked as a data analyst intern.",
+    "job_preferences":    "I'm interested in software development, data analytics, or a remote role in fintech.",
+}
+
 
 # ===================================================================================
 # SYSTEM PROMPT
@@ -109,6 +433,79 @@ After collecting all six fields:
 - Wait for the user to confirm before ending the session"""
 
 
+# ===================================================================================
+# SIMULATED ENGINES (OFFLINE BENCHMARKS AND LOAD TESTS)
+# ===================================================================================
+# The Simulated*Engine classes replace providers with a latency model, so our own code can
+# be measured without provider variance: python benchmarks/pipeline_benchmark.py
+# Each stage draws a log-normal latency fitted to (median, p95) seconds, plus per_char seconds
+# per character produced or spoken, and fails with probability failure_rate. The "cloud" and
+# "groq" profiles are fitted to the stage timings in
+# docs/test-results/2026-04-06-openai-api-pipeline-validation.md and
+# docs/test-results/2026-04-06-groq-api-pipeline-validation.md; "zero" removes provider time.
+# SIMULATED_TIME_SCALE multiplies every wait (0.1 runs ten times faster); set SIMULATED_SEED
+# for the same draws on every run.
+SIMULATED_PROFILE = "cloud"
+SIMULATED_TIME_SCALE = 1.0
+SIMULATED_SEED = None
+SIMULATED_PROFILES = {
+    # Whisper-1, GPT-4, OpenAI TTS-1
+    "cloud": {
+        "stt": {"median": 1.2, "p95": 2.7},
+        "llm": {"median": 1.1, "p95": 2.0, "per_char": 0.0035},
+        "tts": {"median": 1.2, "p95": 2.6, "per_char": 0.009},
+    },
+    # Local Whisper base, Groq llama-3.1-8b-instant, gTTS
+    "groq": {
+        "stt": {"median": 0.8, "p95": 1.6},
+        "llm": {"median": 0.5, "p95": 3.5, "per_char": 0.002},
+        "tts": {"median": 0.3, "p95": 0.8, "per_char": 0.004},
+    },
+    "zero": {
+        "stt": {"median": 0.0},
+        "llm": {"median": 0.0},
+        "tts": {"median": 0.0},
+    },
+}
+# Transcript SimulatedSTTEngine returns per field
+SIMULATED_ANSWERS = {
+    "name":               "My name is Robert Perkins.",
+    "employment_status":  "I am currently a student looking for full-time work.",
+    "skills":             "I have skills in Python, Java, and SQL.",
+    "education":          "I have a Bachelor of Science in Computer Science.",
+    "experience":         "I have two years of experience in academic projects and one internship.",
+    "job_preferences":    "I am looking for software developer roles in Toronto.",
+}
+
+
+# ===================================================================================
+# OPENAI-COMPATIBLE STAND-IN SERVER
+# ===================================================================================
+# When set, OpenAILLMEngine, GroqLLMEngine, OpenRouterLLMEngine, WhisperAPIEngine and
+# OpenAITTSEngine all send their requests here instead of to the provider, and no API keys
+# are needed. Start the stand-in (scripted responses, simulated latency and errors) with:
+#   python benchmarks/stand_in_server.py --port 8900
+STAND_IN_BASE_URL = None  # e.g. "http://127.0.0.1:8900/v1"
+
+
+# ===================================================================================
+# CASSETTE RECORD AND REPLAY
+# ===================================================================================
+# The Cassette*Engine classes (see the Cassette ENGINES option below) either record every
+# call of the live engines in CASSETTE_ENGINES to CASSETTE_PATH, or replay a recording
+# without contacting any provider, so a pipeline change can be benchmarked end to end
+# against identical responses. Replay waits the recorded time multiplied by
+# CASSETTE_TIME_SCALE (1.0 original timing, 0 no waits).
+CASSETTE_MODE = "replay"        # "record" or "replay"
+CASSETTE_PATH = "cassettes/session.jsonl.gz"
+CASSETTE_TIME_SCALE = 1.0
+CASSETTE_ENGINES = {
+    "stt": "core.engines.stt.whisper_api.WhisperAPIEngine",
+    "llm": "core.engines.llm.openai_llm.OpenAILLMEngine",
+    "tts": "core.engines.tts.openai_tts.OpenAITTSEngine",
+}
+
+
 # ===================================================================================
 # ENGINE CONFIGURATION - Swap providers by changing dotted paths below
 # ===================================================================================
@@ -127,6 +524,41 @@ ENGINES = {
 #     "tts": "core.engines.tts.gtts_tts.GTTSEngine",
 # }
 
+# Fully offline local (on-device Piper TTS instead of gTTS, see OFFLINE LOCAL TTS)
+# ENGINES = {
+#     "stt": "core.engines.stt.whisper_local.WhisperLocalEngine",
+#     "llm": "core.engines.llm.ollama_llm.OllamaLLMEngine",
+#     "tts": "core.engines.tts.piper_tts.PiperTTSEngine",
+# }
+
+# Local with shared Whisper server (one model for all API workers, see SHARED LOCAL WHISPER SERVER)
+# ENGINES = {
+#     "stt": "core.engines.stt.whisper_shared.SharedWhisperEngine",
+#     "llm": "core.engines.llm.ollama_llm.OllamaLLMEngine",
+#     "tts": "core.engines.tts.gtts_tts.GTTSEngine",
+# }
+
+# Local on CPU-only nodes (quantized faster-whisper STT)
+# ENGINES = {
+#     "stt": "core.engines.stt.faster_whisper_stt.FasterWhisperEngine",
+#     "llm": "core.engines.llm.ollama_llm.OllamaLLMEngine",
+#     "tts": "core.engines.tts.gtts_tts.GTTSEngine",
+# }
+
+# Simulated providers for offline benchmarks and load tests (see SIMULATED ENGINES)
+# ENGINES = {
+#     "stt": "core.engines.stt.simulated_stt.SimulatedSTTEngine",
+#     "llm": "core.engines.llm.simulated_llm.SimulatedLLMEngine",
+#     "tts": "core.engines.tts.simulated_tts.SimulatedTTSEngine",
+# }
+
+# Cassette record/replay of CASSETTE_ENGINES for reproducible benchmarks (see CASSETTE RECORD AND REPLAY)
+# ENGINES = {
+#     "stt": "core.engines.stt.cassette_stt.CassetteSTTEngine",
+#     "llm": "core.engines.llm.cassette_llm.CassetteLLMEngine",
+#     "tts": "core.engines.tts.cassette_tts.CassetteTTSEngine",
+# }
+
 # Hybrid (Groq LLM + local STT/TTS)
 # ENGINES = {
 #     "stt": "core.engines.stt.whisper_local.WhisperLocalEngine",
@@ -141,3 +573,10 @@ ENGINES = {
 #     "tts": "core.engines.tts.openai_tts.OpenAITTSEngine",
 # }
 
+# Hedged (Groq LLM raced against OpenAI on slow turns, see HEDGED LLM REQUESTS above)
+# ENGINES = {
+#     "stt": "core.engines.stt.whisper_api.WhisperAPIEngine",
+#     "llm": "core.engines.llm.hedged_llm.HedgedLLMEngine",
+#     "tts": "core.engines.tts.openai_tts.OpenAITTSEngine",
+# }
+
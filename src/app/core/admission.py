@@ -0,0 +1,75 @@
+"""
+src.app.core.admission
+
+Request-level admission control for the REST API.
+Caps how many turns run at once and how many may queue behind them, so a burst of
+sessions waits in a bounded queue instead of piling onto the providers together.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from core.engines.rate_limit import AdmissionRejected
+from utils.logger import setup_logger
+from config import MAX_CONCURRENT_TURNS, MAX_QUEUED_TURNS, ADMISSION_MAX_WAIT
+
+logger = setup_logger(__name__, log_type="api")
+
+
+class TurnAdmission:
+    """Bounded concurrency with a bounded wait queue for turn requests."""
+
+    def __init__(
+        self,
+        max_concurrent: int = MAX_CONCURRENT_TURNS,
+        max_queued: int = MAX_QUEUED_TURNS,
+        max_wait: float = ADMISSION_MAX_WAIT,
+    ):
+        """
+        Args:
+            max_concurrent: Turns allowed to run at the same time.
+            max_queued: Turns allowed to wait for a free slot before new ones are rejected.
+            max_wait: Longest a queued turn waits for a slot, in seconds.
+        """
+        self._max_concurrent = max_concurrent
+        self._max_queued = max_queued
+        self._max_wait = max_wait
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self.running = 0
+        self.queued = 0
+
+    @asynccontextmanager
+    async def slot(self):
+        """
+        Hold one turn slot for the duration of the block.
+
+        Raises:
+            AdmissionRejected: 503 if the queue is full or no slot frees up within max_wait.
+        """
+        if self._semaphore.locked() and self.queued >= self._max_queued:
+            logger.warning(f"Turn queue full ({self.queued} waiting), rejecting")
+            raise AdmissionRejected("Server is busy", self._max_wait, status_code=503)
+
+        self.queued += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self._max_wait)
+        except asyncio.TimeoutError:
+            logger.warning(f"Turn waited {self._max_wait:.0f}s without a free slot, rejecting")
+            raise AdmissionRejected("Server is busy", self._max_wait, status_code=503)
+        finally:
+            self.queued -= 1
+
+        self.running += 1
+        try:
+            yield
+        finally:
+            self.running -= 1
+            self._semaphore.release()
+
+    def snapshot(self) -> dict:
+        """Return current running/queued counts and limits as a dict."""
+        return {
+            "running": self.running,
+            "queued": self.queued,
+            "max_concurrent": self._max_concurrent,
+            "max_queued": self._max_queued,
+        }
@@ -0,0 +1,381 @@
+"""
+src.app.core.degradation
+
+SLO-aware graceful degradation for the turn path.
+Runs the LLM and TTS stages against per-stage latency budgets and, when a stage overruns,
+switches to a cheaper behaviour instead of making the user wait:
+
+- LLM over budget: respond with the canonical question for the next field
+- TTS over budget: synthesise with the faster DEGRADE_FALLBACK_TTS engine, then fall back
+  to cached audio for the same text or the filler acknowledgement
+- Slow LLM in the CLI: play a cached filler acknowledgement while the response is generated
+
+Audio for the fixed phrases is cached in memory so degraded turns do not depend on the
+slow provider. Degradations are recorded per turn and counted process-wide for /health.
+
+Each stage call runs on its own thread so the turn can stop waiting on it. At most
+DEGRADE_STAGE_WORKERS calls count as running; an abandoned call stops counting as soon as
+the turn gives up on it and finishes in the background, bounded by the call policy's timeout
+and turn deadline. A stage's budget starts once its call is running, and any wait for a
+worker is reported separately (stage_worker_metrics() and a "<stage>-queue" trace span).
+"""
+
+import os
+import time
+import tempfile
+import threading
+import contextvars
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from collections.abc import Callable
+from typing import TypeVar
+from core import tracing
+from core.engines.base import TTSEngine
+from utils.logger import setup_logger
+from config import (
+    DEGRADATION_ENABLED,
+    DEGRADE_STAGE_BUDGETS,
+    DEGRADE_FILLER_AFTER,
+    DEGRADE_FALLBACK_TTS,
+    DEGRADE_TTS_FALLBACK_SHARE,
+    DEGRADE_STAGE_WORKERS,
+    DEGRADE_FILLER_TEXT,
+    DEGRADE_ACK_TEXT,
+    DEGRADE_FINAL_TEXT,
+    FIELD_QUESTIONS,
+    OPENING_TEXT,
+)
+
+logger = setup_logger(__name__, log_type="pipeline")
+
+T = TypeVar("T")
+
+# Held by each running stage call, and released early when its turn abandons it
+_workers = threading.BoundedSemaphore(DEGRADE_STAGE_WORKERS)
+_worker_stats = {"started": 0, "abandoned": 0, "queued": 0, "waited": 0.0, "max_wait": 0.0}
+
+# Synthesised audio for the fixed phrases, keyed by (engine class, text) -> (bytes, suffix)
+_audio_cache: dict[tuple[str, str], tuple[bytes, str]] = {}
+_counts: dict[str, int] = {}
+_lock = threading.Lock()
+
+
+def canonical_texts() -> list[str]:
+    """Return the opening and every fixed phrase a degraded turn may speak, i.e. the texts worth caching."""
+    return (
+        [OPENING_TEXT, DEGRADE_FILLER_TEXT, DEGRADE_FINAL_TEXT]
+        + [f"{DEGRADE_ACK_TEXT} {question}" for question in FIELD_QUESTIONS.values()]
+    )
+
+
+def degradation_metrics() -> dict[str, int]:
+    """Return how many times each degradation has fired since startup."""
+    with _lock:
+        return dict(_counts)
+
+
+def stage_worker_metrics() -> dict:
+    """Return stage call counts and the time calls spent waiting for a worker, for /health."""
+    with _lock:
+        stats = dict(_worker_stats)
+    return {
+        "started": stats["started"],
+        "abandoned": stats["abandoned"],
+        "queued": stats["queued"],
+        "mean_wait_ms": round(stats["waited"] / stats["started"] * 1000, 1) if stats["started"] else 0.0,
+        "max_wait_ms": round(stats["max_wait"] * 1000, 1),
+    }
+
+
+def _start(stage: str, fn: Callable[[], T]) -> tuple[Future, Callable[[], None]]:
+    """
+    Run fn on its own thread once a worker is free.
+
+    Returns:
+        The call's future, and a release callback that frees its worker early. The worker is
+        freed once, by whichever comes first of release() and the call finishing.
+    """
+    t = time.monotonic()
+    _workers.acquire()
+    waited = time.monotonic() - t
+    with _lock:
+        _worker_stats["started"] += 1
+        _worker_stats["waited"] += waited
+        _worker_stats["max_wait"] = max(_worker_stats["max_wait"], waited)
+        if waited >= 0.001:
+            _worker_stats["queued"] += 1
+    if waited >= 0.001:
+        tracing.record(f"{stage}-queue", waited)
+
+    released = threading.Event()
+
+    def release():
+        with _lock:
+            if released.is_set():
+                return
+            released.set()
+        _workers.release()
+
+    future: Future = Future()
+    context = contextvars.copy_context()
+
+    def run():
+        try:
+            future.set_result(context.run(fn))
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            release()
+
+    threading.Thread(target=run, name=f"degrade-{stage}", daemon=True).start()
+    return future, release
+
+
+def _discard_late_file(future: Future):
+    """Delete the audio file of a TTS call that finished after the turn moved on."""
+    if not future.cancelled() and future.exception() is None:
+        try:
+            os.remove(future.result())
+        except OSError:
+            pass
+
+
+class DegradationController:
+    """Runs turn stages against latency budgets and swaps in cheaper fallbacks when they overrun."""
+
+    def __init__(
+        self,
+        tts: TTSEngine,
+        budgets: dict[str, float] = DEGRADE_STAGE_BUDGETS,
+        filler_after: float = DEGRADE_FILLER_AFTER,
+        fallback_tts: str | TTSEngine | None = DEGRADE_FALLBACK_TTS,
+        enabled: bool = DEGRADATION_ENABLED,
+    ):
+        """
+        Args:
+            tts: The pipeline's TTS engine, used for normal synthesis and to fill the cache.
+            budgets: Latency budget in seconds per stage ("llm", "tts").
+            filler_after: Seconds to wait on the LLM before playing the filler, when requested.
+            fallback_tts: Faster TTS engine or its dotted path, loaded on first use.
+            enabled: When False every stage runs directly with no budget.
+        """
+        self._tts = tts
+        self._budgets = budgets
+        self._filler_after = filler_after
+        self._fallback_tts = fallback_tts
+        self.enabled = enabled
+        self.fired: list[str] = []
+
+    def start_turn(self):
+        """Clear the degradations recorded for the previous turn."""
+        self.fired = []
+
+    def _record(self, name: str, detail: str):
+        self.fired.append(name)
+        with _lock:
+            _counts[name] = _counts.get(name, 0) + 1
+        logger.warning(f"Degraded turn: {name} ({detail})")
+
+    def _run(
+        self,
+        stage: str,
+        fn: Callable[[], T],
+        on_slow: Callable[[], None] | None = None,
+        on_abandon: Callable[[Future], None] | None = None,
+        budget: float | None = None,
+    ) -> Future | None:
+        """
+        Run a stage on a stage worker and wait at most its budget.
+
+        Args:
+            stage: Budget key, "llm" or "tts".
+            fn: The stage call.
+            on_slow: Called once if fn is still running after filler_after seconds.
+            on_abandon: Done-callback attached to the future if the budget runs out.
+            budget: Seconds to wait, overriding the stage's budget.
+
+        Returns:
+            The completed future, or None if the budget ran out first.
+        """
+        budget = self._budgets[stage] if budget is None else budget
+        future, release = _start(stage, fn)
+        start = time.monotonic()
+        try:
+            if on_slow is not None and self._filler_after < budget:
+                try:
+                    future.result(timeout=self._filler_after)
+                    return future
+                except FutureTimeout:
+                    on_slow()
+            future.result(timeout=max(0.0, budget - (time.monotonic() - start)))
+            return future
+        except FutureTimeout:
+            logger.warning(f"{stage.upper()} exceeded its {budget:.1f}s budget")
+            release()
+            with _lock:
+                _worker_stats["abandoned"] += 1
+            if on_abandon is not None:
+                future.add_done_callback(on_abandon)
+            return None
+
+    def canonical_response(self, next_field: str | None) -> str | None:
+        """
+        Return the fixed response used when the LLM is too slow.
+
+        Args:
+            next_field: Field the next turn collects, or None after the last field.
+
+        Returns:
+            The acknowledgement plus the field's canonical question, the final readback
+            prompt after the last field, or None for a field without a canonical question.
+        """
+        if next_field is None:
+            return DEGRADE_FINAL_TEXT
+        question = FIELD_QUESTIONS.get(next_field)
+        return f"{DEGRADE_ACK_TEXT} {question}" if question else None
+
+    def generate(
+        self,
+        fn: Callable[[], str],
+        fallback_text: str | None = None,
+        on_slow: Callable[[], None] | None = None,
+    ) -> str:
+        """
+        Run an LLM call, answering with fallback_text if it overruns the LLM budget.
+
+        Args:
+            fn: Performs the LLM call and returns the response text.
+            fallback_text: Response to use on overrun. If None the call is awaited in full.
+            on_slow: Called once if the LLM has not answered after filler_after seconds.
+
+        Returns:
+            The LLM response, or fallback_text if the budget ran out.
+        """
+        if not self.enabled or fallback_text is None:
+            return fn()
+        future = self._run("llm", fn, on_slow)
+        if future is not None:
+            return future.result()
+        self._record("llm_canonical_question", f"answered with '{fallback_text}'")
+        return fallback_text
+
+    def synthesize(self, text: str) -> str:
+        """
+        Synthesise text within the TTS budget, degrading to the fallback engine and cached audio.
+
+        Args:
+            text: The text to synthesise.
+
+        Returns:
+            Path to an audio file. Caller is responsible for deleting it.
+
+        Raises:
+            RuntimeError: If every fallback fails and no cached audio is available.
+        """
+        if not self.enabled:
+            return self._tts.synthesize(text)
+
+        cached = self.cached_audio(text)
+        if cached:
+            return cached
+
+        # The primary and fallback engines share one TTS budget
+        budget = self._budgets["tts"]
+        fallback = self._fallback()
+        start = time.monotonic()
+        primary_budget = budget * (1 - DEGRADE_TTS_FALLBACK_SHARE) if fallback is not None else budget
+        future = self._run("tts", lambda: self._tts.synthesize(text), on_abandon=_discard_late_file, budget=primary_budget)
+        if future is not None:
+            path = future.result()
+            self._remember(self._tts, text, path)
+            return path
+
+        if fallback is not None:
+            self._record("tts_fallback_engine", type(fallback).__name__)
+            try:
+                left = max(0.0, budget - (time.monotonic() - start))
+                future = self._run("tts", lambda: fallback.synthesize(text), on_abandon=_discard_late_file, budget=left)
+                if future is not None:
+                    path = future.result()
+                    self._remember(fallback, text, path)
+                    return path
+            except Exception as e:
+                logger.warning(f"Fallback TTS failed: {e}")
+
+        cached = self.cached_audio(DEGRADE_FILLER_TEXT)
+        if cached:
+            self._record("tts_filler_audio", "no synthesis finished within budget")
+            return cached
+        raise RuntimeError("TTS exceeded its latency budget and no fallback audio is available")
+
+    def filler_audio(self) -> str | None:
+        """
+        Return a copy of the cached filler acknowledgement, recording that it was used.
+
+        Returns:
+            Path to an audio file the caller must delete, or None if it is not cached yet.
+        """
+        path = self.cached_audio(DEGRADE_FILLER_TEXT)
+        if path:
+            self._record("filler_played", "LLM slower than filler threshold")
+        return path
+
+    def _fallback(self) -> TTSEngine | None:
+        """Return the fallback TTS engine, loading it on first use. None if unavailable or the same as primary."""
+        if isinstance(self._fallback_tts, str):
+            if self._fallback_tts.rsplit(".", 1)[1] == type(self._tts).__name__:
+                self._fallback_tts = None
+            else:
+                from core.pipeline import load_engine
+                try:
+                    self._fallback_tts = load_engine(self._fallback_tts)
+                except Exception as e:
+                    logger.warning(f"Could not load fallback TTS {self._fallback_tts}: {e}")
+                    self._fallback_tts = None
+        return self._fallback_tts
+
+    def _remember(self, engine: TTSEngine, text: str, path: str):
+        """Cache the audio for a fixed phrase so later degraded turns can reuse it."""
+        if text not in canonical_texts():
+            return
+        try:
+            with open(path, "rb") as f:
+                audio = f.read()
+        except OSError as e:
+            logger.warning(f"Could not cache audio for '{text}': {e}")
+            return
+        with _lock:
+            _audio_cache[(type(engine).__name__, text)] = (audio, os.path.splitext(path)[1])
+
+    def cached_audio(self, text: str) -> str | None:
+        """
+        Write cached audio for text to a new temp file, preferring the primary engine's voice.
+
+        Returns:
+            Path to the temp file, or None if the text has not been cached by any engine.
+        """
+        with _lock:
+            entry = _audio_cache.get((type(self._tts).__name__, text))
+            if entry is None:
+                entry = next((v for (_, t), v in _audio_cache.items() if t == text), None)
+        if entry is None:
+            return None
+        audio, suffix = entry
+        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+            tmp.write(audio)
+            return tmp.name
+
+    def preload(self):
+        """Synthesise and cache every fixed phrase not cached yet. Failures are logged, not raised."""
+        if not self.enabled:
+            return
+        for text in canonical_texts():
+            with _lock:
+                if (type(self._tts).__name__, text) in _audio_cache:
+                    continue
+            try:
+                path = self._tts.synthesize(text)
+                self._remember(self._tts, text, path)
+                os.remove(path)
+            except Exception as e:
+                logger.warning(f"Could not preload audio for '{text}': {e}")
+        logger.info("Degradation audio cache ready")
@@ -5,11 +5,19 @@ src.app.core.engines.base
 Abstract base interfaces for the voice agent engine layer.
 """
 
+import os
+import tempfile
+import numpy as np
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 
 class STTEngine(ABC):
     """Base class for Speech-to-Text engines"""
 
+    # True for engines that decode NumPy audio in-process, so callers holding decoded
+    # samples can skip writing a WAV file for them
+    supports_arrays: bool = False
+
     @abstractmethod
     def transcribe(self, audio_path: str) -> str:
         """Transcribe a WAV audio file to text.
@@ -22,6 +30,28 @@ class STTEngine(ABC):
         """
         pass
 
+    def transcribe_array(self, audio: np.ndarray, sample_rate: int) -> str:
+        """Transcribe decoded audio samples.
+
+        Engines that only accept files get a temporary WAV written for them; engines with
+        supports_arrays override this to use the samples directly.
+
+        Args:
+            audio: Samples of shape (n,) or (n, channels)
+            sample_rate: Sample rate of the audio in Hz
+
+        Returns:
+            str: The transcribed text from the audio
+        """
+        import soundfile as sf
+        temp = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
+        temp.close()
+        try:
+            sf.write(temp.name, audio, sample_rate)
+            return self.transcribe(temp.name)
+        finally:
+            os.remove(temp.name)
+
 
 class LLMEngine(ABC):
     """Base class for LLM engines"""
@@ -38,9 +68,27 @@ class LLMEngine(ABC):
         """
         pass
 
+    def generate_stream(self, messages: list[dict]) -> Iterator[str]:
+        """Yield the response in chunks as they arrive from the provider.
+
+        Engines without native streaming yield the full response as a single chunk,
+        so callers can always treat the first chunk as the time-to-first-token.
+
+        Args:
+            messages: OpenAI-style message dicts
+
+        Yields:
+            str: Consecutive pieces of the assistant's response text
+        """
+        yield self.generate(messages)
+
 class TTSEngine(ABC):
     """Base class for Text-to-Speech engines"""
 
+    # True for engines that synthesise PCM in-process, so callers can play or stream
+    # samples without a temporary file round trip
+    supports_pcm: bool = False
+
     @abstractmethod
     def synthesize(self, text: str) -> str:
         """Convert text to speech and write the result to a temporary file.
@@ -54,4 +102,38 @@ class TTSEngine(ABC):
         """
         pass
 
-    
\ No newline at end of file
+    
+
+    def synthesize_pcm(self, text: str) -> tuple[np.ndarray, int]:
+        """Synthesise text to PCM samples in memory.
+
+        Engines that only produce files have theirs decoded and deleted; engines with
+        supports_pcm override this to return samples directly.
+
+        Args:
+            text (str): The input text to synthesize
+
+        Returns:
+            tuple: (mono float32 samples, sample rate in Hz)
+        """
+        import soundfile as sf
+        filepath = self.synthesize(text)
+        try:
+            audio, sample_rate = sf.read(filepath, dtype="float32")
+            return audio, sample_rate
+        finally:
+            os.remove(filepath)
+
+    def synthesize_stream(self, text: str) -> Iterator[tuple[np.ndarray, int]]:
+        """Yield PCM for the text piece by piece as it is synthesised.
+
+        Engines without native streaming yield the whole utterance once, so callers can
+        always start playback on the first piece.
+
+        Args:
+            text (str): The input text to synthesize
+
+        Yields:
+            tuple: (mono float32 samples, sample rate in Hz) for consecutive pieces
+        """
+        yield self.synthesize_pcm(text)
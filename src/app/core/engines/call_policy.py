@@ -0,0 +1,320 @@
+"""
+src.app.core.engines.call_policy
+
+Shared call policy applied to every provider call made by the engine layer.
+
+- Turn deadlines: a turn sets a total budget with turn_deadline(); each provider call
+  gets at most the time remaining, so a slow STT stage leaves less for LLM and TTS
+- Adaptive timeouts: each provider's timeout follows a percentile of its own recent
+  latencies, clamped to per-stage bounds, instead of the SDK's multi-minute default
+- Retry budgets: transient failures are retried with full-jitter backoff, but retries
+  across the whole process are capped to a fraction of requests so an outage cannot
+  multiply load on a struggling provider
+- Admission: each attempt holds the provider's concurrency slot and RPM/TPM quota from
+  core.engines.rate_limit; rejections are raised straight through without retrying.
+  A streamed call (stream()) keeps its slot and the turn deadline until the stream ends
+- Metrics: call, timeout, retry and deadline counters per provider via policy_metrics()
+
+Policies are shared process-wide by provider name, like the failover health registry.
+"""
+
+import time
+import random
+import threading
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from collections.abc import Callable, Iterable, Iterator
+from typing import TypeVar
+from core.engines.rate_limit import limiter_for, AdmissionRejected
+from utils.latency import LatencyWindow
+from utils.logger import setup_logger
+from config import (
+    TURN_BUDGET,
+    CALL_TIMEOUT_BOUNDS,
+    CALL_TIMEOUT_PERCENTILE,
+    CALL_TIMEOUT_MULTIPLIER,
+    CALL_TIMEOUT_MIN_SAMPLES,
+    CALL_MAX_RETRIES,
+    RETRY_BUDGET_RATIO,
+    RETRY_BUDGET_MAX_TOKENS,
+    RETRY_BACKOFF_BASE,
+)
+
+logger = setup_logger(__name__, log_type="pipeline")
+
+T = TypeVar("T")
+
+_deadline: ContextVar[float | None] = ContextVar("turn_deadline", default=None)
+
+
+class DeadlineExceeded(RuntimeError):
+    """Raised when a provider call is attempted after the turn budget is spent."""
+
+
+@contextmanager
+def turn_deadline(budget: float = TURN_BUDGET):
+    """
+    Set a total time budget for the provider calls made inside the block.
+
+    Args:
+        budget: Seconds available for every provider call in the turn combined.
+    """
+    token = _deadline.set(time.monotonic() + budget)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> float | None:
+    """Return the seconds left in the current turn budget, or None outside a turn."""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def _exception_chain(e: BaseException):
+    """Yield an exception and every exception it was raised from."""
+    while e is not None:
+        yield e
+        e = e.__cause__ or e.__context__
+
+
+def is_timeout(e: BaseException) -> bool:
+    """True if the exception (or its cause) is a timeout from any HTTP client library."""
+    return any(
+        "Timeout" in cls.__name__
+        for err in _exception_chain(e)
+        for cls in type(err).__mro__
+    )
+
+
+def is_retryable(e: BaseException) -> bool:
+    """True for timeouts, connection errors, rate limits and 5xx responses."""
+    for err in _exception_chain(e):
+        if is_timeout(err) or "Connection" in type(err).__name__:
+            return True
+        status = getattr(err, "status_code", None) or getattr(getattr(err, "response", None), "status_code", None)
+        if isinstance(status, int) and (status in (408, 409, 429) or status >= 500):
+            return True
+    return False
+
+
+class RetryBudget:
+    """Token bucket where each request deposits a fraction of a token and each retry spends one."""
+
+    def __init__(self, ratio: float = RETRY_BUDGET_RATIO, max_tokens: float = RETRY_BUDGET_MAX_TOKENS):
+        """
+        Args:
+            ratio: Tokens deposited per request, i.e. the long-run retries-per-request cap.
+            max_tokens: Bucket capacity, bounding how many retries can burst at once.
+        """
+        self._ratio = ratio
+        self._max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        with self._lock:
+            self._tokens = min(self._max_tokens, self._tokens + self._ratio)
+
+    def try_spend(self) -> bool:
+        """Spend one token if available, returning whether the retry is allowed."""
+        with self._lock:
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+
+class CallPolicy:
+    """Deadline-aware adaptive timeout and budgeted retry wrapper for one provider."""
+
+    def __init__(
+        self,
+        name: str,
+        stage: str,
+        percentile: float = CALL_TIMEOUT_PERCENTILE,
+        multiplier: float = CALL_TIMEOUT_MULTIPLIER,
+        min_samples: int = CALL_TIMEOUT_MIN_SAMPLES,
+        max_retries: int = CALL_MAX_RETRIES,
+        backoff_base: float = RETRY_BACKOFF_BASE,
+    ):
+        """
+        Args:
+            name: Provider name used in logs and metrics, e.g. "groq".
+            stage: Pipeline stage ("stt", "llm" or "tts"), selects CALL_TIMEOUT_BOUNDS.
+            percentile: Latency percentile the timeout is derived from.
+            multiplier: Headroom applied on top of the percentile latency.
+            min_samples: Samples required before the percentile replaces the maximum timeout.
+            max_retries: Retries allowed per call, subject to the shared retry budget.
+            backoff_base: Base delay in seconds for exponential full-jitter backoff.
+        """
+        self.name = name
+        self.stage = stage
+        self._min_timeout, self._max_timeout = CALL_TIMEOUT_BOUNDS[stage]
+        self._percentile = percentile
+        self._multiplier = multiplier
+        self._min_samples = min_samples
+        self._max_retries = max_retries
+        self._backoff_base = backoff_base
+        self._latency = LatencyWindow()
+        self._budget = RetryBudget()
+        self._limiter = limiter_for(name)
+        self._lock = threading.Lock()
+        self._metrics = {"calls": 0, "failures": 0, "timeouts": 0, "retries": 0,
+                         "retry_budget_exhausted": 0, "deadline_exceeded": 0, "rejected": 0}
+
+    def _count(self, metric: str):
+        with self._lock:
+            self._metrics[metric] += 1
+
+    def timeout(self) -> float:
+        """
+        Return the timeout for the next attempt.
+
+        Returns:
+            Seconds, from the provider's latency percentile with headroom, clamped to the
+            stage bounds and capped by whatever is left of the current turn budget.
+        """
+        timeout = self._max_timeout
+        if len(self._latency) >= self._min_samples:
+            observed = self._latency.percentile(self._percentile) * self._multiplier
+            timeout = min(max(observed, self._min_timeout), self._max_timeout)
+        left = remaining()
+        return timeout if left is None else max(0.0, min(timeout, left))
+
+    def call(self, fn: Callable[[float], T], tokens: int = 0, retryable: bool = True) -> T:
+        """
+        Run a provider call under the policy.
+
+        Args:
+            fn: Callable taking the timeout in seconds and performing one attempt.
+            tokens: Estimated tokens per attempt, counted against the provider's TPM quota.
+            retryable: False for calls into a local inference queue. Their timeouts leave the
+                       abandoned job running on its slot, so a retry would only queue a
+                       second copy behind it.
+
+        Returns:
+            The result of the first successful attempt.
+
+        Raises:
+            DeadlineExceeded: If the turn budget is spent before an attempt can start.
+            AdmissionRejected: If the provider's queue is full or its quota will not refill in time.
+            Exception: The last attempt's exception once retries or budget run out.
+        """
+        result, slot = self._attempt(fn, tokens, retryable)
+        slot.close()
+        return result
+
+    @contextmanager
+    def stream(self, fn: Callable[[float], T], tokens: int = 0) -> Iterator[T]:
+        """
+        Open a streamed provider response under the policy and hold its slot until the block exits.
+
+        Opening is retried like call(); the provider's concurrency slot is then kept while
+        the caller reads the stream, so a limit of one really means one generation at a time.
+        Read the stream through within_deadline() to keep the turn deadline in force.
+
+        Args:
+            fn: Callable taking the timeout in seconds and opening the stream.
+            tokens: Estimated tokens per attempt, counted against the provider's TPM quota.
+
+        Yields:
+            The opened stream, e.g. a streaming HTTP response.
+
+        Raises:
+            DeadlineExceeded: If the turn budget is spent before an attempt can start.
+            AdmissionRejected: If the provider's queue is full or its quota will not refill in time.
+            Exception: The last attempt's exception once retries or budget run out.
+        """
+        result, slot = self._attempt(fn, tokens, retryable=True)
+        with slot:
+            yield result
+
+    def within_deadline(self, chunks: Iterable[T]) -> Iterator[T]:
+        """
+        Yield chunks of a stream, stopping once the turn budget is spent.
+
+        Raises:
+            DeadlineExceeded: If the turn deadline passes before the stream ends.
+        """
+        for chunk in chunks:
+            left = remaining()
+            if left is not None and left <= 0:
+                self._count("deadline_exceeded")
+                logger.warning(f"Turn budget spent while streaming from {self.name}, abandoning the stream")
+                raise DeadlineExceeded(f"Turn deadline exceeded while streaming from {self.name}")
+            yield chunk
+
+    def _attempt(self, fn: Callable[[float], T], tokens: int, retryable: bool) -> tuple[T, ExitStack]:
+        """Run fn with retries, returning its result and the still-held admission slot."""
+        self._budget.deposit()
+        attempt = 0
+        while True:
+            left = remaining()
+            if left is not None and left <= 0:
+                self._count("deadline_exceeded")
+                logger.warning(f"Turn budget spent before {self.name} call, failing fast")
+                raise DeadlineExceeded(f"Turn deadline exceeded before calling {self.name}")
+
+            timeout = self.timeout()
+            try:
+                with ExitStack() as slot:
+                    slot.enter_context(self._limiter.acquire(tokens, max_wait=left))
+                    timeout = self.timeout()
+                    self._count("calls")
+                    t = time.time()
+                    result = fn(timeout)
+                    self._latency.record(time.time() - t)
+                    return result, slot.pop_all()
+            except AdmissionRejected:
+                self._count("rejected")
+                raise
+            except Exception as e:
+                self._count("failures")
+                if is_timeout(e):
+                    self._count("timeouts")
+                    logger.warning(f"{self.name} call timed out after {timeout:.2f}s")
+                if not retryable or attempt >= self._max_retries or not is_retryable(e):
+                    raise
+                if not self._budget.try_spend():
+                    self._count("retry_budget_exhausted")
+                    logger.warning(f"Retry budget exhausted for {self.name}, not retrying")
+                    raise
+                backoff = random.uniform(0, self._backoff_base * 2 ** attempt)
+                left = remaining()
+                if left is not None and left < backoff + self._min_timeout:
+                    raise
+                attempt += 1
+                self._count("retries")
+                logger.info(f"Retrying {self.name} (attempt {attempt + 1}) in {backoff:.2f}s: {e}")
+                time.sleep(backoff)
+
+    def snapshot(self) -> dict:
+        """Return counters, latency percentiles and the current timeout as a dict."""
+        with self._lock:
+            metrics = dict(self._metrics)
+        for pct in (50, 95, 99):
+            value = self._latency.percentile(pct)
+            metrics[f"p{pct}"] = round(value, 3) if value is not None else None
+        metrics["timeout"] = round(self.timeout(), 3)
+        metrics["queued"] = self._limiter.waiting
+        return metrics
+
+
+_policies: dict[str, CallPolicy] = {}
+_registry_lock = threading.Lock()
+
+
+def policy_for(name: str, stage: str) -> CallPolicy:
+    """Return the shared CallPolicy for a provider, creating it on first use."""
+    with _registry_lock:
+        if name not in _policies:
+            _policies[name] = CallPolicy(name, stage)
+        return _policies[name]
+
+
+def policy_metrics() -> dict[str, dict]:
+    """Return a metrics snapshot for every provider policy, keyed by provider name."""
+    with _registry_lock:
+        return {name: policy.snapshot() for name, policy in _policies.items()}
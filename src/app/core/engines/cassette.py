@@ -0,0 +1,131 @@
+"""
+src.app.core.engines.cassette
+
+Record and replay of provider calls for reproducible end-to-end benchmarks.
+
+In record mode the Cassette*Engine classes wrap a live engine and append every call
+(stage, request key, response and how long it took) to a cassette: a JSON-lines file,
+gzip-compressed when the path ends in .gz. In replay mode they answer from the cassette
+instead, waiting the recorded time multiplied by a time scale, so a pipeline change can be
+benchmarked against exactly the same provider responses and timings, offline.
+
+Requests are matched by key (a hash of the audio, messages or text), then by onboarding
+field for STT, then in recorded order, so replay still lines up when a pipeline change
+alters a prompt. Audio is never stored: STT entries keep only the input's hash, TTS entries
+the duration of the speech, which replay reproduces as silence.
+"""
+
+import os
+import gzip
+import json
+import hashlib
+import threading
+from pathlib import Path
+from core.engines import simulation
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__, log_type="pipeline")
+
+RECORD = "record"
+REPLAY = "replay"
+
+
+def request_key(*parts) -> str:
+    """Hash request content (bytes or JSON-serialisable values) into a short key."""
+    digest = hashlib.sha1()
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else json.dumps(part, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+class Cassette:
+    """The recorded calls of one cassette file, shared by its STT, LLM and TTS engines."""
+
+    def __init__(self, path: str, mode: str):
+        """
+        Args:
+            path: Cassette file, .jsonl or .jsonl.gz.
+            mode: RECORD to append calls, REPLAY to answer from them.
+
+        Raises:
+            RuntimeError: If the mode is unknown, or replaying a cassette that does not exist.
+        """
+        if mode not in (RECORD, REPLAY):
+            raise RuntimeError(f"Unknown cassette mode '{mode}', expected '{RECORD}' or '{REPLAY}'")
+        self.path = Path(path)
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._entries: list[dict] = []
+        self._used: set[int] = set()
+        if mode == REPLAY:
+            if not self.path.exists():
+                raise RuntimeError(f"Cassette {self.path} not found, record one first")
+            with self._open("rt") as f:
+                self._entries = [json.loads(line) for line in f if line.strip()]
+            logger.info(f"Replaying {len(self._entries)} calls from {self.path}")
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            logger.info(f"Recording provider calls to {self.path}")
+
+    def _open(self, mode: str):
+        return gzip.open(self.path, mode, encoding="utf-8") if self.path.suffix == ".gz" else open(self.path, mode, encoding="utf-8")
+
+    def append(self, entry: dict):
+        """Write one recorded call to the end of the cassette."""
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+        with self._lock:
+            with self._open("at") as f:
+                f.write(line)
+
+    def match(self, stage: str, key: str, field: str | None = None) -> dict:
+        """
+        Take the recorded call that answers a request, using each entry once per pass.
+
+        Prefers the first unused entry with the same key, then (for STT) with the same
+        field, then the next unused entry for the stage. Once every entry for the stage has
+        been replayed they are reused from the start, so one recorded session can drive a
+        benchmark of many.
+
+        Raises:
+            RuntimeError: If the cassette has no calls recorded for the stage.
+        """
+        with self._lock:
+            recorded = [(i, e) for i, e in enumerate(self._entries) if e["stage"] == stage]
+            if not recorded:
+                raise RuntimeError(f"Cassette {self.path} has no recorded {stage} calls")
+            unused = [(i, e) for i, e in recorded if i not in self._used]
+            if not unused:
+                self._used.difference_update(i for i, _ in recorded)
+                unused = recorded
+            for predicate in (lambda e: e["key"] == key, lambda e: field is not None and e.get("field") == field, lambda e: True):
+                found = next((i for i, e in unused if predicate(e)), None)
+                if found is not None:
+                    self._used.add(found)
+                    return self._entries[found]
+
+
+# Process-wide cassettes, so the three engines of a session share one file
+_cassettes: dict[tuple[str, str], Cassette] = {}
+_cassettes_lock = threading.Lock()
+
+
+def cassette_for(path: str, mode: str) -> Cassette:
+    """Return the shared Cassette for a path and mode, opening it on first use."""
+    key = (os.path.abspath(path), mode)
+    with _cassettes_lock:
+        if key not in _cassettes:
+            _cassettes[key] = Cassette(path, mode)
+        return _cassettes[key]
+
+
+def replay(stage: str, entry: dict, time_scale: float):
+    """
+    Wait the recorded time of a call, scaled, and re-raise a recorded failure.
+    The wait is recorded like a simulated provider wait, so benchmarks can subtract it.
+
+    Raises:
+        RuntimeError: If the recorded call failed.
+    """
+    simulation.wait(stage, entry["seconds"] * time_scale)
+    if "error" in entry:
+        raise RuntimeError(f"Replayed {stage} failure: {entry['error']}")
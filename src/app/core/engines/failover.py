@@ -0,0 +1,293 @@
+"""
+src.app.core.engines.failover
+
+Provider health tracking and failover routing shared by the Failover*Engine classes.
+Each provider gets a circuit breaker fed by an EWMA of its latency and error rate.
+Health is shared process-wide by provider name, so every session's pipeline sees the
+same view of which providers are degraded, and a single background thread probes
+open circuits until the provider recovers.
+"""
+
+import time
+import threading
+from collections.abc import Callable
+from core.engines.call_policy import DeadlineExceeded
+from core.engines.rate_limit import AdmissionRejected
+from utils.logger import setup_logger
+from config import (
+    PROVIDER_EWMA_ALPHA,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_SLOW_THRESHOLD,
+    CIRCUIT_COOLDOWN,
+    CIRCUIT_PROBE_INTERVAL,
+)
+
+logger = setup_logger(__name__, log_type="pipeline")
+
+CLOSED = "closed"
+OPEN = "open"
+
+
+def _own_failure(e: BaseException) -> bool:
+    """
+    True if an error came from our own call policy (turn deadline spent, queue full or
+    quota exhausted) rather than from the provider. Engines wrap errors, so the chain is walked.
+    """
+    while e is not None:
+        if isinstance(e, (DeadlineExceeded, AdmissionRejected)):
+            return True
+        e = e.__cause__ or e.__context__
+    return False
+
+
+class ProviderHealth:
+    """EWMA latency and error-rate tracker with a circuit breaker for one provider."""
+
+    def __init__(
+        self,
+        name: str,
+        latency_slo: float,
+        alpha: float = PROVIDER_EWMA_ALPHA,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        slow_threshold: int = CIRCUIT_SLOW_THRESHOLD,
+        cooldown: float = CIRCUIT_COOLDOWN,
+    ):
+        """
+        Initialise a closed circuit with no latency history.
+
+        Args:
+            name: Provider name used in logs and health snapshots.
+            latency_slo: Latency in seconds above which a call counts as an SLO breach.
+            alpha: EWMA smoothing factor, higher values react faster to recent calls.
+            failure_threshold: Consecutive failures that open the circuit.
+            slow_threshold: Consecutive SLO breaches that open the circuit.
+            cooldown: Seconds an open circuit waits before it is probed.
+        """
+        self.name = name
+        self.latency_slo = latency_slo
+        self._alpha = alpha
+        self._failure_threshold = failure_threshold
+        self._slow_threshold = slow_threshold
+        self._cooldown = cooldown
+        self._lock = threading.Lock()
+        self.state = CLOSED
+        self.ewma_latency: float | None = None
+        self.ewma_error_rate = 0.0
+        self._consecutive_failures = 0
+        self._consecutive_slow = 0
+        self._opened_at = 0.0
+
+    def _open(self, reason: str):
+        """Open the circuit. Caller must hold the lock."""
+        if self.state != OPEN:
+            logger.warning(f"Circuit opened for {self.name}: {reason}")
+        self.state = OPEN
+        self._opened_at = time.monotonic()
+
+    def record_success(self, latency: float):
+        """
+        Record a successful call and open the circuit on repeated SLO breaches.
+
+        Args:
+            latency: Call latency in seconds.
+        """
+        with self._lock:
+            if self.ewma_latency is None:
+                self.ewma_latency = latency
+            else:
+                self.ewma_latency = self._alpha * latency + (1 - self._alpha) * self.ewma_latency
+            self.ewma_error_rate = (1 - self._alpha) * self.ewma_error_rate
+            self._consecutive_failures = 0
+            self._consecutive_slow = self._consecutive_slow + 1 if latency > self.latency_slo else 0
+            if self._consecutive_slow >= self._slow_threshold:
+                self._open(f"{self._consecutive_slow} calls over the {self.latency_slo:.1f}s latency SLO")
+
+    def record_failure(self):
+        """Record a failed call and open the circuit on repeated failures."""
+        with self._lock:
+            self.ewma_error_rate = self._alpha + (1 - self._alpha) * self.ewma_error_rate
+            self._consecutive_failures += 1
+            if self._consecutive_failures >= self._failure_threshold:
+                self._open(f"{self._consecutive_failures} consecutive failures")
+
+    def close(self):
+        """Close the circuit after a successful probe, resetting the breach counters."""
+        with self._lock:
+            if self.state == OPEN:
+                logger.info(f"Circuit closed for {self.name}, provider recovered")
+            self.state = CLOSED
+            self._consecutive_failures = 0
+            self._consecutive_slow = 0
+            self.ewma_latency = None
+
+    def reopen(self):
+        """Restart the cooldown after a failed probe."""
+        with self._lock:
+            self._opened_at = time.monotonic()
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == OPEN
+
+    @property
+    def is_healthy(self) -> bool:
+        """True if the circuit is closed and the EWMA latency is within the SLO."""
+        return self.state == CLOSED and (self.ewma_latency is None or self.ewma_latency <= self.latency_slo)
+
+    @property
+    def probe_due(self) -> bool:
+        """True if the circuit is open and the cooldown has elapsed."""
+        return self.state == OPEN and time.monotonic() - self._opened_at >= self._cooldown
+
+    def score(self) -> float:
+        """Return a routing cost, lower is better. Untested providers score zero."""
+        latency = self.ewma_latency or 0.0
+        return latency * (1 + 4 * self.ewma_error_rate) + self.ewma_error_rate
+
+    def snapshot(self) -> dict:
+        """Return the current health figures as a JSON-serialisable dict."""
+        return {
+            "state": self.state,
+            "ewma_latency": round(self.ewma_latency, 3) if self.ewma_latency is not None else None,
+            "ewma_error_rate": round(self.ewma_error_rate, 3),
+            "latency_slo": self.latency_slo,
+        }
+
+
+# Process-wide health and probe registry, keyed by provider name
+_health: dict[str, ProviderHealth] = {}
+_probes: dict[str, Callable[[], None]] = {}
+_registry_lock = threading.Lock()
+_prober: threading.Thread | None = None
+
+
+def health_for(name: str, latency_slo: float) -> ProviderHealth:
+    """Return the shared ProviderHealth for a provider, creating it on first use."""
+    with _registry_lock:
+        if name not in _health:
+            _health[name] = ProviderHealth(name, latency_slo)
+        return _health[name]
+
+
+def provider_health() -> dict[str, dict]:
+    """Return a snapshot of every tracked provider's health, keyed by provider name."""
+    with _registry_lock:
+        return {name: health.snapshot() for name, health in _health.items()}
+
+
+def _probe_loop():
+    """Background loop that probes open circuits once their cooldown has elapsed."""
+    while True:
+        time.sleep(CIRCUIT_PROBE_INTERVAL)
+        with _registry_lock:
+            due = [(_health[name], probe) for name, probe in _probes.items() if _health[name].probe_due]
+        for health, probe in due:
+            logger.info(f"Probing {health.name}...")
+            try:
+                probe()
+                health.close()
+            except Exception as e:
+                logger.warning(f"Probe of {health.name} failed: {e}")
+                health.reopen()
+
+
+def _register_probe(name: str, probe: Callable[[], None]):
+    """Register a provider's probe and start the background prober on first use."""
+    global _prober
+    with _registry_lock:
+        _probes[name] = probe
+        if _prober is None:
+            _prober = threading.Thread(target=_probe_loop, name="provider-prober", daemon=True)
+            _prober.start()
+
+
+class FailoverRouter:
+    """Routes calls across an ordered list of providers, skipping open circuits."""
+
+    def __init__(
+        self,
+        kind: str,
+        providers: list,
+        latency_slo: float,
+        probe: Callable[[object], None],
+    ):
+        """
+        Load the providers and register their background probes.
+
+        Args:
+            kind: Engine kind ("stt", "llm" or "tts"), used in logs and errors.
+            providers: Ordered dotted engine paths or engine instances, most preferred first.
+                       Providers that fail to initialise (e.g. missing API key) are skipped.
+            latency_slo: Per-call latency SLO in seconds for this engine kind.
+            probe: Callable that makes a minimal call against an engine, raising on failure.
+
+        Raises:
+            RuntimeError: If none of the providers could be initialised.
+        """
+        self.kind = kind
+        self._providers: list[tuple[object, ProviderHealth]] = []
+        for provider in providers:
+            if isinstance(provider, str):
+                name = provider.rsplit(".", 1)[-1]
+                try:
+                    from core.pipeline import load_engine
+                    engine = load_engine(provider)
+                except Exception as e:
+                    logger.warning(f"Skipping {kind} provider {name}: {e}")
+                    continue
+            else:
+                name, engine = type(provider).__name__, provider
+            health = health_for(name, latency_slo)
+            _register_probe(name, lambda engine=engine: probe(engine))
+            self._providers.append((engine, health))
+
+        if not self._providers:
+            raise RuntimeError(f"No {kind} providers could be initialised for failover")
+
+    def _route(self) -> list[tuple[object, ProviderHealth]]:
+        """
+        Order providers for a call: healthy ones in configured order, then degraded
+        closed ones by score, then open ones as a last resort.
+        """
+        healthy = [p for p in self._providers if p[1].is_healthy]
+        degraded = sorted(
+            (p for p in self._providers if not p[1].is_healthy and not p[1].is_open),
+            key=lambda p: p[1].score(),
+        )
+        tripped = [p for p in self._providers if p[1].is_open]
+        return healthy + degraded + tripped
+
+    def call(self, method: str, *args):
+        """
+        Call a method on the healthiest provider, failing over down the route on errors.
+
+        Args:
+            method: Engine method name, e.g. "generate".
+            *args: Positional arguments forwarded to the method.
+
+        Returns:
+            The first successful provider's result.
+
+        Raises:
+            RuntimeError: If every provider fails, chained from the last provider's error.
+            DeadlineExceeded, AdmissionRejected: Re-raised as is (possibly wrapped by the
+                engine) without failing over or counting against the provider's health,
+                since the provider did nothing wrong.
+        """
+        errors = []
+        last_error = None
+        for engine, health in self._route():
+            t = time.time()
+            try:
+                result = getattr(engine, method)(*args)
+            except Exception as e:
+                if _own_failure(e):
+                    raise
+                health.record_failure()
+                logger.warning(f"{self.kind.upper()} provider {health.name} failed, failing over: {e}")
+                errors.append(f"{health.name}: {e}")
+                last_error = e
+                continue
+            health.record_success(time.time() - t)
+            return result
+        raise RuntimeError(f"All {self.kind} providers failed: {'; '.join(errors)}") from last_error
@@ -0,0 +1,110 @@
+"""
+src.app.core.engines.llm.cassette_llm
+
+Record-and-replay LLM engine for reproducible benchmarks (see core.engines.cassette).
+Records a live engine's responses with their timing, including when each streamed chunk
+arrived, or replays them with the recorded or scaled timing. Requests are keyed by a hash
+of the messages.
+"""
+
+import time
+from collections.abc import Iterator
+from core import tracing
+from core.engines.base import LLMEngine
+from core.engines.cassette import RECORD, cassette_for, request_key, replay
+from core.engines import simulation
+from utils.logger import setup_logger
+from config import CASSETTE_MODE, CASSETTE_PATH, CASSETTE_TIME_SCALE, CASSETTE_ENGINES
+
+logger = setup_logger(__name__, log_type="pipeline")
+
+
+class CassetteLLMEngine(LLMEngine):
+    """Records a live LLM engine's calls to a cassette, or replays them from it."""
+
+    def __init__(
+        self,
+        engine: LLMEngine | None = None,
+        mode: str = CASSETTE_MODE,
+        path: str = CASSETTE_PATH,
+        time_scale: float = CASSETTE_TIME_SCALE,
+    ):
+        """
+        Args:
+            engine: Live engine to record; defaults to loading CASSETTE_ENGINES["llm"].
+                    Unused when replaying.
+            mode: "record" or "replay".
+            path: Cassette file, shared with the STT and TTS cassette engines.
+            time_scale: Multiplier on recorded timings when replaying, 0 for no waits.
+
+        Raises:
+            RuntimeError: If the mode is unknown or the cassette to replay does not exist.
+        """
+        self._cassette = cassette_for(path, mode)
+        self._time_scale = time_scale
+        self._engine = None
+        if mode == RECORD:
+            from core.pipeline import load_engine
+            self._engine = engine or load_engine(CASSETTE_ENGINES["llm"])
+
+    def generate(self, messages: list[dict]) -> str:
+        """
+        Generate a response with the live engine, or replay the recorded one.
+
+        Raises:
+            RuntimeError: If generation fails, the recorded call failed, or the cassette has no calls for the stage.
+        """
+        key = request_key(messages)
+        if self._engine is None:
+            entry = self._cassette.match("llm", key)
+            replay("llm", entry, self._time_scale)
+            logger.info(f"Assistant: '{entry['text']}' [replayed]")
+            return entry["text"]
+
+        t = time.time()
+        try:
+            text = self._engine.generate(messages)
+        except Exception as e:
+            self._cassette.append({"stage": "llm", "key": key, "seconds": round(time.time() - t, 4), "error": str(e)})
+            raise
+        self._cassette.append({"stage": "llm", "key": key, "seconds": round(time.time() - t, 4), "text": text})
+        return text
+
+    def generate_stream(self, messages: list[dict]) -> Iterator[str]:
+        """
+        Stream a response from the live engine, or replay the recorded chunks at the
+        (scaled) times they arrived.
+
+        Raises:
+            RuntimeError: If generation fails, the recorded call failed, or the cassette has no calls for the stage.
+        """
+        key = request_key(messages)
+        if self._engine is None:
+            entry = self._cassette.match("llm", key)
+            chunks = entry.get("chunks") or [[entry["seconds"], entry.get("text", "")]]
+            if "error" in entry:
+                replay("llm", entry, self._time_scale)
+            elapsed = 0.0
+            for offset, chunk in chunks:
+                simulation.wait("llm", max(offset - elapsed, 0.0) * self._time_scale)
+                elapsed = offset
+                tracing.first_token()
+                yield chunk
+            return
+
+        t = time.time()
+        chunks = []
+        try:
+            for chunk in self._engine.generate_stream(messages):
+                chunks.append([round(time.time() - t, 4), chunk])
+                yield chunk
+        except Exception as e:
+            self._cassette.append({"stage": "llm", "key": key, "seconds": round(time.time() - t, 4), "error": str(e)})
+            raise
+        self._cassette.append({
+            "stage": "llm",
+            "key": key,
+            "seconds": round(time.time() - t, 4),
+            "text": "".join(chunk for _, chunk in chunks),
+            "chunks": chunks,
+        })
@@ -0,0 +1,52 @@
+"""
+src.app.core.engines.llm.failover_llm
+
+Failover LLM engine implementation.
+Routes each request to the healthiest provider in FAILOVER_ENGINES["llm"], failing over
+down the list when a provider errors and skipping providers whose circuit is open.
+"""
+
+from core.engines.base import LLMEngine
+from core.engines.failover import FailoverRouter
+from config import FAILOVER_ENGINES, STAGE_LATENCY_SLO
+
+PROBE_MESSAGES = [{"role": "user", "content": "Reply with OK."}]
+
+
+def _probe(engine: LLMEngine):
+    """Send a one-line prompt to check an LLM provider has recovered."""
+    engine.generate(PROBE_MESSAGES)
+
+
+class FailoverLLMEngine(LLMEngine):
+    """Generates responses with the healthiest of several LLM providers."""
+
+    def __init__(self, providers: list | None = None):
+        """
+        Load the configured LLM providers in preference order.
+
+        Args:
+            providers: Dotted engine paths or engine instances, most preferred first.
+                       Defaults to FAILOVER_ENGINES["llm"].
+
+        Raises:
+            RuntimeError: If none of the providers could be initialised.
+        """
+        self._router = FailoverRouter(
+            "llm", providers or FAILOVER_ENGINES["llm"], STAGE_LATENCY_SLO["llm"], _probe
+        )
+
+    def generate(self, messages: list[dict]) -> str:
+        """
+        Generate a response, failing over to the next provider on error.
+
+        Args:
+            messages: OpenAI-style message dicts with role and content keys.
+
+        Returns:
+            The assistant's response text.
+
+        Raises:
+            RuntimeError: If every LLM provider fails.
+        """
+        return self._router.call("generate", messages)
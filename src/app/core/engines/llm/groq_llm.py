@@ -10,7 +10,10 @@ import os
 import time
 from utils.logger import setup_logger
 from core.engines.base import LLMEngine
-from config import LLM_MAX_TOKENS, LLM_TEMPERATURE, LLM_PRESENCE_PENALTY, LLM_FREQUENCY_PENALTY, GROQ_MODEL
+from core.engines.call_policy import policy_for
+from core.engines.openai_client import openai_client
+from core.engines.rate_limit import estimate_tokens
+from config import LLM_MAX_TOKENS, LLM_TEMPERATURE, LLM_PRESENCE_PENALTY, LLM_FREQUENCY_PENALTY, GROQ_MODEL, STAND_IN_BASE_URL
 
 logger = setup_logger(__name__, log_type="pipeline")
 
@@ -29,21 +32,18 @@ class GroqLLMEngine(LLMEngine):
             RuntimeError: If GROQ_API_KEY is not available.
         """
         from dotenv import load_dotenv
-        from openai import OpenAI
 
         load_dotenv()
         api_key = os.getenv("GROQ_API_KEY")
-        if not api_key:
+        if not api_key and not STAND_IN_BASE_URL:
             raise RuntimeError(
                 "GROQ_API_KEY not set in environment. "
                 "Set it in src/app/.env or as an environment variable."
             )
 
-        self._client = OpenAI(
-            api_key=api_key,
-            base_url="https://api.groq.com/openai/v1",
-        )
+        self._client = openai_client(api_key=api_key, base_url="https://api.groq.com/openai/v1")
         self._model = model
+        self._policy = policy_for("groq", stage="llm")
 
     def generate(self, messages: list[dict]) -> str:
         """
@@ -61,14 +61,15 @@ class GroqLLMEngine(LLMEngine):
         logger.info(f"Generating response with Groq ({self._model})...")
         t = time.time()
         try:
-            response = self._client.chat.completions.create(
+            response = self._policy.call(lambda timeout: self._client.chat.completions.create(
                 model=self._model,
                 messages=messages,
                 max_tokens=LLM_MAX_TOKENS,
                 temperature=LLM_TEMPERATURE,
                 presence_penalty=LLM_PRESENCE_PENALTY,
                 frequency_penalty=LLM_FREQUENCY_PENALTY,
-            )
+                timeout=timeout,
+            ), tokens=estimate_tokens(messages) + LLM_MAX_TOKENS)
             ai_response = response.choices[0].message.content
             logger.info(f"Assistant: '{ai_response}' [{time.time() - t:.2f}s]")
             return ai_response
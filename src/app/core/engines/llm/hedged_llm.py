@@ -0,0 +1,201 @@
+"""
+src.app.core.engines.llm.hedged_llm
+
+Hedged LLM engine implementation.
+Wraps two existing LLMEngine instances and races them to cut tail latency. The request
+goes to the primary engine first; if no first token arrives within a percentile-based
+delay, the same request is sent to the secondary engine and whichever responds first wins.
+"""
+
+import time
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from collections.abc import Iterator
+from core import tracing
+from core.engines.base import LLMEngine
+from utils.latency import LatencyWindow
+from utils.logger import setup_logger
+from config import (
+    HEDGE_PRIMARY_LLM,
+    HEDGE_SECONDARY_LLM,
+    HEDGE_PERCENTILE,
+    HEDGE_INITIAL_DELAY,
+    HEDGE_MIN_SAMPLES,
+    HEDGE_MIN_DELAY,
+    HEDGE_MAX_DELAY,
+)
+
+logger = setup_logger(__name__, log_type="pipeline")
+
+# Shared across all sessions so the API does not spawn a pool per pipeline instance
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="hedge")
+
+# Primary time-to-first-token history, keyed by engine class so it survives across sessions
+_latency_windows: dict[str, LatencyWindow] = {}
+_latency_lock = threading.Lock()
+
+
+def _latency_window_for(engine: LLMEngine) -> LatencyWindow:
+    """Return the shared latency window for an engine's class, creating it on first use."""
+    key = type(engine).__name__
+    with _latency_lock:
+        if key not in _latency_windows:
+            _latency_windows[key] = LatencyWindow()
+        return _latency_windows[key]
+
+
+def _first_chunk(engine: LLMEngine, messages: list[dict]) -> tuple[str, Iterator[str]]:
+    """Start a streamed generation and block until its first chunk arrives."""
+    stream = engine.generate_stream(messages)
+    chunk = next(stream, "")
+    tracing.first_token()
+    return chunk, stream
+
+
+def _abandon(future: Future):
+    """Cancel a losing attempt, or close its stream once it finishes if already running."""
+    if future.cancel():
+        return
+
+    def _close(f: Future):
+        if not f.cancelled() and f.exception() is None:
+            _, stream = f.result()
+            close = getattr(stream, "close", None)
+            if close:
+                close()
+
+    future.add_done_callback(_close)
+
+
+class HedgedLLMEngine(LLMEngine):
+    """Races a primary and a secondary LLM engine, hedging only when the primary is slow."""
+
+    def __init__(
+        self,
+        primary: LLMEngine | None = None,
+        secondary: LLMEngine | None = None,
+        percentile: float = HEDGE_PERCENTILE,
+        initial_delay: float = HEDGE_INITIAL_DELAY,
+        min_samples: int = HEDGE_MIN_SAMPLES,
+        min_delay: float = HEDGE_MIN_DELAY,
+        max_delay: float = HEDGE_MAX_DELAY,
+    ):
+        """
+        Initialise the hedged engine from two engine instances.
+
+        Args:
+            primary: Engine that receives every request. Defaults to HEDGE_PRIMARY_LLM.
+            secondary: Engine used only when the primary is slow or fails.
+                       Defaults to HEDGE_SECONDARY_LLM.
+            percentile: Percentile of the primary's time-to-first-token used as the hedge delay.
+            initial_delay: Hedge delay in seconds until enough samples are collected.
+            min_samples: Number of primary samples required before the percentile is trusted.
+            min_delay: Lower bound on the hedge delay in seconds.
+            max_delay: Upper bound on the hedge delay in seconds.
+        """
+        if primary is None or secondary is None:
+            from core.pipeline import load_engine
+            primary = primary or load_engine(HEDGE_PRIMARY_LLM)
+            secondary = secondary or load_engine(HEDGE_SECONDARY_LLM)
+        self._primary = primary
+        self._secondary = secondary
+        self._percentile = percentile
+        self._initial_delay = initial_delay
+        self._min_samples = min_samples
+        self._min_delay = min_delay
+        self._max_delay = max_delay
+        self._latency = _latency_window_for(self._primary)
+
+    def hedge_delay(self) -> float:
+        """
+        Return how long to wait for the primary's first token before hedging.
+
+        Returns:
+            Delay in seconds, derived from the primary's recent latency percentile.
+        """
+        if len(self._latency) < self._min_samples:
+            return self._initial_delay
+        delay = self._latency.percentile(self._percentile)
+        return min(max(delay, self._min_delay), self._max_delay)
+
+    def _submit(self, engine: LLMEngine, messages: list[dict]) -> Future:
+        """Submit a first-chunk attempt, carrying the caller's turn deadline into the worker thread."""
+        return _executor.submit(contextvars.copy_context().run, _first_chunk, engine, messages)
+
+    def _submit_primary(self, messages: list[dict]) -> Future:
+        """Submit the primary attempt and record its time-to-first-token when it completes."""
+        t = time.time()
+        future = self._submit(self._primary, messages)
+
+        def _record(f: Future):
+            if not f.cancelled() and f.exception() is None:
+                self._latency.record(time.time() - t)
+
+        future.add_done_callback(_record)
+        return future
+
+    def generate_stream(self, messages: list[dict]) -> Iterator[str]:
+        """
+        Stream a response from whichever engine produces its first token first.
+
+        Args:
+            messages: OpenAI-style message dicts with role and content keys.
+
+        Yields:
+            Consecutive pieces of the winning engine's response text.
+
+        Raises:
+            RuntimeError: If both the primary and secondary engines fail.
+        """
+        delay = self.hedge_delay()
+        t = time.time()
+        attempts = {self._submit_primary(messages): "primary"}
+
+        done, _ = wait(attempts, timeout=delay)
+        if not done:
+            logger.info(f"No first token from primary after {delay:.2f}s, hedging to secondary...")
+            attempts[self._submit(self._secondary, messages)] = "secondary"
+
+        winner = None
+        errors = []
+        pending = set(attempts)
+        while pending and winner is None:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    winner = future
+                    break
+                errors.append(f"{attempts[future]}: {future.exception()}")
+            if winner is None and "secondary" not in attempts.values():
+                logger.warning(f"Primary LLM failed, falling back to secondary: {errors[-1]}")
+                secondary = self._submit(self._secondary, messages)
+                attempts[secondary] = "secondary"
+                pending.add(secondary)
+
+        for future in pending:
+            _abandon(future)
+
+        if winner is None:
+            logger.error(f"Hedged LLM request failed on all engines: {errors}")
+            raise RuntimeError(f"Failed to generate response from any hedged engine: {'; '.join(errors)}")
+
+        logger.info(f"Hedged LLM first token from {attempts[winner]} [{time.time() - t:.2f}s]")
+        first, stream = winner.result()
+        yield first
+        yield from stream
+
+    def generate(self, messages: list[dict]) -> str:
+        """
+        Generate a response, hedging to the secondary engine if the primary is slow.
+
+        Args:
+            messages: OpenAI-style message dicts with role and content keys.
+
+        Returns:
+            The assistant's response text from whichever engine won the race.
+
+        Raises:
+            RuntimeError: If both the primary and secondary engines fail.
+        """
+        return "".join(chunk for chunk in self.generate_stream(messages) if chunk)
@@ -6,37 +6,76 @@ src.app.core.engines.llm.ollama_llm
 Ollama local LLM engine implementation.
 Implements LLMEngine using a locally running Ollama instance.
 Requires Ollama to be running at the configured base_url before use.
+Responses are streamed over a persistent HTTP session, the model is kept resident between
+turns with keep_alive, and it is loaded into memory in the background at construction so
+the first turn does not pay the cold-load cost.
 """
 
+import json
 import time
+import threading
 import requests
+from contextlib import ExitStack
+from collections.abc import Iterator
+from requests.adapters import HTTPAdapter
+from core import tracing
 from core.engines.base import LLMEngine
+from core.engines.call_policy import policy_for
+from core.engines.rate_limit import estimate_tokens
 from utils.logger import setup_logger
+from config import OLLAMA_MODEL, OLLAMA_BASE_URL, OLLAMA_KEEP_ALIVE, OLLAMA_OPTIONS, OLLAMA_PRELOAD
 
 logger = setup_logger(__name__, log_type="pipeline")
 
+# One pooled session for every engine instance, so turns reuse the same TCP connections
+_session = requests.Session()
+_session.mount("http://", HTTPAdapter(pool_maxsize=16))
+
+_lock = threading.Lock()
+# Model resolved per (base_url, requested model), so availability is checked once per process
+_resolved: dict[tuple[str, str], str] = {}
+# Models loaded (or being loaded) into Ollama's memory by this process
+_preloaded: set[tuple[str, str]] = set()
+
+
 class OllamaLLMEngine(LLMEngine):
     """Generates a response using a local Ollama model via the Ollama REST API."""
 
 
-    def __init__(self, model: str = "gemma3:1b", base_url: str = "http://localhost:11434"):
+    def __init__(
+        self,
+        model: str = OLLAMA_MODEL,
+        base_url: str = OLLAMA_BASE_URL,
+        keep_alive: str | int = OLLAMA_KEEP_ALIVE,
+        options: dict = OLLAMA_OPTIONS,
+        preload: bool = OLLAMA_PRELOAD,
+    ):
         """
-        Initialise the Ollama engine and verify the model is available.
+        Initialise the Ollama engine, verify the model is available and start loading it.
 
         Args:
             model: Ollama model tag to use for generation. Defaults to gemma3:1b.
             base_url: Base URL of the running Ollama instance.
-        
+            keep_alive: How long Ollama keeps the model in memory after a request, e.g. "30m", -1 for forever.
+            options: Ollama generation options sent with every request (num_ctx, num_predict, num_thread, ...).
+            preload: Load the model into memory in a background thread now rather than on the first turn.
+
         Raises:
             RuntimeError: If Ollama is unreachable or no models are installed.
         """
         self._model = model
+        self._base_url = base_url
         self._url = f"{base_url}/api/chat"
+        self._keep_alive = keep_alive
+        self._options = {k: v for k, v in options.items() if v is not None}
+        self._policy = policy_for("ollama", stage="llm")
         self._check_ollama(base_url)
+        if preload:
+            self.preload(background=True)
 
     def _check_ollama(self, base_url: str):
         """
-        Verify Ollama is running and the configured model is available.
+        Verify Ollama is running and the configured model is available, once per process.
         Falls back to the first available model if the requested one is not found.
 
         Args:
@@ -45,8 +84,13 @@ class OllamaLLMEngine(LLMEngine):
         Raises:
             RuntimeError: If Ollama is unreachable or no models are installed.
         """
+        key = (base_url, self._model)
+        with _lock:
+            if key in _resolved:
+                self._model = _resolved[key]
+                return
         try:
-            response = requests.get(f"{base_url}/api/tags", timeout=5)
+            response = _session.get(f"{base_url}/api/tags", timeout=5)
             response.raise_for_status()
             models = [m["name"] for m in response.json().get("models", [])]
             if self._model not in models:
@@ -61,6 +105,108 @@ class OllamaLLMEngine(LLMEngine):
                 f"Cannot connect to Ollama: {e}\n"
                 "Make sure Ollama is running: ollama serve"
             )
+        with _lock:
+            _resolved[key] = self._model
+
+    def preload(self, background: bool = False):
+        """
+        Load the model into Ollama's memory and keep it resident, once per process.
+
+        Ollama loads a model when it receives a chat request with no messages, without
+        generating anything.
+
+        Args:
+            background: Return immediately and load in a daemon thread.
+        """
+        key = (self._base_url, self._model)
+        with _lock:
+            if key in _preloaded:
+                return
+            _preloaded.add(key)
+
+        def _load():
+            t = time.time()
+            try:
+                response = _session.post(
+                    self._url,
+                    json={"model": self._model, "messages": [], "keep_alive": self._keep_alive},
+                    timeout=120,
+                )
+                response.raise_for_status()
+                logger.info(f"Ollama model {self._model} loaded [{time.time() - t:.2f}s]")
+            except requests.exceptions.RequestException as e:
+                logger.warning(f"Ollama preload of {self._model} failed: {e}")
+                with _lock:
+                    _preloaded.discard(key)
+
+        if background:
+            threading.Thread(target=_load, name="ollama-preload", daemon=True).start()
+        else:
+            _load()
+
+    def _payload(self, messages: list[dict], stream: bool) -> dict:
+        return {
+            "model": self._model,
+            "messages": messages,
+            "stream": stream,
+            "keep_alive": self._keep_alive,
+            "options": self._options,
+        }
+
+    def generate_stream(self, messages: list[dict]) -> Iterator[str]:
+        """
+        Yield the response in chunks as Ollama generates them.
+
+        The call policy covers connecting and the first response line, and the provider's
+        concurrency slot is held until the stream ends, so PROVIDER_LIMITS["ollama"] bounds
+        how many generations run at once. The timeout then applies to each gap between
+        chunks rather than to the whole response, and the turn deadline to the whole stream.
+
+        Args:
+            messages: OpenAI-style message dicts with role and content keys.
+
+        Yields:
+            Consecutive pieces of the assistant's response text.
+
+        Raises:
+            RuntimeError: If the Ollama server does not respond or reports an error.
+            DeadlineExceeded: If the turn budget runs out mid-stream.
+        """
+        t = time.time()
+
+        def _open(timeout: float) -> requests.Response:
+            response = _session.post(self._url, json=self._payload(messages, stream=True), stream=True, timeout=timeout)
+            response.raise_for_status()
+            return response
+
+        with ExitStack() as held:
+            try:
+                response = held.enter_context(self._policy.stream(_open, tokens=estimate_tokens(messages)))
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Ollama error: {e}")
+                raise RuntimeError("Ollama not responding. Is it running?")
+            held.enter_context(response)
+
+            first = True
+            try:
+                for line in self._policy.within_deadline(response.iter_lines()):
+                    if not line:
+                        continue
+                    data = json.loads(line)
+                    if "error" in data:
+                        raise RuntimeError(f"Ollama error: {data['error']}")
+                    chunk = data.get("message", {}).get("content", "")
+                    if chunk:
+                        if first:
+                            logger.info(f"First token from {self._model} [{time.time() - t:.2f}s]")
+                            tracing.first_token()
+                            first = False
+                        yield chunk
+                    if data.get("done"):
+                        break
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Ollama stream interrupted: {e}")
+                raise RuntimeError(f"Ollama stream interrupted: {e}")
 
     def generate(self, messages: list[dict]) -> str:
         """
@@ -77,17 +223,6 @@ class OllamaLLMEngine(LLMEngine):
         """
         logger.info(f"Generating response with local {self._model}...")
         t = time.time()
-        try:
-            response = requests.post(
-                self._url,
-                json={"model": self._model, "messages": messages, "stream": False},
-                timeout=30,
-            )
-            response.raise_for_status()
-            ai_response = response.json()["message"]["content"]
-            logger.info(f"Assistant: '{ai_response}' [{time.time() - t:.2f}s]")
-            return ai_response
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Ollama error: {e}")
-            raise RuntimeError("Ollama not responding. Is it running?")
-
+        ai_response = "".join(self.generate_stream(messages))
+        logger.info(f"Assistant: '{ai_response}' [{time.time() - t:.2f}s]")
+        return ai_response
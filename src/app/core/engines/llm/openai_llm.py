@@ -10,6 +10,9 @@ Requires OPENAI_API_KEY to be set in .env.
 import time
 from config import LLM_MAX_TOKENS, LLM_TEMPERATURE, LLM_PRESENCE_PENALTY, LLM_FREQUENCY_PENALTY
 from core.engines.base import LLMEngine
+from core.engines.call_policy import policy_for
+from core.engines.openai_client import openai_client
+from core.engines.rate_limit import estimate_tokens
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__, log_type="pipeline")
@@ -25,10 +28,10 @@ class OpenAILLMEngine(LLMEngine):
             model: The OpenAI model to use for text generation. Defaults to gpt-4.
         """
         from dotenv import load_dotenv
-        from openai import OpenAI
         load_dotenv()
-        self._client = OpenAI()
+        self._client = openai_client()
         self._model = model
+        self._policy = policy_for("openai", stage="llm")
 
     def generate(self, messages: list[dict]) -> str:
         """
@@ -46,14 +49,15 @@ class OpenAILLMEngine(LLMEngine):
         logger.info(f"Generating response with {self._model}...")
         t = time.time()
         try:
-            response = self._client.chat.completions.create(
+            response = self._policy.call(lambda timeout: self._client.chat.completions.create(
                 model=self._model,
                 messages=messages,
                 max_tokens=LLM_MAX_TOKENS,
                 temperature=LLM_TEMPERATURE,
                 presence_penalty=LLM_PRESENCE_PENALTY,
                 frequency_penalty=LLM_FREQUENCY_PENALTY,
-            )
+                timeout=timeout,
+            ), tokens=estimate_tokens(messages) + LLM_MAX_TOKENS)
             ai_response = response.choices[0].message.content
             logger.info(f"Assistant: '{ai_response}' [{time.time() - t:.2f}s]")
             return ai_response
@@ -8,6 +8,9 @@ Supports any model available on OpenRouter via a single endpoint, but requires a
 
 import time
 from core.engines.base import LLMEngine
+from core.engines.call_policy import policy_for
+from core.engines.openai_client import openai_client
+from core.engines.rate_limit import estimate_tokens
 from utils.logger import setup_logger
 from config import LLM_MAX_TOKENS, LLM_TEMPERATURE, OPENROUTER_MODEL
 
@@ -19,14 +22,11 @@ class OpenRouterLLMEngine(LLMEngine):
 
     def __init__(self, model: str = OPENROUTER_MODEL):
         from dotenv import load_dotenv
-        from openai import OpenAI
         import os
         load_dotenv()
-        self._client = OpenAI(
-            base_url="https://openrouter.ai/api/v1",
-            api_key=os.getenv("OPENROUTER_API_KEY"),
-        )
+        self._client = openai_client(api_key=os.getenv("OPENROUTER_API_KEY"), base_url="https://openrouter.ai/api/v1")
         self._model = model
+        self._policy = policy_for("openrouter", stage="llm")
 
     def generate(self, messages: list[dict]) -> str:
         """
@@ -44,12 +44,13 @@ class OpenRouterLLMEngine(LLMEngine):
         logger.info(f"Generating response with OpenRouter ({self._model})...")
         t = time.time()
         try:
-            response = self._client.chat.completions.create(
+            response = self._policy.call(lambda timeout: self._client.chat.completions.create(
                 model=self._model,
                 messages=messages,
                 max_tokens=LLM_MAX_TOKENS,
                 temperature=LLM_TEMPERATURE,
-            )
+                timeout=timeout,
+            ), tokens=estimate_tokens(messages) + LLM_MAX_TOKENS)
             ai_response = response.choices[0].message.content
             logger.info(f"Assistant: '{ai_response}' [{time.time() - t:.2f}s]")
             return ai_response
@@ -0,0 +1,82 @@
+"""
+src.app.core.engines.llm.simulated_llm
+
+Simulated LLM engine for offline benchmarks and load tests.
+Implements LLMEngine without a provider: each call waits for a latency drawn from the
+configured simulated profile (core.engines.simulation), longer for longer responses, and
+answers like the onboarding agent does. It acknowledges a field and asks the next one's
+question, summarises after the last field, and closes after the confirmation.
+"""
+
+import re
+import time
+from core.engines.base import LLMEngine
+from core.engines.call_policy import policy_for
+from core.engines.rate_limit import estimate_tokens
+from core.engines.simulation import latency_model, simulate
+from utils.logger import setup_logger
+from config import SIMULATED_PROFILE, ONBOARDING_FIELDS, FIELD_QUESTIONS
+
+logger = setup_logger(__name__, log_type="pipeline")
+
+COLLECTING = re.compile(r"^\[Collecting: (\w+)\]\n(.*)", re.DOTALL)
+CLOSING_TEXT = "Thank you, your profile is complete. We will be in touch with matching opportunities. Goodbye!"
+
+
+def scripted_response(messages: list[dict]) -> str:
+    """Return the response the onboarding agent would give to the latest user message."""
+    match = COLLECTING.match(messages[-1]["content"])
+    if match is None:
+        return CLOSING_TEXT
+    field = match.group(1)
+    index = ONBOARDING_FIELDS.index(field) if field in ONBOARDING_FIELDS else len(ONBOARDING_FIELDS) - 1
+    if index + 1 < len(ONBOARDING_FIELDS):
+        return f"Got it, thank you. {FIELD_QUESTIONS[ONBOARDING_FIELDS[index + 1]]}"
+
+    answers = [
+        m.group(2).strip()
+        for m in (COLLECTING.match(message["content"]) for message in messages if message["role"] == "user")
+        if m is not None
+    ]
+    return "Thank you. Here is a summary of what you shared. " + " ".join(answers) + " Does everything look correct?"
+
+
+class SimulatedLLMEngine(LLMEngine):
+    """Returns scripted onboarding responses after a simulated provider delay."""
+
+    def __init__(self, profile: str = SIMULATED_PROFILE):
+        """
+        Args:
+            profile: Latency profile from SIMULATED_PROFILES.
+
+        Raises:
+            RuntimeError: If the profile is not configured.
+        """
+        self._latency = latency_model(profile, "llm")
+        self._policy = policy_for("simulated-llm", stage="llm")
+
+    def generate(self, messages: list[dict]) -> str:
+        """
+        Generate the scripted response to a list of chat messages.
+
+        Args:
+            messages: OpenAI-style message dicts with role and content keys.
+
+        Returns:
+            The assistant's response text.
+
+        Raises:
+            RuntimeError: If the simulated call fails or times out.
+        """
+        t = time.time()
+        response = scripted_response(messages)
+        try:
+            self._policy.call(
+                lambda timeout: simulate("llm", self._latency, chars=len(response), timeout=timeout),
+                tokens=estimate_tokens(messages),
+            )
+        except Exception as e:
+            logger.error(f"Simulated LLM call failed: {e}")
+            raise RuntimeError(f"Failed to generate response: {e}")
+        logger.info(f"Assistant: '{response}' [{time.time() - t:.2f}s, simulated]")
+        return response
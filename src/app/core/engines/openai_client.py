@@ -0,0 +1,30 @@
+"""
+src.app.core.engines.openai_client
+
+Shared construction of OpenAI SDK clients for the OpenAI-compatible engines.
+Retries are left to the call policy (max_retries=0). When STAND_IN_BASE_URL is set, every
+client points at the local stand-in server (benchmarks/stand_in_server.py) instead of the
+provider, so load tests exercise the real engine code paths offline.
+"""
+
+from config import STAND_IN_BASE_URL
+
+
+def openai_client(api_key: str | None = None, base_url: str | None = None):
+    """
+    Create an OpenAI SDK client.
+
+    Args:
+        api_key: Provider API key; None uses OPENAI_API_KEY from the environment.
+        base_url: Provider base URL; None uses the OpenAI API.
+
+    Returns:
+        An openai.OpenAI client, pointed at STAND_IN_BASE_URL when that is set.
+    """
+    from openai import OpenAI
+
+    if STAND_IN_BASE_URL:
+        return OpenAI(api_key="stand-in", base_url=STAND_IN_BASE_URL, max_retries=0)
+    if base_url is None:
+        return OpenAI(max_retries=0)
+    return OpenAI(api_key=api_key, base_url=base_url, max_retries=0)
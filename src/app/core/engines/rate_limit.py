@@ -0,0 +1,200 @@
+"""
+src.app.core.engines.rate_limit
+
+Per-provider concurrency limits and request/token rate limits.
+
+Each provider configured in PROVIDER_LIMITS gets a ProviderLimiter combining a
+concurrency semaphore with token buckets for requests-per-minute and tokens-per-minute
+quotas. Callers wait in a bounded queue for a slot; when the queue is full or the wait
+would exceed its limit, AdmissionRejected is raised immediately so the API can answer
+with 429/503 and a Retry-After header instead of letting provider throttling cascade.
+"""
+
+import math
+import time
+import threading
+from contextlib import contextmanager
+from utils.logger import setup_logger
+from config import PROVIDER_LIMITS, PROVIDER_MAX_QUEUE, PROVIDER_MAX_WAIT
+
+logger = setup_logger(__name__, log_type="pipeline")
+
+
+class AdmissionRejected(RuntimeError):
+    """Raised when a request is refused because a queue is full or a quota is exhausted."""
+
+    def __init__(self, message: str, retry_after: float, status_code: int = 503):
+        """
+        Args:
+            message: Human-readable reason for the rejection.
+            retry_after: Seconds the client should wait before retrying.
+            status_code: HTTP status the API should return, 429 for quota or 503 for overload.
+        """
+        super().__init__(message)
+        self.retry_after = max(1, math.ceil(retry_after))
+        self.status_code = status_code
+
+
+def find_rejection(e: BaseException) -> AdmissionRejected | None:
+    """Return the AdmissionRejected an exception was raised from, if any."""
+    while e is not None:
+        if isinstance(e, AdmissionRejected):
+            return e
+        e = e.__cause__ or e.__context__
+    return None
+
+
+def estimate_tokens(messages: list[dict]) -> int:
+    """Roughly estimate prompt tokens for a chat request at four characters per token."""
+    return sum(len(m.get("content") or "") for m in messages) // 4 + 4 * len(messages)
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a per-minute rate, supporting reservations."""
+
+    def __init__(self, per_minute: float):
+        """
+        Args:
+            per_minute: Refill rate and capacity, e.g. a provider's RPM or TPM quota.
+        """
+        self._rate = per_minute / 60
+        self._capacity = per_minute
+        self._tokens = float(per_minute)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float, max_wait: float) -> float | None:
+        """
+        Reserve tokens, possibly ahead of the refill.
+
+        Args:
+            amount: Tokens needed. Capped at capacity so oversized requests can still run.
+            max_wait: Longest acceptable wait in seconds for the tokens to become available.
+
+        Returns:
+            Seconds the caller must wait before proceeding, or None if that would exceed
+            max_wait (in which case nothing is reserved).
+        """
+        amount = min(amount, self._capacity)
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            wait = max(0.0, (amount - self._tokens) / self._rate)
+            if wait > max_wait:
+                return None
+            self._tokens -= amount
+            return wait
+
+    def time_until(self, amount: float) -> float:
+        """Return seconds until the given amount would be available without reserving it."""
+        with self._lock:
+            tokens = min(self._capacity, self._tokens + (time.monotonic() - self._updated) * self._rate)
+            return max(0.0, (min(amount, self._capacity) - tokens) / self._rate)
+
+
+class ProviderLimiter:
+    """Concurrency semaphore plus RPM/TPM buckets with a bounded wait queue for one provider."""
+
+    def __init__(
+        self,
+        name: str,
+        concurrency: int | None = None,
+        rpm: float | None = None,
+        tpm: float | None = None,
+        max_queue: int = PROVIDER_MAX_QUEUE,
+        max_wait: float = PROVIDER_MAX_WAIT,
+    ):
+        """
+        Args:
+            name: Provider name used in logs and rejection messages.
+            concurrency: Maximum in-flight calls, or None for unlimited.
+            rpm: Requests-per-minute quota, or None for unlimited.
+            tpm: Tokens-per-minute quota, or None for unlimited.
+            max_queue: Callers allowed to wait for a slot before new ones are rejected.
+            max_wait: Longest a caller may wait for a slot and quota, in seconds.
+        """
+        self.name = name
+        self._semaphore = threading.BoundedSemaphore(concurrency) if concurrency else None
+        self._rpm = TokenBucket(rpm) if rpm else None
+        self._tpm = TokenBucket(tpm) if tpm else None
+        self._max_queue = max_queue
+        self._max_wait = max_wait
+        self._waiting = 0
+        self._lock = threading.Lock()
+
+    @property
+    def waiting(self) -> int:
+        return self._waiting
+
+    def _reserve(self, bucket: TokenBucket | None, amount: float, deadline: float, quota: str):
+        """Wait for quota from a bucket, or reject with 429 if it will not refill in time."""
+        if bucket is None or amount <= 0:
+            return
+        wait = bucket.reserve(amount, max(0.0, deadline - time.monotonic()))
+        if wait is None:
+            retry_after = bucket.time_until(amount)
+            logger.warning(f"{self.name} {quota} quota exhausted, rejecting (retry in {retry_after:.1f}s)")
+            raise AdmissionRejected(f"{self.name} {quota} quota exhausted", retry_after, status_code=429)
+        if wait > 0:
+            time.sleep(wait)
+
+    @contextmanager
+    def acquire(self, tokens: int = 0, max_wait: float | None = None):
+        """
+        Hold a concurrency slot and consume request/token quota for one provider call.
+
+        Args:
+            tokens: Estimated tokens for the call, counted against the TPM quota.
+            max_wait: Override for the longest acceptable wait, e.g. the turn time remaining.
+
+        Raises:
+            AdmissionRejected: 503 if the wait queue is full or no slot frees up in time,
+                               429 if the RPM/TPM quota will not refill in time.
+        """
+        max_wait = self._max_wait if max_wait is None else min(max_wait, self._max_wait)
+        deadline = time.monotonic() + max_wait
+
+        if self._semaphore and not self._semaphore.acquire(blocking=False):
+            with self._lock:
+                if self._waiting >= self._max_queue:
+                    logger.warning(f"{self.name} wait queue full ({self._waiting}), rejecting")
+                    raise AdmissionRejected(f"{self.name} is at capacity", max_wait, status_code=503)
+                self._waiting += 1
+            try:
+                if not self._semaphore.acquire(timeout=max_wait):
+                    raise AdmissionRejected(f"Timed out waiting for a {self.name} slot", max_wait, status_code=503)
+            finally:
+                with self._lock:
+                    self._waiting -= 1
+
+        try:
+            self._reserve(self._rpm, 1, deadline, "requests-per-minute")
+            self._reserve(self._tpm, tokens, deadline, "tokens-per-minute")
+            yield
+        finally:
+            if self._semaphore:
+                self._semaphore.release()
+
+
+class _Unlimited:
+    """No-op limiter for providers without configured limits."""
+
+    waiting = 0
+
+    @contextmanager
+    def acquire(self, tokens: int = 0, max_wait: float | None = None):
+        yield
+
+
+_limiters: dict[str, ProviderLimiter | _Unlimited] = {}
+_registry_lock = threading.Lock()
+
+
+def limiter_for(name: str) -> ProviderLimiter | _Unlimited:
+    """Return the shared limiter for a provider, built from PROVIDER_LIMITS on first use."""
+    with _registry_lock:
+        if name not in _limiters:
+            limits = PROVIDER_LIMITS.get(name)
+            _limiters[name] = ProviderLimiter(name, **limits) if limits else _Unlimited()
+        return _limiters[name]
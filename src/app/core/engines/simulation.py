@@ -0,0 +1,171 @@
+"""
+src.app.core.engines.simulation
+
+Latency and failure model behind the simulated engines.
+
+The Simulated*Engine classes stand in for providers in benchmarks and load tests. Each
+call sleeps for a latency drawn from a log-normal distribution fitted to a median and
+p95 (plus an optional per-character cost, since TTS and LLM time grows with output
+length), and fails with a configurable probability. The profiles in SIMULATED_PROFILES
+are seeded from the measured stage timings in docs/test-results, so the rest of the
+pipeline (call policy, degradation, history, API) is measured under realistic provider
+behaviour without provider variance between runs.
+
+Every simulated wait is recorded, process-wide and in the current ledger(), so a harness
+can subtract provider time from wall time and report the pipeline's own overhead.
+"""
+
+import math
+import time
+import random
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from config import SIMULATED_PROFILES, SIMULATED_TIME_SCALE, SIMULATED_SEED
+
+# z-score of the 95th percentile of a standard normal
+P95_Z = 1.645
+
+_rng = random.Random(SIMULATED_SEED)
+_time_scale = SIMULATED_TIME_SCALE
+_lock = threading.Lock()
+_totals: dict[str, dict] = {}
+_ledger: ContextVar[list | None] = ContextVar("simulation_ledger", default=None)
+
+
+class SimulatedProviderError(Exception):
+    """Injected provider failure; status 503 so the call policy treats it as transient."""
+
+    status_code = 503
+
+
+class LatencyModel:
+    """Log-normal latency with a per-character cost and a failure probability for one stage."""
+
+    def __init__(self, median: float = 0.0, p95: float | None = None, per_char: float = 0.0, failure_rate: float = 0.0):
+        """
+        Args:
+            median: Median fixed latency in seconds.
+            p95: 95th percentile of the fixed latency; defaults to the median (no jitter).
+            per_char: Seconds added per character of text produced or synthesised.
+            failure_rate: Probability that a call fails after its latency.
+        """
+        self.median = median
+        self.per_char = per_char
+        self.failure_rate = failure_rate
+        p95 = p95 if p95 is not None else median
+        self._sigma = math.log(p95 / median) / P95_Z if median > 0 and p95 > median else 0.0
+
+    def sample(self, chars: int = 0) -> float:
+        """Draw one latency in seconds for a call producing chars characters."""
+        with _lock:
+            jitter = _rng.gauss(0, self._sigma) if self._sigma else 0.0
+        return self.median * math.exp(jitter) + self.per_char * chars
+
+    def fails(self) -> bool:
+        """Draw whether this call fails."""
+        if not self.failure_rate:
+            return False
+        with _lock:
+            return _rng.random() < self.failure_rate
+
+
+def latency_model(profile: str, stage: str) -> LatencyModel:
+    """
+    Build the latency model for a stage from SIMULATED_PROFILES.
+
+    Raises:
+        RuntimeError: If the profile or stage is not configured.
+    """
+    if profile not in SIMULATED_PROFILES:
+        raise RuntimeError(f"Unknown simulated profile '{profile}'. Available: {list(SIMULATED_PROFILES)}")
+    try:
+        return LatencyModel(**SIMULATED_PROFILES[profile][stage])
+    except KeyError:
+        raise RuntimeError(f"Simulated profile '{profile}' has no {stage} latency")
+
+
+def seed(value: int | None):
+    """Reseed the shared generator, so a benchmark run draws the same latencies every time."""
+    with _lock:
+        _rng.seed(value)
+
+
+def set_time_scale(scale: float):
+    """Multiply every subsequent simulated wait by scale, e.g. 0.1 to run ten times faster."""
+    global _time_scale
+    _time_scale = scale
+
+
+def wait(stage: str, seconds: float, timeout: float | None = None):
+    """
+    Sleep for a provider wait of a known length and record it.
+    Used by simulate() and by engines replaying recorded provider timings.
+
+    Args:
+        stage: "stt", "llm" or "tts", for the recorded totals.
+        seconds: Length of the wait.
+        timeout: Call timeout; a longer wait stops at the timeout and times out.
+
+    Raises:
+        TimeoutError: If seconds exceeds the timeout.
+    """
+    timed_out = timeout is not None and seconds > timeout
+    if timed_out:
+        seconds = timeout
+    time.sleep(seconds)
+
+    with _lock:
+        totals = _totals.setdefault(stage, {"calls": 0, "seconds": 0.0, "failures": 0})
+        totals["calls"] += 1
+        totals["seconds"] += seconds
+    entries = _ledger.get()
+    if entries is not None:
+        entries.append((stage, seconds))
+
+    if timed_out:
+        raise TimeoutError(f"Simulated {stage} call timed out after {timeout:.2f}s")
+
+
+def simulate(stage: str, model: LatencyModel, chars: int = 0, timeout: float | None = None):
+    """
+    Wait like a provider call, then fail if the model says so.
+
+    Args:
+        stage: "stt", "llm" or "tts", for the recorded totals.
+        model: Latency model to draw from.
+        chars: Characters produced or synthesised by the call.
+        timeout: Call timeout from the call policy; a slower draw waits this long and times out.
+
+    Raises:
+        TimeoutError: If the drawn latency exceeds the timeout.
+        SimulatedProviderError: If the call is drawn to fail.
+    """
+    wait(stage, model.sample(chars) * _time_scale, timeout)
+    if model.fails():
+        with _lock:
+            _totals[stage]["failures"] += 1
+        raise SimulatedProviderError(f"Simulated {stage} provider failure")
+
+
+@contextmanager
+def ledger():
+    """
+    Collect the (stage, seconds) of every simulated wait made in this context, including
+    stage calls the degradation controller runs on its worker threads.
+
+    Yields:
+        The list the waits are appended to.
+    """
+    entries: list[tuple[str, float]] = []
+    token = _ledger.set(entries)
+    try:
+        yield entries
+    finally:
+        _ledger.reset(token)
+
+
+def simulation_totals() -> dict[str, dict]:
+    """Return calls, simulated seconds and injected failures per stage since startup."""
+    with _lock:
+        return {stage: dict(totals) for stage, totals in _totals.items()}
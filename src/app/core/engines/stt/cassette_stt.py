@@ -0,0 +1,89 @@
+"""
+src.app.core.engines.stt.cassette_stt
+
+Record-and-replay STT engine for reproducible benchmarks (see core.engines.cassette).
+Records the transcripts, decoder statistics and timings of a live engine, or replays them
+with the recorded or scaled timing. Requests are keyed by a hash of the audio and the
+field being collected.
+"""
+
+import time
+import numpy as np
+from core.engines.base import STTEngine
+from core.engines.cassette import RECORD, cassette_for, request_key, replay
+from core.hallucination import report_stats, transcript_stats
+from core.inference.decode import current_field
+from utils.logger import setup_logger
+from config import CASSETTE_MODE, CASSETTE_PATH, CASSETTE_TIME_SCALE, CASSETTE_ENGINES
+
+logger = setup_logger(__name__, log_type="pipeline")
+
+
+class CassetteSTTEngine(STTEngine):
+    """Records a live STT engine's calls to a cassette, or replays them from it."""
+
+    def __init__(
+        self,
+        engine: STTEngine | None = None,
+        mode: str = CASSETTE_MODE,
+        path: str = CASSETTE_PATH,
+        time_scale: float = CASSETTE_TIME_SCALE,
+    ):
+        """
+        Args:
+            engine: Live engine to record; defaults to loading CASSETTE_ENGINES["stt"].
+                    Unused when replaying.
+            mode: "record" or "replay".
+            path: Cassette file, shared with the LLM and TTS cassette engines.
+            time_scale: Multiplier on recorded timings when replaying, 0 for no waits.
+
+        Raises:
+            RuntimeError: If the mode is unknown or the cassette to replay does not exist.
+        """
+        self._cassette = cassette_for(path, mode)
+        self._time_scale = time_scale
+        self._engine = None
+        if mode == RECORD:
+            from core.pipeline import load_engine
+            self._engine = engine or load_engine(CASSETTE_ENGINES["stt"])
+            self.supports_arrays = self._engine.supports_arrays
+
+    def _call(self, key: str, transcribe) -> str:
+        field = current_field()
+        if self._engine is None:
+            entry = self._cassette.match("stt", key, field)
+            replay("stt", entry, self._time_scale)
+            report_stats(entry.get("stats"))
+            logger.info(f"You said: '{entry['text']}' [replayed]")
+            return entry["text"]
+
+        t = time.time()
+        entry = {"stage": "stt", "key": key, "field": field}
+        try:
+            text = transcribe()
+        except Exception as e:
+            self._cassette.append({**entry, "seconds": round(time.time() - t, 4), "error": str(e)})
+            raise
+        self._cassette.append({**entry, "seconds": round(time.time() - t, 4), "text": text, "stats": transcript_stats()})
+        return text
+
+    def transcribe(self, audio_path: str) -> str:
+        """
+        Transcribe a WAV file with the live engine, or replay the recorded transcript.
+
+        Raises:
+            RuntimeError: If transcription fails, the recorded call failed, or the cassette has no calls for the stage.
+        """
+        with open(audio_path, "rb") as f:
+            key = request_key(f.read(), current_field())
+        return self._call(key, lambda: self._engine.transcribe(audio_path))
+
+    def transcribe_array(self, audio: np.ndarray, sample_rate: int) -> str:
+        """
+        Transcribe samples with the live engine, or replay the recorded transcript.
+
+        Raises:
+            RuntimeError: If transcription fails, the recorded call failed, or the cassette has no calls for the stage.
+        """
+        key = request_key(np.ascontiguousarray(audio).tobytes(), sample_rate, current_field())
+        return self._call(key, lambda: self._engine.transcribe_array(audio, sample_rate))
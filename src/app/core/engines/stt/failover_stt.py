@@ -0,0 +1,63 @@
+"""
+src.app.core.engines.stt.failover_stt
+
+Failover STT engine implementation.
+Routes each transcription to the healthiest provider in FAILOVER_ENGINES["stt"], failing
+over down the list when a provider errors and skipping providers whose circuit is open.
+"""
+
+import os
+import wave
+import tempfile
+from core.engines.base import STTEngine
+from core.engines.failover import FailoverRouter
+from config import FAILOVER_ENGINES, STAGE_LATENCY_SLO, AUDIO_SAMPLE_RATE
+
+
+def _probe(engine: STTEngine):
+    """Transcribe half a second of silence to check an STT provider has recovered."""
+    temp = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
+    temp.close()
+    try:
+        with wave.open(temp.name, "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(AUDIO_SAMPLE_RATE)
+            w.writeframes(b"\x00\x00" * (AUDIO_SAMPLE_RATE // 2))
+        engine.transcribe(temp.name)
+    finally:
+        os.remove(temp.name)
+
+
+class FailoverSTTEngine(STTEngine):
+    """Transcribes audio with the healthiest of several STT providers."""
+
+    def __init__(self, providers: list | None = None):
+        """
+        Load the configured STT providers in preference order.
+
+        Args:
+            providers: Dotted engine paths or engine instances, most preferred first.
+                       Defaults to FAILOVER_ENGINES["stt"].
+
+        Raises:
+            RuntimeError: If none of the providers could be initialised.
+        """
+        self._router = FailoverRouter(
+            "stt", providers or FAILOVER_ENGINES["stt"], STAGE_LATENCY_SLO["stt"], _probe
+        )
+
+    def transcribe(self, audio_filepath: str) -> str:
+        """
+        Transcribe a WAV audio file, failing over to the next provider on error.
+
+        Args:
+            audio_filepath: Absolute path to the WAV file to transcribe.
+
+        Returns:
+            Transcribed text string.
+
+        Raises:
+            RuntimeError: If every STT provider fails.
+        """
+        return self._router.call("transcribe", audio_filepath)
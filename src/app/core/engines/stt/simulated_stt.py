@@ -0,0 +1,69 @@
+"""
+src.app.core.engines.stt.simulated_stt
+
+Simulated STT engine for offline benchmarks and load tests.
+Implements STTEngine without a model or network: each call waits for a latency drawn from
+the configured simulated profile (core.engines.simulation) and returns the scripted answer
+for the field being collected.
+"""
+
+import time
+import numpy as np
+from core.engines.base import STTEngine
+from core.engines.call_policy import policy_for
+from core.engines.simulation import latency_model, simulate
+from core.inference.decode import current_field
+from utils.logger import setup_logger
+from config import SIMULATED_PROFILE, SIMULATED_ANSWERS
+
+logger = setup_logger(__name__, log_type="pipeline")
+
+CONFIRMATION_ANSWER = "Yes, everything looks correct."
+
+
+class SimulatedSTTEngine(STTEngine):
+    """Returns scripted transcripts after a simulated provider delay."""
+
+    supports_arrays = True
+
+    def __init__(self, profile: str = SIMULATED_PROFILE, answers: dict[str, str] = SIMULATED_ANSWERS):
+        """
+        Args:
+            profile: Latency profile from SIMULATED_PROFILES.
+            answers: Transcript returned per onboarding field.
+
+        Raises:
+            RuntimeError: If the profile is not configured.
+        """
+        self._latency = latency_model(profile, "stt")
+        self._answers = answers
+        self._policy = policy_for("simulated-stt", stage="stt")
+
+    def _transcribe(self) -> str:
+        t = time.time()
+        try:
+            self._policy.call(lambda timeout: simulate("stt", self._latency, timeout=timeout))
+        except Exception as e:
+            logger.error(f"Simulated transcription failed: {e}")
+            raise RuntimeError(f"Audio transcription failed: {e}")
+        transcript = self._answers.get(current_field(), CONFIRMATION_ANSWER)
+        logger.info(f"You said: '{transcript}' [{time.time() - t:.2f}s, simulated]")
+        return transcript
+
+    def transcribe(self, audio_path: str) -> str:
+        """
+        Return the scripted answer for the current field; the audio is not read.
+
+        Raises:
+            RuntimeError: If the simulated call fails or times out.
+        """
+        return self._transcribe()
+
+    def transcribe_array(self, audio: np.ndarray, sample_rate: int) -> str:
+        """
+        Return the scripted answer for the current field; the samples are not decoded.
+
+        Raises:
+            RuntimeError: If the simulated call fails or times out.
+        """
+        return self._transcribe()
@@ -9,6 +9,9 @@ Requires OPENAI_API_KEY in .env.
 
 import time
 from core.engines.base import STTEngine
+from core.engines.call_policy import policy_for
+from core.engines.openai_client import openai_client
+from core.hallucination import report_segments
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__, log_type="pipeline")
@@ -22,9 +25,9 @@ class WhisperAPIEngine(STTEngine):
         Initialize the OpenAI client and load the API key from .env.
         """
         from dotenv import load_dotenv
-        from openai import OpenAI
         load_dotenv()
-        self._client = OpenAI()
+        self._client = openai_client()
+        self._policy = policy_for("whisper-api", stage="stt")
 
     def transcribe(self, audio_filepath: str) -> str:
         """
@@ -42,12 +45,19 @@ class WhisperAPIEngine(STTEngine):
         logger.info("Transcribing with Whisper API...")
         t = time.time()
         try:
-            with open(audio_filepath, "rb") as f:
-                transcript = self._client.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=f,
-                    response_format="text",
-                )
+            def _transcribe(timeout: float):
+                with open(audio_filepath, "rb") as f:
+                    return self._client.audio.transcriptions.create(
+                        model="whisper-1",
+                        file=f,
+                        response_format="verbose_json",
+                        timeout=timeout,
+                    )
+
+            # verbose_json adds per-segment confidence, used by the hallucination filter
+            response = self._policy.call(_transcribe)
+            transcript = response.text
+            report_segments(getattr(response, "segments", None))
             logger.info(f"You said: '{transcript}' [{time.time() - t:.2f}s]")
             return transcript
         except Exception as e:
@@ -4,28 +4,66 @@ src.app.core.engines.stt.whisper_local
 
 Local Whisper STT engine implementation.
 Implements STTEngine using the openai-whisper package running entirely on-device.
-Requires FFmpeg to be installed and available on PATH.
+With WHISPER_BATCHING, all instances in the process share one model and concurrent sessions
+are micro-batched into a single forward pass (core.inference.whisper_batch).
+Inference runs on the thread-capped slots of core.inference.executor, not the caller's thread.
+Decoding options come from the configured decode profile (core.inference.decode).
+Audio is decoded and resampled in-process, so no ffmpeg subprocess is spawned per turn.
 """
 
 import time
+import threading
+import numpy as np
 from core.engines.base import STTEngine
+from core.engines.call_policy import policy_for
+from core.inference.executor import inference_executor
+from core.inference.decode import decode_options, record_latency
+from core.hallucination import report_segments
+from utils.audio import load_audio, resample, to_mono_float32, WHISPER_SAMPLE_RATE
 from utils.logger import setup_logger
+from config import WHISPER_BATCHING, WHISPER_DECODE_PROFILE
 
 logger = setup_logger(__name__, log_type="pipeline")
 
 class WhisperLocalEngine(STTEngine):
     """Transcribes audio using a local openai-whisper model."""
 
-    def __init__(self, model: str = "base"):
+    supports_arrays = True
+
+    def __init__(
+        self,
+        model: str = "base",
+        batched: bool = WHISPER_BATCHING,
+        profile: str = WHISPER_DECODE_PROFILE,
+    ):
         """
-        Load the local Whisper model into memory.
+        Load the local Whisper model into memory, or attach to the process-wide shared one.
 
         Args:
             model: Whisper model size to load.
+            batched: Share one model per process and batch concurrent transcriptions.
+            profile: Decode profile from WHISPER_DECODE_PROFILES.
         """
+        self._profile = profile
+        decode_options(profile)  # fail fast on an unknown profile
+        self._policy = policy_for("whisper-local", stage="stt")
+        self._executor = inference_executor()
+        self._batcher = None
+        if batched:
+            from core.inference.whisper_batch import whisper_batcher
+            self._batcher = whisper_batcher(model)
+            return
+
         import whisper
         logger.info(f"Loading local Whisper model: {model}")
         self._model = whisper.load_model(model)
+        # The API shares one warmed-up instance across sessions, and Whisper's kv-cache hooks
+        # make concurrent decodes on one model unsafe
+        self._model_lock = threading.Lock()
+
+    def _transcribe_locked(self, audio: np.ndarray, options: dict) -> dict:
+        with self._model_lock:
+            return self._model.transcribe(audio, **options)
 
     def transcribe(self, audio_filepath: str) -> str:
         """
@@ -37,17 +75,56 @@ class WhisperLocalEngine(STTEngine):
         Returns:
             Transcribed text string with leading and trailing whitespace stripped.
 
+        Raises:
+            RuntimeError: If decoding or Whisper transcription fails.
+        """
+        try:
+            audio = load_audio(audio_filepath)
+        except Exception as e:
+            logger.error(f"Could not decode {audio_filepath}: {e}")
+            raise RuntimeError(f"Audio transcription failed: {e}")
+        return self.transcribe_array(audio, WHISPER_SAMPLE_RATE)
+
+    def transcribe_array(self, audio: np.ndarray, sample_rate: int) -> str:
+        """
+        Transcribe decoded samples, resampling to 16kHz mono float32 in-process if needed.
+
+        Args:
+            audio: Samples of shape (n,) or (n, channels).
+            sample_rate: Sample rate of the audio in Hz.
+
+        Returns:
+            Transcribed text string with leading and trailing whitespace stripped.
+
         Raises:
             RuntimeError: If Whisper transcription fails.
         """
         logger.info("Transcribing with local Whisper...")
         t = time.time()
         try:
-            result = self._model.transcribe(audio_filepath)
+            audio = resample(to_mono_float32(audio), sample_rate)
+            options = decode_options(self._profile)
+            if self._batcher is not None:
+                # The batch still runs to completion, but this turn stops waiting at the timeout;
+                # retrying would only queue a second copy behind it
+                result = self._policy.call(
+                    lambda timeout: self._batcher.submit((audio, options), timeout=timeout),
+                    retryable=False,
+                )
+            else:
+                # Queued for a free inference slot; the call still completes if this turn stops
+                # waiting, so a timeout is not retried
+                result = self._policy.call(
+                    lambda timeout: self._executor.submit(
+                        lambda: self._transcribe_locked(audio, options), timeout=timeout
+                    ),
+                    retryable=False,
+                )
             transcript = result["text"].strip()
-            logger.info(f"You said: '{transcript}' [{time.time() - t:.2f}s]")
+            report_segments(result["segments"])
+            record_latency(self._profile, time.time() - t, audio.size / WHISPER_SAMPLE_RATE)
+            logger.info(f"You said: '{transcript}' [{time.time() - t:.2f}s, {self._profile}]")
             return transcript
         except Exception as e:
             logger.error(f"Local Whisper transcription failed: {e}")
             raise RuntimeError(f"Audio transcription failed: {e}")
-
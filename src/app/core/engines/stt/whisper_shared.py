@@ -0,0 +1,126 @@
+"""
+src.app.core.engines.stt.whisper_shared
+
+Shared local Whisper STT engine implementation.
+Implements STTEngine as a thin client of the local Whisper inference server
+(core.inference.whisper_server), so every worker and session shares one loaded model.
+Audio is decoded in-process and handed over as a shared-memory buffer, together with the
+decode options of the engine's profile (core.inference.decode).
+Requires the server to be running: cd src/app && python -m core.inference.whisper_server
+"""
+
+import time
+import socket
+import numpy as np
+from core.engines.base import STTEngine
+from core.engines.call_policy import policy_for
+from core.inference.decode import decode_options, record_latency
+from core.hallucination import report_stats
+from core.inference.ipc import send_message, recv_message, share_audio, release_audio
+from utils.audio import load_audio, resample, to_mono_float32, WHISPER_SAMPLE_RATE
+from utils.logger import setup_logger
+from config import WHISPER_SERVER_SOCKET, WHISPER_DECODE_PROFILE
+
+logger = setup_logger(__name__, log_type="pipeline")
+
+
+class SharedWhisperEngine(STTEngine):
+    """Transcribes audio through the shared local Whisper inference server."""
+
+    supports_arrays = True
+
+    def __init__(self, socket_path: str = WHISPER_SERVER_SOCKET, profile: str = WHISPER_DECODE_PROFILE):
+        """
+        Check the inference server is reachable.
+
+        Args:
+            socket_path: Unix socket the Whisper server listens on.
+            profile: Decode profile from WHISPER_DECODE_PROFILES.
+
+        Raises:
+            RuntimeError: If the server is not running or the profile is unknown.
+        """
+        self._socket_path = socket_path
+        self._profile = profile
+        decode_options(profile)  # fail fast on an unknown profile
+        self._policy = policy_for("whisper-shared", stage="stt")
+        try:
+            reply = self._request({"op": "ping"}, timeout=2.0)
+        except OSError as e:
+            raise RuntimeError(
+                f"Whisper server not reachable at {socket_path} ({e}). "
+                "Start it with: cd src/app && python -m core.inference.whisper_server"
+            )
+        logger.info(f"Connected to shared Whisper server (model: {reply.get('model')})")
+
+    def _request(self, message: dict, timeout: float) -> dict:
+        """Send one request on a fresh connection and wait up to timeout seconds for the reply."""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(self._socket_path)
+            send_message(sock, message)
+            return recv_message(sock)
+
+    def _transcribe_audio(self, audio: np.ndarray, options: dict, timeout: float) -> str:
+        """Share the samples with the server and return its transcript."""
+        if audio.size == 0:
+            return ""
+        shm = share_audio(audio)
+        try:
+            reply = self._request(
+                {"op": "transcribe", "shm": shm.name, "samples": int(audio.size), "options": options},
+                timeout,
+            )
+        finally:
+            release_audio(shm)
+        if "error" in reply:
+            raise RuntimeError(f"Whisper server error: {reply['error']}")
+        report_stats(reply.get("stats"))
+        return reply["text"]
+
+    def transcribe(self, audio_filepath: str) -> str:
+        """
+        Transcribe a WAV audio file to text using the shared Whisper server.
+
+        Args:
+            audio_filepath: Absolute path to the WAV file to transcribe.
+
+        Returns:
+            Transcribed text string with leading and trailing whitespace stripped.
+
+        Raises:
+            RuntimeError: If decoding fails or the server is unreachable or errors.
+        """
+        try:
+            audio = load_audio(audio_filepath)
+        except Exception as e:
+            logger.error(f"Could not decode {audio_filepath}: {e}")
+            raise RuntimeError(f"Audio transcription failed: {e}")
+        return self.transcribe_array(audio, WHISPER_SAMPLE_RATE)
+
+    def transcribe_array(self, audio: np.ndarray, sample_rate: int) -> str:
+        """
+        Transcribe decoded samples, resampling to 16kHz mono float32 in-process if needed.
+
+        Args:
+            audio: Samples of shape (n,) or (n, channels).
+            sample_rate: Sample rate of the audio in Hz.
+
+        Returns:
+            Transcribed text string with leading and trailing whitespace stripped.
+
+        Raises:
+            RuntimeError: If the server is unreachable or errors.
+        """
+        logger.info("Transcribing with shared local Whisper...")
+        t = time.time()
+        try:
+            audio = resample(to_mono_float32(audio), sample_rate)
+            options = decode_options(self._profile)
+            transcript = self._policy.call(lambda timeout: self._transcribe_audio(audio, options, timeout))
+            record_latency(self._profile, time.time() - t, audio.size / WHISPER_SAMPLE_RATE)
+            logger.info(f"You said: '{transcript}' [{time.time() - t:.2f}s, {self._profile}]")
+            return transcript
+        except Exception as e:
+            logger.error(f"Shared Whisper transcription failed: {e}")
+            raise RuntimeError(f"Audio transcription failed: {e}")
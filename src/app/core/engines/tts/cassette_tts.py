@@ -0,0 +1,118 @@
+"""
+src.app.core.engines.tts.cassette_tts
+
+Record-and-replay TTS engine for reproducible benchmarks (see core.engines.cassette).
+Records how long a live engine took and how long the resulting speech is, or replays the
+call with the recorded or scaled timing, writing silence of the recorded speech length so
+file handling and response sizes stay realistic. Requests are keyed by a hash of the text.
+"""
+
+import time
+import tempfile
+import numpy as np
+from core.engines.base import TTSEngine
+from core.engines.cassette import RECORD, cassette_for, request_key, replay
+from core.engines.tts.simulated_tts import SPEECH_SECONDS_PER_CHAR
+from utils.logger import setup_logger
+from config import CASSETTE_MODE, CASSETTE_PATH, CASSETTE_TIME_SCALE, CASSETTE_ENGINES
+
+logger = setup_logger(__name__, log_type="pipeline")
+
+# Replayed speech is written at this rate, and estimated from the text length, when the
+# recorded audio could not be decoded
+DEFAULT_SAMPLE_RATE = 24000
+
+
+def _speech_info(filepath: str) -> tuple[float | None, int | None]:
+    """Return (seconds, sample rate) of an audio file, or (None, None) if it cannot be decoded."""
+    import soundfile as sf
+    try:
+        info = sf.info(filepath)
+        return round(info.duration, 3), info.samplerate
+    except Exception:
+        return None, None
+
+
+class CassetteTTSEngine(TTSEngine):
+    """Records a live TTS engine's calls to a cassette, or replays them from it."""
+
+    def __init__(
+        self,
+        engine: TTSEngine | None = None,
+        mode: str = CASSETTE_MODE,
+        path: str = CASSETTE_PATH,
+        time_scale: float = CASSETTE_TIME_SCALE,
+    ):
+        """
+        Args:
+            engine: Live engine to record; defaults to loading CASSETTE_ENGINES["tts"].
+                    Unused when replaying.
+            mode: "record" or "replay".
+            path: Cassette file, shared with the STT and LLM cassette engines.
+            time_scale: Multiplier on recorded timings when replaying, 0 for no waits.
+
+        Raises:
+            RuntimeError: If the mode is unknown or the cassette to replay does not exist.
+        """
+        self._cassette = cassette_for(path, mode)
+        self._time_scale = time_scale
+        self._engine = None
+        if mode == RECORD:
+            from core.pipeline import load_engine
+            self._engine = engine or load_engine(CASSETTE_ENGINES["tts"])
+            self.supports_pcm = self._engine.supports_pcm
+
+    def _record(self, text: str, synthesize):
+        t = time.time()
+        entry = {"stage": "tts", "key": request_key(text)}
+        try:
+            result = synthesize()
+        except Exception as e:
+            self._cassette.append({**entry, "seconds": round(time.time() - t, 4), "error": str(e)})
+            raise
+        return result, {**entry, "seconds": round(time.time() - t, 4)}
+
+    def _replay(self, text: str) -> tuple[np.ndarray, int]:
+        entry = self._cassette.match("tts", request_key(text))
+        replay("tts", entry, self._time_scale)
+        sample_rate = entry.get("sample_rate") or DEFAULT_SAMPLE_RATE
+        seconds = entry.get("audio_seconds") or len(text) * SPEECH_SECONDS_PER_CHAR
+        logger.info("TTS complete! [replayed]")
+        return np.zeros(int(seconds * sample_rate), dtype=np.float32), sample_rate
+
+    def synthesize(self, text: str) -> str:
+        """
+        Synthesise with the live engine, or write silence of the recorded speech length.
+
+        Returns:
+            Absolute path to the audio file. Caller is responsible for deleting it.
+
+        Raises:
+            RuntimeError: If synthesis fails, the recorded call failed, or the cassette has no calls for the stage.
+        """
+        if self._engine is None:
+            import soundfile as sf
+            audio, sample_rate = self._replay(text)
+            temp = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
+            temp.close()
+            sf.write(temp.name, audio, sample_rate)
+            return temp.name
+
+        filepath, entry = self._record(text, lambda: self._engine.synthesize(text))
+        seconds, sample_rate = _speech_info(filepath)
+        self._cassette.append({**entry, "audio_seconds": seconds, "sample_rate": sample_rate})
+        return filepath
+
+    def synthesize_pcm(self, text: str) -> tuple[np.ndarray, int]:
+        """
+        Synthesise PCM with the live engine, or return silence of the recorded speech length.
+
+        Raises:
+            RuntimeError: If synthesis fails, the recorded call failed, or the cassette has no calls for the stage.
+        """
+        if self._engine is None:
+            return self._replay(text)
+
+        (audio, sample_rate), entry = self._record(text, lambda: self._engine.synthesize_pcm(text))
+        self._cassette.append({**entry, "audio_seconds": round(len(audio) / sample_rate, 3), "sample_rate": sample_rate})
+        return audio, sample_rate
@@ -0,0 +1,52 @@
+"""
+src.app.core.engines.tts.failover_tts
+
+Failover TTS engine implementation.
+Routes each synthesis to the healthiest provider in FAILOVER_ENGINES["tts"], failing over
+down the list when a provider errors and skipping providers whose circuit is open.
+"""
+
+import os
+from core.engines.base import TTSEngine
+from core.engines.failover import FailoverRouter
+from config import FAILOVER_ENGINES, STAGE_LATENCY_SLO
+
+
+def _probe(engine: TTSEngine):
+    """Synthesise a single word to check a TTS provider has recovered."""
+    os.remove(engine.synthesize("OK"))
+
+
+class FailoverTTSEngine(TTSEngine):
+    """Synthesises speech with the healthiest of several TTS providers."""
+
+    def __init__(self, providers: list | None = None):
+        """
+        Load the configured TTS providers in preference order.
+
+        Args:
+            providers: Dotted engine paths or engine instances, most preferred first.
+                       Defaults to FAILOVER_ENGINES["tts"].
+
+        Raises:
+            RuntimeError: If none of the providers could be initialised.
+        """
+        self._router = FailoverRouter(
+            "tts", providers or FAILOVER_ENGINES["tts"], STAGE_LATENCY_SLO["tts"], _probe
+        )
+
+    def synthesize(self, text: str) -> str:
+        """
+        Convert text to speech, failing over to the next provider on error.
+
+        Args:
+            text: The text to synthesise into speech.
+
+        Returns:
+            Absolute path to the generated audio file.
+            Caller is responsible for deleting the file after playback.
+
+        Raises:
+            RuntimeError: If every TTS provider fails.
+        """
+        return self._router.call("synthesize", text)
@@ -10,6 +10,7 @@ Requires internet connection despite being used as the local agent TTS.
 import time
 import tempfile
 from core.engines.base import TTSEngine
+from core.engines.call_policy import policy_for
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__, log_type="pipeline")
@@ -26,6 +27,7 @@ class GTTSEngine(TTSEngine):
             lang: Language code for speech synthesis. Defaults to English.
         """
         self._lang = lang
+        self._policy = policy_for("gtts", stage="tts")
 
     def synthesize(self, text: str) -> str:
         """
@@ -48,7 +50,9 @@ class GTTSEngine(TTSEngine):
         temp.close()
         try:
             from gtts import gTTS
-            gTTS(text=text, lang=self._lang, slow=False).save(filepath)
+            self._policy.call(
+                lambda timeout: gTTS(text=text, lang=self._lang, slow=False, timeout=timeout).save(filepath)
+            )
             logger.info(f"TTS complete! [{time.time() - t:.2f}s]")
             return filepath
         except Exception as e:
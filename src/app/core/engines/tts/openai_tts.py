@@ -10,6 +10,8 @@ Requires the OPENAI_API_KEY in .env.
 import time
 import tempfile
 from core.engines.base import TTSEngine
+from core.engines.call_policy import policy_for
+from core.engines.openai_client import openai_client
 from utils.logger import setup_logger
 from config import TTS_MODEL, TTS_VOICE
 
@@ -28,11 +30,11 @@ class OpenAITTSEngine(TTSEngine):
             voice: The voice to use for synthesis. Defaults to alloy.
         """
         from dotenv import load_dotenv
-        from openai import OpenAI
         load_dotenv()
-        self._client = OpenAI()
+        self._client = openai_client()
         self._model = model
         self._voice = voice
+        self._policy = policy_for("openai-tts", stage="tts")
 
     def synthesize(self, text: str) -> str:
         """
@@ -54,11 +56,12 @@ class OpenAITTSEngine(TTSEngine):
             temp = tempfile.NamedTemporaryFile(delete=False, suffix=".mp3")
             filepath = temp.name
             temp.close()
-            response = self._client.audio.speech.create(
+            response = self._policy.call(lambda timeout: self._client.audio.speech.create(
                 model=self._model,
                 voice=self._voice,
                 input=text,
-            )
+                timeout=timeout,
+            ))
             with open(filepath, "wb") as f:
                     f.write(response.content)
             logger.info(f"TTS complete! [{time.time() - t:.2f}s]")
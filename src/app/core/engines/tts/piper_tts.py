@@ -0,0 +1,160 @@
+"""
+src.app.core.engines.tts.piper_tts
+
+Offline Piper TTS engine implementation.
+Implements TTSEngine using Piper, a fast neural TTS that runs ONNX voice models on CPU,
+so the local engine set needs no network round trip per utterance. Speech is synthesised
+to PCM in memory one sentence at a time, letting callers start playback after the first
+sentence. Voices are loaded once per process and warmed up at construction.
+Requires the optional piper-tts package and a downloaded voice (see docs/SETUP.md).
+"""
+
+import os
+import time
+import tempfile
+import threading
+import numpy as np
+from collections.abc import Iterator
+from core.engines.base import TTSEngine
+from core.engines.call_policy import policy_for
+from core.inference.executor import inference_executor
+from utils.text import split_sentences
+from utils.logger import setup_logger
+from config import PIPER_VOICE
+
+logger = setup_logger(__name__, log_type="pipeline")
+
+# Relative voice paths are resolved against src/app
+APP_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+_voices: dict = {}
+_lock = threading.Lock()
+
+
+def load_voice(voice_path: str = PIPER_VOICE):
+    """
+    Return the process-wide Piper voice for a model path, loading and warming it on first use.
+
+    Args:
+        voice_path: Path to the .onnx voice model; its .onnx.json config must sit beside it.
+
+    Returns:
+        A loaded piper.PiperVoice.
+
+    Raises:
+        RuntimeError: If piper-tts is not installed or the voice model is missing.
+    """
+    if not os.path.isabs(voice_path):
+        voice_path = os.path.join(APP_DIR, voice_path)
+    with _lock:
+        if voice_path not in _voices:
+            try:
+                from piper import PiperVoice
+            except ImportError:
+                raise RuntimeError("piper-tts is not installed. Run: pip install piper-tts")
+            if not os.path.exists(voice_path):
+                raise RuntimeError(f"Piper voice not found at {voice_path}. See docs/SETUP.md to download one.")
+
+            logger.info(f"Loading Piper voice: {voice_path}")
+            t = time.time()
+            voice = PiperVoice.load(voice_path)
+            # The first ONNX run allocates and optimises the graph; pay for it now, not on turn one
+            for _ in voice.synthesize("Hello."):
+                pass
+            logger.info(f"Piper voice ready [{time.time() - t:.2f}s]")
+            _voices[voice_path] = voice
+        return _voices[voice_path]
+
+
+class PiperTTSEngine(TTSEngine):
+    """Synthesises speech on-device with a Piper neural voice."""
+
+    supports_pcm = True
+
+    def __init__(self, voice: str = PIPER_VOICE):
+        """
+        Load (or reuse) the Piper voice so the first turn does not pay for it.
+
+        Args:
+            voice: Path to the .onnx voice model, absolute or relative to src/app.
+
+        Raises:
+            RuntimeError: If piper-tts is not installed or the voice model is missing.
+        """
+        self._voice = load_voice(voice)
+        self.sample_rate = self._voice.config.sample_rate
+        self._executor = inference_executor()
+        self._policy = policy_for("piper", stage="tts")
+
+    def _synthesize_sentence(self, sentence: str) -> np.ndarray:
+        """Synthesise one sentence on an inference slot and return its float32 samples."""
+        def _run() -> np.ndarray:
+            chunks = [chunk.audio_float_array for chunk in self._voice.synthesize(sentence)]
+            return np.concatenate(chunks).astype(np.float32) if chunks else np.zeros(0, dtype=np.float32)
+
+        return self._policy.call(lambda timeout: self._executor.submit(_run, timeout=timeout), retryable=False)
+
+    def synthesize_stream(self, text: str) -> Iterator[tuple[np.ndarray, int]]:
+        """
+        Yield PCM one sentence at a time, so playback can start after the first sentence.
+
+        Args:
+            text: The text to synthesise into speech.
+
+        Yields:
+            (mono float32 samples, sample rate) per sentence.
+
+        Raises:
+            RuntimeError: If synthesis fails.
+        """
+        t = time.time()
+        for i, sentence in enumerate(split_sentences(text)):
+            try:
+                audio = self._synthesize_sentence(sentence)
+            except Exception as e:
+                logger.error(f"Piper synthesis failed: {e}")
+                raise RuntimeError(f"Piper TTS error: {e}")
+            if i == 0:
+                logger.info(f"First sentence synthesised [{time.time() - t:.2f}s]")
+            yield audio, self.sample_rate
+
+    def synthesize_pcm(self, text: str) -> tuple[np.ndarray, int]:
+        """
+        Synthesise the whole text to PCM in memory.
+
+        Args:
+            text: The text to synthesise into speech.
+
+        Returns:
+            (mono float32 samples, sample rate in Hz).
+
+        Raises:
+            RuntimeError: If synthesis fails.
+        """
+        logger.info("Converting response to speech with Piper...")
+        t = time.time()
+        pieces = [audio for audio, _ in self.synthesize_stream(text)]
+        audio = np.concatenate(pieces) if pieces else np.zeros(0, dtype=np.float32)
+        logger.info(f"TTS complete! [{time.time() - t:.2f}s]")
+        return audio, self.sample_rate
+
+    def synthesize(self, text: str) -> str:
+        """
+        Convert text to speech and save to a temporary WAV file.
+
+        Args:
+            text: The text to synthesise into speech.
+
+        Returns:
+            Absolute path to the generated WAV file.
+            Caller is responsible for deleting the file after playback.
+
+        Raises:
+            RuntimeError: If synthesis fails.
+        """
+        import soundfile as sf
+        audio, sample_rate = self.synthesize_pcm(text)
+        temp = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
+        temp.close()
+        sf.write(temp.name, audio, sample_rate)
+        return temp.name
@@ -0,0 +1,66 @@
+"""
+src.app.core.engines.tts.simulated_tts
+
+Simulated TTS engine for offline benchmarks and load tests.
+Implements TTSEngine without a provider: each call waits for a latency drawn from the
+configured simulated profile (core.engines.simulation), longer for longer text, and writes
+a silent WAV of roughly the length the text would take to speak, so file handling and
+response sizes stay realistic.
+"""
+
+import time
+import tempfile
+import numpy as np
+from core.engines.base import TTSEngine
+from core.engines.call_policy import policy_for
+from core.engines.simulation import latency_model, simulate
+from utils.logger import setup_logger
+from config import SIMULATED_PROFILE
+
+logger = setup_logger(__name__, log_type="pipeline")
+
+SAMPLE_RATE = 16000
+# Average speaking rate of the cloud voices, about 15 characters per second
+SPEECH_SECONDS_PER_CHAR = 0.065
+
+
+class SimulatedTTSEngine(TTSEngine):
+    """Writes silent speech-length audio after a simulated provider delay."""
+
+    def __init__(self, profile: str = SIMULATED_PROFILE):
+        """
+        Args:
+            profile: Latency profile from SIMULATED_PROFILES.
+
+        Raises:
+            RuntimeError: If the profile is not configured.
+        """
+        self._latency = latency_model(profile, "tts")
+        self._policy = policy_for("simulated-tts", stage="tts")
+
+    def synthesize(self, text: str) -> str:
+        """
+        Write speech-length silence for text to a temporary WAV file.
+
+        Args:
+            text: The text to synthesise into speech.
+
+        Returns:
+            Absolute path to the generated WAV file.
+            Caller is responsible for deleting the file after playback.
+
+        Raises:
+            RuntimeError: If the simulated call fails or times out.
+        """
+        import soundfile as sf
+        t = time.time()
+        try:
+            self._policy.call(lambda timeout: simulate("tts", self._latency, chars=len(text), timeout=timeout))
+        except Exception as e:
+            logger.error(f"Simulated TTS failed: {e}")
+            raise RuntimeError(f"TTS error: {e}")
+        temp = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
+        temp.close()
+        sf.write(temp.name, np.zeros(int(len(text) * SPEECH_SECONDS_PER_CHAR * SAMPLE_RATE), dtype=np.int16), SAMPLE_RATE)
+        logger.info(f"TTS complete! [{time.time() - t:.2f}s, simulated]")
+        return temp.name
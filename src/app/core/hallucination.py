@@ -0,0 +1,191 @@
+"""
+src.app.core.hallucination
+
+Post-STT filter that rejects hallucinated transcripts before they reach the LLM.
+
+Whisper emits phantom text on near-silent or noisy clips ("you", "Thank you so much for
+watching", "Bye bye.", ". .", text in other scripts; see
+docs/test-results/2026-02-24-whisper-hallucination-testing.md). The energy gate catches true
+silence but not coughs or background noise. This filter checks each transcript against
+Whisper's own confidence signals (no-speech probability, average log-probability,
+compression ratio) and a blocklist of known phrases. Blocklisted phrases such as "Thank you."
+are also real answers, so they are only rejected when the decoder statistics show some doubt
+as well. A rejected turn skips the LLM and TTS calls entirely.
+
+Engines that expose segment statistics call report_segments() after decoding, and the
+filter reads them from the current context. Transcripts without statistics (or from
+engines that do not report them) are only checked for having no words and for repetition.
+"""
+
+import zlib
+import threading
+from contextvars import ContextVar
+from utils.logger import setup_logger
+from utils.text import normalize_text
+from config import (
+    HALLUCINATION_FILTER_ENABLED,
+    HALLUCINATION_NO_SPEECH_THRESHOLD,
+    HALLUCINATION_LOGPROB_THRESHOLD,
+    HALLUCINATION_MIN_AVG_LOGPROB,
+    HALLUCINATION_COMPRESSION_RATIO,
+    HALLUCINATION_BLOCKLIST,
+    HALLUCINATION_BLOCKLIST_NO_SPEECH,
+    HALLUCINATION_BLOCKLIST_LOGPROB,
+)
+
+logger = setup_logger(__name__, log_type="pipeline")
+
+_stats: ContextVar[dict | None] = ContextVar("transcript_stats", default=None)
+
+_lock = threading.Lock()
+_counts: dict[str, int] = {}
+
+
+def _segment_value(segment, key: str):
+    """Read a statistic from a segment dict (openai-whisper) or object (faster-whisper, OpenAI API)."""
+    return segment.get(key) if isinstance(segment, dict) else getattr(segment, key, None)
+
+
+def segment_stats(segments) -> dict | None:
+    """
+    Summarise per-segment decoder statistics for a whole transcript.
+
+    Args:
+        segments: Segments carrying no_speech_prob, avg_logprob and compression_ratio.
+
+    Returns:
+        Mean no-speech probability, mean average log-probability and worst compression
+        ratio across segments, or None if there are no segments with statistics.
+    """
+    rows = [
+        (_segment_value(s, "no_speech_prob"), _segment_value(s, "avg_logprob"), _segment_value(s, "compression_ratio"))
+        for s in segments or []
+    ]
+    rows = [row for row in rows if None not in row]
+    if not rows:
+        return None
+    return {
+        "no_speech_prob": sum(r[0] for r in rows) / len(rows),
+        "avg_logprob": sum(r[1] for r in rows) / len(rows),
+        "compression_ratio": max(r[2] for r in rows),
+    }
+
+
+def report_segments(segments):
+    """Record the statistics of the transcript just produced, for the filter to read."""
+    report_stats(segment_stats(segments))
+
+
+def report_stats(stats: dict | None):
+    """Record already summarised statistics, e.g. returned by the shared Whisper server."""
+    _stats.set(stats)
+
+
+def reset_transcript_stats():
+    """Forget the previous transcript's statistics before a new transcription."""
+    _stats.set(None)
+
+
+def transcript_stats() -> dict | None:
+    """Return the statistics reported for the current transcript, if any."""
+    return _stats.get()
+
+
+def compression_ratio(text: str) -> float:
+    """Whisper's repetition measure: UTF-8 length over zlib-compressed length."""
+    data = text.encode("utf-8")
+    return len(data) / len(zlib.compress(data)) if data else 0.0
+
+
+def hallucination_metrics() -> dict:
+    """Return the number of rejected transcripts per reason."""
+    with _lock:
+        return dict(_counts)
+
+
+class HallucinationFilter:
+    """Rejects transcripts that are likely Whisper hallucinations rather than speech."""
+
+    def __init__(
+        self,
+        enabled: bool = HALLUCINATION_FILTER_ENABLED,
+        no_speech_threshold: float = HALLUCINATION_NO_SPEECH_THRESHOLD,
+        logprob_threshold: float = HALLUCINATION_LOGPROB_THRESHOLD,
+        min_avg_logprob: float = HALLUCINATION_MIN_AVG_LOGPROB,
+        compression_ratio_threshold: float = HALLUCINATION_COMPRESSION_RATIO,
+        blocklist: list[str] = HALLUCINATION_BLOCKLIST,
+        blocklist_no_speech: float = HALLUCINATION_BLOCKLIST_NO_SPEECH,
+        blocklist_logprob: float = HALLUCINATION_BLOCKLIST_LOGPROB,
+    ):
+        """
+        Args:
+            enabled: If False, check() accepts every transcript.
+            no_speech_threshold: No-speech probability above which a low-confidence transcript is silence.
+            logprob_threshold: Average log-probability below which a high no-speech transcript is rejected.
+            min_avg_logprob: Average log-probability below which any transcript is rejected.
+            compression_ratio_threshold: Compression ratio above which a transcript is a repetition loop.
+            blocklist: Known hallucinated phrases, matched against the whole normalised transcript.
+            blocklist_no_speech: No-speech probability above which a blocklisted phrase is rejected.
+            blocklist_logprob: Average log-probability below which a blocklisted phrase is rejected.
+        """
+        self.enabled = enabled
+        self._no_speech_threshold = no_speech_threshold
+        self._logprob_threshold = logprob_threshold
+        self._min_avg_logprob = min_avg_logprob
+        self._compression_ratio_threshold = compression_ratio_threshold
+        self._blocklist = {" ".join(normalize_text(phrase)) for phrase in blocklist}
+        self._blocklist_no_speech = blocklist_no_speech
+        self._blocklist_logprob = blocklist_logprob
+
+    def reason(self, text: str, stats: dict | None = None) -> str | None:
+        """
+        Decide whether a transcript is a hallucination.
+
+        Args:
+            text: Transcript returned by the STT engine.
+            stats: Decoder statistics from segment_stats(). Defaults to those reported for
+                the current transcript.
+
+        Returns:
+            The rejection reason ("no_words", "blocklist", "no_speech", "low_confidence",
+            "repetition"), or None if the transcript looks like real speech.
+        """
+        if not any(ch.isalnum() for ch in text):
+            # Punctuation only (". ."); letters and digits in any script count as words
+            return "no_words"
+
+        stats = stats if stats is not None else transcript_stats()
+        if stats is not None:
+            unsure = stats["no_speech_prob"] > self._blocklist_no_speech or stats["avg_logprob"] < self._blocklist_logprob
+            if unsure and " ".join(normalize_text(text)) in self._blocklist:
+                return "blocklist"
+            # Whisper's own silence rule: likely no speech and not confident in the words
+            if stats["no_speech_prob"] > self._no_speech_threshold and stats["avg_logprob"] < self._logprob_threshold:
+                return "no_speech"
+            if stats["avg_logprob"] < self._min_avg_logprob:
+                return "low_confidence"
+            ratio = stats["compression_ratio"]
+        else:
+            ratio = compression_ratio(text)
+        if ratio > self._compression_ratio_threshold:
+            return "repetition"
+        return None
+
+    def check(self, text: str) -> str | None:
+        """
+        Check a transcript, logging and counting rejections.
+
+        Args:
+            text: Transcript returned by the STT engine.
+
+        Returns:
+            The rejection reason, or None if the transcript should continue to the LLM.
+        """
+        if not self.enabled or not text.strip():
+            return None
+        reason = self.reason(text)
+        if reason is not None:
+            with _lock:
+                _counts[reason] = _counts.get(reason, 0) + 1
+            logger.warning(f"Rejected likely hallucinated transcript ({reason}): '{text.strip()}'")
+        return reason
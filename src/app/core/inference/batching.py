@@ -0,0 +1,128 @@
+"""
+src.app.core.inference.batching
+
+Micro-batching scheduler for local inference.
+
+Callers from many sessions submit one item each and block on the result. A single worker
+thread takes the first pending item, keeps collecting for a short window (or until the batch
+is full), runs the whole batch through one call, and hands each result back to its waiter.
+Under concurrent load this turns N sequential forward passes into one batched pass; a lone
+request pays at most the window in extra latency.
+"""
+
+import time
+import queue
+import threading
+from concurrent.futures import Future
+from collections.abc import Callable
+from typing import Generic, TypeVar
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__, log_type="inference")
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class MicroBatcher(Generic[T, R]):
+    """Collects concurrent submissions into batches for a single batched call."""
+
+    def __init__(
+        self,
+        process: Callable[[list[T]], list[R]],
+        max_batch: int,
+        window: float,
+        name: str = "batch",
+    ):
+        """
+        Args:
+            process: Runs one batch and returns one result per item, in order.
+            max_batch: Largest batch dispatched at once.
+            window: Seconds to keep collecting after the first item of a batch arrives.
+            name: Used for the worker thread name and log messages.
+        """
+        self._process = process
+        self._max_batch = max_batch
+        self._window = window
+        self._name = name
+        self._queue: queue.Queue[tuple[T, Future]] = queue.Queue()
+        self._lock = threading.Lock()
+        self._batches = 0
+        self._items = 0
+        self._worker = threading.Thread(target=self._run, name=f"{name}-batcher", daemon=True)
+        self._worker.start()
+
+    def submit(self, item: T, timeout: float | None = None) -> R:
+        """
+        Queue one item and block until its batch has been processed.
+
+        Args:
+            item: Input for the batched call.
+            timeout: Longest to wait for the result in seconds, or None to wait indefinitely.
+
+        Returns:
+            This item's result from the batch.
+
+        Raises:
+            TimeoutError: If the result is not ready within timeout. The item is still processed.
+            Exception: Whatever the batched call raised for this batch.
+        """
+        future: Future = Future()
+        self._queue.put((item, future))
+        return future.result(timeout=timeout)
+
+    def _collect(self) -> list[tuple[T, Future]]:
+        """Block for the first item, then gather more until the window closes or the batch is full."""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self._window
+        while len(batch) < self._max_batch:
+            left = deadline - time.monotonic()
+            if left <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=left))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            futures = [future for _, future in batch]
+            items = [item for item, _ in batch]
+            # Drop references to the inputs before waking waiters: they may be views over
+            # shared memory that the waiter closes as soon as its result arrives
+            del batch
+            t = time.time()
+            try:
+                results = self._process(items)
+                if len(results) != len(items):
+                    raise RuntimeError(f"Batch returned {len(results)} results for {len(items)} items")
+            except Exception as e:
+                logger.error(f"{self._name} batch of {len(items)} failed: {e}")
+                # The traceback's frames would otherwise keep the inputs alive too
+                e.with_traceback(None)
+                del items
+                for future in futures:
+                    future.set_exception(e)
+                continue
+
+            size = len(items)
+            del items
+            with self._lock:
+                self._batches += 1
+                self._items += size
+            logger.info(f"{self._name} batch of {size} done [{time.time() - t:.2f}s]")
+            for future, result in zip(futures, results):
+                future.set_result(result)
+
+    def snapshot(self) -> dict:
+        """Return batch count, item count, mean batch size and current queue depth."""
+        with self._lock:
+            batches, items = self._batches, self._items
+        return {
+            "batches": batches,
+            "items": items,
+            "mean_batch_size": round(items / batches, 2) if batches else None,
+            "queued": self._queue.qsize(),
+        }
@@ -0,0 +1,123 @@
+"""
+src.app.core.inference.decode
+
+Decode profiles for the local Whisper engines.
+
+A profile is a named set of openai-whisper transcribe() options from config.py
+(WHISPER_DECODE_PROFILES). decode_options() resolves a profile plus the initial prompt for the
+field being collected, which callers set around transcription with decode_field(). Helpers
+translate the options for whisper.decode() batches and for faster-whisper, and latency is
+recorded per profile so the profiles can be compared in /health.
+"""
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from config import (
+    WHISPER_DECODE_PROFILE,
+    WHISPER_DECODE_PROFILES,
+    WHISPER_FIELD_PROMPTS,
+    FIELD_INITIAL_PROMPTS,
+)
+
+_field: ContextVar[str | None] = ContextVar("decode_field", default=None)
+
+_lock = threading.Lock()
+_latency: dict[str, dict] = {}
+
+
+@contextmanager
+def decode_field(field: str | None):
+    """
+    Mark the onboarding field being transcribed inside the block, selecting its initial prompt.
+
+    Args:
+        field: Onboarding field name, or None for no field-specific prompt.
+    """
+    token = _field.set(field)
+    try:
+        yield
+    finally:
+        _field.reset(token)
+
+
+def current_field() -> str | None:
+    """Return the field set by the enclosing decode_field() block, if any."""
+    return _field.get()
+
+
+def decode_options(profile: str = WHISPER_DECODE_PROFILE, field: str | None = None) -> dict:
+    """
+    Resolve a decode profile into openai-whisper transcribe() keyword arguments.
+
+    Args:
+        profile: Name of a profile in WHISPER_DECODE_PROFILES.
+        field: Field whose initial prompt to add. Defaults to the current decode_field().
+
+    Returns:
+        A new dict of transcribe() options.
+
+    Raises:
+        RuntimeError: If the profile is not defined.
+    """
+    if profile not in WHISPER_DECODE_PROFILES:
+        raise RuntimeError(f"Unknown Whisper decode profile: {profile}")
+    options = dict(WHISPER_DECODE_PROFILES[profile])
+    field = field or current_field()
+    if WHISPER_FIELD_PROMPTS and field in FIELD_INITIAL_PROMPTS:
+        options["initial_prompt"] = FIELD_INITIAL_PROMPTS[field]
+    return options
+
+
+def batch_decoding_options(options: dict) -> dict:
+    """
+    Translate transcribe() options into whisper.DecodingOptions arguments for a batched pass.
+
+    whisper.decode() runs a single pass, so only the first temperature is used, and the
+    no-speech, log-probability and compression thresholds (which only drive fallback) are dropped.
+    """
+    temperature = options.get("temperature", 0.0)
+    if isinstance(temperature, (tuple, list)):
+        temperature = temperature[0]
+    decoding = {
+        "language": options.get("language"),
+        "temperature": temperature,
+        "beam_size": options.get("beam_size"),
+        "prompt": options.get("initial_prompt"),
+        "without_timestamps": True,
+    }
+    if temperature > 0 and options.get("best_of") is not None:
+        decoding["best_of"] = options["best_of"]
+    return decoding
+
+
+def faster_whisper_options(options: dict) -> dict:
+    """Translate transcribe() options into faster-whisper WhisperModel.transcribe() arguments."""
+    translated = dict(options)
+    if "logprob_threshold" in translated:
+        translated["log_prob_threshold"] = translated.pop("logprob_threshold")
+    # faster-whisper has no greedy-without-beam mode; a beam of 1 is greedy
+    translated["beam_size"] = translated.get("beam_size") or 1
+    return translated
+
+
+def record_latency(profile: str, seconds: float, audio_seconds: float):
+    """Record one transcription's latency and audio length under its profile."""
+    with _lock:
+        stats = _latency.setdefault(profile, {"count": 0, "seconds": 0.0, "audio_seconds": 0.0})
+        stats["count"] += 1
+        stats["seconds"] += seconds
+        stats["audio_seconds"] += audio_seconds
+
+
+def decode_metrics() -> dict:
+    """Return transcription count, mean latency and real-time factor per decode profile."""
+    with _lock:
+        return {
+            profile: {
+                "count": stats["count"],
+                "mean_seconds": round(stats["seconds"] / stats["count"], 3),
+                "rtf": round(stats["seconds"] / stats["audio_seconds"], 3) if stats["audio_seconds"] else None,
+            }
+            for profile, stats in _latency.items()
+        }
@@ -0,0 +1,184 @@
+"""
+src.app.core.inference.executor
+
+Process-wide CPU executor for local model inference.
+
+Every local forward pass (Whisper, faster-whisper, batched or not) runs on one of a fixed
+number of worker slots instead of on the calling session's thread. Each slot caps the
+PyTorch intra-op threads it uses, and can optionally be pinned to its own set of cores,
+so N concurrent sessions share the machine as slots x threads_per_slot threads rather
+than N x all-cores threads thrashing the same caches. Work beyond the slot count waits
+in a FIFO queue.
+"""
+
+import os
+import sys
+import time
+import queue
+import threading
+from concurrent.futures import Future
+from collections.abc import Callable
+from typing import TypeVar
+from utils.logger import setup_logger
+from config import INFERENCE_SLOTS, INFERENCE_THREADS_PER_SLOT, INFERENCE_PIN_CPUS
+
+logger = setup_logger(__name__, log_type="inference")
+
+R = TypeVar("R")
+
+_executor: "InferenceExecutor | None" = None
+_lock = threading.Lock()
+
+
+def cpu_sets(slots: int, threads_per_slot: int) -> list[set[int]]:
+    """
+    Split the cores this process may run on into one disjoint set per slot.
+
+    Args:
+        slots: Number of worker slots.
+        threads_per_slot: Cores wanted by each slot.
+
+    Returns:
+        One set of CPU ids per slot. Slots wrap around when there are fewer cores than
+        slots x threads_per_slot.
+    """
+    available = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else list(range(os.cpu_count() or 1))
+    return [
+        {available[(slot * threads_per_slot + i) % len(available)] for i in range(threads_per_slot)}
+        for slot in range(slots)
+    ]
+
+
+class InferenceExecutor:
+    """Runs inference calls on a fixed pool of thread-capped, optionally CPU-pinned slots."""
+
+    def __init__(self, slots: int, threads_per_slot: int, pin_cpus: bool = False):
+        """
+        Args:
+            slots: Number of inference calls allowed to run at once.
+            threads_per_slot: Intra-op threads each call may use.
+            pin_cpus: Pin each slot's thread to its own cores (Linux only).
+        """
+        self.slots = slots
+        self.threads_per_slot = threads_per_slot
+        self._queue: queue.Queue[tuple[Callable, tuple, Future, float]] = queue.Queue()
+        self._lock = threading.Lock()
+        self._busy = 0
+        self._started = 0
+        self._completed = 0
+        self._waited = 0.0
+        self._cpu_sets = cpu_sets(slots, threads_per_slot) if pin_cpus and hasattr(os, "sched_setaffinity") else None
+        if pin_cpus and self._cpu_sets is None:
+            logger.warning("CPU pinning is not supported on this platform, running unpinned")
+        self._workers = [
+            threading.Thread(target=self._run, args=(slot,), name=f"inference-{slot}", daemon=True)
+            for slot in range(slots)
+        ]
+        for worker in self._workers:
+            worker.start()
+        logger.info(
+            f"Inference executor: {slots} slots x {threads_per_slot} threads"
+            + (f", pinned to {[sorted(s) for s in self._cpu_sets]}" if self._cpu_sets else "")
+        )
+
+    def submit(self, fn: Callable[..., R], *args, timeout: float | None = None) -> R:
+        """
+        Queue one inference call and block until a slot has run it.
+
+        Args:
+            fn: The inference call.
+            *args: Positional arguments for fn.
+            timeout: Longest to wait for the result in seconds, or None to wait indefinitely.
+
+        Returns:
+            Whatever fn returns.
+
+        Raises:
+            TimeoutError: If the result is not ready within timeout. The call still runs.
+            Exception: Whatever fn raised.
+        """
+        future: Future = Future()
+        self._queue.put((fn, args, future, time.monotonic()))
+        return future.result(timeout=timeout)
+
+    def _configure_torch(self) -> bool:
+        """
+        Cap this slot's PyTorch threads once torch has been imported by a model.
+
+        Returns:
+            True once torch is configured, False if it is not loaded yet.
+        """
+        torch = sys.modules.get("torch")
+        if torch is None:
+            return False
+        # The intra-op setting applies to the calling thread's parallel region,
+        # so every slot sets it on itself
+        torch.set_num_threads(self.threads_per_slot)
+        try:
+            # Process-wide and only settable before the first inter-op parallel call
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            pass
+        return True
+
+    def _run(self, slot: int):
+        if self._cpu_sets is not None:
+            # pid 0 is the calling thread on Linux
+            os.sched_setaffinity(0, self._cpu_sets[slot])
+        torch_ready = False
+        while True:
+            fn, args, future, queued_at = self._queue.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            if not torch_ready:
+                torch_ready = self._configure_torch()
+            with self._lock:
+                self._busy += 1
+                self._started += 1
+                self._waited += time.monotonic() - queued_at
+            result = error = None
+            try:
+                result = fn(*args)
+            except Exception as e:
+                # The traceback's frames would otherwise keep the inputs alive
+                error = e.with_traceback(None)
+            # Drop references to the inputs (arguments or closure) before waking the caller: they
+            # may be views over shared memory that the caller closes as soon as its result arrives
+            del fn, args
+            with self._lock:
+                self._busy -= 1
+                self._completed += 1
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+            del result, error
+
+    def snapshot(self) -> dict:
+        """Return slot layout, busy slots, queue depth, completed calls and mean queue wait."""
+        with self._lock:
+            busy, started, completed, waited = self._busy, self._started, self._completed, self._waited
+        return {
+            "slots": self.slots,
+            "threads_per_slot": self.threads_per_slot,
+            "pinned": self._cpu_sets is not None,
+            "busy": busy,
+            "queued": self._queue.qsize(),
+            "completed": completed,
+            "mean_wait_seconds": round(waited / started, 4) if started else None,
+        }
+
+
+def inference_executor() -> InferenceExecutor:
+    """Return the process-wide executor, starting it on first use."""
+    global _executor
+    with _lock:
+        if _executor is None:
+            threads = INFERENCE_THREADS_PER_SLOT or max(1, (os.cpu_count() or 1) // INFERENCE_SLOTS)
+            _executor = InferenceExecutor(INFERENCE_SLOTS, threads, pin_cpus=INFERENCE_PIN_CPUS)
+        return _executor
+
+
+def executor_metrics() -> dict | None:
+    """Return the executor's snapshot, or None if no local model has used it yet."""
+    return _executor.snapshot() if _executor is not None else None
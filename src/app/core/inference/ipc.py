@@ -0,0 +1,79 @@
+"""
+src.app.core.inference.ipc
+
+Wire protocol shared by the local inference server and its client engines.
+
+Messages are length-prefixed JSON over a Unix domain socket. Audio never travels over
+the socket: the client writes float32 samples into a POSIX shared-memory block and sends
+only its name and length, and the server maps the same pages as a NumPy array.
+"""
+
+import json
+import socket
+import struct
+import numpy as np
+from multiprocessing import shared_memory, resource_tracker
+
+_HEADER = struct.Struct(">I")
+MAX_MESSAGE_BYTES = 1 << 20
+
+# Blocks created by this process, which its resource tracker already owns
+_created: set[str] = set()
+
+
+def send_message(sock: socket.socket, message: dict):
+    """Send a JSON message prefixed with its 4-byte big-endian length."""
+    payload = json.dumps(message).encode("utf-8")
+    sock.sendall(_HEADER.pack(len(payload)) + payload)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("Inference server connection closed mid-message")
+        data.extend(chunk)
+    return bytes(data)
+
+
+def recv_message(sock: socket.socket) -> dict:
+    """
+    Receive one length-prefixed JSON message.
+
+    Raises:
+        ConnectionError: If the peer closes the connection or the message is oversized.
+    """
+    (size,) = _HEADER.unpack(_recv_exact(sock, _HEADER.size))
+    if size > MAX_MESSAGE_BYTES:
+        raise ConnectionError(f"Inference message of {size} bytes exceeds the {MAX_MESSAGE_BYTES} byte limit")
+    return json.loads(_recv_exact(sock, size))
+
+
+def share_audio(audio: np.ndarray) -> shared_memory.SharedMemory:
+    """
+    Copy float32 samples into a new shared-memory block.
+
+    The caller owns the block and must pass it to release_audio() once the server replies.
+    """
+    shm = shared_memory.SharedMemory(create=True, size=audio.nbytes)
+    _created.add(shm.name)
+    np.ndarray(audio.shape, dtype=np.float32, buffer=shm.buf)[:] = audio
+    return shm
+
+
+def release_audio(shm: shared_memory.SharedMemory):
+    """Close and unlink a block created by share_audio()."""
+    shm.close()
+    shm.unlink()
+    _created.discard(shm.name)
+
+
+def attach_audio(name: str) -> shared_memory.SharedMemory:
+    """Attach to a client's shared-memory block without taking ownership of it."""
+    shm = shared_memory.SharedMemory(name=name)
+    # Attaching registers the block with this process's resource tracker, which would
+    # unlink it on exit and warn about a leak; the client owns and unlinks it instead
+    if name not in _created:
+        resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
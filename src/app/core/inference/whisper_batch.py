@@ -0,0 +1,109 @@
+"""
+src.app.core.inference.whisper_batch
+
+Batched Whisper decoding and the process-wide shared model.
+
+transcribe_batch() pads each clip to Whisper's 30-second window, stacks the log-mel
+spectrograms, and runs the encoder and decoder once for all clips sharing the same decode
+options (profile and field prompt) with whisper.decode(). Clips longer than one window fall
+back to model.transcribe() so their audio is not truncated. whisper_batcher() loads each model size once per process and wraps
+it in a MicroBatcher shared by every engine instance. Each batch runs on the inference
+executor, so it shares the capped CPU slots with every other local model call.
+"""
+
+import threading
+import numpy as np
+from core.inference.batching import MicroBatcher
+from core.inference.executor import inference_executor
+from core.inference.decode import batch_decoding_options
+from utils.audio import WHISPER_SAMPLE_RATE
+from utils.logger import setup_logger
+from config import WHISPER_BATCH_MAX_SIZE, WHISPER_BATCH_WINDOW
+
+logger = setup_logger(__name__, log_type="inference")
+
+# Whisper decodes fixed 30-second windows
+WINDOW_SAMPLES = 30 * WHISPER_SAMPLE_RATE
+
+_batchers: dict[str, MicroBatcher] = {}
+_lock = threading.Lock()
+
+
+def transcribe_batch(model, items: list[tuple[np.ndarray, dict]]) -> list[dict]:
+    """
+    Transcribe several 16kHz float32 clips with one batched forward pass per decode setting.
+
+    Args:
+        model: A loaded openai-whisper model.
+        items: (mono float32 clip at 16kHz, transcribe() options from decode_options()) pairs.
+            Clips whose options translate to the same DecodingOptions share a pass.
+
+    Returns:
+        One result per clip, in order, shaped like model.transcribe()'s: the stripped "text"
+        and "segments" carrying no_speech_prob, avg_logprob and compression_ratio.
+    """
+    import torch
+    import whisper
+
+    results: list[dict | None] = [None] * len(items)
+    groups: dict[tuple, list[int]] = {}
+    for i, (clip, options) in enumerate(items):
+        if clip.size > WINDOW_SAMPLES:
+            result = model.transcribe(clip, **options)
+            results[i] = {"text": result["text"].strip(), "segments": result["segments"]}
+        else:
+            key = tuple(sorted(batch_decoding_options(options).items()))
+            groups.setdefault(key, []).append(i)
+
+    n_mels = getattr(model.dims, "n_mels", 80)
+    for key, indices in groups.items():
+        mels = torch.stack([
+            whisper.log_mel_spectrogram(whisper.pad_or_trim(items[i][0]), n_mels)
+            for i in indices
+        ]).to(model.device)
+        options = whisper.DecodingOptions(fp16=model.device.type == "cuda", **dict(key))
+        with torch.no_grad():
+            decoded = whisper.decode(model, mels, options)
+        for i, result in zip(indices, decoded):
+            results[i] = {
+                "text": result.text.strip(),
+                "segments": [{
+                    "no_speech_prob": result.no_speech_prob,
+                    "avg_logprob": result.avg_logprob,
+                    "compression_ratio": result.compression_ratio,
+                }],
+            }
+    return results
+
+
+def whisper_batcher(
+    model_name: str,
+    max_batch: int = WHISPER_BATCH_MAX_SIZE,
+    window: float = WHISPER_BATCH_WINDOW,
+    model=None,
+) -> MicroBatcher:
+    """
+    Return the process-wide batcher for a model size, loading the model on first use.
+
+    Args:
+        model_name: Whisper model size, e.g. "base".
+        max_batch: Largest batch dispatched at once.
+        window: Seconds to wait for more clips after the first arrives.
+        model: Already-loaded model to use instead of loading one.
+
+    Returns:
+        A MicroBatcher whose submit((clip, options)) returns the clip's transcribe_batch() result.
+    """
+    with _lock:
+        if model_name not in _batchers:
+            if model is None:
+                import whisper
+                logger.info(f"Loading shared local Whisper model: {model_name}")
+                model = whisper.load_model(model_name)
+            _batchers[model_name] = MicroBatcher(
+                lambda clips: inference_executor().submit(transcribe_batch, model, clips),
+                max_batch=max_batch,
+                window=window,
+                name=f"whisper-{model_name}",
+            )
+        return _batchers[model_name]
@@ -0,0 +1,169 @@
+"""
+src.app.core.inference.whisper_server
+
+Standalone local Whisper inference server.
+
+Loads one Whisper model and serves transcription requests from every API worker and CLI
+process on the machine over a Unix domain socket, so memory holds a single model no matter
+how many workers or sessions use it. Audio arrives as shared-memory float32 buffers, see
+core.inference.ipc. Clients use SharedWhisperEngine. Concurrent requests are micro-batched
+into one forward pass unless --batch-size is 1. Forward passes run on the inference
+executor's thread-capped slots (core.inference.executor).
+
+Run from src/app:
+    python -m core.inference.whisper_server --model base
+"""
+
+import os
+import socket
+import argparse
+import threading
+import socketserver
+import numpy as np
+from core.inference.ipc import send_message, recv_message, attach_audio
+from core.inference.batching import MicroBatcher
+from core.inference.executor import inference_executor
+from core.hallucination import segment_stats
+from utils.logger import setup_logger
+from config import (
+    WHISPER_SERVER_SOCKET,
+    WHISPER_SERVER_MODEL,
+    WHISPER_BATCH_MAX_SIZE,
+    WHISPER_BATCH_WINDOW,
+)
+
+logger = setup_logger(__name__, log_type="inference")
+
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+    """Handles one request per connection: a ping or a shared-memory transcription."""
+
+    def handle(self):
+        try:
+            request = recv_message(self.request)
+        except (ConnectionError, ValueError) as e:
+            logger.warning(f"Dropping malformed request: {e}")
+            return
+
+        try:
+            if request.get("op") == "ping":
+                response = {"ok": True, "model": self.server.model_name}
+            elif request.get("op") == "transcribe":
+                response = self.server.transcribe_shared(request["shm"], request["samples"], request.get("options", {}))
+            else:
+                response = {"error": f"Unknown op: {request.get('op')}"}
+        except Exception as e:
+            logger.error(f"Transcription request failed: {e}")
+            response = {"error": str(e)}
+
+        try:
+            send_message(self.request, response)
+        except OSError as e:
+            logger.warning(f"Client went away before the response was sent: {e}")
+
+
+class WhisperServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server owning the single Whisper model instance."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        socket_path: str,
+        model,
+        model_name: str = WHISPER_SERVER_MODEL,
+        batcher: MicroBatcher | None = None,
+    ):
+        """
+        Args:
+            socket_path: Filesystem path of the Unix socket to listen on.
+            model: Loaded model exposing transcribe(audio: np.ndarray, **options) -> {"text": ...}.
+            model_name: Model size reported to clients on ping.
+            batcher: Batches concurrent clips into one pass. If None, clips run one at a time.
+        """
+        self.model_name = model_name
+        self._model = model
+        self._batcher = batcher
+        # Without a batcher, one forward pass at a time: Whisper's decoder installs kv-cache hooks
+        # on the shared model, so concurrent passes would interfere. Connections still queue here
+        self._lock = threading.Lock()
+        super().__init__(socket_path, _RequestHandler)
+
+    def transcribe_shared(self, shm_name: str, samples: int, options: dict | None = None) -> dict:
+        """
+        Transcribe audio from a client's shared-memory block without copying it.
+
+        Args:
+            shm_name: Name of the client's shared-memory block.
+            samples: Number of float32 samples in the block.
+            options: Whisper transcribe() options from the client's decode profile.
+
+        Returns:
+            {"text": transcript with whitespace stripped, "stats": segment statistics or None}.
+        """
+        shm = attach_audio(shm_name)
+        try:
+            audio = np.ndarray((samples,), dtype=np.float32, buffer=shm.buf)
+            try:
+                options = options or {}
+                if self._batcher is not None:
+                    result = self._batcher.submit((audio, options))
+                else:
+                    with self._lock:
+                        result = inference_executor().submit(lambda: self._model.transcribe(audio, **options))
+                # Only the summary goes back over the socket, not every segment's tokens
+                return {"text": result["text"].strip(), "stats": segment_stats(result.get("segments"))}
+            finally:
+                # The view must be released before the mapping can be closed
+                del audio
+        finally:
+            shm.close()
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.server_address):
+            os.remove(self.server_address)
+
+
+def _server_running(socket_path: str) -> bool:
+    """True if something is already accepting connections on the socket path."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+            return True
+        except OSError:
+            return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Shared local Whisper inference server")
+    parser.add_argument("--model", default=WHISPER_SERVER_MODEL, help="Whisper model size to load")
+    parser.add_argument("--socket", default=WHISPER_SERVER_SOCKET, help="Unix socket path to listen on")
+    parser.add_argument("--batch-size", type=int, default=WHISPER_BATCH_MAX_SIZE, help="Largest batch, 1 disables batching")
+    parser.add_argument("--batch-window", type=float, default=WHISPER_BATCH_WINDOW, help="Seconds to collect a batch")
+    args = parser.parse_args()
+
+    if os.path.exists(args.socket):
+        if _server_running(args.socket):
+            raise SystemExit(f"A Whisper server is already listening on {args.socket}")
+        os.remove(args.socket)
+
+    import whisper
+    logger.info(f"Loading local Whisper model: {args.model}")
+    model = whisper.load_model(args.model)
+
+    batcher = None
+    if args.batch_size > 1:
+        from core.inference.whisper_batch import whisper_batcher
+        batcher = whisper_batcher(args.model, args.batch_size, args.batch_window, model=model)
+
+    with WhisperServer(args.socket, model, model_name=args.model, batcher=batcher) as server:
+        logger.info(f"Whisper server listening on {args.socket}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("Whisper server shutting down.")
+
+
+if __name__ == "__main__":
+    main()
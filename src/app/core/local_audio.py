@@ -0,0 +1,103 @@
+"""
+src.app.core.local_audio
+
+Microphone and speaker I/O for the CLI and dashboard.
+Imports sounddevice (PortAudio) and pygame (SDL), which cost a few hundred milliseconds
+to load and need audio devices, so core.pipeline only imports this module when a local
+session records or plays audio. The API server never does.
+"""
+
+import time
+from collections.abc import Iterable
+import numpy as np
+import pygame
+import sounddevice as sd
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__, log_type="pipeline")
+
+
+def record_audio(duration: float, sample_rate: int) -> np.ndarray:
+    """
+    Record audio from the default microphone.
+
+    Args:
+        duration: Seconds of audio to record.
+        sample_rate: Microphone sample rate in Hz.
+
+    Returns:
+        Raw audio samples as a float32 numpy array of shape (samples, 1).
+
+    Raises:
+        RuntimeError: If microphone recording fails.
+    """
+    logger.info(f"Recording for {duration} seconds... Speak now!")
+    t = time.time()
+    try:
+        audio_data = sd.rec(
+            int(duration * sample_rate),
+            samplerate=sample_rate,
+            channels=1,
+            dtype="float32",
+        )
+        sd.wait()
+        logger.info(f"Recording complete! [{time.time() - t:.2f}s]")
+        return audio_data
+    except Exception as e:
+        logger.error(f"Microphone recording failed: {e}")
+        raise RuntimeError(f"Failed to record audio: {e}")
+
+
+def play_audio(filepath: str):
+    """
+    Play an audio file through the default output device using pygame.
+    Blocks until playback is complete.
+
+    Args:
+        filepath: Path to the audio file to play (MP3 or WAV).
+
+    Raises:
+        RuntimeError: If audio playback fails.
+    """
+    logger.info("Playing response...")
+    t = time.time()
+    try:
+        pygame.mixer.init()
+        pygame.mixer.music.load(filepath)
+        pygame.mixer.music.play()
+        while pygame.mixer.music.get_busy():
+            pygame.time.Clock().tick(10)
+        logger.info(f"Playback complete! [{time.time() - t:.2f}s]")
+    except Exception as e:
+        logger.error(f"Audio playback failed: {e}")
+        raise RuntimeError(f"Failed to play audio: {e}")
+
+
+def play_stream(pieces: Iterable[tuple[np.ndarray, int]]) -> bool:
+    """
+    Play PCM pieces back to back, producing the next piece while the current one plays.
+
+    Args:
+        pieces: (samples, sample rate) pairs, e.g. from TTSEngine.synthesize_stream().
+
+    Returns:
+        True if the audio was played, False if the stream failed before any audio played,
+        so the caller can fall back to file playback.
+    """
+    logger.info("Streaming response...")
+    t = time.time()
+    played = False
+    try:
+        for audio, sample_rate in pieces:
+            sd.wait()
+            sd.play(audio, sample_rate)
+            if not played:
+                logger.info(f"First audio playing [{time.time() - t:.2f}s]")
+                played = True
+        sd.wait()
+        logger.info(f"Playback complete! [{time.time() - t:.2f}s]")
+    except Exception as e:
+        logger.error(f"Streamed playback failed: {e}")
+        if not played:
+            return False
+    return True
@@ -2,19 +2,25 @@
 src.app.core.pipeline
 
 Dynamic engine loader and OnboardingPipeline.
-All audio I/O, conversation history management, and turn sequencing lives here.
+Conversation history management and turn sequencing live here.
 STT, LLM, and TTS are injected as engine instances, the pipeline is provider-agnostic.
+Microphone and speaker I/O is in core.local_audio, imported only when a local session
+records or plays, so the API imports this module without PortAudio or SDL.
 """
 
 import os
 import time
-import pygame
+import threading
 import tempfile
 import importlib
 import numpy as np
-import sounddevice as sd
-import soundfile as sf
 from core.engines.base import STTEngine, LLMEngine, TTSEngine
+from core.engines.call_policy import turn_deadline
+from core.engines.rate_limit import estimate_tokens
+from core.degradation import DegradationController
+from core import tracing
+from core.inference.decode import decode_field
+from core.hallucination import HallucinationFilter, reset_transcript_stats
 from config import MAX_HISTORY_LENGTH, OPENING_TEXT
 from utils.logger import setup_logger
 
@@ -40,10 +46,41 @@ def load_engine(dotted_path: str) -> STTEngine | LLMEngine | TTSEngine:
     return cls()
 
 
+def transcribe_audio(
+    stt: STTEngine,
+    audio: np.ndarray,
+    sample_rate: int,
+    audio_path: str | None = None,
+    field: str | None = None,
+) -> str:
+    """
+    Transcribe audio the caller has already decoded, avoiding a second decode where possible.
+
+    Engines that accept arrays get the samples directly; file-based engines get
+    audio_path if one exists, otherwise a temporary WAV is written for them.
+
+    Args:
+        stt: STT engine instance.
+        audio: Decoded samples.
+        sample_rate: Sample rate of the samples in Hz.
+        audio_path: Path the samples were read from or saved to, if any.
+        field: Onboarding field being answered, selecting local Whisper's initial prompt.
+
+    Returns:
+        The transcribed text. Engines that expose decoder statistics report them for
+        HallucinationFilter to read in the same context.
+    """
+    reset_transcript_stats()
+    with decode_field(field):
+        if audio_path is not None and not stt.supports_arrays:
+            return stt.transcribe(audio_path)
+        return stt.transcribe_array(audio, sample_rate)
+
+
 class OnboardingPipeline:
     """
     Drives the voice onboarding conversation loop.
-    Audio I/O (record, save, play, cleanup) lives here. 
+    Audio file handling (save, cleanup) lives here; recording and playback delegate to core.local_audio.
     """
 
     def __init__(
@@ -79,10 +116,13 @@ class OnboardingPipeline:
         self.sample_rate = sample_rate
         self.energy_threshold = energy_threshold
         self.conversation_history: list[dict] = []
+        self.degradation = DegradationController(tts)
+        self.hallucination_filter = HallucinationFilter()
 
     def get_opening(self) -> tuple[str, str]:
         """
-        Return the hardcoded opening text and synthesise it to a temp audio file.
+        Return the hardcoded opening text and its audio in a temp file, from the TTS
+        cache when it has been warmed up, otherwise synthesised now.
 
         This is the single source of truth for the opening message — used by
         both the CLI runner and the REST API so behaviour is consistent.
@@ -91,7 +131,7 @@ class OnboardingPipeline:
             Tuple of (opening_text, audio_filepath).
             The caller is responsible for cleaning up the audio file.
         """
-        audio_path = self.tts.synthesize(OPENING_TEXT)
+        audio_path = self.degradation.cached_audio(OPENING_TEXT) or self.tts.synthesize(OPENING_TEXT)
         return OPENING_TEXT, audio_path
 
     def record_audio(self) -> np.ndarray:
@@ -104,21 +144,8 @@ class OnboardingPipeline:
         Raises:
             RuntimeError: If microphone recording fails.
         """
-        logger.info(f"Recording for {self.recording_duration} seconds... Speak now!")
-        t = time.time()
-        try:
-            audio_data = sd.rec(
-                int(self.recording_duration * self.sample_rate),
-                samplerate=self.sample_rate,
-                channels=1,
-                dtype="float32",
-            )
-            sd.wait()
-            logger.info(f"Recording complete! [{time.time() - t:.2f}s]")
-            return audio_data
-        except Exception as e:
-            logger.error(f"Microphone recording failed: {e}")
-            raise RuntimeError(f"Failed to record audio: {e}")
+        from core import local_audio
+        return local_audio.record_audio(self.recording_duration, self.sample_rate)
 
     def save_audio(self, audio_data: np.ndarray) -> str:
         """
@@ -133,6 +160,7 @@ class OnboardingPipeline:
         Raises:
             RuntimeError: If the file write fails.
         """
+        import soundfile as sf
         try:
             temp = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
             filepath = temp.name
@@ -145,7 +173,7 @@ class OnboardingPipeline:
 
     def play_audio(self, filepath: str):
         """
-        Play an audio file through the default output device using pygame.
+        Play an audio file through the default output device.
         Blocks until playback is complete.
 
         Args:
@@ -154,18 +182,8 @@ class OnboardingPipeline:
         Raises:
             RuntimeError: If audio playback fails.
         """
-        logger.info("Playing response...")
-        t = time.time()
-        try:
-            pygame.mixer.init()
-            pygame.mixer.music.load(filepath)
-            pygame.mixer.music.play()
-            while pygame.mixer.music.get_busy():
-                pygame.time.Clock().tick(10)
-            logger.info(f"Playback complete! [{time.time() - t:.2f}s]")
-        except Exception as e:
-            logger.error(f"Audio playback failed: {e}")
-            raise RuntimeError(f"Failed to play audio: {e}")
+        from core import local_audio
+        local_audio.play_audio(filepath)
 
     def cleanup_file(self, filepath: str):
         """
@@ -180,20 +198,25 @@ class OnboardingPipeline:
         except Exception as e:
             logger.warning(f"Could not delete {filepath}: {e}")
 
-    def _generate(self, user_input: str) -> str:
+    def _generate(self, user_input: str, fallback: str | None = None, on_slow=None) -> str:
         """
         Append user input to history, call the LLM, append the response,
         and trim history to MAX_HISTORY_LENGTH if exceeded.
 
         Args:
             user_input: The user's transcribed message or initial prompt.
+            fallback: Response to use if the LLM overruns its latency budget.
+                      If None the LLM is always awaited.
+            on_slow: Called once if the LLM is slower than the filler threshold.
 
         Returns:
             The assistant's response text, or empty string if LLM returns nothing.
         """
         self.conversation_history.append({"role": "user", "content": user_input})
         messages = [{"role": "system", "content": self.system_prompt}] + self.conversation_history
-        response = self.llm.generate(messages)
+        response = self.degradation.generate(lambda: self.llm.generate(messages), fallback, on_slow)
+        # Estimated at four characters per token, engines do not all report usage
+        tracing.annotate(prompt_tokens=estimate_tokens(messages), completion_tokens=len(response or "") // 4)
         if not response or not response.strip():
             logger.warning("LLM returned empty response, skipping turn...")
             self.conversation_history.pop()
@@ -205,17 +228,71 @@ class OnboardingPipeline:
             logger.info(f"Trimmed conversation history to last {MAX_HISTORY_LENGTH} messages")
         return response
 
+    def _synthesize(self, text: str) -> str:
+        """
+        Synthesise text within the TTS latency budget, degrading to faster or cached audio.
+
+        Args:
+            text: The text to synthesise.
+
+        Returns:
+            Path to the audio file. Caller is responsible for deleting it.
+        """
+        return self.degradation.synthesize(text)
+
     def _speak(self, text: str):
         """
         Synthesise text to speech, play the audio, and delete the temp file.
+        Engines with in-memory PCM are streamed sentence by sentence instead; synthesis then
+        overlaps playback, so the whole stream is timed as the playback span.
 
         Args:
             text: The text to speak aloud.
         """
-        filepath = self.tts.synthesize(text)
-        self.play_audio(filepath)
+        if self.tts.supports_pcm:
+            with tracing.span("playback", streamed=True):
+                if self._speak_stream(text):
+                    return
+        with tracing.span("tts"):
+            filepath = self._synthesize(text)
+            if tracing.current_trace() is not None:
+                tracing.annotate(speech_bytes=os.path.getsize(filepath))
+        with tracing.span("playback"):
+            self.play_audio(filepath)
         self.cleanup_file(filepath)
 
+    def _speak_stream(self, text: str) -> bool:
+        """
+        Play PCM sentence by sentence, synthesising the next sentence while the current one plays.
+
+        Args:
+            text: The text to speak aloud.
+
+        Returns:
+            True if the text was spoken, False if synthesis failed before any audio played,
+            so the caller can fall back to the file path.
+        """
+        from core import local_audio
+        try:
+            pieces = self.tts.synthesize_stream(text)
+        except Exception as e:
+            logger.error(f"Streamed synthesis failed: {e}")
+            return False
+        return local_audio.play_stream(pieces)
+
+    def _fallback_response(self, turn: int) -> str | None:
+        """Return the canonical response for a turn whose LLM call overruns its budget."""
+        next_turn = turn + 1
+        next_field = self.onboarding_fields[next_turn] if next_turn < len(self.onboarding_fields) else None
+        return self.degradation.canonical_response(next_field)
+
+    def _play_filler(self):
+        """Play the cached acknowledgement while a slow LLM response is still being generated."""
+        filepath = self.degradation.filler_audio()
+        if filepath:
+            self.play_audio(filepath)
+            self.cleanup_file(filepath)
+
     def run(self):
         """
         Run the full onboarding session.
@@ -226,6 +303,9 @@ class OnboardingPipeline:
         """
         logger.info("Starting onboarding session...")
 
+        # Cache the fixed degradation phrases in the background so slow turns can use them
+        threading.Thread(target=self.degradation.preload, daemon=True).start()
+
         opening_text, opening_path = self.get_opening()
         self.play_audio(opening_path)
         self.cleanup_file(opening_path)
@@ -239,29 +319,56 @@ class OnboardingPipeline:
             current_field = self.onboarding_fields[turn]
             logger.info(f"Starting turn {turn + 1} of {len(self.onboarding_fields)} — collecting: {current_field}")
             audio_data = self.record_audio()
-            recorded_path = self.save_audio(audio_data)
+            # Engines that take arrays get the recording directly, no WAV round-trip
+            recorded_path = None if self.stt.supports_arrays else self.save_audio(audio_data)
 
             try:
-                audio_arr, _ = sf.read(recorded_path)
-                energy = np.abs(audio_arr).mean()
-                logger.info(f"Audio energy: {energy:.4f}")
-
-                if energy < self.energy_threshold:
-                    logger.warning(f"Silent audio on turn {turn + 1} (energy: {energy:.4f}), skipping...")
-                    continue
-
-                user_text = self.stt.transcribe(recorded_path)
-                if not user_text.strip():
-                    logger.warning(f"Empty transcription on turn {turn + 1}, skipping...")
-                    continue
+                with turn_deadline():
+                    self._run_turn(turn, current_field, audio_data, recorded_path)
+            finally:
+                if recorded_path:
+                    self.cleanup_file(recorded_path)
 
-                response = self._generate(f"[Collecting: {current_field}]\n{user_text}")
-                if not response:
-                    logger.warning(f"Skipping TTS on turn {turn + 1} - empty LLM response")
-                    continue
+        logger.info("Onboarding session complete.")
 
-                self._speak(response)
-            finally:
-                self.cleanup_file(recorded_path)
+    def _run_turn(self, turn: int, current_field: str, audio_data: np.ndarray, recorded_path: str | None):
+        """
+        Energy-check, transcribe, generate and speak a single recorded turn.
+        Silent audio, empty or hallucinated transcriptions and empty LLM responses end the turn early.
+        Stages that overrun their latency budget are degraded rather than awaited.
 
-        logger.info("Onboarding session complete.")
\ No newline at end of file
+        Args:
+            turn: Zero-based turn index, used in log messages.
+            current_field: Onboarding field being collected this turn.
+            audio_data: Recorded samples as returned by record_audio().
+            recorded_path: Path to the saved WAV file, or None if the STT engine takes arrays.
+        """
+        self.degradation.start_turn()
+        energy = np.abs(audio_data).mean()
+        logger.info(f"Audio energy: {energy:.4f}")
+
+        if energy < self.energy_threshold:
+            logger.warning(f"Silent audio on turn {turn + 1} (energy: {energy:.4f}), skipping...")
+            return
+
+        user_text = transcribe_audio(self.stt, audio_data, self.sample_rate, recorded_path, field=current_field)
+        if not user_text.strip():
+            logger.warning(f"Empty transcription on turn {turn + 1}, skipping...")
+            return
+
+        if self.hallucination_filter.check(user_text):
+            logger.warning(f"Likely hallucination on turn {turn + 1}, skipping LLM and TTS...")
+            return
+
+        response = self._generate(
+            f"[Collecting: {current_field}]\n{user_text}",
+            fallback=self._fallback_response(turn),
+            on_slow=self._play_filler,
+        )
+        if not response:
+            logger.warning(f"Skipping TTS on turn {turn + 1} - empty LLM response")
+            return
+
+        self._speak(response)
+        if self.degradation.fired:
+            logger.warning(f"Turn {turn + 1} degraded: {', '.join(self.degradation.fired)}")
@@ -0,0 +1,295 @@
+"""
+src.app.core.tracing
+
+Per-turn span tracing for the API.
+
+Each /turn and /confirm request runs inside a Trace whose trace ID is derived from the
+session ID, so every turn of a session correlates. The stages of the turn (upload read,
+energy gate, STT, LLM, TTS, reading the synthesised audio back, sending the response) are
+recorded as spans. The LLM's time to first token is an attribute only for engines that
+stream natively and call first_token(): Ollama, the hedged engine and cassette replay. The
+OpenAI-compatible engines (OpenAI, Groq, OpenRouter) make one non-streaming call, so their
+turns report no llm-ttft, and a failover engine reports it only when the provider that
+served the turn streams. The API summarises the spans in a
+Server-Timing header for the frontend, and finished traces are exported on a background
+thread as JSON lines (logs/traces/) or to a local OpenTelemetry collector over OTLP/HTTP.
+
+The active trace and span live in context variables, so span() and first_token() can be
+called from anywhere on the turn path, including stage calls run on worker threads with a
+copied context, and do nothing outside a trace.
+"""
+
+import json
+import time
+import uuid
+import queue
+import threading
+import urllib.request
+from pathlib import Path
+from datetime import datetime
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from utils.logger import setup_logger
+from config import TRACING_ENABLED, TRACE_EXPORTER, TRACE_OTLP_ENDPOINT
+
+logger = setup_logger(__name__, log_type="pipeline")
+
+SERVICE_NAME = "voice-onboarding-api"
+
+
+class Span:
+    """One timed stage of a trace."""
+
+    def __init__(self, name: str, parent: "Span | None", attributes: dict):
+        self.name = name
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent.span_id if parent is not None else None
+        self.attributes = attributes
+        self.start_ns = time.time_ns()
+        self._start = time.perf_counter()
+        self.duration: float | None = None
+        self.error: str | None = None
+
+    def end(self):
+        self.duration = time.perf_counter() - self._start
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self._start
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_ns": self.start_ns,
+            "duration_ms": round(self.duration * 1000, 1) if self.duration is not None else None,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+class Trace:
+    """The spans of one request, correlated across a session by its trace ID."""
+
+    def __init__(self, name: str, session_id: str, **attributes):
+        """
+        Args:
+            name: Root span name, e.g. "turn" or "confirm".
+            session_id: Session the request belongs to; the trace ID is derived from it.
+            **attributes: Extra root attributes, e.g. the turn number and field.
+        """
+        self.trace_id = uuid.uuid5(uuid.NAMESPACE_URL, f"session/{session_id}").hex
+        self.session_id = session_id
+        self.root = Span(name, None, {"session_id": session_id, **attributes})
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+
+    def start_span(self, name: str, parent: Span | None = None, **attributes) -> Span:
+        span = Span(name, parent or self.root, attributes)
+        with self._lock:
+            self.spans.append(span)
+        return span
+
+    def stages(self) -> dict[str, float]:
+        """
+        Return the seconds spent in each finished stage (direct child) span, in start order,
+        plus '<stage>-ttft' for stages with a time to first token. Spans with the same name
+        are summed.
+        """
+        totals: dict[str, float] = {}
+        with self._lock:
+            for span in self.spans:
+                if span.duration is not None and span.parent_id == self.root.span_id:
+                    totals[span.name] = totals.get(span.name, 0.0) + span.duration
+                    if "ttft_ms" in span.attributes:
+                        totals.setdefault(f"{span.name}-ttft", span.attributes["ttft_ms"] / 1000)
+        return totals
+
+    def server_timing(self) -> str:
+        """
+        Summarise the stages as a Server-Timing header value, e.g.
+        'stt;dur=812.4, llm;dur=1290.0, llm-ttft;dur=402.7, total;dur=2650.3', where llm-ttft
+        is only present for streaming LLM engines.
+        """
+        totals = self.stages()
+        totals["total"] = self.root.elapsed()
+        return ", ".join(f"{name};dur={seconds * 1000:.1f}" for name, seconds in totals.items())
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            spans = [span.to_dict() for span in self.spans]
+        return {"trace_id": self.trace_id, "session_id": self.session_id, **self.root.to_dict(), "spans": spans}
+
+
+_trace: ContextVar[Trace | None] = ContextVar("trace", default=None)
+_span: ContextVar[Span | None] = ContextVar("trace_span", default=None)
+
+
+def start_trace(name: str, session_id: str, **attributes) -> Trace | None:
+    """
+    Start a trace and make it current in this context.
+
+    Returns:
+        The trace, or None if tracing is disabled.
+    """
+    if not TRACING_ENABLED:
+        return None
+    trace = Trace(name, session_id, **attributes)
+    _trace.set(trace)
+    _span.set(None)
+    return trace
+
+
+def current_trace() -> Trace | None:
+    """Return the trace of the current request, if any."""
+    return _trace.get()
+
+
+@contextmanager
+def activate(trace: Trace):
+    """
+    Make a trace current for a block, regardless of TRACING_ENABLED. The dashboard uses
+    this to time its turns for the latency panel even when export is off.
+    """
+    trace_token, span_token = _trace.set(trace), _span.set(None)
+    try:
+        yield trace
+    finally:
+        _span.reset(span_token)
+        _trace.reset(trace_token)
+
+
+@contextmanager
+def _traced(trace: Trace, name: str, attributes: dict):
+    span = trace.start_span(name, _span.get(), **attributes)
+    token = _span.set(span)
+    try:
+        yield span
+    except BaseException as e:
+        span.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        span.end()
+        _span.reset(token)
+
+
+def span(name: str, **attributes):
+    """
+    Time a block as a span of the current trace, nested under the enclosing span if any.
+    Outside a trace this is a no-op context manager.
+    """
+    trace = _trace.get()
+    if trace is None:
+        return nullcontext()
+    return _traced(trace, name, attributes)
+
+
+def record(name: str, seconds: float, **attributes):
+    """Add an already timed stage, ending now, to the current trace, e.g. a wait measured around an await."""
+    trace = _trace.get()
+    if trace is None:
+        return
+    span = trace.start_span(name, _span.get(), **attributes)
+    span.start_ns -= int(seconds * 1e9)
+    span.duration = seconds
+
+
+def annotate(**attributes):
+    """Add attributes, such as token or byte counts, to the enclosing span. No-op outside a span."""
+    span = _span.get()
+    if span is not None:
+        span.attributes.update(attributes)
+
+
+def first_token():
+    """
+    Record the time to first token on the enclosing span. Called by the engines that stream
+    natively (Ollama, hedged, cassette); non-streaming engines never set it.
+    """
+    span = _span.get()
+    if span is not None and "ttft_ms" not in span.attributes:
+        span.attributes["ttft_ms"] = round(span.elapsed() * 1000, 1)
+
+
+def _otlp_payload(trace: Trace) -> dict:
+    """Encode a finished trace as an OTLP/HTTP JSON ExportTraceServiceRequest."""
+
+    def encode(span: Span) -> dict:
+        attributes = [{"key": k, "value": {"stringValue": str(v)}} for k, v in span.attributes.items()]
+        encoded = {
+            "traceId": trace.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": 2 if span is trace.root else 1,
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(span.start_ns + int((span.duration or 0.0) * 1e9)),
+            "attributes": attributes,
+            "status": {"code": 2, "message": span.error} if span.error else {},
+        }
+        if span.parent_id:
+            encoded["parentSpanId"] = span.parent_id
+        return encoded
+
+    with trace._lock:
+        spans = [trace.root] + list(trace.spans)
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": SERVICE_NAME}}]},
+            "scopeSpans": [{"scope": {"name": __name__}, "spans": [encode(span) for span in spans]}],
+        }]
+    }
+
+
+class _Exporter:
+    """Background thread that writes finished traces, so exporting never delays a response."""
+
+    def __init__(self, exporter: str):
+        self._exporter = exporter
+        self._queue: queue.Queue[Trace] = queue.Queue(maxsize=1000)
+        self._path = None
+        if exporter == "jsonl":
+            log_dir = Path(__file__).parent.parent / "logs" / "traces"
+            log_dir.mkdir(parents=True, exist_ok=True)
+            self._path = log_dir / f"{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.jsonl"
+        threading.Thread(target=self._loop, name="trace-exporter", daemon=True).start()
+
+    def submit(self, trace: Trace):
+        try:
+            self._queue.put_nowait(trace)
+        except queue.Full:
+            logger.warning("Trace export queue full, dropping trace")
+
+    def _loop(self):
+        while True:
+            trace = self._queue.get()
+            try:
+                if self._exporter == "jsonl":
+                    with open(self._path, "a", encoding="utf-8") as f:
+                        f.write(json.dumps(trace.to_dict()) + "\n")
+                else:
+                    request = urllib.request.Request(
+                        TRACE_OTLP_ENDPOINT,
+                        data=json.dumps(_otlp_payload(trace)).encode("utf-8"),
+                        headers={"Content-Type": "application/json"},
+                    )
+                    urllib.request.urlopen(request, timeout=5).close()
+            except Exception as e:
+                logger.warning(f"Trace export failed: {e}")
+
+
+_exporter: _Exporter | None = None
+_exporter_lock = threading.Lock()
+
+
+def finish_trace(trace: Trace | None):
+    """End a trace's root span and, if tracing is enabled, queue it for export. Safe to call with None."""
+    global _exporter
+    if trace is None:
+        return
+    trace.root.end()
+    if not TRACING_ENABLED or TRACE_EXPORTER not in ("jsonl", "otlp"):
+        return
+    with _exporter_lock:
+        if _exporter is None:
+            _exporter = _Exporter(TRACE_EXPORTER)
+    _exporter.submit(trace)
@@ -0,0 +1,58 @@
+"""
+src.app.core.turn_metrics
+
+Per-turn latency and size metrics for the dashboard's metrics panel.
+
+Turns are summarised from their trace (see core.tracing) rather than from log text: the
+duration of each stage span, the LLM's time to first token, and the counts the pipeline
+annotates on its spans (recorded audio, estimated LLM tokens, synthesised speech bytes).
+"""
+
+from utils.latency import nearest_rank
+
+STAGES = ["stt", "llm", "tts", "playback"]
+COUNTS = ["audio_seconds", "recorded_bytes", "prompt_tokens", "completion_tokens", "speech_bytes"]
+
+
+def turn_summary(trace) -> dict:
+    """
+    Summarise a finished turn.
+
+    Args:
+        trace: The turn's core.tracing.Trace.
+
+    Returns:
+        The turn and field from the root span, milliseconds per stage in STAGES (0 for a
+        stage that did not run), 'llm_ttft' in milliseconds or None, and the sum of each of
+        COUNTS over the turn's spans.
+    """
+    stages = trace.stages()
+    summary = {
+        "turn": trace.root.attributes.get("turn"),
+        "field": trace.root.attributes.get("field"),
+    }
+    for stage in STAGES:
+        summary[stage] = round(stages.get(stage, 0.0) * 1000, 1)
+    ttft = stages.get("llm-ttft")
+    summary["llm_ttft"] = round(ttft * 1000, 1) if ttft is not None else None
+    for name in COUNTS:
+        summary[name] = 0
+    for span in trace.spans:
+        for name in COUNTS:
+            summary[name] += span.attributes.get(name, 0)
+    return summary
+
+
+def stage_percentiles(turns: list[dict]) -> dict[str, dict]:
+    """
+    Return running p50 and p95 in milliseconds per stage over a session's turn summaries,
+    by the same nearest-rank rule as the call policies' latency windows reported on /health.
+    Stages that have not run in any turn are left out.
+    """
+    result = {}
+    for stage in STAGES + ["llm_ttft"]:
+        samples = [turn[stage] for turn in turns if turn.get(stage)]
+        if not samples:
+            continue
+        result[stage] = {"p50": nearest_rank(samples, 50), "p95": nearest_rank(samples, 95), "count": len(samples)}
+    return result
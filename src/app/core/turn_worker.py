@@ -0,0 +1,81 @@
+"""
+src.app.core.turn_worker
+
+Background execution of dashboard turns.
+
+Streamlit re-renders only between script runs, so a turn run inside the script (record,
+transcribe, generate, speak) freezes the page and its status label never changes. A
+TurnWorker runs each turn on its own thread instead and reports progress as events on a
+queue, which the dashboard drains on a timer and renders. The worker never touches
+Streamlit state, since that is only available to the script thread.
+"""
+
+import time
+import queue
+import threading
+from typing import Callable
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__, log_type="pipeline")
+
+
+class TurnWorker:
+    """Runs one job at a time for a dashboard session on a background thread."""
+
+    def __init__(self):
+        self._events: queue.Queue[dict] = queue.Queue()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def busy(self) -> bool:
+        """True while a job is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, job: Callable[[Callable[[str], None]], dict], name: str = "turn") -> bool:
+        """
+        Run a job on a new thread.
+
+        The job is called with a report(stage) callback, to announce each stage as it
+        starts, and returns a dict of results. Progress is delivered as events, each with
+        the job's name under "job": {"type": "stage", "stage", "at"}, then
+        {"type": "done", "result"} or {"type": "error", "error"}.
+
+        Args:
+            job: The work to run, e.g. one recorded turn.
+            name: Job name, e.g. "opening" or "turn", reported with its events.
+
+        Returns:
+            False without starting if a job is still running.
+        """
+        if self.busy:
+            return False
+
+        def report(stage: str):
+            self._events.put({"type": "stage", "job": name, "stage": stage, "at": time.time()})
+
+        def run():
+            try:
+                result = job(report)
+            except Exception as e:
+                logger.error(f"Dashboard {name} failed: {e}")
+                self._events.put({"type": "error", "job": name, "error": str(e)})
+            else:
+                self._events.put({"type": "done", "job": name, "result": result})
+
+        self._thread = threading.Thread(target=run, name=f"dashboard-{name}", daemon=True)
+        self._thread.start()
+        return True
+
+    def poll(self) -> list[dict]:
+        """Return the events reported since the last poll, oldest first."""
+        events = []
+        while True:
+            try:
+                events.append(self._events.get_nowait())
+            except queue.Empty:
+                return events
+
+    def join(self, timeout: float | None = None):
+        """Wait for the running job, if any, to finish."""
+        if self._thread is not None:
+            self._thread.join(timeout)
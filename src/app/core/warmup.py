@@ -0,0 +1,154 @@
+"""
+src.app.core.warmup
+
+Startup warm-up for the API process.
+
+Loads one shared instance of each configured engine, then makes a tiny call through each
+one. That pays up front for model loads (Whisper, Ollama, Piper), TLS handshakes to the
+provider, connection-pool set-up and first-call JIT/graph optimisation, instead of the
+first session paying for them. It finishes by filling the TTS cache with the fixed phrases.
+Latency is measured per engine, and ready() stays False until everything has succeeded,
+so a load balancer can keep traffic away from cold instances. Engines that fail are retried
+in the background with exponential backoff, so a transient startup error (a local model
+server that is not up yet) does not keep the instance unready for the life of the process.
+"""
+
+import os
+import time
+import threading
+import numpy as np
+from utils.logger import setup_logger
+from config import WARMUP_CALLS, WARMUP_RETRY_BACKOFF, WARMUP_RETRY_MAX_BACKOFF
+
+logger = setup_logger(__name__, log_type="pipeline")
+
+WARMUP_TEXT = "Hello."
+WARMUP_MESSAGES = [{"role": "user", "content": "Reply with the single word: ready"}]
+
+
+class WarmUp:
+    """Instantiates the shared engines and exercises each once before the API reports ready."""
+
+    def __init__(
+        self,
+        engine_paths: dict[str, str],
+        calls: bool = WARMUP_CALLS,
+        retry_backoff: float = WARMUP_RETRY_BACKOFF,
+        max_backoff: float = WARMUP_RETRY_MAX_BACKOFF,
+    ):
+        """
+        Args:
+            engine_paths: Dotted engine class path per stage ("stt", "llm", "tts").
+            calls: Also make a tiny call through each engine, not just construct it.
+            retry_backoff: Seconds before the first retry of failed engines, doubling per attempt.
+            max_backoff: Longest wait between retries in seconds.
+        """
+        self._engine_paths = engine_paths
+        self._calls = calls
+        self._retry_backoff = retry_backoff
+        self._max_backoff = max_backoff
+        self.attempts = 0
+        self._lock = threading.Lock()
+        self.state = "pending"
+        self.engines: dict = {}
+        self._results: dict[str, dict] = {}
+        self._seconds: float | None = None
+
+    def ready(self) -> bool:
+        """True once every engine has loaded and warmed up without error, or warm-up is disabled."""
+        return self.state in ("ready", "skipped")
+
+    def skip(self):
+        """Report ready without warming up; engines load per session as before."""
+        self.state = "skipped"
+
+    def _call(self, stage: str, engine):
+        """Make the smallest useful request through an engine."""
+        if stage == "stt":
+            # Half a second of near-silence: enough to load weights and open the connection
+            engine.transcribe_array(np.full(8000, 1e-4, dtype=np.float32), 16000)
+        elif stage == "llm":
+            engine.generate(WARMUP_MESSAGES)
+        elif stage == "tts":
+            os.remove(engine.synthesize(WARMUP_TEXT))
+
+    def _warm_stage(self, stage: str, dotted_path: str):
+        from core.pipeline import load_engine
+
+        result = {"engine": dotted_path.rsplit(".", 1)[1]}
+        try:
+            t = time.time()
+            engine = load_engine(dotted_path)
+            result["load_seconds"] = round(time.time() - t, 3)
+            if self._calls:
+                t = time.time()
+                self._call(stage, engine)
+                result["call_seconds"] = round(time.time() - t, 3)
+            with self._lock:
+                self.engines[stage] = engine
+        except Exception as e:
+            logger.error(f"Warm-up of {stage} engine {result['engine']} failed: {e}")
+            result["error"] = str(e)
+        with self._lock:
+            self._results[stage] = result
+
+    def run(self):
+        """
+        Warm up every engine not warmed yet concurrently, then preload the TTS cache.
+        Failures are recorded per engine rather than raised; calling run() again retries
+        only the engines that failed.
+        """
+        from core.degradation import DegradationController
+
+        self.state = "warming"
+        self.attempts += 1
+        logger.info("Warming up engines..." if self.attempts == 1 else f"Retrying warm-up (attempt {self.attempts})...")
+        t = time.time()
+        threads = [
+            threading.Thread(target=self._warm_stage, args=(stage, path), name=f"warmup-{stage}")
+            for stage, path in self._engine_paths.items()
+            if stage not in self.engines
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        if "tts" in self.engines and "cache_seconds" not in self._results["tts"]:
+            t_cache = time.time()
+            DegradationController(self.engines["tts"]).preload()
+            self._results["tts"]["cache_seconds"] = round(time.time() - t_cache, 3)
+
+        self._seconds = round(time.time() - t, 3)
+        failed = [stage for stage, result in self._results.items() if "error" in result]
+        self.state = "failed" if failed else "ready"
+        if failed:
+            logger.error(f"Warm-up failed for {', '.join(failed)} after {self._seconds}s")
+        else:
+            logger.info(f"Warm-up complete [{self._seconds}s]")
+
+    def run_until_ready(self):
+        """Run the warm-up, retrying failed engines with exponential backoff until all succeed."""
+        backoff = self._retry_backoff
+        self.run()
+        while self.state == "failed":
+            logger.info(f"Retrying failed engines in {backoff:.1f}s")
+            time.sleep(backoff)
+            backoff = min(backoff * 2, self._max_backoff)
+            self.run()
+
+    def start(self) -> threading.Thread:
+        """Warm up in a background thread, retrying failures, so the server can answer /ready meanwhile."""
+        thread = threading.Thread(target=self.run_until_ready, name="warmup", daemon=True)
+        thread.start()
+        return thread
+
+    def snapshot(self) -> dict:
+        """Return the state, attempts, last warm-up seconds and per-engine load and call latency."""
+        with self._lock:
+            return {
+                "state": self.state,
+                "attempts": self.attempts,
+                "seconds": self._seconds,
+                "engines": {stage: dict(result) for stage, result in self._results.items()},
+            }
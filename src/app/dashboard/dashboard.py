@@ -7,11 +7,15 @@ Uses the OnboardingPipeline and engine layer, provider is controlled via config.
 """
 
 import sys
+import time
+import uuid
 import logging
 import streamlit as st
 import soundfile as sf
 import numpy as np
 from pathlib import Path
+from collections import deque
+from functools import partial
 
 # Ensure the app directory is in the path for internal imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -24,7 +28,10 @@ from config import (
     ENERGY_THRESHOLD,
     ENGINES
 )
-from core.pipeline import load_engine, OnboardingPipeline
+from core import tracing
+from core.pipeline import load_engine, OnboardingPipeline, transcribe_audio
+from core.turn_metrics import STAGES, turn_summary, stage_percentiles
+from core.turn_worker import TurnWorker
 
 st.set_page_config(page_title="Voice Agent Dashboard", layout="wide")
 
@@ -39,8 +46,11 @@ def init_state():
         "last_transcript": "",
         "last_response": "",
         "pipeline_params": {},
-        "log_lines": [],
-        "log_handler_attached": False,
+        "session_id": None,
+        "turn_metrics": [],
+        "worker": None,
+        "stage_started": None,
+        "log_handler": None,
     }
     for k, v in defaults.items():
         if k not in st.session_state:
@@ -50,37 +60,48 @@ init_state()
 
 
 class DashboardLogHandler(logging.Handler):
-    """Captures log messages from the entire app into session state for display."""
+    """
+    Captures log messages from the entire app for display, keeping the last 100 lines.
+    Lines are buffered on the handler rather than in session state, since turns log from
+    the worker thread, where session state is not available.
+    """
+    def __init__(self):
+        super().__init__()
+        self.lines = deque(maxlen=100)
+
     def emit(self, record):
         try:
-            line = self.format(record)
-            if "log_lines" in st.session_state:
-                st.session_state["log_lines"].append(line)
-                if len(st.session_state["log_lines"]) > 100:
-                    st.session_state["log_lines"] = st.session_state["log_lines"][-100:]
+            self.lines.append(self.format(record))
         except Exception:
             self.handleError(record)
 
 
-if not st.session_state.log_handler_attached:
+if st.session_state.log_handler is None:
     root_logger = logging.getLogger()
     dash_handler = DashboardLogHandler()
     dash_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s", datefmt="%H:%M:%S"))
     root_logger.addHandler(dash_handler)
     root_logger.setLevel(logging.INFO)
-    st.session_state.log_handler_attached = True
+    st.session_state.log_handler = dash_handler
     logging.info("Dashboard log handler attached.")
 
 
+@st.cache_resource(show_spinner="Loading models...")
+def load_engines(stt_path: str, llm_path: str, tts_path: str) -> dict:
+    """
+    Load each configured engine once per dashboard process. Sessions and reruns share the
+    instances, so only the first Start pays for model loads and connection set-up.
+    """
+    return {"stt": load_engine(stt_path), "llm": load_engine(llm_path), "tts": load_engine(tts_path)}
+
+
 def build_pipeline(recording_duration: int, sample_rate: int) -> OnboardingPipeline:
-    """Instantiate the OnboardingPipeline using engines defined in config.py."""
-    stt = load_engine(ENGINES["stt"])
-    llm = load_engine(ENGINES["llm"])
-    tts = load_engine(ENGINES["tts"])
+    """Instantiate the OnboardingPipeline using the cached engines defined in config.py."""
+    engines = load_engines(ENGINES["stt"], ENGINES["llm"], ENGINES["tts"])
     return OnboardingPipeline(
-        stt=stt,
-        llm=llm,
-        tts=tts,
+        stt=engines["stt"],
+        llm=engines["llm"],
+        tts=engines["tts"],
         system_prompt=SYSTEM_PROMPT,
         onboarding_fields=ONBOARDING_FIELDS,
         recording_duration=recording_duration,
@@ -89,6 +110,137 @@ def build_pipeline(recording_duration: int, sample_rate: int) -> OnboardingPipel
     )
 
 
+def run_opening(pipeline: OnboardingPipeline, report) -> dict:
+    """Generate and speak the opening message. Runs on the session's worker thread."""
+    report("generating")
+    opening = pipeline._generate("Begin the onboarding conversation.")
+    report("speaking")
+    pipeline._speak(opening)
+    return {"last_response": opening}
+
+
+def run_turn(pipeline: OnboardingPipeline, session_id: str, turn: int, report) -> dict:
+    """
+    Record, transcribe, generate and speak one turn. Runs on the session's worker thread,
+    so it reports progress through report() instead of writing session state.
+
+    Transcription goes through transcribe_audio() and the pipeline's hallucination filter,
+    like an API turn, so the field's decode profile applies and the stage spans measure the
+    same path as production.
+
+    Raises:
+        ValueError: If no speech was detected, nothing was transcribed or the transcript
+                    looks like a hallucination.
+    """
+    # Each turn is traced, the metrics panel reads stage timings from its spans
+    trace = tracing.Trace("turn", session_id, turn=turn + 1, field=ONBOARDING_FIELDS[turn])
+    try:
+        with tracing.activate(trace):
+            report("recording")
+            audio_data = pipeline.record_audio()
+            recorded_path = pipeline.save_audio(audio_data)
+
+            audio_arr, sample_rate = sf.read(recorded_path, dtype="float32")
+            energy = np.abs(audio_arr).mean()
+            if energy < ENERGY_THRESHOLD:
+                pipeline.cleanup_file(recorded_path)
+                raise ValueError(f"No audio detected (energy: {energy:.4f}). Please speak clearly and try again.")
+
+            report("transcribing")
+            with tracing.span("stt"):
+                tracing.annotate(
+                    audio_seconds=round(len(audio_arr) / sample_rate, 2),
+                    recorded_bytes=Path(recorded_path).stat().st_size,
+                )
+                user_text = transcribe_audio(
+                    pipeline.stt, audio_arr, sample_rate, recorded_path, field=ONBOARDING_FIELDS[turn]
+                )
+            pipeline.cleanup_file(recorded_path)
+
+            if not user_text.strip():
+                raise ValueError("Nothing was transcribed. Please try again.")
+            reason = pipeline.hallucination_filter.check(user_text)
+            if reason:
+                raise ValueError(f"No clear speech detected ({reason}). Please speak clearly and try again.")
+
+            report("generating")
+            with tracing.span("llm"):
+                response = pipeline._generate(user_text)
+
+            report("speaking")
+            pipeline._speak(response)
+    finally:
+        tracing.finish_trace(trace)
+    return {"last_transcript": user_text, "last_response": response, "metrics": turn_summary(trace)}
+
+
+def apply_events(events: list[dict]) -> bool:
+    """
+    Apply the worker's progress events to session state.
+
+    Returns:
+        True if a job finished, so the whole page should re-render.
+    """
+    finished = False
+    for event in events:
+        if event["type"] == "stage":
+            st.session_state.status = event["stage"]
+            st.session_state.stage_started = event["at"]
+        elif event["type"] == "done":
+            result = event["result"]
+            for key in ("last_transcript", "last_response"):
+                if key in result:
+                    st.session_state[key] = result[key]
+            if "metrics" in result:
+                st.session_state.turn_metrics.append(result["metrics"])
+                st.session_state.turn += 1
+            st.session_state.status = "ready"
+            st.session_state.error = None
+            finished = True
+        else:
+            st.session_state.error = event["error"]
+            st.session_state.status = "error"
+            if event["job"] == "opening":
+                st.session_state.session_active = False
+                st.session_state.pipeline = None
+            finished = True
+    return finished
+
+
+def render_status(recording_duration: int):
+    """Show the current stage, with how long it has been running while a job is busy."""
+    status = st.session_state.status
+    status_display = {
+        "ready":        ("READY", "Press **Record** to answer."),
+        "recording":    ("RECORDING", f"Speak now ({recording_duration}s)..."),
+        "transcribing": ("PROCESSING", "Transcribing..."),
+        "generating":   ("PROCESSING", "Agent is thinking..."),
+        "speaking":     ("PLAYING", "Agent is speaking..."),
+        "error":        ("ERROR", f"{st.session_state.error}"),
+    }
+    icon, label = status_display.get(status, ("IDLE", status))
+    worker = st.session_state.worker
+    if worker is not None and worker.busy and st.session_state.stage_started:
+        label += f" ({time.time() - st.session_state.stage_started:.1f}s)"
+    st.markdown(f"**{icon}**: {label}")
+
+
+@st.fragment(run_every=0.5)
+def turn_progress(recording_duration: int):
+    """
+    Poll the worker while a job runs, re-rendering only the status line;
+    re-runs the whole page once the job has finished.
+    """
+    if apply_events(st.session_state.worker.poll()):
+        st.rerun()
+    render_status(recording_duration)
+
+
+# Pick up events that arrived since the last run, e.g. a job finishing between polls
+if st.session_state.worker is not None:
+    apply_events(st.session_state.worker.poll())
+worker_busy = st.session_state.worker is not None and st.session_state.worker.busy
+
 st.title("Voice Agent Onboarding Dashboard")
 main_col, debug_col = st.columns([3, 2])
 
@@ -127,15 +279,17 @@ with st.sidebar:
 
     if not st.session_state.session_active:
         if st.button("▶ Start session", type="primary", use_container_width=True):
-            st.session_state.log_lines = []
+            st.session_state.log_handler.lines.clear()
             try:
-                with st.spinner("Loading models..."):
-                    pipeline = build_pipeline(recording_duration, sample_rate)
+                pipeline = build_pipeline(recording_duration, sample_rate)
 
                 st.session_state.pipeline = pipeline
+                st.session_state.session_id = str(uuid.uuid4())
+                st.session_state.turn_metrics = []
                 st.session_state.session_active = True
                 st.session_state.turn = 0
-                st.session_state.status = "ready"
+                st.session_state.status = "generating"
+                st.session_state.stage_started = None
                 st.session_state.error = None
 
                 st.session_state.pipeline_params = {
@@ -147,9 +301,9 @@ with st.sidebar:
                     "energy_threshold": ENERGY_THRESHOLD,
                 }
 
-                opening = pipeline._generate("Begin the onboarding conversation.")
-                pipeline._speak(opening)
-                st.session_state.last_response = opening
+                # The opening plays on the worker so the page renders while it is spoken
+                st.session_state.worker = TurnWorker()
+                st.session_state.worker.start(partial(run_opening, pipeline), name="opening")
 
             except Exception as e:
                 st.session_state.error = str(e)
@@ -157,7 +311,7 @@ with st.sidebar:
                 st.session_state.session_active = False
             st.rerun()
     else:
-        if st.button("⏹ End session", use_container_width=True):
+        if st.button("⏹ End session", disabled=worker_busy, use_container_width=True):
             st.session_state.session_active = False
             st.session_state.pipeline = None
             st.session_state.status = "idle"
@@ -203,52 +357,19 @@ with main_col:
         st.stop()
 
     status = st.session_state.status
-    status_display = {
-        "ready":        ("READY", "Press **Record** to answer."),
-        "recording":    ("RECORDING", f"Speak now ({recording_duration}s)..."),
-        "transcribing": ("PROCESSING", "Transcribing..."),
-        "generating":   ("PROCESSING", "Agent is thinking..."),
-        "speaking":     ("PLAYING", "Agent is speaking..."),
-        "error":        ("ERROR", f"{st.session_state.error}"),
-    }
-    icon, label = status_display.get(status, ("IDLE", status))
-    st.markdown(f"**{icon}**: {label}")
+    if worker_busy:
+        turn_progress(recording_duration)
+    else:
+        render_status(recording_duration)
 
     btn_col, retry_col = st.columns([1, 2])
     with btn_col:
-        if st.button("Record", disabled=(status != "ready"), type="primary", use_container_width=True):
-            try:
-                st.session_state.status = "recording"
-                audio_data = pipeline.record_audio()
-                recorded_path = pipeline.save_audio(audio_data)
-
-                audio_arr, _ = sf.read(recorded_path)
-                energy = np.abs(audio_arr).mean()
-                if energy < ENERGY_THRESHOLD:
-                    pipeline.cleanup_file(recorded_path)
-                    raise ValueError(f"No audio detected (energy: {energy:.4f}). Please speak clearly and try again.")
-
-                st.session_state.status = "transcribing"
-                user_text = pipeline.stt.transcribe(recorded_path)
-                pipeline.cleanup_file(recorded_path)
-                st.session_state.last_transcript = user_text
-
-                if not user_text.strip():
-                    raise ValueError("Nothing was transcribed. Please try again.")
-
-                st.session_state.status = "generating"
-                response = pipeline._generate(user_text)
-                st.session_state.last_response = response
-
-                st.session_state.status = "speaking"
-                pipeline._speak(response)
-
-                st.session_state.turn += 1
-                st.session_state.status = "ready"
-                st.session_state.error = None
-            except Exception as e:
-                st.session_state.error = str(e)
-                st.session_state.status = "error"
+        if st.button("Record", disabled=(status != "ready" or worker_busy), type="primary", use_container_width=True):
+            st.session_state.worker.start(
+                partial(run_turn, pipeline, st.session_state.session_id, current_turn), name="turn",
+            )
+            st.session_state.status = "recording"
+            st.session_state.stage_started = None
             st.rerun()
 
     with retry_col:
@@ -281,6 +402,31 @@ with debug_col:
         else:
             st.caption("No active session.")
 
+    with st.expander("Latency metrics", expanded=True):
+        turns = st.session_state.get("turn_metrics", [])
+        if turns:
+            chart = {"turn": [f"Turn {t['turn']} ({t['field']})" for t in turns]}
+            for stage in STAGES:
+                chart[stage] = [t[stage] for t in turns]
+            st.bar_chart(chart, x="turn", y=STAGES, stack=True, x_label="", y_label="ms")
+
+            st.markdown("**Session p50 / p95 (ms)**")
+            st.table([
+                {"stage": stage.replace("_", " "), "p50": p["p50"], "p95": p["p95"], "turns": p["count"]}
+                for stage, p in stage_percentiles(turns).items()
+            ])
+
+            last = turns[-1]
+            st.markdown("**Last turn**")
+            audio_col, token_col, speech_col = st.columns(3)
+            audio_col.metric("Recorded", f"{last['audio_seconds']:.1f}s", f"{last['recorded_bytes'] / 1024:.0f} KB", delta_color="off")
+            token_col.metric("Tokens (est.)", f"{last['prompt_tokens']} in", f"{last['completion_tokens']} out", delta_color="off")
+            speech_col.metric("Speech", f"{last['speech_bytes'] / 1024:.0f} KB")
+            if last["llm_ttft"] is not None:
+                st.caption(f"LLM time to first token: {last['llm_ttft']:.0f} ms")
+        else:
+            st.caption("Stage timings appear here after the first completed turn.")
+
     with st.expander("System prompt", expanded=False):
         st.code(SYSTEM_PROMPT, language=None)
 
@@ -289,7 +435,7 @@ with debug_col:
             st.json(st.session_state.pipeline.conversation_history)
 
     with st.expander("Runtime log", expanded=True):
-        log_lines = st.session_state.get("log_lines", [])
+        log_lines = list(st.session_state.log_handler.lines)
         if log_lines:
             st.code("\n".join(log_lines), language=None)
         else:
@@ -0,0 +1,68 @@
+"""
+src.app.utils.audio
+
+Audio decoding helpers for local inference.
+Whisper expects mono float32 samples at 16kHz; these helpers produce that in-process
+with soundfile and NumPy rather than spawning ffmpeg.
+"""
+
+import numpy as np
+import soundfile as sf
+
+WHISPER_SAMPLE_RATE = 16000
+
+
+def to_mono_float32(audio: np.ndarray) -> np.ndarray:
+    """
+    Convert samples of shape (n,) or (n, channels) to a contiguous mono float32 array.
+
+    Args:
+        audio: Audio samples, integer PCM or float.
+
+    Returns:
+        1-D float32 array. Integer PCM is scaled to [-1, 1].
+    """
+    audio = np.asarray(audio)
+    if audio.ndim == 2:
+        audio = audio.mean(axis=1)
+    if np.issubdtype(audio.dtype, np.integer):
+        audio = audio / float(np.iinfo(audio.dtype).max)
+    return np.ascontiguousarray(audio, dtype=np.float32)
+
+
+def resample(audio: np.ndarray, orig_rate: int, target_rate: int = WHISPER_SAMPLE_RATE) -> np.ndarray:
+    """
+    Resample mono audio with linear interpolation.
+
+    Good enough for speech recognition input; the recorder already captures at 16kHz,
+    so this only runs for uploads recorded at another rate.
+
+    Args:
+        audio: 1-D float32 samples.
+        orig_rate: Sample rate of the input in Hz.
+        target_rate: Desired sample rate in Hz.
+
+    Returns:
+        1-D float32 array at target_rate. The input is returned as-is if the rates match.
+    """
+    if orig_rate == target_rate or audio.size == 0:
+        return audio
+    duration = audio.size / orig_rate
+    n_out = int(round(duration * target_rate))
+    positions = np.linspace(0, audio.size - 1, n_out)
+    return np.interp(positions, np.arange(audio.size), audio).astype(np.float32)
+
+
+def load_audio(audio_path: str, target_rate: int = WHISPER_SAMPLE_RATE) -> np.ndarray:
+    """
+    Read an audio file into mono float32 samples at the target rate.
+
+    Args:
+        audio_path: Path to a WAV/FLAC/OGG file readable by soundfile.
+        target_rate: Desired sample rate in Hz.
+
+    Returns:
+        1-D float32 array.
+    """
+    audio, rate = sf.read(audio_path, dtype="float32", always_2d=False)
+    return resample(to_mono_float32(audio), rate, target_rate)
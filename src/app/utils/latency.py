@@ -0,0 +1,70 @@
+"""
+src.app.utils.latency
+
+Rolling latency window used to derive percentile-based delays and timeouts, and the
+nearest-rank percentile every latency report in the app shares.
+"""
+
+import math
+import threading
+from collections import deque
+
+
+def nearest_rank(samples, pct: float) -> float | None:
+    """
+    Return the nearest-rank percentile of a collection of samples.
+
+    Args:
+        samples: Sample values, in any order.
+        pct: Percentile in the range 0-100, e.g. 95 for p95.
+
+    Returns:
+        The sample at the requested percentile, or None if there are no samples.
+    """
+    ordered = sorted(samples)
+    if not ordered:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class LatencyWindow:
+    """Thread-safe rolling window of the most recent call latencies (in seconds)."""
+
+    def __init__(self, size: int = 100):
+        """
+        Initialise an empty latency window.
+
+        Args:
+            size: Maximum number of samples retained. Oldest samples are dropped first.
+        """
+        self._samples: deque[float] = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        """
+        Add a latency sample to the window.
+
+        Args:
+            seconds: Observed latency in seconds.
+        """
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, pct: float) -> float | None:
+        """
+        Return the nearest-rank percentile of the recorded samples.
+
+        Args:
+            pct: Percentile in the range 0-100, e.g. 95 for p95.
+
+        Returns:
+            The latency at the requested percentile, or None if the window is empty.
+        """
+        with self._lock:
+            samples = list(self._samples)
+        return nearest_rank(samples, pct)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._samples)
@@ -3,14 +3,158 @@
 src.app.utils.logger
 
 Centralized logging configuration.
+
+All module loggers share one file handler and one console handler. In the default "queue"
+mode (LOG_MODE) each logger only puts records on a queue, and a single background listener
+formats and writes them, so logging on the request path never waits on disk or stdout.
+The file is JSON lines (LOG_FORMAT), rotated by size and age, and high-volume levels can be
+sampled (LOG_SAMPLING).
 """
 
+import sys
+import json
+import time
+import queue
+import atexit
+import random
 import logging
+import threading
 from pathlib import Path
-from datetime import datetime
-import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from config import LOG_MODE, LOG_FORMAT, LOG_MAX_BYTES, LOG_ROTATE_SECONDS, LOG_BACKUP_COUNT, LOG_SAMPLING
 
 _session_log_file = None
+_handlers: list[logging.Handler] | None = None
+_listener: QueueListener | None = None
+_lock = threading.Lock()
+_sampling: logging.Filter | None = None
+
+TEXT_FORMAT = '[%(levelname)s] %(filename)s:%(lineno)d - %(funcName)s() - %(message)s'
+
+# Attributes every LogRecord has; anything else on a record came from extra= and is logged as a field
+_RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "taskName", "sample"}
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats a record as one JSON object, including fields passed with extra=."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "source": f"{record.filename}:{record.lineno}",
+            "function": record.funcName,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keeps a fraction of records per level, e.g. {"DEBUG": 0.1}, or the fraction a call passes
+    as extra={"sample": 0.1}. WARNING and above always pass. Kept records note the rate, so
+    counts from the log can be scaled back up.
+    """
+
+    def __init__(self, rates: dict[str, float]):
+        super().__init__()
+        self._rates = {logging.getLevelName(level): rate for level, rate in rates.items()}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = getattr(record, "sample", None)
+        if rate is None:
+            rate = self._rates.get(record.levelno, 1.0)
+        if rate >= 1.0:
+            return True
+        record.sample_rate = rate
+        return random.random() < rate
+
+
+class SizeAndTimeRotatingFileHandler(RotatingFileHandler):
+    """Rotates when the file reaches max_bytes or every interval seconds, whichever comes first."""
+
+    def __init__(self, filename, max_bytes: int, interval: float | None, backup_count: int):
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True)
+        self._interval = interval
+        self._rollover_at = time.time() + interval if interval else None
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self._rollover_at is not None and time.time() >= self._rollover_at:
+            return True
+        return bool(super().shouldRollover(record))
+
+    def doRollover(self):
+        super().doRollover()
+        if self._interval:
+            self._rollover_at = time.time() + self._interval
+
+
+class _QueueHandler(QueueHandler):
+    """
+    Enqueues records with only the work that must happen on the caller's thread: merging the
+    message arguments (they may change later) and rendering any traceback. Formatting is left
+    to the listener.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def _output_handlers(log_type: str) -> list[logging.Handler]:
+    """Create the file and console handlers every logger shares, on first use."""
+    global _session_log_file, _handlers, _listener
+
+    with _lock:
+        if _handlers is not None:
+            return _handlers
+
+        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        log_dir = Path(__file__).parent.parent / "logs" / log_type
+        log_dir.mkdir(parents=True, exist_ok=True)
+        _session_log_file = log_dir / f"{timestamp}.{'jsonl' if LOG_FORMAT == 'json' else 'log'}"
+
+        file_handler = SizeAndTimeRotatingFileHandler(_session_log_file, LOG_MAX_BYTES, LOG_ROTATE_SECONDS, LOG_BACKUP_COUNT)
+        file_handler.setFormatter(JsonFormatter() if LOG_FORMAT == "json" else logging.Formatter(TEXT_FORMAT))
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+        outputs = [file_handler, console_handler]
+
+        if LOG_MODE == "queue":
+            records: queue.SimpleQueue = queue.SimpleQueue()
+            _listener = QueueListener(records, *outputs)
+            _listener.start()
+            atexit.register(stop_logging)
+            _handlers = [_QueueHandler(records)]
+        else:
+            _handlers = outputs
+        return _handlers
+
+
+def stop_logging():
+    """Write out any queued records and stop the background listener. Called at exit."""
+    global _listener
+    with _lock:
+        listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
+
 
 def setup_logger(
     name: str,
@@ -19,43 +163,29 @@ def setup_logger(
 ) -> logging.Logger:
     """
     Set up logger with timestamped file and console output.
-    
+
     Args:
         name: Logger name (usually __name__ from calling module)
-        log_type: Category for organizing logs (e.g., "test", "dashboard", "agent")
+        log_type: Category for organizing logs (e.g., "test", "dashboard", "agent");
+                  only the first call's log_type picks the log directory
         level: Logging level (default: INFO)
-    
+
     Returns:
         Configured logger instance
     """
-
-    global _session_log_file
-
-    if _session_log_file is None:
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        log_dir = Path(__file__).parent.parent / "logs" / log_type
-        log_dir.mkdir(parents=True, exist_ok=True)
-        _session_log_file = log_dir / f"{timestamp}.log"
+    global _sampling
 
     logger = logging.getLogger(name)
     logger.setLevel(level)
-    
+
     if logger.handlers:
         return logger
-    
-    formatter = logging.Formatter(
-        '[%(levelname)s] %(filename)s:%(lineno)d - %(funcName)s() - %(message)s'
-    )
-    
-    file_handler = logging.FileHandler(_session_log_file)
-    file_handler.setLevel(level)
-    file_handler.setFormatter(formatter)
-    
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(level)
-    console_handler.setFormatter(formatter)
-    
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
-    
-    return logger
\ No newline at end of file
+
+    if _sampling is None:
+        _sampling = SamplingFilter(LOG_SAMPLING)
+    # Sampled on the logger, so a dropped record costs no formatting, queueing or propagation
+    logger.addFilter(_sampling)
+    for handler in _output_handlers(log_type):
+        logger.addHandler(handler)
+
+    return logger
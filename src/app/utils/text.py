@@ -0,0 +1,68 @@
+"""
+src.app.utils.text
+
+Transcript normalisation and word error rate for STT evaluation, and sentence splitting
+for streamed TTS.
+"""
+
+import re
+
+_NON_WORD = re.compile(r"[^a-z0-9' ]+")
+# Split after sentence punctuation followed by whitespace, keeping the punctuation
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def normalize_text(text: str) -> list[str]:
+    """
+    Lowercase, strip punctuation and split a transcript into words.
+
+    Args:
+        text: Raw transcript or reference text.
+
+    Returns:
+        List of normalised words.
+    """
+    return _NON_WORD.sub(" ", text.lower().replace("-", " ")).split()
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    """
+    Compute word error rate as word-level edit distance over reference length.
+
+    Args:
+        reference: Ground-truth transcript.
+        hypothesis: Transcript produced by the STT engine.
+
+    Returns:
+        (substitutions + deletions + insertions) / reference words. 0.0 for two empty
+        transcripts, 1.0 for any hypothesis against an empty reference.
+    """
+    ref = normalize_text(reference)
+    hyp = normalize_text(hypothesis)
+    if not ref:
+        return 0.0 if not hyp else 1.0
+
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, start=1):
+        current = [i] + [0] * len(hyp)
+        for j, hyp_word in enumerate(hyp, start=1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ref_word != hyp_word),
+            )
+        previous = current
+    return previous[-1] / len(ref)
+
+
+def split_sentences(text: str) -> list[str]:
+    """
+    Split text into sentences so speech can be synthesised and played one sentence at a time.
+
+    Args:
+        text: Text to split.
+
+    Returns:
+        Non-empty sentences with surrounding whitespace stripped.
+    """
+    return [sentence.strip() for sentence in _SENTENCE_END.split(text) if sentence.strip()]
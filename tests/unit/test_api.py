@@ -16,6 +16,7 @@ def make_mock_pipeline(opening_text="Hello, what is your full name?"):
     pipeline = MagicMock()
     pipeline.get_opening.return_value = (opening_text, "/tmp/fake_opening.mp3")
     pipeline.stt.transcribe.return_value = "John Smith"
+    pipeline.stt.supports_arrays = False
     pipeline.tts.synthesize.return_value = "/tmp/fake_response.mp3"
     pipeline._generate.return_value = "Got it. What is your employment status?"
     pipeline.energy_threshold = 0.01
@@ -133,6 +134,12 @@ def test_turn_returns_audio_bytes():
     assert resp.headers["content-type"] == "audio/mpeg"
     assert len(resp.content) > 0
 
+def test_turn_returns_server_timing_per_stage():
+    session_id = start_session()
+    resp = client.post(f"/session/{session_id}/turn", files=make_audio_upload())
+    stages = [entry.split(";")[0] for entry in resp.headers["Server-Timing"].split(", ")]
+    assert stages == ["upload", "queue", "energy", "stt", "llm", "tts", "audio-read", "total"]
+
 def test_turn_invalid_session_returns_404():
     resp = client.post(
         "/session/does-not-exist/turn",
@@ -161,6 +168,25 @@ def test_silent_audio_does_not_advance_turn(mock_engines):
     assert health["active_sessions"] >= 1
     client.delete(f"/session/{session_id}")
 
+def test_hallucinated_transcript_returns_400(mock_engines):
+    """A blocklisted hallucination must be rejected before the LLM is called."""
+    from core.hallucination import report_stats
+
+    def transcribe(path):
+        report_stats({"no_speech_prob": 0.45, "avg_logprob": -0.5, "compression_ratio": 1.0})
+        return "Bye bye."
+
+    pipeline = make_mock_pipeline()
+    pipeline.stt.transcribe.side_effect = transcribe
+    mock_engines.return_value = pipeline
+    session_id = start_session()
+    resp = client.post(f"/session/{session_id}/turn", files=make_audio_upload())
+
+    assert resp.status_code == 400
+    assert "blocklist" in resp.json()["detail"]
+    pipeline._generate.assert_not_called()
+    assert client.get("/health").json()["hallucinations"]["blocklist"] >= 1
+
 def test_turn_after_complete_returns_400():
     """Calling /turn after all 6 fields are done should return 400."""
     from api.main import sessions, ONBOARDING_FIELDS
@@ -202,4 +228,56 @@ def test_delete_removes_session():
     session_id = start_session()
     client.delete(f"/session/{session_id}")
     resp = client.post(f"/session/{session_id}/turn", files=make_audio_upload())
-    assert resp.status_code == 404
\ No newline at end of file
+    assert resp.status_code == 404
+
+
+def test_provider_quota_rejection_returns_429_with_retry_after(mock_engines):
+    """A provider quota rejection must reach the client as 429 with Retry-After rounded up."""
+    from core.engines.rate_limit import AdmissionRejected
+
+    pipeline = make_mock_pipeline()
+    def transcribe(path):
+        try:
+            raise AdmissionRejected("groq tokens-per-minute quota exhausted", 7.2, status_code=429)
+        except AdmissionRejected as e:
+            raise RuntimeError(f"Failed to transcribe audio: {e}")
+    pipeline.stt.transcribe.side_effect = transcribe
+    mock_engines.return_value = pipeline
+
+    session_id = start_session()
+    resp = client.post(f"/session/{session_id}/turn", files=make_audio_upload())
+    assert resp.status_code == 429
+    assert resp.headers["Retry-After"] == "8"
+
+
+def test_turn_deadline_exceeded_returns_504(mock_engines):
+    """A turn that runs out of its time budget should return 504."""
+    from core.engines.call_policy import DeadlineExceeded
+
+    pipeline = make_mock_pipeline()
+    pipeline.stt.transcribe.side_effect = DeadlineExceeded("Turn deadline exceeded")
+    mock_engines.return_value = pipeline
+
+    session_id = start_session()
+    resp = client.post(f"/session/{session_id}/turn", files=make_audio_upload())
+    assert resp.status_code == 504
+
+
+def test_health_contains_admission():
+    """/health should report turn admission counts."""
+    data = client.get("/health").json()
+    assert data["admission"]["running"] == 0
+
+
+def test_ready_returns_503_until_warm_up_completes(monkeypatch):
+    """/ready should return 503 while engines warm up and 200 once they are ready."""
+    from api.main import warmup
+    monkeypatch.setattr(warmup, "state", "warming")
+    resp = client.get("/ready")
+    assert resp.status_code == 503
+    assert resp.json()["ready"] is False
+
+    monkeypatch.setattr(warmup, "state", "ready")
+    resp = client.get("/ready")
+    assert resp.status_code == 200
+    assert resp.json()["ready"] is True
@@ -0,0 +1,105 @@
+"""
+tests.unit.test_batching
+
+Unit tests for the micro-batching scheduler and batched shared Whisper server.
+"""
+
+import threading
+import numpy as np
+import pytest
+from unittest.mock import patch
+import soundfile as sf
+from concurrent.futures import ThreadPoolExecutor
+from src.app.core.inference.batching import MicroBatcher
+from src.app.core.inference.whisper_server import WhisperServer
+from src.app.core.engines.stt.whisper_shared import SharedWhisperEngine
+from src.app.core.engines.stt.whisper_local import WhisperLocalEngine
+
+
+def test_concurrent_submissions_share_a_batch():
+    sizes = []
+
+    def process(items):
+        sizes.append(len(items))
+        return [item * 2 for item in items]
+
+    batcher = MicroBatcher(process, max_batch=8, window=0.2, name="test")
+    with ThreadPoolExecutor(4) as pool:
+        results = list(pool.map(batcher.submit, [1, 2, 3, 4]))
+
+    assert results == [2, 4, 6, 8]
+    assert sum(sizes) == 4
+    assert len(sizes) < 4
+    assert batcher.snapshot()["items"] == 4
+
+
+def test_concurrent_local_transcriptions_share_a_batch():
+    """ The whisper-local provider limit must let concurrent calls reach the batcher together """
+    sizes = []
+
+    def process(items):
+        sizes.append(len(items))
+        return [{"text": f"{clip.size} samples", "segments": []} for clip, options in items]
+
+    batcher = MicroBatcher(process, max_batch=8, window=0.2)
+    with patch("core.inference.whisper_batch.whisper_batcher", return_value=batcher):
+        engine = WhisperLocalEngine(batched=True)
+    clips = [np.zeros(n, dtype=np.float32) for n in (1600, 3200, 4800, 6400)]
+    with ThreadPoolExecutor(4) as pool:
+        results = list(pool.map(lambda clip: engine.transcribe_array(clip, 16000), clips))
+
+    assert results == ["1600 samples", "3200 samples", "4800 samples", "6400 samples"]
+    assert sizes == [4]
+
+
+def test_batch_respects_max_size():
+    sizes = []
+    batcher = MicroBatcher(lambda items: sizes.append(len(items)) or items, max_batch=2, window=0.2)
+    with ThreadPoolExecutor(5) as pool:
+        list(pool.map(batcher.submit, range(5)))
+    assert max(sizes) <= 2
+
+
+def test_batch_failure_reaches_every_waiter():
+    def process(items):
+        raise ValueError("decoder crashed")
+
+    batcher = MicroBatcher(process, max_batch=4, window=0.05)
+    with pytest.raises(ValueError, match="decoder crashed"):
+        batcher.submit("clip")
+
+
+def test_mismatched_result_count_is_an_error():
+    batcher = MicroBatcher(lambda items: [], max_batch=4, window=0.0)
+    with pytest.raises(RuntimeError, match="0 results for 1 items"):
+        batcher.submit("clip")
+
+
+def test_server_batches_shared_memory_clips(tmp_path):
+    sizes = []
+
+    def process(items):
+        sizes.append(len(items))
+        return [{"text": f"{clip.size} samples"} for clip, options in items]
+
+    socket_path = str(tmp_path / "whisper.sock")
+    batcher = MicroBatcher(process, max_batch=8, window=0.2)
+    server = WhisperServer(socket_path, model=None, model_name="fake", batcher=batcher)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        engine = SharedWhisperEngine(socket_path=socket_path)
+        paths = []
+        for n in (1600, 3200, 4800):
+            path = str(tmp_path / f"clip-{n}.wav")
+            sf.write(path, np.zeros(n, dtype=np.float32), 16000)
+            paths.append(path)
+
+        with ThreadPoolExecutor(3) as pool:
+            results = list(pool.map(engine.transcribe, paths))
+
+        assert results == ["1600 samples", "3200 samples", "4800 samples"]
+        assert sum(sizes) == 3
+        assert len(sizes) < 3
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,89 @@
+"""
+tests.unit.test_benchmark_compare
+
+Unit tests for the benchmark results format and the regression gate.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "benchmarks"))
+
+import results  # noqa: E402
+from compare import compare  # noqa: E402
+from stats import percentiles  # noqa: E402
+from src.app.utils.latency import LatencyWindow
+
+
+def run(turn_p95: float, peak_mb: float | None = 500.0, **stages) -> dict:
+    result = results.build("pipeline", {"sessions": 10, "output": "x.json"}, {"turn": {"count": 60, "p95": turn_p95}, **stages}, {}, {})
+    result["memory"]["peak_rss_mb"] = peak_mb
+    return result
+
+
+def test_result_document_has_fingerprint_and_drops_output_parameters():
+    result = run(100.0)
+    assert result["schema"] == results.SCHEMA
+    assert result["parameters"] == {"sessions": 10}
+    assert {"python", "cpu_count", "git_commit"} <= result["environment"].keys()
+
+
+def test_p95_regression_beyond_threshold_fails():
+    rows, regressions = compare(run(100.0), run(115.0), p95_threshold=0.10, memory_threshold=0.10, min_delta_ms=5.0)
+    assert regressions == ["turn"]
+    assert rows[0]["status"] == "REGRESSED"
+
+
+def test_small_or_absolute_tiny_changes_pass():
+    assert compare(run(100.0), run(109.0), 0.10, 0.10, 5.0)[1] == []
+    # +100% but only 2ms, below the absolute floor
+    assert compare(run(2.0), run(4.0), 0.10, 0.10, 5.0)[1] == []
+
+
+def test_memory_regression_fails_and_missing_memory_is_not_gated():
+    assert compare(run(100.0, 500.0), run(100.0, 600.0), 0.10, 0.10, 5.0)[1] == ["memory"]
+    assert compare(run(100.0, 500.0), run(100.0, None), 0.10, 0.10, 5.0)[1] == []
+
+
+def test_stage_missing_from_one_run_is_listed_not_gated():
+    rows, regressions = compare(run(100.0), run(100.0, confirm={"count": 10, "p95": 900.0}), 0.10, 0.10, 5.0)
+    assert regressions == []
+    assert any(row["name"].startswith("confirm") and row["status"] == "not compared" for row in rows)
+
+
+def test_stage_with_no_successful_samples_regresses():
+    new = run(100.0)
+    new["stages"]["turn"] = {"count": 120, "error_rate": 1.0}
+    rows, regressions = compare(run(100.0), new, 0.10, 0.10, 5.0)
+    assert regressions == ["turn"]
+    assert rows[0]["status"] == "REGRESSED" and rows[0]["new"] is None
+
+
+def test_error_rate_increase_beyond_threshold_fails():
+    baseline = run(100.0, load={"count": 100, "p95": 50.0, "error_rate": 0.0})
+    assert compare(baseline, run(100.0, load={"count": 100, "p95": 50.0, "error_rate": 0.005}), 0.10, 0.10, 5.0, 0.01)[1] == []
+    rows, regressions = compare(baseline, run(100.0, load={"count": 100, "p95": 50.0, "error_rate": 0.05}), 0.10, 0.10, 5.0, 0.01)
+    assert regressions == ["load"]
+    assert any(row["name"] == "load error rate" and row["status"] == "REGRESSED" for row in rows)
+
+
+def test_latest_returns_most_recent_stored_run(tmp_path, monkeypatch):
+    monkeypatch.setattr(results, "STORE", tmp_path)
+    monkeypatch.setattr(results, "ROOT", tmp_path)
+    older, newer = run(100.0), run(90.0)
+    older["created"], newer["created"] = "2026-04-01T00:00:00+00:00", "2026-04-02T00:00:00+00:00"
+    results.write(older, save="a")
+    results.write(newer, save="b")
+    assert results.load(results.latest("pipeline"))["stages"]["turn"]["p95"] == 90.0
+    assert results.latest("load") is None
+
+
+def test_percentiles_match_latency_window():
+    for values in ([0.1, 0.9], [0.3, 0.1, 0.2], [i / 100 for i in range(1, 40)]):
+        window = LatencyWindow()
+        for value in values:
+            window.record(value)
+        summary = percentiles(values)
+        for p in (50, 95, 99):
+            assert summary[f"p{p}"] == round(window.percentile(p) * 1000, 1)
+    assert percentiles([0.1, 0.9])["p50"] == 100.0
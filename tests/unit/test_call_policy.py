@@ -0,0 +1,121 @@
+"""
+tests.unit.test_call_policy
+
+Unit tests for the shared provider call policy.
+"""
+
+import time
+import pytest
+from concurrent.futures import TimeoutError as FutureTimeout
+from src.app.core.engines.call_policy import (
+    CallPolicy,
+    RetryBudget,
+    DeadlineExceeded,
+    turn_deadline,
+    remaining,
+    is_timeout,
+    is_retryable,
+)
+
+
+class FakeTimeout(Exception):
+    """Stands in for httpx/requests/openai timeout exceptions, matched by class name."""
+
+
+class FakeStatusError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+def make_policy(**kwargs) -> CallPolicy:
+    kwargs.setdefault("backoff_base", 0.0)
+    return CallPolicy("test", stage="llm", **kwargs)
+
+
+def test_timeout_classification():
+    assert is_timeout(FakeTimeout())
+    assert not is_timeout(ValueError())
+    assert is_retryable(FakeStatusError(429))
+    assert is_retryable(FakeStatusError(503))
+    assert not is_retryable(FakeStatusError(401))
+
+
+def test_timeout_uses_stage_maximum_without_history():
+    policy = make_policy()
+    assert policy.timeout() == 12.0
+
+
+def test_timeout_follows_latency_percentile():
+    policy = make_policy(min_samples=3, multiplier=2.0)
+    for latency in [1.0, 1.5, 2.0]:
+        policy._latency.record(latency)
+    assert policy.timeout() == 4.0
+
+
+def test_timeout_capped_by_turn_deadline():
+    policy = make_policy()
+    with turn_deadline(1.0):
+        assert policy.timeout() <= 1.0
+    assert remaining() is None
+
+
+def test_call_passes_timeout_and_returns_result():
+    policy = make_policy()
+    assert policy.call(lambda timeout: timeout) == 12.0
+
+
+def test_transient_failure_is_retried():
+    attempts = []
+
+    def flaky(timeout):
+        attempts.append(timeout)
+        if len(attempts) == 1:
+            raise FakeTimeout()
+        return "ok"
+
+    policy = make_policy()
+    assert policy.call(flaky) == "ok"
+    assert policy.snapshot()["timeouts"] == 1
+    assert policy.snapshot()["retries"] == 1
+
+
+def test_permanent_failure_is_not_retried():
+    policy = make_policy()
+    with pytest.raises(FakeStatusError):
+        policy.call(lambda timeout: (_ for _ in ()).throw(FakeStatusError(401)))
+    assert policy.snapshot()["retries"] == 0
+
+
+def test_exhausted_retry_budget_stops_retries():
+    policy = make_policy()
+    policy._budget = RetryBudget(ratio=0.0, max_tokens=0)
+
+    def always_times_out(timeout):
+        raise FakeTimeout()
+
+    with pytest.raises(FakeTimeout):
+        policy.call(always_times_out)
+    assert policy.snapshot()["retry_budget_exhausted"] == 1
+
+
+def test_spent_deadline_fails_fast():
+    policy = make_policy()
+    with turn_deadline(0.01):
+        time.sleep(0.02)
+        with pytest.raises(DeadlineExceeded):
+            policy.call(lambda timeout: "never called")
+
+
+def test_local_queue_timeout_is_not_retried():
+    attempts = []
+
+    def queued(timeout):
+        attempts.append(timeout)
+        raise FutureTimeout()
+
+    policy = make_policy()
+    with pytest.raises(FutureTimeout):
+        policy.call(queued, retryable=False)
+    assert len(attempts) == 1
+    assert policy.snapshot()["timeouts"] == 1 and policy.snapshot()["retries"] == 0
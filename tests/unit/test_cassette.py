@@ -0,0 +1,94 @@
+"""
+tests.unit.test_cassette
+
+Unit tests for the record-and-replay cassette engines.
+"""
+
+import os
+import pytest
+import numpy as np
+from src.app.core.engines.stt.cassette_stt import CassetteSTTEngine
+from src.app.core.engines.llm.cassette_llm import CassetteLLMEngine
+from src.app.core.engines.tts.cassette_tts import CassetteTTSEngine
+from src.app.core.engines.stt.simulated_stt import SimulatedSTTEngine
+from src.app.core.engines.llm.simulated_llm import SimulatedLLMEngine
+from src.app.core.engines.tts.simulated_tts import SimulatedTTSEngine
+# Same module copies the cassette engines use
+from core.engines import simulation
+from core.engines.cassette import Cassette
+from core.hallucination import report_stats, transcript_stats
+from core.inference.decode import decode_field
+
+MESSAGES = [{"role": "user", "content": "[Collecting: name]\nMy name is Ada."}]
+AUDIO = np.zeros(1600, dtype=np.float32)
+
+
+class FailingLLM(SimulatedLLMEngine):
+    def generate(self, messages):
+        raise RuntimeError("Failed to generate response: 503")
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "session.jsonl.gz")
+
+
+def test_replay_returns_recorded_responses(path):
+    stt = CassetteSTTEngine(SimulatedSTTEngine("zero", answers={"name": "My name is Ada."}), mode="record", path=path)
+    llm = CassetteLLMEngine(SimulatedLLMEngine("zero"), mode="record", path=path)
+    tts = CassetteTTSEngine(SimulatedTTSEngine("zero"), mode="record", path=path)
+    with decode_field("name"):
+        heard = stt.transcribe_array(AUDIO, 16000)
+    said = llm.generate(MESSAGES)
+    os.remove(tts.synthesize("x" * 100))
+
+    kwargs = {"mode": "replay", "path": path, "time_scale": 0}
+    with decode_field("name"):
+        assert CassetteSTTEngine(**kwargs).transcribe_array(AUDIO, 16000) == heard
+    assert CassetteLLMEngine(**kwargs).generate(MESSAGES) == said
+    audio, sample_rate = CassetteTTSEngine(**kwargs).synthesize_pcm("x" * 100)
+    assert len(audio) / sample_rate == pytest.approx(6.5)
+
+
+def test_replay_restores_transcript_stats(path):
+    class ReportingSTT(SimulatedSTTEngine):
+        def transcribe_array(self, audio, sample_rate):
+            report_stats({"no_speech_prob": 0.9, "avg_logprob": -1.5, "compression_ratio": 1.0})
+            return "Thank you."
+
+    CassetteSTTEngine(ReportingSTT("zero"), mode="record", path=path).transcribe_array(AUDIO, 16000)
+    report_stats(None)
+    CassetteSTTEngine(mode="replay", path=path, time_scale=0).transcribe_array(AUDIO, 16000)
+    assert transcript_stats()["no_speech_prob"] == 0.9
+
+
+def test_stream_replays_chunks_with_scaled_timing(path):
+    cassette = Cassette(path, "record")
+    cassette.append({"stage": "llm", "key": "k", "seconds": 0.4, "text": "Hi there", "chunks": [[0.2, "Hi "], [0.4, "there"]]})
+
+    llm = CassetteLLMEngine(mode="replay", path=path, time_scale=0.1)
+    with simulation.ledger() as entries:
+        chunks = list(llm.generate_stream(MESSAGES))
+    assert chunks == ["Hi ", "there"]
+    assert [seconds for _, seconds in entries] == pytest.approx([0.02, 0.02])
+
+
+def test_recorded_failure_is_replayed(path):
+    with pytest.raises(RuntimeError):
+        CassetteLLMEngine(FailingLLM("zero"), mode="record", path=path).generate(MESSAGES)
+    with pytest.raises(RuntimeError, match="Replayed llm failure"):
+        CassetteLLMEngine(mode="replay", path=path, time_scale=0).generate(MESSAGES)
+
+
+def test_match_prefers_key_then_field_then_order_and_cycles(path):
+    cassette = Cassette(path, "record")
+    for key, field in [("a", "name"), ("b", "skills"), ("c", None)]:
+        cassette.append({"stage": "stt", "key": key, "field": field, "seconds": 0, "text": key})
+
+    replay = Cassette(path, "replay")
+    assert replay.match("stt", "c")["text"] == "c"
+    assert replay.match("stt", "unknown", "skills")["text"] == "b"
+    assert replay.match("stt", "unknown")["text"] == "a"
+    assert replay.match("stt", "unknown")["text"] == "a"
+    with pytest.raises(RuntimeError, match="no recorded tts calls"):
+        replay.match("tts", "x")
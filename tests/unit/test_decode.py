@@ -0,0 +1,57 @@
+"""
+tests.unit.test_decode
+
+Unit tests for local Whisper decode profiles.
+"""
+
+import pytest
+from src.app.core.inference.decode import (
+    decode_field,
+    decode_options,
+    batch_decoding_options,
+    faster_whisper_options,
+    record_latency,
+    decode_metrics,
+)
+from src.app.config import FIELD_INITIAL_PROMPTS, ONBOARDING_FIELDS
+
+
+def test_fast_profile_pins_language_and_disables_fallback():
+    options = decode_options("fast")
+    assert options["language"] == "en"
+    assert options["temperature"] == 0.0
+    assert options["condition_on_previous_text"] is False
+
+
+def test_field_prompt_comes_from_enclosing_block():
+    assert "initial_prompt" not in decode_options("fast")
+    with decode_field("skills"):
+        assert decode_options("fast")["initial_prompt"] == FIELD_INITIAL_PROMPTS["skills"]
+    assert "initial_prompt" not in decode_options("fast")
+
+
+def test_every_field_has_a_prompt():
+    assert set(ONBOARDING_FIELDS) <= set(FIELD_INITIAL_PROMPTS)
+
+
+def test_unknown_profile_raises():
+    with pytest.raises(RuntimeError, match="Unknown Whisper decode profile"):
+        decode_options("turbo")
+
+
+def test_batch_options_use_first_temperature_and_prompt():
+    decoding = batch_decoding_options(decode_options("accurate", field="name"))
+    assert decoding["temperature"] == 0.0
+    assert decoding["beam_size"] == 5
+    assert decoding["prompt"] == FIELD_INITIAL_PROMPTS["name"]
+    assert "no_speech_threshold" not in decoding
+
+
+def test_faster_whisper_greedy_is_beam_of_one():
+    assert faster_whisper_options(decode_options("fast"))["beam_size"] == 1
+
+
+def test_latency_reported_per_profile():
+    record_latency("test-profile", 0.5, 2.0)
+    record_latency("test-profile", 1.5, 2.0)
+    assert decode_metrics()["test-profile"] == {"count": 2, "mean_seconds": 1.0, "rtf": 0.5}
@@ -0,0 +1,150 @@
+"""
+tests.unit.test_degradation
+
+Unit tests for SLO-aware turn degradation.
+"""
+
+import os
+import time
+import pytest
+import threading
+from unittest.mock import MagicMock
+from src.app.core import degradation
+from src.app.core.degradation import DegradationController
+from src.app.config import DEGRADE_FILLER_TEXT, DEGRADE_FINAL_TEXT, FIELD_QUESTIONS
+
+
+class FileTTS:
+    """TTS stand-in that writes the text to a real temp file after an optional delay."""
+
+    def __init__(self, tmp_path, delay: float = 0.0, name: str = "primary"):
+        self._dir = tmp_path
+        self._delay = delay
+        self._name = name
+        self.calls = []
+
+    def synthesize(self, text: str) -> str:
+        self.calls.append(text)
+        time.sleep(self._delay)
+        path = self._dir / f"{self._name}-{len(self.calls)}-{time.monotonic_ns()}.mp3"
+        path.write_text(f"{self._name}:{text}")
+        return str(path)
+
+
+class FallbackTTS(FileTTS):
+    pass
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    degradation._audio_cache.clear()
+    yield
+    degradation._audio_cache.clear()
+
+
+def make_controller(tts, fallback=None, llm_budget=0.2, tts_budget=0.2, filler_after=0.05):
+    return DegradationController(
+        tts,
+        budgets={"llm": llm_budget, "tts": tts_budget},
+        filler_after=filler_after,
+        fallback_tts=fallback,
+        enabled=True,
+    )
+
+
+def test_fast_llm_is_not_degraded(tmp_path):
+    controller = make_controller(FileTTS(tmp_path))
+    assert controller.generate(lambda: "LLM reply", fallback_text="Fallback") == "LLM reply"
+    assert controller.fired == []
+
+
+def test_slow_llm_uses_canonical_question(tmp_path):
+    controller = make_controller(FileTTS(tmp_path))
+    fallback = controller.canonical_response("skills")
+    assert fallback.endswith(FIELD_QUESTIONS["skills"])
+
+    result = controller.generate(lambda: time.sleep(0.5) or "late", fallback_text=fallback)
+    assert result == fallback
+    assert controller.fired == ["llm_canonical_question"]
+
+
+def test_canonical_response_after_last_field(tmp_path):
+    controller = make_controller(FileTTS(tmp_path))
+    assert controller.canonical_response(None) == DEGRADE_FINAL_TEXT
+    assert controller.canonical_response("unknown_field") is None
+
+
+def test_without_fallback_llm_is_awaited(tmp_path):
+    controller = make_controller(FileTTS(tmp_path))
+    assert controller.generate(lambda: time.sleep(0.3) or "late") == "late"
+    assert controller.fired == []
+
+
+def test_on_slow_called_before_budget(tmp_path):
+    controller = make_controller(FileTTS(tmp_path))
+    on_slow = MagicMock()
+    controller.generate(lambda: time.sleep(0.1) or "reply", fallback_text="Fallback", on_slow=on_slow)
+    on_slow.assert_called_once()
+
+
+def test_slow_tts_falls_back_to_faster_engine(tmp_path):
+    fallback = FallbackTTS(tmp_path, name="fallback")
+    controller = make_controller(FileTTS(tmp_path, delay=0.5), fallback=fallback)
+    path = controller.synthesize("Hello there")
+    assert open(path).read() == "fallback:Hello there"
+    assert controller.fired == ["tts_fallback_engine"]
+
+
+def test_tts_uses_filler_when_every_engine_is_slow(tmp_path):
+    primary = FileTTS(tmp_path)
+    controller = make_controller(primary)
+    controller.preload()
+
+    controller._tts = FileTTS(tmp_path, delay=0.5)
+    path = controller.synthesize("Something new")
+    assert open(path).read() == f"primary:{DEGRADE_FILLER_TEXT}"
+    assert controller.fired == ["tts_filler_audio"]
+
+
+def test_canonical_text_served_from_cache(tmp_path):
+    primary = FileTTS(tmp_path)
+    controller = make_controller(primary)
+    text = controller.canonical_response("education")
+
+    first = controller.synthesize(text)
+    second = controller.synthesize(text)
+    assert primary.calls == [text]
+    assert first != second
+    assert open(second).read() == f"primary:{text}"
+    os.remove(second)
+
+
+def test_disabled_controller_passes_through(tmp_path):
+    primary = FileTTS(tmp_path, delay=0.3)
+    controller = make_controller(primary)
+    controller.enabled = False
+    assert controller.generate(lambda: time.sleep(0.3) or "late", fallback_text="Fallback") == "late"
+    assert open(controller.synthesize("Hi")).read() == "primary:Hi"
+    assert controller.fired == []
+
+
+def test_abandoned_stage_call_frees_its_worker(tmp_path, monkeypatch):
+    monkeypatch.setattr(degradation, "_workers", threading.BoundedSemaphore(1))
+    controller = make_controller(FileTTS(tmp_path), llm_budget=0.1)
+    assert controller.generate(lambda: time.sleep(0.5) or "late", fallback_text="Fallback") == "Fallback"
+
+    start = time.monotonic()
+    assert controller.generate(lambda: "LLM reply", fallback_text="Fallback") == "LLM reply"
+    assert time.monotonic() - start < 0.1
+    assert degradation.stage_worker_metrics()["abandoned"] >= 1
+
+
+def test_fallback_tts_gets_the_remaining_budget(tmp_path):
+    fallback = FallbackTTS(tmp_path, delay=0.15, name="fallback")
+    controller = make_controller(FileTTS(tmp_path, delay=0.5), fallback=fallback, tts_budget=0.2)
+
+    start = time.monotonic()
+    with pytest.raises(RuntimeError, match="latency budget"):
+        controller.synthesize("Hello there")
+    assert time.monotonic() - start < 0.3
+    assert fallback.calls == ["Hello there"]
@@ -0,0 +1,69 @@
+"""
+tests.unit.test_executor
+
+Unit tests for the local inference executor.
+"""
+
+import threading
+import time
+import pytest
+from src.app.core.inference.executor import InferenceExecutor, cpu_sets
+
+
+def test_runs_at_most_slots_calls_at_once():
+    executor = InferenceExecutor(slots=2, threads_per_slot=1)
+    lock = threading.Lock()
+    running = []
+    peak = [0]
+
+    def work(i):
+        with lock:
+            running.append(i)
+            peak[0] = max(peak[0], len(running))
+        time.sleep(0.05)
+        with lock:
+            running.remove(i)
+        return i * 10
+
+    results = [None] * 6
+    threads = [
+        threading.Thread(target=lambda i=i: results.__setitem__(i, executor.submit(work, i)))
+        for i in range(6)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [0, 10, 20, 30, 40, 50]
+    assert peak[0] == 2
+    snapshot = executor.snapshot()
+    assert snapshot["completed"] == 6
+    assert snapshot["busy"] == 0
+    assert snapshot["mean_wait_seconds"] > 0
+
+
+def test_errors_propagate_to_caller():
+    executor = InferenceExecutor(slots=1, threads_per_slot=1)
+    with pytest.raises(ValueError, match="bad clip"):
+        executor.submit(lambda: (_ for _ in ()).throw(ValueError("bad clip")))
+    assert executor.submit(lambda: "still serving") == "still serving"
+
+
+def test_timeout_stops_waiting_but_call_completes():
+    executor = InferenceExecutor(slots=1, threads_per_slot=1)
+    done = threading.Event()
+
+    def slow():
+        time.sleep(0.1)
+        done.set()
+
+    with pytest.raises(TimeoutError):
+        executor.submit(slow, timeout=0.01)
+    assert done.wait(1.0)
+
+
+def test_cpu_sets_are_disjoint_when_cores_allow(monkeypatch):
+    monkeypatch.setattr("os.sched_getaffinity", lambda pid: {0, 1, 2, 3, 4, 5, 6, 7}, raising=False)
+    assert cpu_sets(2, 4) == [{0, 1, 2, 3}, {4, 5, 6, 7}]
+    assert cpu_sets(3, 4)[2] == {0, 1, 2, 3}
@@ -0,0 +1,134 @@
+"""
+tests.unit.test_failover
+
+Unit tests for provider health tracking and the failover engines.
+"""
+
+import uuid
+import pytest
+from src.app.core.engines.failover import ProviderHealth
+from src.app.core.engines.llm.failover_llm import FailoverLLMEngine
+# Same module copies the failover router checks against
+from core.engines.call_policy import DeadlineExceeded
+from core.engines.rate_limit import AdmissionRejected
+
+
+class FakeLLM:
+    """LLM provider stand-in that returns a fixed reply or raises."""
+
+    def __init__(self, reply: str = "ok", fail: bool = False, error: Exception | None = None):
+        self.reply = reply
+        self.fail = fail
+        self.error = error
+        self.calls = 0
+
+    def generate(self, messages):
+        self.calls += 1
+        if self.error is not None:
+            # Engines wrap errors from the call policy like any other failure
+            try:
+                raise self.error
+            except Exception as e:
+                raise RuntimeError(f"Failed to generate response: {e}")
+        if self.fail:
+            raise RuntimeError("provider down")
+        return self.reply
+
+
+def make_provider(reply: str = "ok", fail: bool = False, error: Exception | None = None) -> FakeLLM:
+    """Return a FakeLLM under a unique class name so providers never share health state."""
+    cls = type(f"FakeLLM_{uuid.uuid4().hex[:8]}", (FakeLLM,), {})
+    return cls(reply, fail, error)
+
+
+def test_circuit_opens_after_consecutive_failures():
+    health = ProviderHealth("test", latency_slo=3.0, failure_threshold=3)
+    health.record_failure()
+    health.record_failure()
+    assert not health.is_open
+    health.record_failure()
+    assert health.is_open
+
+
+def test_success_resets_failure_count():
+    health = ProviderHealth("test", latency_slo=3.0, failure_threshold=2)
+    health.record_failure()
+    health.record_success(0.5)
+    health.record_failure()
+    assert not health.is_open
+
+
+def test_circuit_opens_after_repeated_slo_breaches():
+    health = ProviderHealth("test", latency_slo=1.0, slow_threshold=2)
+    health.record_success(2.5)
+    health.record_success(2.5)
+    assert health.is_open
+
+
+def test_ewma_latency_over_slo_marks_provider_unhealthy():
+    health = ProviderHealth("test", latency_slo=1.0, alpha=0.5, slow_threshold=10)
+    health.record_success(0.5)
+    assert health.is_healthy
+    health.record_success(3.0)
+    assert not health.is_healthy
+    assert not health.is_open
+
+
+def test_probe_due_only_after_cooldown():
+    health = ProviderHealth("test", latency_slo=1.0, failure_threshold=1, cooldown=0)
+    assert not health.probe_due
+    health.record_failure()
+    assert health.probe_due
+    health.close()
+    assert not health.is_open
+
+
+def test_failover_uses_first_provider_when_healthy():
+    primary, backup = make_provider("primary"), make_provider("backup")
+    engine = FailoverLLMEngine(providers=[primary, backup])
+    assert engine.generate([{"role": "user", "content": "Hi"}]) == "primary"
+    assert backup.calls == 0
+
+
+def test_failover_falls_back_on_provider_error():
+    primary, backup = make_provider(fail=True), make_provider("backup")
+    engine = FailoverLLMEngine(providers=[primary, backup])
+    assert engine.generate([{"role": "user", "content": "Hi"}]) == "backup"
+
+
+def test_open_circuit_is_skipped():
+    """Once the primary's circuit opens, calls should go straight to the backup."""
+    primary, backup = make_provider(fail=True), make_provider("backup")
+    engine = FailoverLLMEngine(providers=[primary, backup])
+    for _ in range(3):
+        engine.generate([{"role": "user", "content": "Hi"}])
+    calls_before = primary.calls
+    engine.generate([{"role": "user", "content": "Hi"}])
+    assert primary.calls == calls_before
+
+
+def test_all_providers_failing_raises_runtime_error():
+    engine = FailoverLLMEngine(providers=[make_provider(fail=True), make_provider(fail=True)])
+    with pytest.raises(RuntimeError, match="All llm providers failed"):
+        engine.generate([{"role": "user", "content": "Hi"}])
+
+
+@pytest.mark.parametrize("error", [DeadlineExceeded("turn budget spent"), AdmissionRejected("queue full", retry_after=2)])
+def test_own_call_policy_errors_are_reraised_without_tripping_circuits(error):
+    primary, backup = make_provider(error=error), make_provider("backup")
+    engine = FailoverLLMEngine(providers=[primary, backup])
+    for _ in range(5):
+        with pytest.raises(RuntimeError) as raised:
+            engine.generate([{"role": "user", "content": "Hi"}])
+        assert raised.value.__context__ is error
+    assert backup.calls == 0
+    primary.error = None
+    assert engine.generate([{"role": "user", "content": "Hi"}]) == "ok"
+
+
+def test_all_providers_failing_keeps_the_cause():
+    last = make_provider(fail=True)
+    engine = FailoverLLMEngine(providers=[make_provider(fail=True), last])
+    with pytest.raises(RuntimeError) as raised:
+        engine.generate([{"role": "user", "content": "Hi"}])
+    assert str(raised.value.__cause__) == "provider down"
@@ -0,0 +1,56 @@
+"""
+tests.unit.test_faster_whisper
+
+Unit tests for the quantized faster-whisper STT engine and WER metric.
+"""
+
+import sys
+import numpy as np
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from src.app.core.engines.stt.faster_whisper_stt import FasterWhisperEngine
+from src.app.utils.text import word_error_rate
+
+
+@pytest.fixture
+def fake_faster_whisper():
+    model = MagicMock()
+    model.transcribe.return_value = (
+        iter([SimpleNamespace(text=" My name is"), SimpleNamespace(text=" Jane Doe. ")]),
+        SimpleNamespace(language="en"),
+    )
+    module = SimpleNamespace(WhisperModel=MagicMock(return_value=model))
+    with patch.dict(sys.modules, {"faster_whisper": module}):
+        yield module, model
+
+
+def test_init_loads_quantized_cpu_model(fake_faster_whisper):
+    module, _ = fake_faster_whisper
+    FasterWhisperEngine(model="small", compute_type="int8", threads=2)
+    module.WhisperModel.assert_called_once_with("small", device="cpu", compute_type="int8", cpu_threads=2)
+
+
+def test_init_raises_when_package_missing():
+    with patch.dict(sys.modules, {"faster_whisper": None}):
+        with pytest.raises(RuntimeError, match="pip install faster-whisper"):
+            FasterWhisperEngine()
+
+
+def test_transcribe_array_joins_segments(fake_faster_whisper):
+    _, model = fake_faster_whisper
+    engine = FasterWhisperEngine(profile="accurate")
+    assert engine.transcribe_array(np.zeros(8000, dtype=np.float32), 8000) == "My name is Jane Doe."
+
+    audio = model.transcribe.call_args.args[0]
+    assert audio.dtype == np.float32 and audio.size == 16000
+    options = model.transcribe.call_args.kwargs
+    assert options["beam_size"] == 5
+    assert options["log_prob_threshold"] == -1.0 and "logprob_threshold" not in options
+
+
+def test_word_error_rate():
+    assert word_error_rate("My name is Jane Doe.", "my name is jane doe") == 0.0
+    assert word_error_rate("my name is jane doe", "my name is john doe") == pytest.approx(0.2)
+    assert word_error_rate("co-op placement", "co op") == pytest.approx(1 / 3)
+    assert word_error_rate("", "") == 0.0
@@ -2,8 +2,8 @@
 Unit tests for Groq LLM engine.
 """
 
-from unittest.mock import patch
-from types import SimpleNamespacefrom unittest.mock import patchfrom types import SimpleNamespacefrom unittest.mock import patch
+from unittest.mock import patch, ANY
+from types import SimpleNamespace
 
 import pytest
 
@@ -12,7 +12,7 @@ from src.app.config import (
     LLM_TEMPERATURE,
     LLM_PRESENCE_PENALTY,
     LLM_FREQUENCY_PENALTY,
-))))
+)
 from src.app.core.engines.llm.groq_llm import GroqLLMEngine
 
 
@@ -43,10 +43,24 @@ def test_init_configures_openai_client_for_groq_base_url(fake_openai_client):
     mock_openai.assert_called_once_with(
         api_key="test-key",
         base_url="https://api.groq.com/openai/v1",
+        max_retries=0,
     )
     assert engine._model == "llama-3.1-8b-instant"
 
 
+def test_init_uses_stand_in_server_without_api_key(fake_openai_client):
+    """With STAND_IN_BASE_URL set, the client targets the stand-in and no key is required."""
+    url = "http://127.0.0.1:8900/v1"
+    with patch.dict("os.environ", {}, clear=True):
+        with patch("dotenv.load_dotenv", return_value=False):
+            with patch("src.app.core.engines.llm.groq_llm.STAND_IN_BASE_URL", url):
+                with patch("core.engines.openai_client.STAND_IN_BASE_URL", url):
+                    with patch("openai.OpenAI", return_value=fake_openai_client) as mock_openai:
+                        GroqLLMEngine()
+
+    mock_openai.assert_called_once_with(api_key="stand-in", base_url=url, max_retries=0)
+
+
 def test_generate_calls_client_with_expected_parameters(fake_openai_client):
     """Engine should pass config-driven generation parameters to Groq client."""
     mock_response = SimpleNamespace(
@@ -69,6 +83,7 @@ def test_generate_calls_client_with_expected_parameters(fake_openai_client):
         temperature=LLM_TEMPERATURE,
         presence_penalty=LLM_PRESENCE_PENALTY,
         frequency_penalty=LLM_FREQUENCY_PENALTY,
+        timeout=ANY,
     )
 
 
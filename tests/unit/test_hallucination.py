@@ -0,0 +1,80 @@
+"""
+tests.unit.test_hallucination
+
+Unit tests for the post-STT hallucination filter.
+"""
+
+from types import SimpleNamespace
+import pytest
+from src.app.core.hallucination import HallucinationFilter, segment_stats
+
+SPEECH = {"no_speech_prob": 0.05, "avg_logprob": -0.3, "compression_ratio": 1.2}
+# Below Whisper's silence rule, but doubtful enough to reject a blocklisted phrase
+UNSURE = {"no_speech_prob": 0.45, "avg_logprob": -0.5, "compression_ratio": 1.2}
+
+
+@pytest.fixture
+def hallucination_filter():
+    return HallucinationFilter(enabled=True)
+
+
+@pytest.mark.parametrize("text", [
+    "you\n",
+    "Thank you so much for watching !",
+    "Bye bye.",
+    "Oh! POOF! POOF! POOF!",
+])
+def test_known_hallucinations_are_blocklisted(hallucination_filter, text):
+    assert hallucination_filter.reason(text, UNSURE) == "blocklist"
+
+
+@pytest.mark.parametrize("text", ["You.", "Thank you.", "Bye."])
+def test_blocklisted_phrases_pass_when_confidently_spoken(hallucination_filter, text):
+    assert hallucination_filter.reason(text, SPEECH) is None
+    assert hallucination_filter.reason(text, {**SPEECH, "avg_logprob": -0.9}) == "blocklist"
+    # Without decoder statistics there is no doubt signal, so a short polite answer is kept
+    assert hallucination_filter.reason(text) is None
+
+
+@pytest.mark.parametrize("text", [". .", "\n.", "…?!"])
+def test_transcripts_without_words_are_rejected(hallucination_filter, text):
+    assert hallucination_filter.reason(text, SPEECH) == "no_words"
+
+
+@pytest.mark.parametrize("text", ["张伟", "Алексей Петров", "محمد", "5"])
+def test_words_in_any_script_pass(hallucination_filter, text):
+    assert hallucination_filter.reason(text, SPEECH) is None
+
+
+def test_real_answers_pass(hallucination_filter):
+    assert hallucination_filter.reason("Hi.", SPEECH) is None
+    assert hallucination_filter.reason("Bye bye, I'm looking for a developer role.", SPEECH) is None
+    assert hallucination_filter.reason("My name is José Álvarez.") is None
+
+
+def test_whisper_silence_rule(hallucination_filter):
+    silent = {"no_speech_prob": 0.9, "avg_logprob": -1.2, "compression_ratio": 1.0}
+    assert hallucination_filter.reason("I have a diploma", silent) == "no_speech"
+    # High no-speech probability alone is not enough when the decoder was confident
+    confident = {"no_speech_prob": 0.9, "avg_logprob": -0.4, "compression_ratio": 1.0}
+    assert hallucination_filter.reason("I have a diploma", confident) is None
+
+
+def test_low_confidence_and_repetition(hallucination_filter):
+    assert hallucination_filter.reason("C'mon", {**SPEECH, "avg_logprob": -2.0}) == "low_confidence"
+    assert hallucination_filter.reason("I am I am", {**SPEECH, "compression_ratio": 3.1}) == "repetition"
+    # Without decoder statistics the ratio is computed from the text
+    assert hallucination_filter.reason("the the the " * 20) == "repetition"
+
+
+def test_segment_stats_reads_dicts_and_objects():
+    stats = segment_stats([
+        {"no_speech_prob": 0.2, "avg_logprob": -0.2, "compression_ratio": 1.1},
+        SimpleNamespace(no_speech_prob=0.4, avg_logprob=-0.6, compression_ratio=2.0),
+    ])
+    assert stats == pytest.approx({"no_speech_prob": 0.3, "avg_logprob": -0.4, "compression_ratio": 2.0})
+    assert segment_stats([]) is None
+
+
+def test_disabled_filter_accepts_everything():
+    assert HallucinationFilter(enabled=False).check("Bye bye.") is None
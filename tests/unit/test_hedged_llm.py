@@ -0,0 +1,86 @@
+"""
+tests.unit.test_hedged_llm
+
+Unit tests for the HedgedLLMEngine.
+"""
+
+import time
+import pytest
+from src.app.core.engines.llm.hedged_llm import HedgedLLMEngine
+from src.app.utils.latency import LatencyWindow
+
+
+class FakeLLM:
+    """Minimal LLM engine that sleeps before answering, or raises if told to fail."""
+
+    def __init__(self, reply: str, delay: float = 0.0, fail: bool = False):
+        self.reply = reply
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+
+    def generate_stream(self, messages):
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("provider down")
+        yield self.reply
+
+
+def make_engine(primary, secondary, initial_delay=0.05):
+    """Build a hedged engine with a fresh latency window so tests do not share history."""
+    engine = HedgedLLMEngine(primary=primary, secondary=secondary, initial_delay=initial_delay, min_samples=3)
+    engine._latency = LatencyWindow()
+    return engine
+
+
+def test_fast_primary_does_not_hedge():
+    """Secondary should never be called when the primary answers within the hedge delay."""
+    primary = FakeLLM("primary")
+    secondary = FakeLLM("secondary")
+    engine = make_engine(primary, secondary, initial_delay=0.5)
+    assert engine.generate([{"role": "user", "content": "Hi"}]) == "primary"
+    assert secondary.calls == 0
+
+
+def test_slow_primary_hedges_to_secondary():
+    """A primary slower than the hedge delay should lose to a fast secondary."""
+    primary = FakeLLM("primary", delay=0.5)
+    secondary = FakeLLM("secondary")
+    engine = make_engine(primary, secondary)
+    assert engine.generate([{"role": "user", "content": "Hi"}]) == "secondary"
+    assert secondary.calls == 1
+
+
+def test_failed_primary_falls_back_to_secondary():
+    """A primary error should fire the secondary immediately rather than raising."""
+    engine = make_engine(FakeLLM("primary", fail=True), FakeLLM("secondary"), initial_delay=5.0)
+    start = time.time()
+    assert engine.generate([{"role": "user", "content": "Hi"}]) == "secondary"
+    assert time.time() - start < 1.0
+
+
+def test_both_engines_failing_raises_runtime_error():
+    engine = make_engine(FakeLLM("primary", fail=True), FakeLLM("secondary", fail=True))
+    with pytest.raises(RuntimeError, match="any hedged engine"):
+        engine.generate([{"role": "user", "content": "Hi"}])
+
+
+def test_hedge_delay_uses_initial_delay_until_enough_samples():
+    engine = make_engine(FakeLLM("primary"), FakeLLM("secondary"), initial_delay=1.5)
+    engine._latency.record(0.2)
+    assert engine.hedge_delay() == 1.5
+
+
+def test_hedge_delay_follows_primary_percentile_within_bounds():
+    engine = HedgedLLMEngine(
+        primary=FakeLLM("primary"), secondary=FakeLLM("secondary"),
+        percentile=95, min_samples=3, min_delay=0.3, max_delay=4.0,
+    )
+    engine._latency = LatencyWindow()
+    for latency in [0.5, 0.6, 0.7, 1.2]:
+        engine._latency.record(latency)
+    assert engine.hedge_delay() == 1.2
+
+    engine._latency.record(30.0)
+    assert engine.hedge_delay() == 4.0
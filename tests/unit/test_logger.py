@@ -0,0 +1,77 @@
+"""
+tests.unit.test_logger
+
+Unit tests for queue-based structured logging.
+"""
+
+import json
+import queue
+import logging
+from logging.handlers import QueueListener
+from src.app.utils.logger import JsonFormatter, SamplingFilter, SizeAndTimeRotatingFileHandler, _QueueHandler
+
+
+def make_logger(name: str, *handlers, filters=()) -> logging.Logger:
+    logger = logging.getLogger(name)
+    logger.handlers.clear()
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    for f in filters:
+        logger.addFilter(f)
+    for handler in handlers:
+        logger.addHandler(handler)
+    return logger
+
+
+def test_queued_records_are_written_as_json_lines(tmp_path):
+    path = tmp_path / "app.jsonl"
+    file_handler = SizeAndTimeRotatingFileHandler(path, max_bytes=0, interval=None, backup_count=1)
+    file_handler.setFormatter(JsonFormatter())
+    records = queue.SimpleQueue()
+    listener = QueueListener(records, file_handler)
+    listener.start()
+    logger = make_logger("test.queue", _QueueHandler(records))
+
+    values = ["Ada"]
+    logger.info("Transcript: %s", values, extra={"turn": 1})
+    values.append("changed after the call")
+    try:
+        raise ValueError("bad audio")
+    except ValueError:
+        logger.exception("STT failed")
+    listener.stop()
+    file_handler.close()
+
+    first, second = [json.loads(line) for line in path.read_text().splitlines()]
+    assert first["message"] == "Transcript: ['Ada']" and first["turn"] == 1 and first["level"] == "INFO"
+    assert second["level"] == "ERROR" and "ValueError: bad audio" in second["exception"]
+
+
+def test_sampling_drops_low_levels_but_never_warnings():
+    kept = []
+
+    class Collect(logging.Handler):
+        def emit(self, record):
+            kept.append(record)
+
+    logger = make_logger("test.sampling", Collect(), filters=[SamplingFilter({"DEBUG": 0.0, "INFO": 1.0})])
+    logger.debug("dropped")
+    logger.info("kept")
+    logger.info("dropped too", extra={"sample": 0.0})
+    logger.warning("always kept", extra={"sample": 0.0})
+    assert [r.getMessage() for r in kept] == ["kept", "always kept"]
+
+
+def test_file_rotates_by_size_and_by_age(tmp_path):
+    path = tmp_path / "app.log"
+    handler = SizeAndTimeRotatingFileHandler(path, max_bytes=200, interval=3600, backup_count=2)
+    logger = make_logger("test.rotation", handler)
+    for i in range(10):
+        logger.info("x" * 50)
+    assert (tmp_path / "app.log.1").exists()
+
+    handler._rollover_at = 0
+    logger.info("after an hour")
+    handler.close()
+    assert path.read_text() == "after an hour\n"
+    assert not (tmp_path / "app.log.3").exists()
@@ -0,0 +1,123 @@
+"""
+tests.unit.test_ollama
+
+Unit tests for the Ollama local LLM engine.
+"""
+
+import json
+import time
+import pytest
+import threading
+from unittest.mock import MagicMock, patch
+from src.app.core.engines.llm import ollama_llm
+from src.app.core.engines.llm.ollama_llm import OllamaLLMEngine
+
+
+def stream_response(*chunks, done=True):
+    """Return a mock streaming response yielding Ollama NDJSON lines."""
+    lines = [json.dumps({"message": {"content": c}, "done": False}).encode() for c in chunks]
+    if done:
+        lines.append(json.dumps({"message": {"content": ""}, "done": True}).encode())
+    response = MagicMock()
+    response.iter_lines.return_value = iter(lines)
+    response.__enter__.return_value = response
+    return response
+
+
+@pytest.fixture
+def session():
+    ollama_llm._resolved.clear()
+    ollama_llm._preloaded.clear()
+    with patch.object(ollama_llm, "_session") as session:
+        session.get.return_value.json.return_value = {"models": [{"name": "gemma3:1b"}]}
+        yield session
+    ollama_llm._resolved.clear()
+    ollama_llm._preloaded.clear()
+
+
+def test_model_check_runs_once_per_process(session):
+    OllamaLLMEngine(preload=False)
+    OllamaLLMEngine(preload=False)
+    assert session.get.call_count == 1
+
+
+def test_missing_model_falls_back_to_first_available(session):
+    session.get.return_value.json.return_value = {"models": [{"name": "llama3.2:1b"}]}
+    engine = OllamaLLMEngine(model="gemma3:1b", preload=False)
+    assert engine._model == "llama3.2:1b"
+
+
+def test_generate_streams_with_keep_alive_and_options(session):
+    session.post.return_value = stream_response("Got it. ", "What is your ", "employment status?")
+    engine = OllamaLLMEngine(keep_alive=-1, options={"num_ctx": 2048, "num_thread": None}, preload=False)
+
+    assert engine.generate([{"role": "user", "content": "Jane"}]) == "Got it. What is your employment status?"
+    payload = session.post.call_args.kwargs["json"]
+    assert payload["stream"] is True
+    assert payload["keep_alive"] == -1
+    assert payload["options"] == {"num_ctx": 2048}
+    assert session.post.call_args.kwargs["stream"] is True
+
+
+def test_generate_stream_yields_chunks(session):
+    session.post.return_value = stream_response("Hello", " there")
+    engine = OllamaLLMEngine(preload=False)
+    assert list(engine.generate_stream([])) == ["Hello", " there"]
+
+
+def test_stream_error_line_raises(session):
+    response = stream_response(done=False)
+    response.iter_lines.return_value = iter([json.dumps({"error": "model crashed"}).encode()])
+    session.post.return_value = response
+    engine = OllamaLLMEngine(preload=False)
+    with pytest.raises(RuntimeError, match="model crashed"):
+        engine.generate([])
+
+
+def test_preload_loads_model_once(session):
+    engine = OllamaLLMEngine(preload=False)
+    engine.preload()
+    engine.preload()
+    assert session.post.call_count == 1
+    payload = session.post.call_args.kwargs["json"]
+    assert payload["messages"] == [] and payload["keep_alive"] == "30m"
+
+
+def test_unreachable_ollama_raises(session):
+    import requests
+    session.get.side_effect = requests.exceptions.ConnectionError("refused")
+    with pytest.raises(RuntimeError, match="Cannot connect to Ollama"):
+        OllamaLLMEngine(preload=False)
+
+
+def test_concurrent_streams_are_serialised_by_the_provider_limit(session):
+    active, overlap = [0], []
+    lock = threading.Lock()
+
+    def slow_lines(*chunks):
+        with lock:
+            active[0] += 1
+            overlap.append(active[0])
+        for chunk in chunks:
+            time.sleep(0.05)
+            yield json.dumps({"message": {"content": chunk}, "done": False}).encode()
+        with lock:
+            active[0] -= 1
+        yield json.dumps({"message": {"content": ""}, "done": True}).encode()
+
+    def post(*args, **kwargs):
+        response = stream_response()
+        response.iter_lines.return_value = slow_lines("a", "b", "c")
+        return response
+
+    session.post.side_effect = post
+    engine = OllamaLLMEngine(preload=False)
+    replies = []
+    threads = [threading.Thread(target=lambda: replies.append(engine.generate([]))) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert replies == ["abc", "abc"]
+    assert max(overlap) == 1
@@ -135,3 +135,91 @@ def test_save_audio_creates_wav_file(pipeline):
     path = pipeline.save_audio(audio_data)
     assert os.path.exists(path)
     os.remove(path)
+
+def test_slow_llm_falls_back_to_canonical_question(pipeline):
+    """ LLM overrunning its budget should be replaced by the next field's question """
+    import time
+    pipeline.degradation._budgets = {"llm": 0.1, "tts": 0.1}
+    pipeline.llm.generate.side_effect = lambda messages: time.sleep(0.3) or "late reply"
+    fallback = pipeline._fallback_response(0)
+    result = pipeline._generate("[Collecting: name]\nMy name is Brendan", fallback=fallback)
+    assert result == fallback
+    assert "currently employed" in result
+    assert pipeline.conversation_history[-1] == {"role": "assistant", "content": fallback}
+    assert pipeline.degradation.fired == ["llm_canonical_question"]
+
+def test_hallucinated_transcript_skips_llm_and_tts(pipeline):
+    """ A known hallucination on a noisy clip should end the turn before any provider call """
+    import numpy as np
+    from core.hallucination import report_stats
+
+    def transcribe_array(audio, sample_rate):
+        report_stats({"no_speech_prob": 0.45, "avg_logprob": -0.5, "compression_ratio": 1.0})
+        return "Thank you so much for watching!"
+
+    pipeline.stt.supports_arrays = True
+    pipeline.stt.transcribe_array.side_effect = transcribe_array
+    pipeline._run_turn(0, "name", np.full(1600, 0.05, dtype="float32"), None)
+    pipeline.llm.generate.assert_not_called()
+    pipeline.tts.synthesize.assert_not_called()
+
+def test_pcm_tts_is_streamed_sentence_by_sentence(pipeline):
+    """ Engines with in-memory PCM should be played piece by piece without a temp file """
+    import numpy as np
+    pipeline.tts.supports_pcm = True
+    pipeline.tts.synthesize_stream.return_value = iter([(np.zeros(10), 22050), (np.zeros(20), 22050)])
+    with patch("sounddevice.play") as play, patch("sounddevice.wait"):
+        pipeline._speak("Got it. Next question?")
+    assert play.call_count == 2
+    pipeline.tts.synthesize.assert_not_called()
+
+def test_failed_stream_falls_back_to_file_playback(pipeline):
+    """ A stream that fails before any audio plays should fall back to the file path """
+    pipeline.tts.supports_pcm = True
+    pipeline.tts.synthesize_stream.side_effect = RuntimeError("voice crashed")
+    with patch("sounddevice.play"), patch("sounddevice.wait"), patch.object(pipeline, "play_audio") as play:
+        pipeline._speak("Hello.")
+    play.assert_called_once()
+
+def test_transcribe_audio_passes_arrays_to_array_engines():
+    """ Engines that accept arrays should get samples directly, not a file path """
+    import numpy as np
+    from src.app.core.pipeline import transcribe_audio
+    stt = MagicMock()
+    stt.supports_arrays = True
+    stt.transcribe_array.return_value = "hello"
+    audio = np.zeros(1600, dtype="float32")
+    assert transcribe_audio(stt, audio, 16000, "/tmp/clip.wav") == "hello"
+    stt.transcribe.assert_not_called()
+
+def test_transcribe_audio_uses_path_for_file_engines():
+    """ File-based engines should reuse the existing WAV instead of writing another """
+    import numpy as np
+    from src.app.core.pipeline import transcribe_audio
+    stt = MagicMock()
+    stt.supports_arrays = False
+    stt.transcribe.return_value = "hello"
+    assert transcribe_audio(stt, np.zeros(1600), 16000, "/tmp/clip.wav") == "hello"
+    stt.transcribe.assert_called_once_with("/tmp/clip.wav")
+
+def test_base_transcribe_array_writes_temp_wav():
+    """ The default transcribe_array should hand file-based engines a readable WAV """
+    import numpy as np
+    import soundfile as sf
+    from src.app.core.engines.base import STTEngine
+
+    class FileOnly(STTEngine):
+        def transcribe(self, audio_path):
+            audio, rate = sf.read(audio_path)
+            return f"{len(audio)}@{rate}"
+
+    assert FileOnly().transcribe_array(np.zeros(800, dtype="float32"), 8000) == "800@8000"
+
+def test_pipeline_import_does_not_load_audio_devices():
+    """ Importing the pipeline (as the API does) should not pull in PortAudio or SDL """
+    import subprocess
+    import sys
+    code = "import sys; import core.pipeline; print('sounddevice' in sys.modules or 'pygame' in sys.modules)"
+    app_dir = os.path.join(os.path.dirname(__file__), "..", "..", "src", "app")
+    result = subprocess.run([sys.executable, "-c", code], cwd=app_dir, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,95 @@
+"""
+tests.unit.test_piper
+
+Unit tests for the offline Piper TTS engine and the TTSEngine PCM defaults.
+"""
+
+import sys
+import numpy as np
+import pytest
+import soundfile as sf
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from src.app.core.engines.tts import piper_tts
+from src.app.core.engines.tts.piper_tts import PiperTTSEngine
+from src.app.core.engines.base import TTSEngine
+from src.app.utils.text import split_sentences
+
+
+class FakeVoice:
+    """Yields one chunk of samples per call, sized by the text length."""
+
+    config = SimpleNamespace(sample_rate=22050)
+
+    def __init__(self):
+        self.calls = []
+
+    def synthesize(self, text):
+        self.calls.append(text)
+        yield SimpleNamespace(audio_float_array=np.full(len(text), 0.1, dtype=np.float32))
+
+
+@pytest.fixture
+def voice(tmp_path):
+    fake = FakeVoice()
+    module = SimpleNamespace(PiperVoice=MagicMock())
+    module.PiperVoice.load.return_value = fake
+    model = tmp_path / "voice.onnx"
+    model.write_bytes(b"onnx")
+    piper_tts._voices.clear()
+    with patch.dict(sys.modules, {"piper": module}):
+        yield fake, module, str(model)
+    piper_tts._voices.clear()
+
+
+def test_voice_is_loaded_once_and_warmed_up(voice):
+    fake, module, model = voice
+    PiperTTSEngine(voice=model)
+    PiperTTSEngine(voice=model)
+    module.PiperVoice.load.assert_called_once_with(model)
+    assert fake.calls == ["Hello."]
+
+
+def test_streams_one_piece_per_sentence(voice):
+    fake, _, model = voice
+    engine = PiperTTSEngine(voice=model)
+    pieces = list(engine.synthesize_stream("Got it. What is your employment status?"))
+    assert [audio.size for audio, _ in pieces] == [7, 31]
+    assert all(rate == 22050 for _, rate in pieces)
+
+
+def test_synthesize_writes_wav(voice):
+    _, _, model = voice
+    path = PiperTTSEngine(voice=model).synthesize("Thanks. Next question.")
+    audio, rate = sf.read(path)
+    assert rate == 22050 and audio.size == len("Thanks.") + len("Next question.")
+
+
+def test_missing_voice_raises(voice, tmp_path):
+    with pytest.raises(RuntimeError, match="Piper voice not found"):
+        PiperTTSEngine(voice=str(tmp_path / "missing.onnx"))
+
+
+def test_missing_package_raises(tmp_path):
+    piper_tts._voices.clear()
+    with patch.dict(sys.modules, {"piper": None}):
+        with pytest.raises(RuntimeError, match="pip install piper-tts"):
+            PiperTTSEngine(voice=str(tmp_path / "voice.onnx"))
+
+
+def test_base_synthesize_pcm_decodes_and_deletes_file(tmp_path):
+    class FileOnly(TTSEngine):
+        def synthesize(self, text):
+            path = str(tmp_path / "out.wav")
+            sf.write(path, np.zeros(400, dtype=np.float32), 8000)
+            return path
+
+    pieces = list(FileOnly().synthesize_stream("Hello there. Bye."))
+    assert len(pieces) == 1
+    assert pieces[0][0].size == 400 and pieces[0][1] == 8000
+    assert not (tmp_path / "out.wav").exists()
+
+
+def test_split_sentences():
+    assert split_sentences("Hi!  How are you? I'm fine.") == ["Hi!", "How are you?", "I'm fine."]
+    assert split_sentences("No punctuation") == ["No punctuation"]
@@ -0,0 +1,94 @@
+"""
+tests.unit.test_rate_limit
+
+Unit tests for provider rate limits and turn admission control.
+"""
+
+import asyncio
+import threading
+import pytest
+from src.app.core.engines.rate_limit import (
+    AdmissionRejected,
+    TokenBucket,
+    ProviderLimiter,
+    find_rejection,
+    estimate_tokens,
+)
+from src.app.core.admission import TurnAdmission
+
+
+def test_token_bucket_allows_burst_up_to_capacity():
+    bucket = TokenBucket(per_minute=60)
+    assert bucket.reserve(60, max_wait=0) == 0
+    assert bucket.reserve(1, max_wait=0) is None
+
+
+def test_token_bucket_reports_wait_within_max_wait():
+    bucket = TokenBucket(per_minute=60)
+    bucket.reserve(60, max_wait=0)
+    wait = bucket.reserve(1, max_wait=5)
+    assert 0 < wait <= 1.0
+
+
+def test_limiter_rejects_with_429_when_quota_will_not_refill():
+    limiter = ProviderLimiter("test", rpm=1, max_wait=0.1)
+    with limiter.acquire():
+        pass
+    with pytest.raises(AdmissionRejected) as exc:
+        with limiter.acquire():
+            pass
+    assert exc.value.status_code == 429
+    assert exc.value.retry_after >= 1
+
+
+def test_limiter_rejects_with_503_when_queue_full():
+    limiter = ProviderLimiter("test", concurrency=1, max_queue=0, max_wait=1.0)
+    holding = threading.Event()
+    release = threading.Event()
+
+    def hold():
+        with limiter.acquire():
+            holding.set()
+            release.wait(2)
+
+    worker = threading.Thread(target=hold)
+    worker.start()
+    holding.wait(2)
+    try:
+        with pytest.raises(AdmissionRejected) as exc:
+            with limiter.acquire():
+                pass
+        assert exc.value.status_code == 503
+    finally:
+        release.set()
+        worker.join()
+
+
+def test_find_rejection_walks_wrapped_exceptions():
+    try:
+        try:
+            raise AdmissionRejected("busy", 2)
+        except AdmissionRejected as e:
+            raise RuntimeError(f"Failed to generate response: {e}")
+    except RuntimeError as wrapped:
+        assert find_rejection(wrapped).retry_after == 2
+    assert find_rejection(ValueError()) is None
+
+
+def test_estimate_tokens():
+    assert estimate_tokens([{"role": "user", "content": "a" * 40}]) == 14
+
+
+def test_turn_admission_rejects_when_queue_full():
+    admission = TurnAdmission(max_concurrent=1, max_queued=0, max_wait=1.0)
+
+    async def scenario():
+        async with admission.slot():
+            assert admission.snapshot()["running"] == 1
+            # admission.py raises the core.engines copy of AdmissionRejected
+            with pytest.raises(RuntimeError) as exc:
+                async with admission.slot():
+                    pass
+            assert exc.value.status_code == 503
+
+    asyncio.run(scenario())
@@ -0,0 +1,74 @@
+"""
+tests.unit.test_simulation
+
+Unit tests for the simulated engines and their latency model.
+"""
+
+import os
+import pytest
+from src.app.core.engines import simulation
+from src.app.core.engines.simulation import LatencyModel, latency_model
+from src.app.core.engines.stt.simulated_stt import SimulatedSTTEngine
+from src.app.core.engines.llm.simulated_llm import SimulatedLLMEngine, scripted_response, CLOSING_TEXT
+from src.app.core.engines.tts.simulated_tts import SimulatedTTSEngine
+# Same module copy the engine reads the field from
+from core.inference.decode import decode_field
+
+
+def test_latency_model_matches_median_and_p95():
+    simulation.seed(1)
+    model = LatencyModel(median=1.0, p95=2.0)
+    draws = sorted(model.sample() for _ in range(4000))
+    assert draws[2000] == pytest.approx(1.0, rel=0.1)
+    assert draws[3800] == pytest.approx(2.0, rel=0.1)
+
+
+def test_latency_grows_with_characters_and_no_p95_means_no_jitter():
+    model = LatencyModel(median=0.5, per_char=0.01)
+    assert model.sample(chars=100) == pytest.approx(1.5)
+    assert model.sample(chars=100) == pytest.approx(1.5)
+
+
+def test_unknown_profile_raises():
+    with pytest.raises(RuntimeError, match="Unknown simulated profile"):
+        latency_model("nonexistent", "llm")
+
+
+def test_slow_draw_times_out_and_is_recorded():
+    with simulation.ledger() as entries:
+        with pytest.raises(TimeoutError):
+            simulation.simulate("llm", LatencyModel(median=5.0), timeout=0.01)
+    assert entries == [("llm", 0.01)]
+
+
+def test_failure_rate_injects_retryable_errors():
+    with pytest.raises(simulation.SimulatedProviderError) as e:
+        simulation.simulate("tts", LatencyModel(failure_rate=1.0))
+    assert e.value.status_code == 503
+
+
+def test_stt_returns_scripted_answer_for_current_field():
+    stt = SimulatedSTTEngine("zero", answers={"name": "My name is Ada."})
+    with decode_field("name"):
+        assert stt.transcribe("/tmp/unused.wav") == "My name is Ada."
+    assert stt.transcribe("/tmp/unused.wav") == "Yes, everything looks correct."
+
+
+def test_llm_asks_next_question_then_summarises_then_closes():
+    turn = [{"role": "user", "content": "[Collecting: name]\nMy name is Ada."}]
+    assert "currently employed" in scripted_response(turn)
+
+    last = turn + [{"role": "user", "content": "[Collecting: job_preferences]\nData roles."}]
+    summary = scripted_response(last)
+    assert "My name is Ada." in summary and "Data roles." in summary
+
+    assert scripted_response([{"role": "user", "content": "Yes."}]) == CLOSING_TEXT
+    assert SimulatedLLMEngine("zero").generate(turn).startswith("Got it")
+
+
+def test_tts_writes_speech_length_wav():
+    import soundfile as sf
+    path = SimulatedTTSEngine("zero").synthesize("x" * 100)
+    info = sf.info(path)
+    os.remove(path)
+    assert info.duration == pytest.approx(6.5)
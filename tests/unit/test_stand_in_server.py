@@ -0,0 +1,105 @@
+"""
+Unit tests for the OpenAI-compatible stand-in server used in performance testing.
+"""
+
+import io
+import json
+import pytest
+
+import numpy as np
+import soundfile as sf
+from fastapi.testclient import TestClient
+
+from benchmarks.stand_in_server import create_app, CONFIRMATION
+from src.app.config import ONBOARDING_FIELDS, FIELD_QUESTIONS, SIMULATED_ANSWERS
+
+
+def collecting(field: str) -> list[dict]:
+    return [{"role": "user", "content": f"[Collecting: {field}]\nMy answer."}]
+
+
+def test_chat_completion_returns_next_question():
+    """A non-streamed completion should ask the next field's question."""
+    client = TestClient(create_app(profile="zero"))
+    response = client.post("/v1/chat/completions", json={"model": "m", "messages": collecting(ONBOARDING_FIELDS[0])})
+
+    assert response.status_code == 200
+    content = response.json()["choices"][0]["message"]["content"]
+    assert FIELD_QUESTIONS[ONBOARDING_FIELDS[1]] in content
+
+
+def test_chat_completion_streams_sse_chunks():
+    """A streamed completion should send role, content and stop chunks, then [DONE]."""
+    client = TestClient(create_app(profile="zero"))
+    response = client.post(
+        "/v1/chat/completions",
+        json={"model": "m", "stream": True, "messages": collecting(ONBOARDING_FIELDS[0])},
+    )
+
+    events = [line[len("data: "):] for line in response.text.splitlines() if line.startswith("data: ")]
+    assert events[-1] == "[DONE]"
+    chunks = [json.loads(event) for event in events[:-1]]
+    assert chunks[0]["choices"][0]["delta"]["role"] == "assistant"
+    assert chunks[-1]["choices"][0]["finish_reason"] == "stop"
+    text = "".join(chunk["choices"][0]["delta"].get("content", "") for chunk in chunks)
+    assert FIELD_QUESTIONS[ONBOARDING_FIELDS[1]] in text
+
+
+def test_transcriptions_cycle_answers_with_segment_stats():
+    """Transcriptions should return the scripted answers in order with verbose_json segments."""
+    client = TestClient(create_app(profile="zero"))
+    buf = io.BytesIO()
+    sf.write(buf, np.zeros(16000, dtype=np.float32), 16000, format="WAV")
+
+    texts = []
+    for _ in range(len(SIMULATED_ANSWERS) + 1):
+        response = client.post(
+            "/v1/audio/transcriptions",
+            files={"file": ("audio.wav", buf.getvalue(), "audio/wav")},
+            data={"model": "whisper-1", "response_format": "verbose_json"},
+        )
+        body = response.json()
+        assert body["duration"] == 1.0
+        assert {"avg_logprob", "no_speech_prob", "compression_ratio"} <= body["segments"][0].keys()
+        texts.append(body["text"])
+
+    assert texts == list(SIMULATED_ANSWERS.values()) + [CONFIRMATION]
+
+
+def test_speech_returns_wav_audio():
+    """Speech should return a WAV whose length grows with the input text."""
+    client = TestClient(create_app(profile="zero"))
+    request = {"model": "tts-1", "voice": "alloy", "response_format": "wav"}
+    short = client.post("/v1/audio/speech", json={**request, "input": "Hi."})
+    long = client.post("/v1/audio/speech", json={**request, "input": "Hello there, nice to meet you."})
+
+    assert short.headers["content-type"] == "audio/wav"
+    assert sf.info(io.BytesIO(long.content)).duration > sf.info(io.BytesIO(short.content)).duration
+
+
+@pytest.mark.parametrize("response_format, media_type, audio_format", [
+    (None, "audio/mpeg", "MP3"),
+    ("flac", "audio/flac", "FLAC"),
+    ("pcm", "audio/wav", "WAV"),
+])
+def test_speech_honours_response_format(response_format, media_type, audio_format):
+    """Speech should be encoded as the requested format, mp3 by default, with a matching content type."""
+    if audio_format not in sf.available_formats():
+        pytest.skip(f"libsndfile {sf.__libsndfile_version__} cannot write {audio_format}")
+    client = TestClient(create_app(profile="zero"))
+    request = {"model": "tts-1", "voice": "alloy", "input": "Hello there."}
+    if response_format:
+        request["response_format"] = response_format
+    response = client.post("/v1/audio/speech", json=request)
+
+    assert response.headers["content-type"] == media_type
+    assert sf.info(io.BytesIO(response.content)).format == audio_format
+
+
+def test_injected_429_includes_retry_after():
+    """Injected rate-limit errors should carry Retry-After like a real provider."""
+    client = TestClient(create_app(profile="zero", error_rate=1.0, error_status=429))
+    response = client.post("/v1/chat/completions", json={"model": "m", "messages": collecting(ONBOARDING_FIELDS[0])})
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "1"
@@ -0,0 +1,54 @@
+"""
+tests.unit.test_tracing
+
+Unit tests for per-turn span tracing.
+"""
+
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+# Same module copy the API and engines use
+from core import tracing
+
+
+def test_spans_nest_and_record_first_token_from_worker_threads():
+    def run():
+        trace = tracing.start_trace("turn", "session-1", turn=1)
+        with tracing.span("llm"):
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                pool.submit(contextvars.copy_context().run, tracing.first_token).result()
+            with tracing.span("retry"):
+                pass
+        return trace
+
+    trace = contextvars.copy_context().run(run)
+    llm, retry = trace.spans
+    assert llm.parent_id == trace.root.span_id and retry.parent_id == llm.span_id
+    assert "ttft_ms" in llm.attributes
+
+    timing = trace.server_timing()
+    assert timing.startswith("llm;dur=") and "llm-ttft;dur=" in timing and "retry" not in timing
+
+
+def test_trace_id_correlates_a_session():
+    assert tracing.Trace("turn", "abc").trace_id == tracing.Trace("confirm", "abc").trace_id
+    assert tracing.Trace("turn", "abc").trace_id != tracing.Trace("turn", "xyz").trace_id
+
+
+def test_span_outside_a_trace_is_a_no_op():
+    def run():
+        with tracing.span("stt"):
+            tracing.first_token()
+            tracing.record("queue", 0.1)
+        return tracing.current_trace()
+
+    assert contextvars.copy_context().run(run) is None
+
+
+def test_otlp_payload_links_spans_to_the_root():
+    trace = tracing.Trace("turn", "abc", field="name")
+    trace.start_span("stt").end()
+    trace.root.end()
+    spans = tracing._otlp_payload(trace)["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert [span["name"] for span in spans] == ["turn", "stt"]
+    assert spans[1]["parentSpanId"] == spans[0]["spanId"]
+    assert len(spans[0]["traceId"]) == 32 and "parentSpanId" not in spans[0]
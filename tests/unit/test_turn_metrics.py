@@ -0,0 +1,62 @@
+"""
+tests.unit.test_turn_metrics
+
+Unit tests for the dashboard's per-turn latency metrics.
+"""
+
+from unittest.mock import MagicMock, patch
+from src.app.core.pipeline import OnboardingPipeline
+from src.app.core.turn_metrics import turn_summary, stage_percentiles
+from src.app.utils.latency import LatencyWindow
+# Same module copy the pipeline uses
+from core import tracing
+
+
+def test_traced_turn_is_summarised_from_pipeline_spans(tmp_path):
+    speech = tmp_path / "speech.mp3"
+    speech.write_bytes(b"\0" * 2048)
+    tts = MagicMock(supports_pcm=False)
+    tts.synthesize.return_value = str(speech)
+    llm = MagicMock()
+    llm.generate.return_value = "Thanks Ada. What is your employment status?"
+    pipeline = OnboardingPipeline(
+        stt=MagicMock(), llm=llm, tts=tts, system_prompt="Test Prompt",
+        onboarding_fields=["name"], recording_duration=5, sample_rate=16000, energy_threshold=0.01,
+    )
+
+    trace = tracing.Trace("turn", "session-1", turn=1, field="name")
+    with tracing.activate(trace), patch.object(pipeline, "play_audio"):
+        with tracing.span("stt"):
+            tracing.annotate(audio_seconds=5.0, recorded_bytes=160044)
+        with tracing.span("llm"):
+            pipeline._generate("My name is Ada.")
+        pipeline._speak("Thanks Ada. What is your employment status?")
+    assert tracing.current_trace() is None
+
+    summary = turn_summary(trace)
+    assert (summary["turn"], summary["field"]) == (1, "name")
+    assert all(summary[stage] >= 0 for stage in ("stt", "llm", "tts", "playback"))
+    assert summary["llm_ttft"] is None
+    assert summary["speech_bytes"] == 2048 and summary["recorded_bytes"] == 160044
+    assert summary["prompt_tokens"] > 0 and summary["completion_tokens"] == 10
+
+
+def test_stage_percentiles_skip_stages_that_did_not_run():
+    turns = [{"stt": ms, "llm": 2 * ms, "tts": 0, "playback": 0, "llm_ttft": None} for ms in range(100, 1100, 100)]
+    result = stage_percentiles(turns)
+    assert result["stt"] == {"p50": 500, "p95": 1000, "count": 10}
+    assert result["llm"]["p50"] == 1000
+    assert "tts" not in result and "llm_ttft" not in result
+
+
+def test_stage_percentiles_match_latency_window():
+    """The dashboard should report the same percentiles as the latency windows behind /health."""
+    for values in ([100, 900], [300, 100, 200], list(range(10, 1000, 37))):
+        window = LatencyWindow()
+        for ms in values:
+            window.record(ms)
+        result = stage_percentiles([{"stt": ms} for ms in values])
+        assert result["stt"]["p50"] == window.percentile(50)
+        assert result["stt"]["p95"] == window.percentile(95)
+
+    assert stage_percentiles([{"stt": 100}, {"stt": 900}])["stt"]["p50"] == 100
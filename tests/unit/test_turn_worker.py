@@ -0,0 +1,47 @@
+"""
+tests.unit.test_turn_worker
+
+Unit tests for the dashboard's background turn worker.
+"""
+
+import threading
+from src.app.core.turn_worker import TurnWorker
+
+
+def test_job_reports_stages_then_result():
+    worker = TurnWorker()
+
+    def job(report):
+        report("transcribing")
+        report("generating")
+        return {"last_response": "Hi"}
+
+    assert worker.start(job)
+    worker.join(5)
+    events = worker.poll()
+    assert [e.get("stage") for e in events[:2]] == ["transcribing", "generating"]
+    assert events[-1] == {"type": "done", "job": "turn", "result": {"last_response": "Hi"}}
+    assert worker.poll() == []
+
+
+def test_only_one_job_runs_at_a_time():
+    worker = TurnWorker()
+    release = threading.Event()
+    assert worker.start(lambda report: release.wait(5) and {})
+    assert worker.busy
+    assert not worker.start(lambda report: {})
+    release.set()
+    worker.join(5)
+    assert not worker.busy
+
+
+def test_failed_job_reports_an_error():
+    worker = TurnWorker()
+
+    def job(report):
+        report("recording")
+        raise ValueError("No audio detected")
+
+    worker.start(job, name="opening")
+    worker.join(5)
+    assert worker.poll()[-1] == {"type": "error", "job": "opening", "error": "No audio detected"}
@@ -0,0 +1,127 @@
+"""
+tests.unit.test_warmup
+
+Unit tests for the API startup warm-up.
+"""
+
+import os
+import tempfile
+import pytest
+from unittest.mock import patch
+from src.app.core.warmup import WarmUp
+import core.degradation
+
+ENGINES = {"stt": "fake.FakeSTT", "llm": "fake.FakeLLM", "tts": "fake.FakeTTS"}
+
+
+class FakeSTT:
+    def __init__(self):
+        self.calls = 0
+
+    def transcribe_array(self, audio, sample_rate):
+        self.calls += 1
+        return ""
+
+
+class FakeLLM:
+    def __init__(self):
+        self.calls = 0
+
+    def generate(self, messages):
+        self.calls += 1
+        return "ready"
+
+
+class FakeTTS:
+    def __init__(self):
+        self.texts = []
+
+    def synthesize(self, text):
+        self.texts.append(text)
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".mp3") as tmp:
+            tmp.write(b"audio")
+            return tmp.name
+
+
+def fake_load_engine(dotted_path):
+    return {"FakeSTT": FakeSTT, "FakeLLM": FakeLLM, "FakeTTS": FakeTTS}[dotted_path.rsplit(".", 1)[1]]()
+
+
+@pytest.fixture(autouse=True)
+def engines():
+    core.degradation._audio_cache.clear()
+    with patch("core.pipeline.load_engine", side_effect=fake_load_engine) as load:
+        yield load
+    core.degradation._audio_cache.clear()
+
+
+def test_warm_up_loads_and_calls_every_engine():
+    warmup = WarmUp(ENGINES)
+    assert not warmup.ready()
+    warmup.run()
+
+    assert warmup.ready()
+    assert warmup.engines["stt"].calls == 1
+    assert warmup.engines["llm"].calls == 1
+    assert warmup.engines["tts"].texts[0] == "Hello."
+    snapshot = warmup.snapshot()
+    assert snapshot["state"] == "ready"
+    assert set(snapshot["engines"]["stt"]) == {"engine", "load_seconds", "call_seconds"}
+    assert "cache_seconds" in snapshot["engines"]["tts"]
+
+
+def test_warm_up_fills_the_tts_cache():
+    from config import OPENING_TEXT
+    warmup = WarmUp(ENGINES)
+    warmup.run()
+
+    path = core.degradation.DegradationController(warmup.engines["tts"]).cached_audio(OPENING_TEXT)
+    assert path is not None
+    os.remove(path)
+
+
+def test_failed_engine_is_reported_and_not_ready(engines):
+    def load(dotted_path):
+        if dotted_path.endswith("FakeLLM"):
+            raise RuntimeError("Cannot connect to Ollama")
+        return fake_load_engine(dotted_path)
+
+    engines.side_effect = load
+    warmup = WarmUp(ENGINES)
+    warmup.run()
+
+    assert warmup.state == "failed"
+    assert not warmup.ready()
+    assert "llm" not in warmup.engines
+    assert "stt" in warmup.engines
+    assert "Ollama" in warmup.snapshot()["engines"]["llm"]["error"]
+
+
+def test_calls_disabled_only_constructs_engines():
+    warmup = WarmUp(ENGINES, calls=False)
+    warmup.run()
+
+    assert warmup.ready()
+    assert warmup.engines["stt"].calls == 0
+    assert "call_seconds" not in warmup.snapshot()["engines"]["llm"]
+
+
+def test_failed_engine_recovers_on_retry(engines):
+    attempts = []
+
+    def load(dotted_path):
+        if dotted_path.endswith("FakeLLM"):
+            attempts.append(dotted_path)
+            if len(attempts) < 3:
+                raise RuntimeError("Cannot connect to Ollama")
+        return fake_load_engine(dotted_path)
+
+    engines.side_effect = load
+    warmup = WarmUp(ENGINES, retry_backoff=0.01)
+    warmup.start().join(timeout=5)
+
+    assert warmup.ready()
+    assert warmup.snapshot()["attempts"] == 3
+    assert "error" not in warmup.snapshot()["engines"]["llm"]
+    # Engines that warmed up the first time are kept, not loaded again
+    assert sum(call.args[0].endswith("FakeSTT") for call in engines.call_args_list) == 1
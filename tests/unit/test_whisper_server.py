@@ -0,0 +1,98 @@
+"""
+tests.unit.test_whisper_server
+
+Unit tests for the shared local Whisper server and its client engine.
+"""
+
+import threading
+import numpy as np
+import pytest
+import soundfile as sf
+from src.app.core.inference.whisper_server import WhisperServer
+from src.app.core.engines.stt.whisper_shared import SharedWhisperEngine
+from src.app.utils.audio import load_audio, resample
+
+
+class FakeModel:
+    """Records the arrays it receives instead of running Whisper."""
+
+    def __init__(self):
+        self.received = []
+
+    def transcribe(self, audio, **options):
+        self.received.append((audio.dtype, audio.shape, float(audio.max())))
+        self.options = options
+        return {"text": f"  {audio.size} samples  "}
+
+
+@pytest.fixture
+def server(tmp_path):
+    model = FakeModel()
+    socket_path = str(tmp_path / "whisper.sock")
+    server = WhisperServer(socket_path, model, model_name="fake")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, model, socket_path
+    server.shutdown()
+    server.server_close()
+
+
+def write_wav(path, samples: np.ndarray, rate: int = 16000) -> str:
+    sf.write(str(path), samples, rate)
+    return str(path)
+
+
+def test_transcribes_through_shared_memory(server, tmp_path):
+    _, model, socket_path = server
+    engine = SharedWhisperEngine(socket_path=socket_path)
+    wav = write_wav(tmp_path / "clip.wav", np.full(8000, 0.5, dtype=np.float32))
+
+    assert engine.transcribe(wav) == "8000 samples"
+    dtype, shape, peak = model.received[0]
+    assert dtype == np.float32
+    assert shape == (8000,)
+    assert peak == pytest.approx(0.5, abs=1e-3)
+
+
+def test_resamples_before_sending(server, tmp_path):
+    _, model, socket_path = server
+    engine = SharedWhisperEngine(socket_path=socket_path)
+    wav = write_wav(tmp_path / "clip.wav", np.zeros(8000, dtype=np.float32), rate=8000)
+
+    assert engine.transcribe(wav) == "16000 samples"
+
+
+def test_server_errors_raise_runtime_error(server, tmp_path):
+    _, model, socket_path = server
+    model.transcribe = lambda audio, **options: (_ for _ in ()).throw(ValueError("bad audio"))
+    engine = SharedWhisperEngine(socket_path=socket_path)
+    wav = write_wav(tmp_path / "clip.wav", np.zeros(1600, dtype=np.float32))
+
+    with pytest.raises(RuntimeError, match="bad audio"):
+        engine.transcribe(wav)
+
+
+def test_missing_server_fails_at_init(tmp_path):
+    with pytest.raises(RuntimeError, match="not reachable"):
+        SharedWhisperEngine(socket_path=str(tmp_path / "missing.sock"))
+
+
+def test_load_audio_downmixes_stereo(tmp_path):
+    stereo = np.stack([np.ones(100), -np.ones(100)], axis=1).astype(np.float32)
+    wav = write_wav(tmp_path / "stereo.wav", stereo)
+    audio = load_audio(wav)
+    assert audio.shape == (100,)
+    assert np.allclose(audio, 0.0, atol=1e-3)
+
+
+def test_resample_same_rate_is_noop():
+    audio = np.arange(10, dtype=np.float32)
+    assert resample(audio, 16000, 16000) is audio
+
+
+def test_transcribe_array_resamples_in_process(server):
+    _, model, socket_path = server
+    engine = SharedWhisperEngine(socket_path=socket_path)
+    stereo_8k = np.zeros((4000, 2), dtype=np.int16)
+    assert engine.transcribe_array(stereo_8k, 8000) == "8000 samples"
+    assert model.received[-1][0] == np.float32